@@ -116,6 +116,8 @@ class GuiConfig(BaseConfig):
     MWINDOW_TMP_FOLDER_PATH: Attribute = Attribute("/tmp/cr_designer/", "Temporary folder path")
     LOG_ACTIONS_OF_THE_USER: Attribute = Attribute(True, "Log user actions")
     ENABLE_EDITING_CURVED_LANELETS: Attribute = Attribute(True, "Enable editing of curved lanelets")
+    # search the element pickers of the road network toolbox only for elements in the visible area
+    SEARCH_ELEMENTS_IN_VIEW: Attribute = Attribute(False, "Search only elements in view")
     # default values in default_draw_params
     DRAW_TRAJECTORY: Attribute = Attribute(False, "Draw trajectory")
     DRAW_DYNAMIC_OBSTACLES: Attribute = Attribute(True, "Draw dynamic obstacles")
@@ -194,6 +196,7 @@ class GuiConfig(BaseConfig):
             "Other",
             ENABLE_EDITING_CURVED_LANELETS,
             ENABLE_UNDETAILED_DISPLAY,
+            SEARCH_ELEMENTS_IN_VIEW,
             DRAW_OCCUPANCY,
             DRAW_TRAFFIC_SIGNS,
             DRAW_TRAFFIC_LIGHTS,
@@ -19,10 +19,29 @@ class OpenDriveConfig(BaseConfig):
         "Min. step length between two sampling positions on the reference geometry",
     )
 
+    adaptive_sampling = Attribute(
+        False,
+        "Adaptive sampling",
+        "Samples lanes depending on their curvature and width so that the vertices deviate at most by the error "
+        "tolerance instead of sampling them every 0.5 m",
+    )
+    elevation = Attribute(
+        False,
+        "Elevation",
+        "Converts lanes with heights from the elevation and superelevation of the roads, i.e., with 3D vertices",
+    )
+
     precision = Attribute(
         0.5, "Precision", "Precision with which to convert plane group to lanelet"
     )
 
+    num_processes = Attribute(
+        1,
+        "Number of processes",
+        "Number of processes calculating the vertices of the roads; 1 calculates them sequentially",
+        validation=lambda value: value >= 1,
+    )
+
     driving_default_lanelet_type = Attribute(
         "urban",
         "Driving default lanelet type",
@@ -116,7 +135,10 @@ class OpenDriveConfig(BaseConfig):
             initial_cr_id,
             error_tolerance,
             min_delta_s,
+            adaptive_sampling,
+            elevation,
             precision,
+            num_processes,
             proj_string_odr,
             "Intersection and Lane Segment Parameters",
             intersection_straight_threshold,
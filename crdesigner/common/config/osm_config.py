@@ -7,6 +7,8 @@ class OsmConfig(BaseConfig):
     """
 
     GEONAMES_USERNAME = Attribute("demo", "Geonames Username")
+    # Path to a cities file of geonames, e.g., cities500.zip, which is used instead of the geonames API if set
+    GEONAMES_CITIES_FILE = Attribute("", "Geonames Cities File")
     # Mapillary Client ID which can be set to extract additional traffic signs. If set to "demo",
     # mapillary signs will be disabled
     MAPILLARY_CLIENT_ID = Attribute("demo", "Mapillary Client ID")
@@ -35,6 +37,14 @@ class OsmConfig(BaseConfig):
     DOWNLOAD_EDGE_LENGTH = Attribute(200, "Download Edge Length")
     # coordinates in latitude and longitude specifying the center of the downloaded area
     DOWNLOAD_COORDINATES = Attribute((48.262447, 11.657881), "Download Coordinates")
+    # edge length in degree of the tiles into which large areas are split for the download
+    DOWNLOAD_TILE_SIZE = Attribute(0.02, "Download Tile Size")
+    # number of tiles downloaded concurrently
+    DOWNLOAD_PARALLEL_REQUESTS = Attribute(2, "Download Parallel Requests")
+    # path to cache downloaded tiles
+    DOWNLOAD_CACHE_PATH = Attribute("files/osm_tiles/", "Download Cache Path")
+    # maximum age of cached tiles in seconds; cached tiles are not used if 0
+    DOWNLOAD_CACHE_MAX_AGE = Attribute(7 * 24 * 3600, "Download Cache Max Age")
 
     # Scenario Settings
     # include tunnels in result
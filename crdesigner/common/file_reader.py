@@ -1,17 +1,16 @@
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
+from xml.etree import ElementTree
 
 from commonroad.common.file_reader import CommonRoadFileReader
+from commonroad.common.reader.file_reader_xml import XMLFileReader
 from commonroad.common.util import FileFormat, Path_T
 from commonroad.planning.planning_problem import PlanningProblemSet
 from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.scenario import Scenario
 
 from crdesigner.common.common_file_reader_writer import project_scenario_and_pps
+from crdesigner.common.scenario_filter import BoundingBox, ScenarioFilter
 from crdesigner.verification_repairing.config import MapVerParams
-from crdesigner.verification_repairing.map_verification_repairing import (
-    verify_and_repair_map,
-    verify_and_repair_scenario,
-)
 
 
 class CRDesignerFileReader(CommonRoadFileReader):
@@ -26,6 +25,7 @@ class CRDesignerFileReader(CommonRoadFileReader):
         :return:
         """
         super().__init__(filename, file_format)
+        self._filename = filename
         # map verification parameters
         self._mapver_params = MapVerParams()
 
@@ -47,17 +47,25 @@ class CRDesignerFileReader(CommonRoadFileReader):
         verify_repair_scenario: bool = False,
         target_projection: str = None,
         lanelet_assignment: bool = False,
+        bounding_box: Optional[BoundingBox] = None,
+        element_ids: Optional[Iterable[int]] = None,
     ) -> Tuple[Scenario, PlanningProblemSet]:
         """
         Opens and loads CommonRoad scenario and planning problem set from file.
         If the boolean is set to True, the function verifies and repairs the scenario.
+        If a bounding box or element IDs are provided, the XML file is streamed and only the elements
+        intersecting the bounding box or having one of the IDs are loaded (see ScenarioFilter).
 
         :param verify_repair_scenario: Boolean that indicates if the function will verify and repair the scenario.
         :param target_projection: Target projection that the user provides.
         :param lanelet_assignment: Activates calculation of lanelets occupied by obstacles.
+        :param bounding_box: Window (x_min, y_min, x_max, y_max) in the coordinates of the file.
+        :param element_ids: IDs of lanelets, obstacles, planning problems and traffic elements to load.
         :return: Scenario and planning problem set.
         """
-        scenario, planning_problem_set = super().open(lanelet_assignment)
+        scenario, planning_problem_set = self._reader(bounding_box, element_ids).open(
+            lanelet_assignment
+        )
 
         # check for a projection
         # If target projection is not provided, no projection should be applied
@@ -71,20 +79,52 @@ class CRDesignerFileReader(CommonRoadFileReader):
 
         # check for verifying and repairing the scenario
         if verify_repair_scenario is True:
+            from crdesigner.verification_repairing.map_verification_repairing import (
+                verify_and_repair_scenario,
+            )
+
             scenario = verify_and_repair_scenario(scenario, config=self.mapver_params)[0]
 
         return scenario, planning_problem_set
 
-    def open_lanelet_network(self, verify_repair_lanelet_network: bool = False) -> LaneletNetwork:
+    def open_lanelet_network(
+        self,
+        verify_repair_lanelet_network: bool = False,
+        bounding_box: Optional[BoundingBox] = None,
+        element_ids: Optional[Iterable[int]] = None,
+    ) -> LaneletNetwork:
         """
         Opens and loads CommonRoad lanelet network from the file.
         If the boolean is set to True, the function verifies and repairs the lanelet network.
 
         :param verify_repair_lanelet_network: Boolean that indicates if the function will verify and repair
         the lanelet network.
+        :param bounding_box: Window (x_min, y_min, x_max, y_max) in the coordinates of the file.
+        :param element_ids: IDs of lanelets and traffic elements to load.
         :return: Lanelet network.
         """
-        lanelet_network = super().open_lanelet_network()
+        lanelet_network = self._reader(bounding_box, element_ids).open_lanelet_network()
         if verify_repair_lanelet_network is True:
+            from crdesigner.verification_repairing.map_verification_repairing import (
+                verify_and_repair_map,
+            )
+
             lanelet_network = verify_and_repair_map(lanelet_network, config=self.mapver_params)[0]
         return lanelet_network
+
+    def _reader(self, bounding_box: Optional[BoundingBox], element_ids: Optional[Iterable[int]]):
+        """
+        Returns the reader for the whole file or for the part of it selected by the bounding box and IDs.
+
+        :param bounding_box: Window the loaded elements intersect.
+        :param element_ids: IDs of the loaded elements.
+        :return: File reader.
+        """
+        if bounding_box is None and element_ids is None:
+            return self._file_reader
+        if not isinstance(self._file_reader, XMLFileReader):
+            raise ValueError(
+                "CRDesignerFileReader: partial loading is only supported for XML files."
+            )
+        root = ScenarioFilter(bounding_box, element_ids).filter(self._filename)
+        return XMLFileReader(ElementTree.tostring(root))
@@ -8,9 +8,6 @@ from commonroad.scenario.scenario import Location, Scenario, Tag
 
 from crdesigner.common.common_file_reader_writer import project_scenario_and_pps
 from crdesigner.verification_repairing.config import MapVerParams
-from crdesigner.verification_repairing.map_verification_repairing import (
-    verify_and_repair_scenario,
-)
 
 
 class CRDesignerFileWriter(CommonRoadFileWriter):
@@ -105,6 +102,10 @@ class CRDesignerFileWriter(CommonRoadFileWriter):
 
         # check for verifying and repairing the scenario
         if verify_repair_scenario is True:
+            from crdesigner.verification_repairing.map_verification_repairing import (
+                verify_and_repair_scenario,
+            )
+
             self._file_writer.scenario = verify_and_repair_scenario(
                 self._file_writer.scenario, config=self.mapver_params
             )[0]
@@ -127,6 +128,10 @@ class CRDesignerFileWriter(CommonRoadFileWriter):
         :return: Scenario
         """
         if verify_repair_scenario is True:
+            from crdesigner.verification_repairing.map_verification_repairing import (
+                verify_and_repair_scenario,
+            )
+
             self._file_writer.scenario = verify_and_repair_scenario(
                 self._file_writer.scenario, config=self.mapver_params
             )[0]
@@ -0,0 +1,58 @@
+import multiprocessing
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+Task = TypeVar("Task")
+Result = TypeVar("Result")
+
+# function and shared data of the current pool; set before the worker processes are forked so that the data, e.g., a
+# scenario or lanelet network, is shared with the workers instead of being pickled for each task
+_job: Optional[Tuple[Callable[[Any, Any], Any], Any]] = None
+
+
+def _run_task(task: Any) -> Any:
+    """
+    Applies the function of the current job to a task in a worker process.
+
+    :param task: Task.
+    :return: Result of the task.
+    """
+    function, data = _job
+    return function(data, task)
+
+
+def imap_forked(
+    function: Callable[[Any, Task], Result],
+    data: Any,
+    tasks: Sequence[Task],
+    num_processes: int = 1,
+) -> Iterator[Result]:
+    """
+    Applies a function to each task and yields the results in the order of the tasks. The tasks are distributed over
+    a pool of forked processes, which inherit the shared data from the parent process. Only the tasks and results are
+    pickled, so that neither the function nor the data have to be picklable. The tasks are processed sequentially if
+    only one process is requested, if there are less than two tasks, or if processes cannot be forked on the platform.
+
+    :param function: Function called with the shared data and a task.
+    :param data: Data shared by all tasks.
+    :param tasks: Tasks.
+    :param num_processes: Number of processes.
+    :return: Results of the tasks.
+    """
+    global _job
+
+    if (
+        num_processes <= 1
+        or len(tasks) < 2
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        for task in tasks:
+            yield function(data, task)
+        return
+
+    previous_job = _job
+    _job = (function, data)
+    try:
+        with multiprocessing.get_context("fork").Pool(min(num_processes, len(tasks))) as pool:
+            yield from pool.imap(_run_task, tasks)
+    finally:
+        _job = previous_job
@@ -0,0 +1,626 @@
+import copy
+import shutil
+import subprocess
+from collections import defaultdict
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import matplotlib as mpl
+import numpy as np
+from commonroad.geometry.shape import Circle, Shape, ShapeGroup
+from commonroad.planning.planning_problem import PlanningProblemSet
+from commonroad.scenario.obstacle import DynamicObstacle
+from commonroad.scenario.scenario import Scenario
+from commonroad.visualization.draw_params import MPDrawParams
+from commonroad.visualization.mp_renderer import MPRenderer
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+from crdesigner.common.process_pool import imap_forked
+
+# formats of exported videos; GIFs are encoded with Pillow, all other formats with ffmpeg
+VIDEO_FORMATS = (".mp4", ".gif", ".avi")
+
+# margin around the lanelets in exported videos in meter
+MARGIN = 10.0
+
+# number of consecutive frames rendered by a worker process at once
+FRAMES_PER_TASK = 20
+
+# scenarios with more dynamic obstacles are animated with their occupancies only
+MAX_DETAILED_OBSTACLES = 100
+
+# vertices of a unit circle approximating circular occupancies
+_UNIT_CIRCLE = np.stack(
+    (np.cos(np.linspace(0, 2 * np.pi, 17)[:-1]), np.sin(np.linspace(0, 2 * np.pi, 17)[:-1])), axis=1
+)
+
+
+def final_time_step(scenario: Scenario) -> int:
+    """
+    Computes the last time step in which an obstacle of the scenario is present. The final time step of the
+    prediction is used for dynamic obstacles with a prediction and the initial time step for all others.
+
+    :param scenario: CommonRoad scenario.
+    :return: Final time step or 0 if the scenario has no dynamic obstacles.
+    """
+    return max(
+        (
+            (
+                obstacle.prediction.final_time_step
+                if obstacle.prediction is not None
+                else obstacle.initial_state.time_step
+            )
+            for obstacle in scenario.dynamic_obstacles
+        ),
+        default=0,
+    )
+
+
+def scenario_extent(scenario: Scenario, margin: float = MARGIN) -> List[float]:
+    """
+    Computes the area covered by the lanelets of a scenario.
+
+    :param scenario: CommonRoad scenario.
+    :param margin: Margin around the lanelets in meter.
+    :return: Plot limits [x_min, x_max, y_min, y_max].
+    """
+    vertices = [
+        np.concatenate((lanelet.left_vertices[:, :2], lanelet.right_vertices[:, :2]))
+        for lanelet in scenario.lanelet_network.lanelets
+    ]
+    if not vertices:
+        return [-50.0, 50.0, -50.0, 50.0]
+    vertices = np.concatenate(vertices)
+    x_min, y_min = vertices.min(axis=0) - margin
+    x_max, y_max = vertices.max(axis=0) + margin
+    return [float(x_min), float(x_max), float(y_min), float(y_max)]
+
+
+def shape_vertices(shape: Shape) -> List[np.ndarray]:
+    """
+    Computes the outlines of a shape. Circles are approximated by polygons.
+
+    :param shape: Shape of an occupancy.
+    :return: Vertices of the outlines.
+    """
+    if isinstance(shape, ShapeGroup):
+        return [vertices for part in shape.shapes for vertices in shape_vertices(part)]
+    if isinstance(shape, Circle):
+        return [shape.center + shape.radius * _UNIT_CIRCLE]
+    return [shape.vertices]
+
+
+class OccupancyCollection:
+    """
+    Draws the occupancies of many dynamic obstacles as one collection. The outlines of all occupancies are computed
+    once and indexed by time step. The collection stays on the axes and only its vertices are replaced per frame,
+    which is considerably faster than drawing each obstacle with the renderer. Trajectories, signal states, and
+    labels of the obstacles are not drawn.
+    """
+
+    def __init__(self, obstacles: Iterable[DynamicObstacle], ax: Axes, draw_params: MPDrawParams):
+        """
+        Constructor.
+
+        :param obstacles: Dynamic obstacles.
+        :param ax: Axes the collection is added to.
+        :param draw_params: Drawing parameters; the occupancy style of dynamic obstacles is used.
+        """
+        self._vertices: Dict[int, List[np.ndarray]] = defaultdict(list)
+        for obstacle in obstacles:
+            occupancies = [obstacle.occupancy_at_time(obstacle.initial_state.time_step)]
+            if obstacle.prediction is not None:
+                occupancies.extend(
+                    occupancy
+                    for occupancy in obstacle.prediction.occupancy_set
+                    if occupancy.time_step != obstacle.initial_state.time_step
+                )
+            for occupancy in occupancies:
+                self._vertices[occupancy.time_step].extend(shape_vertices(occupancy.shape))
+        style = draw_params.dynamic_obstacle.vehicle_shape.occupancy.shape
+        self.collection = PolyCollection(
+            [],
+            facecolors=style.facecolor,
+            edgecolors=style.edgecolor,
+            linewidths=style.linewidth,
+            alpha=style.opacity,
+            zorder=style.zorder,
+            animated=True,
+        )
+        ax.add_collection(self.collection, autolim=False)
+
+    def update(self, time_step: int) -> PolyCollection:
+        """
+        Replaces the occupancies of the collection by the occupancies at a time step.
+
+        :param time_step: Time step.
+        :return: Updated collection.
+        """
+        self.collection.set_verts(self._vertices.get(time_step, []))
+        return self.collection
+
+
+class ScenarioAnimation:
+    """
+    Draws a scenario frame by frame onto the axes of a renderer. The static elements, i.e., the lanelet network with
+    its traffic signs and the planning problems, are drawn once as background. A frame only consists of the obstacles
+    and the traffic light states of its time step. The artists of a frame are animated and replace the artists of the
+    previous frame, so that frames can be blitted onto a cached image of the background.
+    Scenarios with many dynamic obstacles are animated with an occupancy collection updated in place, and their
+    static obstacles are part of the background.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        renderer: MPRenderer,
+        draw_params: Optional[MPDrawParams] = None,
+        planning_problem_set: Optional[PlanningProblemSet] = None,
+        time_end: Optional[int] = None,
+        draw_obstacles: Optional[Callable[[MPDrawParams], None]] = None,
+        max_detailed_obstacles: int = MAX_DETAILED_OBSTACLES,
+    ):
+        """
+        Constructor.
+
+        :param scenario: CommonRoad scenario.
+        :param renderer: Renderer whose axes are used.
+        :param draw_params: Drawing parameters; the parameters of the renderer are used if none are given.
+        :param planning_problem_set: Planning problems drawn in the background.
+        :param time_end: Last time step of the trajectories; the final time step of the scenario if none is given.
+        :param draw_obstacles: Function drawing the obstacles of a frame with the renderer, e.g., with custom colors.
+        :param max_detailed_obstacles: Maximum number of dynamic obstacles drawn in detail by the renderer.
+        """
+        self.scenario = scenario
+        self.renderer = renderer
+        self.planning_problem_set = planning_problem_set
+        self.time_end = time_end if time_end is not None else final_time_step(scenario)
+        self._draw_obstacles = draw_obstacles
+        self.detailed_obstacles = len(scenario.dynamic_obstacles) <= max_detailed_obstacles
+        self._occupancies: Optional[OccupancyCollection] = None
+        self._frame_artists: List[Artist] = []
+        self._callback_ids: List[int] = []
+
+        # the parameters are copied once, frames only change the time steps
+        self.draw_params = copy.deepcopy(
+            draw_params if draw_params is not None else renderer.draw_params
+        )
+        self._traffic_light_params = None
+        if self.draw_params.lanelet_network.traffic_light.draw_traffic_lights and len(
+            scenario.lanelet_network.traffic_lights
+        ):
+            # only the center lines of lanelets with traffic lights and the traffic lights change over time
+            self._traffic_light_params = copy.deepcopy(self.draw_params.lanelet_network)
+            self._traffic_light_params.draw_ids = [
+                lanelet.lanelet_id
+                for lanelet in scenario.lanelet_network.lanelets
+                if lanelet.traffic_lights
+            ]
+            self._traffic_light_params.traffic_sign.draw_traffic_signs = False
+            self._traffic_light_params.intersection.draw_intersections = False
+
+    def _set_time_step(self, time_step: int):
+        """
+        Sets the time step of the drawing parameters.
+
+        :param time_step: Time step.
+        """
+        self.draw_params.time_begin = time_step
+        self.draw_params.time_end = time_step
+        self.draw_params.dynamic_obstacle.trajectory.time_begin = time_step
+        self.draw_params.dynamic_obstacle.trajectory.time_end = self.time_end
+        self.draw_params.trajectory.time_begin = time_step
+        self.draw_params.trajectory.time_end = self.time_end
+
+    def draw_background(self, time_step: int = 0) -> List[Artist]:
+        """
+        Draws the static elements of the scenario. Traffic signs belong to the background, traffic lights to the
+        frames.
+
+        :param time_step: Time step of the planning problems.
+        :return: Artists of the background.
+        """
+        self.clear_frame()
+        self._set_time_step(time_step)
+        background_params = copy.deepcopy(self.draw_params.lanelet_network)
+        background_params.traffic_light.draw_traffic_lights = False
+
+        self.renderer.clear()
+        self.scenario.lanelet_network.draw(self.renderer, background_params)
+        if self.planning_problem_set is not None:
+            self.planning_problem_set.draw(self.renderer, self.draw_params.planning_problem_set)
+        if not self.detailed_obstacles:
+            for obstacle in self.scenario.static_obstacles:
+                obstacle.draw(self.renderer, self.draw_params)
+        artists = self.renderer.render_static()
+        artists.extend(self.renderer.render_dynamic())
+        self.renderer.clear()
+        # the callbacks are connected to the axes now and must not be connected again with every frame
+        self.renderer.callbacks.clear()
+        return artists
+
+    def draw_frame(self, time_step: int) -> List[Artist]:
+        """
+        Removes the artists of the previous frame and draws the obstacles and traffic lights of a time step.
+
+        :param time_step: Time step.
+        :return: Animated artists of the frame.
+        """
+        self.clear_frame()
+        self._set_time_step(time_step)
+
+        self.renderer.clear()
+        if self._traffic_light_params is not None:
+            self._traffic_light_params.time_begin = time_step
+            self._traffic_light_params.time_end = time_step
+            self.scenario.lanelet_network.draw(self.renderer, self._traffic_light_params)
+            # lanelets drawn for the traffic light states are already part of the background
+            self.renderer.static_collections.clear()
+            self.renderer.static_artists.clear()
+        if not self.detailed_obstacles:
+            pass
+        elif self._draw_obstacles is not None:
+            self._draw_obstacles(self.draw_params)
+        else:
+            for obstacle in self.scenario.obstacles:
+                obstacle.draw(self.renderer, self.draw_params)
+        # the renderer clears the returned list with its buffers
+        artists = list(self.renderer.render_dynamic())
+        artists.extend(self.renderer.dynamic_labels)
+        self.renderer.clear()
+        # the callbacks scaling the traffic light icons to the view are connected by the renderer; connecting them
+        # again returns their IDs, so that they can be disconnected with the frame
+        ax = self.renderer.ax
+        for event, funcs in self.renderer.callbacks.items():
+            for func in funcs:
+                self._callback_ids.append(ax.callbacks.connect(event, func))
+                func(ax)
+        self.renderer.callbacks.clear()
+
+        for artist in artists:
+            artist.set_animated(True)
+        self._frame_artists = artists
+        if not self.detailed_obstacles:
+            # the collection is kept for the following frames
+            if self._occupancies is None or self._occupancies.collection.axes is None:
+                self._occupancies = OccupancyCollection(
+                    self.scenario.dynamic_obstacles, ax, self.draw_params
+                )
+            artists = artists + [self._occupancies.update(time_step)]
+        return artists
+
+    def clear_frame(self):
+        """Removes the artists of the current frame from the axes."""
+        for artist in self._frame_artists:
+            if artist.axes is not None:
+                artist.remove()
+        for callback_id in self._callback_ids:
+            self.renderer.ax.callbacks.disconnect(callback_id)
+        self._frame_artists = []
+        self._callback_ids = []
+
+
+class BlittedAnimation:
+    """
+    Plays an animation on the canvas of a figure by blitting the animated artists of each frame onto a cached image
+    of the figure. In contrast to a FuncAnimation, the cached image is captured after each full redraw of the canvas,
+    e.g., after zooming or panning, so that it never shows an outdated view.
+    """
+
+    def __init__(
+        self,
+        figure: Figure,
+        func: Callable[[int], Iterable[Artist]],
+        init_func: Callable[[], Iterable[Artist]],
+        interval: float,
+    ):
+        """
+        Constructor.
+
+        :param figure: Figure of the animation.
+        :param func: Function drawing a frame, which is called with the frame number.
+        :param init_func: Function drawing the background.
+        :param interval: Delay between frames in milliseconds.
+        """
+        self.figure = figure
+        self._func = func
+        self._init_func = init_func
+        self._frame = 0
+        self._artists: List[Artist] = []
+        self._background = None
+        self.event_source = figure.canvas.new_timer(interval=interval)
+        self.event_source.add_callback(self.draw_next_frame)
+        self._draw_cid = figure.canvas.mpl_connect("draw_event", self._on_draw)
+        self.redraw_background()
+
+    def redraw_background(self):
+        """Draws the background again and requests a full redraw of the canvas, which caches the new image."""
+        self._artists = [artist for artist in self._init_func() if artist.get_animated()]
+        self._background = None
+        self.figure.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """
+        Caches the image of the figure after a full redraw and draws the current frame on top of it.
+
+        :param event: Draw event.
+        """
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            if artist.axes is not None:
+                artist.axes.draw_artist(artist)
+
+    def draw_next_frame(self):
+        """Draws the next frame and blits it onto the cached image."""
+        self._artists = list(self._func(self._frame))
+        self._frame += 1
+        canvas = self.figure.canvas
+        if self._background is None:
+            # the frame is drawn after the pending full redraw
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_artists()
+        canvas.blit(self.figure.bbox)
+
+    def stop(self):
+        """Stops the animation and disconnects it from the canvas."""
+        self.event_source.stop()
+        self.figure.canvas.mpl_disconnect(self._draw_cid)
+
+
+class FrameRenderer:
+    """
+    Renders frames of a scenario into RGB images with the Agg backend. The background is rendered once and every
+    frame only draws its animated artists onto a copy of the cached background. No pyplot state is used, so that
+    frames can be rendered in worker processes.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        planning_problem_set: Optional[PlanningProblemSet] = None,
+        draw_params: Optional[MPDrawParams] = None,
+        time_end: Optional[int] = None,
+        plot_limits: Optional[List[float]] = None,
+        width: int = 1280,
+        dpi: int = 100,
+    ):
+        """
+        Constructor.
+
+        :param scenario: CommonRoad scenario.
+        :param planning_problem_set: Planning problems drawn in the background.
+        :param draw_params: Drawing parameters.
+        :param time_end: Last time step of the trajectories.
+        :param plot_limits: Visible area [x_min, x_max, y_min, y_max]; the area of the lanelets if none is given.
+        :param width: Width of the frames in pixels; the height follows from the aspect ratio of the plot limits.
+        :param dpi: Dots per inch of the figure.
+        """
+        self.plot_limits = (
+            list(plot_limits) if plot_limits is not None else scenario_extent(scenario)
+        )
+        x_min, x_max, y_min, y_max = self.plot_limits
+        # video encoders require an even number of pixels in both dimensions
+        width = 2 * max(1, round(width / 2))
+        height = 2 * max(1, round(width * (y_max - y_min) / (x_max - x_min) / 2))
+
+        self.figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_axes((0.0, 0.0, 1.0, 1.0))
+        self.animation = ScenarioAnimation(
+            scenario, MPRenderer(ax=self.ax), draw_params, planning_problem_set, time_end
+        )
+        self._background = None
+
+    def _render_background(self, time_step: int):
+        self.animation.draw_background(time_step)
+        self.ax.set_aspect("auto")
+        self.ax.set_xlim(self.plot_limits[:2])
+        self.ax.set_ylim(self.plot_limits[2:])
+        self.ax.set_axis_off()
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def render(self, time_step: int) -> np.ndarray:
+        """
+        Renders the frame of a time step.
+
+        :param time_step: Time step.
+        :return: RGB image.
+        """
+        if self._background is None:
+            self._render_background(time_step)
+        self.canvas.restore_region(self._background)
+        for artist in self.animation.draw_frame(time_step):
+            self.ax.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+# frame renderer of a worker process, which is created for the first frames the worker renders
+_frame_renderer: Optional[FrameRenderer] = None
+
+
+def _render_frames(
+    video: Tuple[Scenario, Optional[PlanningProblemSet], dict], time_steps: Sequence[int]
+) -> List[np.ndarray]:
+    """
+    Renders frames of a video.
+
+    :param video: Scenario, planning problems, and further arguments of the frame renderer.
+    :param time_steps: Time steps of the frames.
+    :return: RGB images.
+    """
+    global _frame_renderer
+
+    if _frame_renderer is None:
+        scenario, planning_problem_set, kwargs = video
+        _frame_renderer = FrameRenderer(scenario, planning_problem_set, **kwargs)
+    return [_frame_renderer.render(time_step) for time_step in time_steps]
+
+
+def render_frames(
+    scenario: Scenario,
+    time_steps: Sequence[int],
+    planning_problem_set: Optional[PlanningProblemSet] = None,
+    num_processes: int = 1,
+    **kwargs,
+) -> Iterator[np.ndarray]:
+    """
+    Renders frames of a scenario in order. Chunks of consecutive frames are distributed over a pool of forked
+    processes, see imap_forked.
+
+    :param scenario: CommonRoad scenario.
+    :param time_steps: Time steps of the frames.
+    :param planning_problem_set: Planning problems drawn in the background.
+    :param num_processes: Number of processes.
+    :param kwargs: Further arguments of the frame renderer, e.g., the drawing parameters or the width.
+    :return: RGB images.
+    """
+    global _frame_renderer
+
+    chunks = [
+        time_steps[i : i + FRAMES_PER_TASK] for i in range(0, len(time_steps), FRAMES_PER_TASK)
+    ]
+    _frame_renderer = None
+    try:
+        video = (scenario, planning_problem_set, kwargs)
+        for frames in imap_forked(_render_frames, video, chunks, num_processes):
+            yield from frames
+    finally:
+        _frame_renderer = None
+
+
+def _write_gif(frames: Iterator[np.ndarray], file_path: Path, fps: float):
+    """
+    Encodes frames as GIF with an adaptive palette per frame.
+
+    :param frames: RGB images.
+    :param file_path: Path of the GIF.
+    :param fps: Frames per second.
+    """
+    from PIL import Image
+
+    images = [
+        Image.fromarray(frame).convert("P", palette=Image.Palette.ADAPTIVE) for frame in frames
+    ]
+    images[0].save(
+        file_path,
+        save_all=True,
+        append_images=images[1:],
+        duration=max(1, round(1000 / fps)),
+        loop=0,
+    )
+
+
+def _write_ffmpeg(frames: Iterator[np.ndarray], file_path: Path, fps: float):
+    """
+    Encodes frames with ffmpeg, which receives the raw frames through a pipe.
+
+    :param frames: RGB images.
+    :param file_path: Path of the video; the container is derived from the suffix.
+    :param fps: Frames per second.
+    """
+    executable = shutil.which(mpl.rcParams["animation.ffmpeg_path"])
+    if executable is None:
+        raise RuntimeError(
+            f"ffmpeg is required to export {file_path.suffix} videos, but it was not found. "
+            "Install ffmpeg or export a GIF."
+        )
+    first = next(frames)
+    height, width = first.shape[:2]
+    codec = ["-vcodec", "libx264", "-pix_fmt", "yuv420p"] if file_path.suffix == ".mp4" else []
+    command = [
+        executable,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+        *codec,
+        str(file_path),
+    ]
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+        for frame in chain([first], frames):
+            process.stdin.write(frame.tobytes())
+        process.stdin.close()
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed to encode {file_path}.")
+
+
+def save_scenario_video(
+    scenario: Scenario,
+    file_path: Union[str, Path],
+    planning_problem_set: Optional[PlanningProblemSet] = None,
+    draw_params: Optional[MPDrawParams] = None,
+    time_begin: int = 0,
+    time_end: Optional[int] = None,
+    plot_limits: Optional[List[float]] = None,
+    width: int = 1280,
+    dpi: int = 100,
+    fps: Optional[float] = None,
+    num_processes: int = 1,
+) -> Path:
+    """
+    Exports a video of a scenario without a GUI. The frames are rendered with the Agg backend, optionally in
+    parallel worker processes, and encoded as MP4 or AVI with ffmpeg or as GIF with Pillow.
+
+    :param scenario: CommonRoad scenario.
+    :param file_path: Path of the video; the suffix .mp4 is appended if the suffix is not supported.
+    :param planning_problem_set: Planning problems drawn in the background.
+    :param draw_params: Drawing parameters.
+    :param time_begin: First time step.
+    :param time_end: Last time step; the final time step of the scenario if none is given.
+    :param plot_limits: Visible area [x_min, x_max, y_min, y_max]; the area of the lanelets if none is given.
+    :param width: Width of the video in pixels.
+    :param dpi: Dots per inch of the frames.
+    :param fps: Frames per second; the real-time frame rate of the scenario if none is given.
+    :param num_processes: Number of processes rendering frames.
+    :return: Path of the video.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix not in VIDEO_FORMATS:
+        file_path = file_path.with_name(file_path.name + ".mp4")
+    if time_end is None:
+        time_end = final_time_step(scenario)
+    if fps is None:
+        fps = max(1.0, 1.0 / scenario.dt)
+    assert (
+        time_begin <= time_end
+    ), f"time_begin={time_begin} needs to be smaller than time_end={time_end}."
+
+    frames = render_frames(
+        scenario,
+        list(range(time_begin, time_end + 1)),
+        planning_problem_set,
+        num_processes,
+        draw_params=draw_params,
+        time_end=time_end,
+        plot_limits=plot_limits,
+        width=width,
+        dpi=dpi,
+    )
+    try:
+        if file_path.suffix == ".gif":
+            _write_gif(frames, file_path, fps)
+        else:
+            _write_ffmpeg(frames, file_path, fps)
+    finally:
+        frames.close()
+    return file_path
@@ -0,0 +1,252 @@
+import io
+from typing import Iterable, List, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+import numpy as np
+from commonroad.common.util import Path_T
+from shapely.geometry import Polygon, box
+
+BoundingBox = Tuple[float, float, float, float]
+
+OBSTACLE_TAGS = {
+    "obstacle",
+    "staticObstacle",
+    "dynamicObstacle",
+    "environmentObstacle",
+    "phantomObstacle",
+}
+
+# children of an intersection incoming which reference lanelets
+INCOMING_LANELET_TAGS = {
+    "incomingLanelet",
+    "successorsRight",
+    "successorsStraight",
+    "successorsLeft",
+    "outgoingRight",
+    "outgoingStraight",
+    "outgoingLeft",
+}
+
+
+class ScenarioFilter:
+    """
+    Selects the elements of a CommonRoad XML file which intersect a bounding box or whose IDs are given.
+    The lanelets, obstacles and planning problems are selected while the file is streamed, so elements
+    outside the window are discarded as soon as they are parsed. Traffic signs, traffic lights and
+    intersections referenced by the selected lanelets are kept and references to discarded elements
+    are removed.
+    """
+
+    def __init__(
+        self,
+        bounding_box: Optional[BoundingBox] = None,
+        element_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        :param bounding_box: Window (x_min, y_min, x_max, y_max) the kept elements intersect.
+        :param element_ids: IDs of elements which are kept independent of their position.
+        """
+        if bounding_box is None and element_ids is None:
+            raise ValueError(
+                "ScenarioFilter: either a bounding box or element IDs must be provided."
+            )
+        self.bounding_box = bounding_box
+        self.element_ids = set(element_ids) if element_ids is not None else set()
+        self._window = box(*bounding_box) if bounding_box is not None else None
+
+    def filter(self, filename: Path_T) -> ElementTree.Element:
+        """
+        Streams a CommonRoad XML file and returns its root element containing only the kept elements.
+
+        :param filename: Path of the file or its content.
+        :return: Root element of the filtered file.
+        """
+        source = io.BytesIO(filename) if isinstance(filename, bytes) else filename
+        root = None
+        depth = 0
+        for event, element in ElementTree.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            # signs, lights and intersections depend on the kept lanelets and are filtered afterwards
+            if depth == 1 and not self._select(element):
+                root.remove(element)
+
+        lanelet_ids = {int(lanelet.get("id")) for lanelet in root.findall("lanelet")}
+        for lanelet in root.findall("lanelet"):
+            _truncate_lanelet(lanelet, lanelet_ids)
+        self._filter_traffic_elements(root, "trafficSign", "trafficSignRef")
+        self._filter_traffic_elements(root, "trafficLight", "trafficLightRef")
+        for intersection in root.findall("intersection"):
+            if not self._keep_intersection(intersection, lanelet_ids):
+                root.remove(intersection)
+        for planning_problem in root.findall("planningProblem"):
+            if not _goal_lanelets(planning_problem) <= lanelet_ids:
+                root.remove(planning_problem)
+        return root
+
+    def _selected_id(self, element: ElementTree.Element) -> bool:
+        return element.get("id") is not None and int(element.get("id")) in self.element_ids
+
+    def _select(self, element: ElementTree.Element) -> bool:
+        """
+        Decides whether a child of the root element is kept after it was parsed.
+
+        :param element: Child of the root element.
+        :return: Boolean indicating whether the element is kept.
+        """
+        if element.tag == "lanelet":
+            return self._selected_id(element) or self._lanelet_in_window(element)
+        if element.tag in OBSTACLE_TAGS:
+            return self._selected_id(element) or self._obstacle_in_window(element)
+        if element.tag == "planningProblem":
+            return self._selected_id(element) or self._points_in_window(
+                _coordinates([element.find("initialState")])
+            )
+        return True
+
+    def _points_in_window(self, points: np.ndarray, margin: float = 0.0) -> bool:
+        if self.bounding_box is None or len(points) == 0:
+            return False
+        x_min, y_min, x_max, y_max = self.bounding_box
+        inside = (
+            (points[:, 0] >= x_min - margin)
+            & (points[:, 0] <= x_max + margin)
+            & (points[:, 1] >= y_min - margin)
+            & (points[:, 1] <= y_max + margin)
+        )
+        return bool(inside.any())
+
+    def _lanelet_in_window(self, lanelet: ElementTree.Element) -> bool:
+        if self._window is None:
+            return False
+        left = _coordinates([lanelet.find("leftBound")])
+        right = _coordinates([lanelet.find("rightBound")])
+        if self._points_in_window(left) or self._points_in_window(right):
+            return True
+        # the window can lie between the vertices or completely inside of the lanelet
+        polygon = Polygon(np.concatenate((left, right[::-1])))
+        if not polygon.is_valid:
+            polygon = polygon.buffer(0)
+        return polygon.intersects(self._window)
+
+    def _obstacle_in_window(self, obstacle: ElementTree.Element) -> bool:
+        shape = obstacle.find("shape")
+        if obstacle.tag == "environmentObstacle":
+            return self._points_in_window(_coordinates([shape]), _shape_radius(shape, local=False))
+        # the shape of static and dynamic obstacles is given relative to their states
+        occupancies = obstacle.find("occupancySet")
+        margin = 0.0 if shape is None else _shape_radius(shape)
+        if occupancies is not None:
+            margin = max(margin, _shape_radius(occupancies, local=False))
+        geometries = [obstacle.find("initialState"), obstacle.find("trajectory"), occupancies]
+        return self._points_in_window(_coordinates(geometries), margin)
+
+    def _filter_traffic_elements(self, root: ElementTree.Element, tag: str, reference_tag: str):
+        """
+        Removes the traffic signs or lights which are neither referenced by a kept lanelet nor selected.
+
+        :param root: Root element of the filtered file.
+        :param tag: Tag of the traffic elements.
+        :param reference_tag: Tag of the references from lanelets to the traffic elements.
+        """
+        referenced = {
+            int(reference.get("ref"))
+            for lanelet in root.findall("lanelet")
+            for reference in lanelet.iter(reference_tag)
+        }
+        for element in root.findall(tag):
+            if int(element.get("id")) in referenced or self._selected_id(element):
+                continue
+            if self._points_in_window(_coordinates([element.find("position")])):
+                continue
+            root.remove(element)
+
+    def _keep_intersection(self, intersection: ElementTree.Element, lanelet_ids: Set[int]) -> bool:
+        """
+        Removes the references of an intersection to discarded lanelets and incomings.
+
+        :param intersection: Intersection element.
+        :param lanelet_ids: IDs of the kept lanelets.
+        :return: Boolean indicating whether the intersection is kept.
+        """
+        for incoming in intersection.findall("incoming"):
+            _remove_references(incoming, INCOMING_LANELET_TAGS, lanelet_ids)
+            if incoming.find("incomingLanelet") is None:
+                intersection.remove(incoming)
+        incoming_ids = {int(incoming.get("id")) for incoming in intersection.findall("incoming")}
+        for incoming in intersection.findall("incoming"):
+            _remove_references(incoming, {"isLeftOf"}, incoming_ids)
+        for crossing in intersection.findall("crossing"):
+            _remove_references(crossing, {"crossingLanelet"}, lanelet_ids)
+            if len(crossing) == 0:
+                intersection.remove(crossing)
+        return len(incoming_ids) > 0 or self._selected_id(intersection)
+
+
+def _coordinates(elements: List[Optional[ElementTree.Element]]) -> np.ndarray:
+    """
+    Collects the points and shape centers below the given elements.
+
+    :param elements: Elements to search; missing elements are skipped.
+    :return: Array of the x- and y-coordinates.
+    """
+    coordinates = [
+        (float(point.findtext("x")), float(point.findtext("y")))
+        for element in elements
+        if element is not None
+        for point in element.iter()
+        if point.tag in ("point", "center")
+    ]
+    return np.array(coordinates, dtype=float).reshape(-1, 2)
+
+
+def _shape_radius(shape: ElementTree.Element, local: bool = True) -> float:
+    """
+    Computes an upper bound for the distance of a shape's outline to its reference point.
+
+    :param shape: Element containing the shapes.
+    :param local: Boolean indicating whether polygons are given relative to the reference point.
+        Otherwise, their vertices are already part of the collected coordinates.
+    :return: Radius of the shape.
+    """
+    radius = 0.0
+    for rectangle in shape.iter("rectangle"):
+        length, width = float(rectangle.findtext("length")), float(rectangle.findtext("width"))
+        radius = max(radius, np.hypot(length, width) / 2)
+    for circle in shape.iter("circle"):
+        radius = max(radius, float(circle.findtext("radius")))
+    if local:
+        for polygon in shape.iter("polygon"):
+            radius = max(radius, float(np.max(np.linalg.norm(_coordinates([polygon]), axis=1))))
+    return radius
+
+
+def _remove_references(element: ElementTree.Element, tags: Set[str], ids: Set[int]):
+    """
+    Removes the children of an element with the given tags which reference an ID not contained in ids.
+
+    :param element: Element whose references are truncated.
+    :param tags: Tags of the reference elements.
+    :param ids: IDs which may still be referenced.
+    """
+    for child in list(element):
+        if child.tag in tags and int(child.get("ref")) not in ids:
+            element.remove(child)
+
+
+def _truncate_lanelet(lanelet: ElementTree.Element, lanelet_ids: Set[int]):
+    _remove_references(
+        lanelet, {"predecessor", "successor", "adjacentLeft", "adjacentRight"}, lanelet_ids
+    )
+
+
+def _goal_lanelets(planning_problem: ElementTree.Element) -> Set[int]:
+    return {
+        int(lanelet.get("ref"))
+        for goal_state in planning_problem.findall("goalState")
+        for lanelet in goal_state.iter("lanelet")
+    }
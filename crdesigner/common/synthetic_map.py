@@ -0,0 +1,402 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from commonroad.scenario.intersection import Intersection
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork, LaneletType
+from commonroad.scenario.scenario import Scenario, ScenarioID
+from commonroad.scenario.traffic_light import TrafficLight
+from commonroad.scenario.traffic_sign import (
+    TrafficSign,
+    TrafficSignElement,
+    TrafficSignIDZamunda,
+)
+
+from crdesigner.ui.gui.utilities.map_creator import MapCreator
+
+# directions of the arms of an intersection; the index times pi/2 is the orientation of the arm
+EAST, NORTH, WEST, SOUTH = range(4)
+DIRECTIONS = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+
+# distance by which the start of a lanelet is moved to create a gap to its predecessor
+GAP_SIZE = 1.0
+# distance between two vertices of the lanelets of roads
+VERTEX_DISTANCE = 10.0
+
+# lanelets of a four-way and a three-way intersection created by the map creator
+FOUR_WAY_LANELETS = 20
+THREE_WAY_LANELETS = 12
+
+
+@dataclass
+class SyntheticMapConfig:
+    """
+    Parameters of a synthetic map. The intersections are placed on a grid and neighbouring intersections are
+    connected by straight roads. Intersections with three roads are three-way intersections, all others are
+    four-way intersections whose unused arms end without successor.
+    """
+
+    rows: int = 3  # rows of the grid of intersections
+    columns: int = 3  # columns of the grid of intersections
+    seed: int = 0  # seed of the random number generator; maps with the same config are identical
+    # probability that two neighbouring intersections are connected; values below 1 create a random city
+    road_probability: float = 1.0
+    # number of lanelets of each road between two intersections; controls the density of intersections
+    road_segments: int = 1
+    segment_length: float = 40.0
+    lanes_per_direction: int = 1  # additional lanes only exist between the intersections
+    lane_width: float = 3.0
+    incoming_length: float = 30.0
+    diameter_crossing: float = 20.0
+    traffic_signs: bool = True
+    traffic_lights: bool = False
+    speed_limit: float = 13.89  # value of the speed limit signs at the start of the roads
+    # number of lanelets with injected defects
+    num_gaps: int = 0
+    num_flipped_boundaries: int = 0
+    num_dangling_references: int = 0
+
+    @property
+    def intersection_size(self) -> float:
+        """Distance between the ends of opposite arms of an intersection."""
+        return 2 * self.incoming_length + self.diameter_crossing
+
+    @property
+    def pitch(self) -> float:
+        """Distance between the centers of neighbouring intersections."""
+        return self.intersection_size + self.road_segments * self.segment_length
+
+    def num_lanelets(self) -> int:
+        """
+        Computes the number of lanelets of a map with all roads, i.e., a road probability of 1.
+
+        :return: Number of lanelets.
+        """
+        rows, columns = self.rows, self.columns
+        roads = rows * (columns - 1) + columns * (rows - 1)
+        # the intersections at the border of the grid without the corners have three roads
+        three_way = 0 if rows < 2 or columns < 2 else 2 * max(rows - 2, 0) + 2 * max(columns - 2, 0)
+        four_way = rows * columns - three_way
+        return (
+            four_way * FOUR_WAY_LANELETS
+            + three_way * THREE_WAY_LANELETS
+            + roads * 2 * self.lanes_per_direction * self.road_segments
+        )
+
+    @classmethod
+    def for_lanelet_count(cls, num_lanelets: int, **kwargs) -> "SyntheticMapConfig":
+        """
+        Creates the config of the smallest square grid with at least the given number of lanelets.
+
+        :param num_lanelets: Minimum number of lanelets.
+        :param kwargs: Further parameters of the config.
+        :return: Config.
+        """
+        config = cls(rows=1, columns=1, **kwargs)
+        while config.num_lanelets() < num_lanelets:
+            config.rows += 1
+            config.columns += 1
+        return config
+
+
+class SyntheticMapGenerator:
+    """
+    Generates synthetic maps of arbitrary size from the building blocks of the map creator, e.g., for benchmarks.
+    The lanelets with injected defects are stored in the attribute defects.
+    """
+
+    def __init__(self, config: Optional[SyntheticMapConfig] = None):
+        """
+        Constructor.
+
+        :param config: Parameters of the map.
+        """
+        self._config = config if config is not None else SyntheticMapConfig()
+        self._rng = np.random.default_rng(self._config.seed)
+        self._scenario: Optional[Scenario] = None
+        self._lanelets: Dict[int, Lanelet] = {}
+        self._traffic_signs: List[TrafficSign] = []
+        self._traffic_lights: List[TrafficLight] = []
+        self._intersections: List[Intersection] = []
+        # incoming and outgoing lanelet of each arm of each intersection
+        self._arms: Dict[Tuple[int, int], Dict[int, Tuple[Lanelet, Lanelet]]] = {}
+        self.defects: Dict[str, List[int]] = {}
+
+    def generate(self) -> Scenario:
+        """
+        Generates the map.
+
+        :return: Scenario containing the map.
+        """
+        self._scenario = Scenario(
+            dt=0.1, scenario_id=ScenarioID(country_id="ZAM", map_name="Synthetic", map_id=1)
+        )
+        self._lanelets.clear()
+        self._traffic_signs.clear()
+        self._traffic_lights.clear()
+        self._intersections.clear()
+        self._arms.clear()
+
+        roads = self._sample_roads()
+        roads_of_tile: Dict[Tuple[int, int], Set[int]] = {}
+        for tile, direction in roads:
+            neighbour = self._neighbour(tile, direction)
+            roads_of_tile.setdefault(tile, set()).add(direction)
+            roads_of_tile.setdefault(neighbour, set()).add((direction + 2) % 4)
+
+        for tile in sorted(roads_of_tile):
+            self._create_intersection(tile, roads_of_tile[tile])
+        for tile, direction in roads:
+            self._create_road(tile, direction)
+
+        self._inject_defects()
+
+        # the objects are added at the end, since generating IDs is linear in the number of used IDs and adding
+        # lanelets one by one rebuilds the STRtree of the network for each lanelet
+        network = LaneletNetwork.create_from_lanelet_list(
+            list(self._lanelets.values()), cleanup_ids=False
+        )
+        for traffic_sign in self._traffic_signs:
+            network.add_traffic_sign(traffic_sign, set())
+        for traffic_light in self._traffic_lights:
+            network.add_traffic_light(traffic_light, set())
+        for intersection in self._intersections:
+            network.add_intersection(intersection)
+        self._scenario.add_objects(network)
+        return self._scenario
+
+    @staticmethod
+    def _neighbour(tile: Tuple[int, int], direction: int) -> Tuple[int, int]:
+        row, column = tile
+        return (row, column + 1) if direction == EAST else (row + 1, column)
+
+    def _sample_roads(self) -> List[Tuple[int, int]]:
+        """
+        Samples the roads of the map. Each road is given by the tile of the intersection at its start and the
+        direction towards the intersection at its end, which is either east or north.
+
+        :return: Roads.
+        """
+        config = self._config
+        roads = []
+        for row in range(config.rows):
+            for column in range(config.columns):
+                for direction, exists in (
+                    (EAST, column + 1 < config.columns),
+                    (NORTH, row + 1 < config.rows),
+                ):
+                    if exists and self._rng.random() < config.road_probability:
+                        roads.append(((row, column), direction))
+        return roads
+
+    def _create_intersection(self, tile: Tuple[int, int], directions: Set[int]):
+        """
+        Creates the intersection of a tile and stores the lanelets of its arms.
+
+        :param tile: Row and column of the tile.
+        :param directions: Directions of the roads connected to the intersection.
+        """
+        config = self._config
+        args = (
+            config.lane_width,
+            config.diameter_crossing,
+            config.incoming_length,
+            self._scenario,
+            config.traffic_signs,
+            config.traffic_lights,
+            TrafficSignIDZamunda,
+        )
+        if len(directions) == 3:
+            intersection, signs, lights, lanelets = MapCreator.create_three_way_intersection(*args)
+            # the three-way intersection has no arm towards the east
+            missing = next(d for d in range(4) if d not in directions)
+            angle = missing * np.pi / 2
+        else:
+            intersection, signs, lights, lanelets = MapCreator.create_four_way_intersection(*args)
+            angle = 0.0
+
+        # the intersection is created around the center of its tile
+        local_center = np.array(
+            [config.incoming_length + config.diameter_crossing / 2, config.lane_width / 2]
+        )
+        center = np.array(tile[::-1], dtype=float) * config.pitch
+        translation = _rotate(center, -angle) - local_center
+        for lanelet in lanelets:
+            lanelet.translate_rotate(translation, angle)
+            self._lanelets[lanelet.lanelet_id] = lanelet
+        for element in signs + lights:
+            element.translate_rotate(translation, angle)
+        self._traffic_signs.extend(signs)
+        self._traffic_lights.extend(lights)
+        self._intersections.append(intersection)
+
+        # the arms are identified by the direction of their outer end from the center of the intersection
+        arms = self._arms.setdefault(tile, {})
+        incomings = [
+            self._lanelets[lanelet_id]
+            for incoming in intersection.incomings
+            for lanelet_id in incoming.incoming_lanelets
+        ]
+        for incoming in incomings:
+            direction = int(np.argmax(DIRECTIONS @ (incoming.center_vertices[0] - center)))
+            outgoing = self._lanelets[incoming.adj_left]
+            arms[direction] = (incoming, outgoing)
+
+    def _create_road(self, tile: Tuple[int, int], direction: int):
+        """
+        Creates the road from the intersection of a tile to the neighbouring intersection.
+
+        :param tile: Row and column of the tile at the start of the road.
+        :param direction: Direction of the road, i.e., east or north.
+        """
+        config = self._config
+        start_incoming, start_outgoing = self._arms[tile][direction]
+        end_arms = self._arms[self._neighbour(tile, direction)]
+        end_incoming, end_outgoing = end_arms[(direction + 2) % 4]
+        if config.road_segments == 0:
+            MapCreator.set_predecessor_successor_relation(start_outgoing, end_incoming)
+            MapCreator.set_predecessor_successor_relation(end_outgoing, start_incoming)
+            return
+
+        angle = direction * np.pi / 2
+        origin = _rotate(start_outgoing.center_vertices[-1], -angle)
+        num_vertices = max(2, math.ceil(config.segment_length / VERTEX_DISTANCE) + 1)
+        lane_types = {LaneletType.URBAN}
+        forward: List[List[Lanelet]] = []
+        backward: List[List[Lanelet]] = []
+        for segment in range(config.road_segments):
+            forward_lanes = [
+                MapCreator.create_straight(
+                    config.lane_width,
+                    config.segment_length,
+                    num_vertices,
+                    self._scenario.generate_object_id(),
+                    lane_types,
+                )
+            ]
+            backward_lanes = [
+                MapCreator.create_adjacent_lanelet(
+                    True,
+                    forward_lanes[0],
+                    self._scenario.generate_object_id(),
+                    False,
+                    config.lane_width,
+                    lane_types,
+                )
+            ]
+            for lanes in (forward_lanes, backward_lanes):
+                for _ in range(config.lanes_per_direction - 1):
+                    lanes.append(
+                        MapCreator.create_adjacent_lanelet(
+                            False,
+                            lanes[-1],
+                            self._scenario.generate_object_id(),
+                            True,
+                            config.lane_width,
+                            lane_types,
+                        )
+                    )
+            translation = origin + np.array([segment * config.segment_length, 0.0])
+            for lanelet in forward_lanes + backward_lanes:
+                lanelet.translate_rotate(translation, angle)
+                self._lanelets[lanelet.lanelet_id] = lanelet
+
+            if segment > 0:
+                for predecessor, successor in zip(forward[-1], forward_lanes):
+                    MapCreator.set_predecessor_successor_relation(predecessor, successor)
+                for predecessor, successor in zip(backward_lanes, backward[-1]):
+                    MapCreator.set_predecessor_successor_relation(predecessor, successor)
+            forward.append(forward_lanes)
+            backward.append(backward_lanes)
+
+        MapCreator.set_predecessor_successor_relation(start_outgoing, forward[0][0])
+        MapCreator.set_predecessor_successor_relation(forward[-1][0], end_incoming)
+        MapCreator.set_predecessor_successor_relation(end_outgoing, backward[-1][0])
+        MapCreator.set_predecessor_successor_relation(backward[0][0], start_incoming)
+
+        if config.traffic_signs:
+            for lanes in (forward[0], backward[-1]):
+                self._add_speed_limit(lanes)
+
+    def _add_speed_limit(self, lanes: List[Lanelet]):
+        """
+        Adds a speed limit sign at the start of the lanes of a road.
+
+        :param lanes: Lanelets of the same direction.
+        """
+        traffic_sign = TrafficSign(
+            self._scenario.generate_object_id(),
+            [TrafficSignElement(TrafficSignIDZamunda.MAX_SPEED, [str(self._config.speed_limit)])],
+            {lanes[0].lanelet_id},
+            lanes[-1].right_vertices[0],
+        )
+        for lanelet in lanes:
+            lanelet.traffic_signs.add(traffic_sign.traffic_sign_id)
+        self._traffic_signs.append(traffic_sign)
+
+    def _inject_defects(self):
+        """Injects the configured defects into randomly selected lanelets. Each lanelet has at most one defect."""
+        config = self._config
+        candidates = self._rng.permutation(sorted(self._lanelets))
+        with_predecessor = [
+            lanelet_id
+            for lanelet_id in candidates
+            if len(self._lanelets[lanelet_id].predecessor) > 0
+        ]
+        gaps = with_predecessor[: config.num_gaps]
+        others = [lanelet_id for lanelet_id in candidates if lanelet_id not in set(gaps)]
+        flipped = others[: config.num_flipped_boundaries]
+        num_flipped_or_dangling = config.num_flipped_boundaries + config.num_dangling_references
+        dangling = others[config.num_flipped_boundaries : num_flipped_or_dangling]
+
+        for lanelet_id in gaps:
+            lanelet = self._lanelets[lanelet_id]
+            direction = lanelet.center_vertices[1] - lanelet.center_vertices[0]
+            offset = direction / np.linalg.norm(direction) * GAP_SIZE
+            for vertices in (
+                lanelet.left_vertices,
+                lanelet.center_vertices,
+                lanelet.right_vertices,
+            ):
+                vertices[0] += offset
+        for lanelet_id in flipped:
+            lanelet = self._lanelets[lanelet_id]
+            lanelet.left_vertices, lanelet.right_vertices = (
+                lanelet.right_vertices,
+                lanelet.left_vertices,
+            )
+        for lanelet_id in dangling:
+            self._lanelets[lanelet_id].add_successor(self._scenario.generate_object_id())
+
+        for lanelet_id in gaps + flipped:
+            # recreates the polygon of the lanelet from the modified vertices
+            self._lanelets[lanelet_id].translate_rotate(np.zeros(2), 0.0)
+
+        self.defects = {
+            "gaps": sorted(int(lanelet_id) for lanelet_id in gaps),
+            "flipped_boundaries": sorted(int(lanelet_id) for lanelet_id in flipped),
+            "dangling_references": sorted(int(lanelet_id) for lanelet_id in dangling),
+        }
+
+
+def _rotate(point: np.ndarray, angle: float) -> np.ndarray:
+    """
+    Rotates a point around the origin.
+
+    :param point: Point.
+    :param angle: Counter-clockwise angle in radian.
+    :return: Rotated point.
+    """
+    cos, sin = np.cos(angle), np.sin(angle)
+    return np.array([cos * point[0] - sin * point[1], sin * point[0] + cos * point[1]])
+
+
+def generate_synthetic_map(config: Optional[SyntheticMapConfig] = None) -> Scenario:
+    """
+    Generates a synthetic map.
+
+    :param config: Parameters of the map.
+    :return: Scenario containing the map.
+    """
+    return SyntheticMapGenerator(config).generate()
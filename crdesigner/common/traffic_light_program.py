@@ -0,0 +1,313 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+import numpy as np
+from commonroad.scenario.intersection import Intersection, IntersectionIncomingElement
+from commonroad.scenario.lanelet import LaneletNetwork
+from commonroad.scenario.traffic_light import (
+    TrafficLight,
+    TrafficLightCycle,
+    TrafficLightCycleElement,
+    TrafficLightDirection,
+    TrafficLightState,
+)
+
+# minimal area of the overlap of two movements in square meter so that they conflict; adjacent lanelets only touch
+CONFLICT_AREA = 0.1
+
+
+@dataclass
+class TrafficLightTimings:
+    """Durations of the phases of generated traffic lights in time steps."""
+
+    green: int = 300
+    yellow: int = 30
+    red_yellow: int = 10
+    # time between the end of the yellow phase of one signal group and the start of the next signal group
+    all_red: int = 20
+    # green of the protected left turn phases; left turns yield to the opposing traffic if 0
+    left_green: int = 0
+    time_offset: int = 0
+    # minimal duration of the red phases; the all-red time is extended if the other signal groups are shorter
+    min_red: int = 0
+
+
+@dataclass
+class _Phase:
+    """Slot of the cycle in which one signal group has green."""
+
+    green: int
+    incomings: List[IntersectionIncomingElement]
+
+
+def find_intersection(network: LaneletNetwork, lanelet_id: int) -> Optional[Intersection]:
+    """
+    Finds the intersection of a lanelet. The lanelet is either an incoming lanelet, a lanelet within the
+    intersection, or a predecessor of an incoming lanelet.
+
+    :param network: Lanelet network.
+    :param lanelet_id: ID of lanelet.
+    :return: Intersection or None if the lanelet does not belong to an intersection.
+    """
+    lanelet = network.find_lanelet_by_id(lanelet_id)
+    candidates = {lanelet_id} | (set(lanelet.successor) if lanelet is not None else set())
+    for intersection in network.intersections:
+        for incoming in intersection.incomings:
+            movements = (
+                incoming.successors_right | incoming.successors_straight | incoming.successors_left
+            )
+            if candidates & incoming.incoming_lanelets or lanelet_id in movements:
+                return intersection
+    return None
+
+
+def _ordered_incomings(intersection: Intersection) -> List[IntersectionIncomingElement]:
+    """
+    Orders the incomings of an intersection counter-clockwise along their left_of relation, beginning with an
+    incoming which is not left of any other incoming.
+
+    :param intersection: Intersection.
+    :return: Incomings.
+    """
+    incomings = {incoming.incoming_id: incoming for incoming in intersection.incomings}
+    left_of_ids = {incoming.left_of for incoming in intersection.incomings}
+    incoming = next(
+        (
+            incoming
+            for incoming in intersection.incomings
+            if incoming.incoming_id not in left_of_ids and incoming.left_of is not None
+        ),
+        intersection.incomings[0],
+    )
+    ordered = []
+    while incoming is not None and incoming not in ordered:
+        ordered.append(incoming)
+        incoming = incomings.get(incoming.left_of)
+    ordered += [incoming for incoming in intersection.incomings if incoming not in ordered]
+    return ordered
+
+
+class _ConflictChecker:
+    """Checks whether the movements of two incomings cross each other."""
+
+    def __init__(self, network: LaneletNetwork):
+        self._network = network
+        self._polygons = {}
+
+    def _polygon(self, lanelet_id: int):
+        if lanelet_id not in self._polygons:
+            lanelet = self._network.find_lanelet_by_id(lanelet_id)
+            self._polygons[lanelet_id] = (
+                lanelet.polygon.shapely_object if lanelet is not None else None
+            )
+        return self._polygons[lanelet_id]
+
+    @staticmethod
+    def main_movements(incoming: IntersectionIncomingElement) -> Set[int]:
+        """
+        Returns the movements which have green in the phase of the incoming. Left turns yield to the opposing
+        traffic, so that only the straight movements determine the conflicts of incomings with straight movements.
+
+        :param incoming: Incoming.
+        :return: IDs of lanelets of the movements.
+        """
+        if incoming.successors_straight:
+            return set(incoming.successors_straight)
+        return incoming.successors_right | incoming.successors_left
+
+    def conflict(self, movements: Set[int], other_movements: Set[int]) -> bool:
+        """
+        Checks whether two sets of movements overlap.
+
+        :param movements: IDs of lanelets of the movements.
+        :param other_movements: IDs of lanelets of the other movements.
+        :return: Boolean indicating whether the movements conflict.
+        """
+        for lanelet_id in movements:
+            polygon = self._polygon(lanelet_id)
+            for other_id in other_movements:
+                other = self._polygon(other_id)
+                if lanelet_id == other_id or polygon is None or other is None:
+                    continue
+                if polygon.intersects(other) and polygon.intersection(other).area > CONFLICT_AREA:
+                    return True
+        return False
+
+
+def _create_cycle(
+    timings: TrafficLightTimings, green: int, start: int, cycle_length: int
+) -> TrafficLightCycle:
+    """
+    Creates the cycle of a traffic light which has green in one slot of the cycle.
+
+    :param timings: Timings.
+    :param green: Duration of the green phase.
+    :param start: Start of the slot within the cycle.
+    :param cycle_length: Duration of the cycle.
+    :return: Traffic light cycle.
+    """
+    slot = timings.red_yellow + green + timings.yellow + timings.all_red
+    red = cycle_length - slot + timings.all_red
+    elements = [
+        TrafficLightCycleElement(state, duration)
+        for state, duration in (
+            (TrafficLightState.RED, red),
+            (TrafficLightState.RED_YELLOW, timings.red_yellow),
+            (TrafficLightState.GREEN, green),
+            (TrafficLightState.YELLOW, timings.yellow),
+        )
+        if duration > 0
+    ]
+    # the red phase begins at the end of the slot, so that red-yellow begins at the start of the slot
+    return TrafficLightCycle(
+        elements, time_offset=(timings.time_offset + start + slot - timings.all_red) % cycle_length
+    )
+
+
+def create_traffic_light_program(
+    network: LaneletNetwork,
+    intersection: Intersection,
+    timings: TrafficLightTimings = TrafficLightTimings(),
+    id_generator: Optional[Callable[[], int]] = None,
+) -> List[TrafficLight]:
+    """
+    Creates phased traffic lights for all incomings of an intersection and replaces the traffic lights referenced by
+    the incoming lanelets. Incomings whose main movements do not cross each other, e.g., opposite incomings of a
+    four-way intersection, form a signal group with a common green phase. The signal groups follow each other in the
+    order of the left_of relation of the incomings. If a protected left turn phase is configured, the left turns of a
+    signal group get their own slot before the green phase of the group.
+
+    :param network: Lanelet network containing the intersection.
+    :param intersection: Intersection.
+    :param timings: Timings of the phases.
+    :param id_generator: Generator of unused IDs; the IDs following the maximum ID of the network are used if none.
+    :return: Created traffic lights, which are added to the network.
+    """
+    if id_generator is None:
+        next_id = max_network_id(network) + 1
+
+        def id_generator() -> int:
+            nonlocal next_id
+            next_id += 1
+            return next_id - 1
+
+    checker = _ConflictChecker(network)
+
+    # signal groups of incomings without conflicting main movements
+    groups: List[List[IntersectionIncomingElement]] = []
+    for incoming in _ordered_incomings(intersection):
+        movements = checker.main_movements(incoming)
+        group = next(
+            (
+                group
+                for group in groups
+                if not any(
+                    checker.conflict(movements, checker.main_movements(other)) for other in group
+                )
+            ),
+            None,
+        )
+        if group is None:
+            groups.append([incoming])
+        else:
+            group.append(incoming)
+
+    protected_left = timings.left_green > 0
+    phases: List[_Phase] = []
+    left_phases: Dict[int, _Phase] = {}
+    main_phases: Dict[int, _Phase] = {}
+    for group in groups:
+        left_turning = [incoming for incoming in group if incoming.successors_left]
+        if protected_left and left_turning:
+            phases.append(_Phase(timings.left_green, left_turning))
+            left_phases.update({incoming.incoming_id: phases[-1] for incoming in left_turning})
+        phases.append(_Phase(timings.green, group))
+        main_phases.update({incoming.incoming_id: phases[-1] for incoming in group})
+
+    slots = [
+        timings.red_yellow + phase.green + timings.yellow + timings.all_red for phase in phases
+    ]
+    shortest_red = sum(slots) - max(slots, default=0) + timings.all_red
+    if phases and shortest_red < timings.min_red:
+        # extending the all-red time of every slot extends every red phase by the number of slots
+        extension = -(-(timings.min_red - shortest_red) // len(phases))
+        timings = dataclasses.replace(timings, all_red=timings.all_red + extension)
+
+    starts, cycle_length = {}, 0
+    for phase in phases:
+        starts[id(phase)] = cycle_length
+        cycle_length += timings.red_yellow + phase.green + timings.yellow + timings.all_red
+
+    # replace the existing traffic lights of the incomings
+    incoming_lanelets = [
+        network.find_lanelet_by_id(lanelet_id)
+        for incoming in intersection.incomings
+        for lanelet_id in incoming.incoming_lanelets
+    ]
+    for traffic_light_id in {
+        traffic_light_id
+        for lanelet in incoming_lanelets
+        if lanelet is not None
+        for traffic_light_id in lanelet.traffic_lights
+    }:
+        network.remove_traffic_light(traffic_light_id)
+
+    traffic_lights = []
+    for incoming in intersection.incomings:
+        lanelets = [
+            network.find_lanelet_by_id(lanelet_id)
+            for lanelet_id in sorted(incoming.incoming_lanelets)
+        ]
+        lanelets = [lanelet for lanelet in lanelets if lanelet is not None]
+        if not lanelets:
+            continue
+        rightmost = next(
+            (
+                lanelet
+                for lanelet in lanelets
+                if lanelet.adj_right not in incoming.incoming_lanelets
+            ),
+            lanelets[0],
+        )
+        position = np.array(rightmost.right_vertices[-1])
+
+        if incoming.incoming_id in left_phases:
+            directions = [
+                (TrafficLightDirection.STRAIGHT_RIGHT, main_phases[incoming.incoming_id]),
+                (TrafficLightDirection.LEFT, left_phases[incoming.incoming_id]),
+            ]
+        else:
+            directions = [(TrafficLightDirection.ALL, main_phases[incoming.incoming_id])]
+
+        for direction, phase in directions:
+            traffic_light = TrafficLight(
+                traffic_light_id=id_generator(),
+                position=position,
+                traffic_light_cycle=_create_cycle(
+                    timings, phase.green, starts[id(phase)], cycle_length
+                ),
+                direction=direction,
+                active=True,
+            )
+            network.add_traffic_light(traffic_light, {lanelet.lanelet_id for lanelet in lanelets})
+            traffic_lights.append(traffic_light)
+
+    return traffic_lights
+
+
+def max_network_id(network: LaneletNetwork) -> int:
+    """
+    Computes the maximum ID of all elements of a lanelet network.
+
+    :param network: Lanelet network.
+    :return: Maximum ID.
+    """
+    ids = [lanelet.lanelet_id for lanelet in network.lanelets]
+    ids += [traffic_sign.traffic_sign_id for traffic_sign in network.traffic_signs]
+    ids += [traffic_light.traffic_light_id for traffic_light in network.traffic_lights]
+    for intersection in network.intersections:
+        ids.append(intersection.intersection_id)
+        ids += [incoming.incoming_id for incoming in intersection.incomings]
+    ids += [area.area_id for area in network.areas]
+    return max(ids, default=0)
@@ -440,6 +440,7 @@ class ConversionLanelet(Lanelet):
             mirror_interval=mirror_interval,
             adjacent_lanelet=adjacent_lanelet,
             precision=precision,
+            elevation=self.left_vertices.shape[-1] == 3,
         )
 
         self.left_vertices = lanelet.left_vertices
@@ -21,11 +21,18 @@ from crdesigner.map_conversion.common.utils import (
     generate_unique_id,
 )
 
+# attributes of a lanelet which reference other lanelets
+_REFERENCE_RELATIONS = ("predecessor", "successor", "adj_left", "adj_right")
+
 
 class ConversionLaneletNetwork(LaneletNetwork):
     """
     Add functions to LaneletNetwork which further enable it to modify its Lanelets.
     This class is being used in OpenDrive and Lanelet2 format conversions
+
+    Renaming and removing lanelets uses a reverse index from a lanelet ID to the (lanelet ID, relation) pairs
+    referencing it. The index is built on first use and afterwards maintained by the methods of this class.
+    It may contain outdated entries, which are skipped by checking the referencing lanelet.
     """
 
     def __init__(
@@ -41,6 +48,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
         self._config = config
         self._old_lanelet_ids = {}
         self._transformer = transformer
+        self._references: Optional[Dict[str, Set[Tuple[str, str]]]] = None
 
     def old_lanelet_ids(self) -> Dict[str, int]:
         """Get the old lanelet ids.
@@ -49,6 +57,69 @@ class ConversionLaneletNetwork(LaneletNetwork):
         """
         return self._old_lanelet_ids
 
+    def _reference_index(self) -> Dict[str, Set[Tuple[str, str]]]:
+        """
+        Returns the reverse reference index and builds it if it does not exist yet.
+
+        :return: Dict mapping a lanelet ID to the (lanelet ID, relation) pairs referencing it.
+        """
+        if self._references is None:
+            self._references = {}
+            for lanelet in self.lanelets:
+                self._index_references(lanelet)
+        return self._references
+
+    def _index_references(self, lanelet: ConversionLanelet, relations=_REFERENCE_RELATIONS):
+        """
+        Adds the references of a lanelet to the reverse reference index if the index exists.
+
+        :param lanelet: Lanelet whose references are added.
+        :param relations: Relations of the lanelet which are added.
+        """
+        if self._references is None:
+            return
+        for relation in relations:
+            referenced = getattr(lanelet, relation)
+            if relation in ("predecessor", "successor"):
+                for ref_id in referenced:
+                    self._references.setdefault(ref_id, set()).add((lanelet.lanelet_id, relation))
+            elif referenced is not None:
+                self._references.setdefault(referenced, set()).add((lanelet.lanelet_id, relation))
+
+    def _pop_references(self, lanelet_id: str) -> List[Tuple[ConversionLanelet, str]]:
+        """
+        Removes the references to a lanelet from the reverse reference index.
+
+        :param lanelet_id: ID of the referenced lanelet.
+        :return: Lanelets and their relations which currently reference the lanelet.
+        """
+        references = []
+        for ref_id, relation in self._reference_index().pop(lanelet_id, ()):
+            lanelet = self._lanelets.get(ref_id)
+            if lanelet is None:
+                continue
+            referenced = getattr(lanelet, relation)
+            if relation in ("predecessor", "successor"):
+                is_referenced = lanelet_id in referenced
+            else:
+                is_referenced = referenced == lanelet_id
+            if is_referenced:
+                references.append((lanelet, relation))
+        return references
+
+    def add_lanelet(self, lanelet: ConversionLanelet, rtree: bool = True) -> bool:
+        """
+        Adds a lanelet to the network and its references to the reverse reference index.
+
+        :param lanelet: The lanelet to add.
+        :param rtree: Boolean indicating whether rtree should be initialized.
+        :return: True if the lanelet has successfully been added to the network, false otherwise.
+        """
+        added = super().add_lanelet(lanelet, rtree)
+        if added:
+            self._index_references(lanelet)
+        return added
+
     def remove_lanelet(self, lanelet_id: str, remove_references: bool = False):
         """
         Remove a lanelets with the specific lanelet_id from the _lanelets dict.
@@ -58,16 +129,17 @@ class ConversionLaneletNetwork(LaneletNetwork):
         """
         del self._lanelets[lanelet_id]
         if remove_references:
-            for lanelet in self.lanelets:
-                lanelet.predecessor[:] = [
-                    pred for pred in lanelet.predecessor if pred != lanelet_id
-                ]
-
-                lanelet.successor[:] = [succ for succ in lanelet.successor if succ != lanelet_id]
-                if lanelet.adj_right == lanelet_id:
-                    lanelet.adj_right = None
-                if lanelet.adj_left == lanelet_id:
-                    lanelet.adj_left = None
+            for lanelet, relation in self._pop_references(lanelet_id):
+                if relation == "predecessor":
+                    lanelet.predecessor[:] = [
+                        pred for pred in lanelet.predecessor if pred != lanelet_id
+                    ]
+                elif relation == "successor":
+                    lanelet.successor[:] = [
+                        succ for succ in lanelet.successor if succ != lanelet_id
+                    ]
+                else:
+                    setattr(lanelet, relation, None)
 
     def find_lanelet_by_id(self, lanelet_id: int) -> ConversionLanelet:
         """
@@ -127,6 +199,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
                     str(lanelet.adj_right), self._old_lanelet_ids
                 )
             self.add_lanelet(lanelet)
+        # all references changed, the index is rebuilt on its next use
+        self._references = None
 
         new_lanelet_ids_assigned = {}
         for key in self._old_lanelet_ids.keys():
@@ -141,7 +215,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
         """
         self.delete_zero_width_parametric_lanes()
 
-        lanelet_ids = [x.lanelet_id for x in self.lanelets]
+        lanelet_ids = {x.lanelet_id for x in self.lanelets}
 
         for lanelet in self.lanelets:
             lanelet.predecessor[:] = [pred for pred in lanelet.predecessor if pred in lanelet_ids]
@@ -166,6 +240,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
                         else:
                             adj_right.adj_right = lanelet.adj_left
                             adj_right.adj_right_same_direction = not lanelet.adj_left_same_direction
+                        self._index_references(adj_right, ("adj_left", "adj_right"))
 
                 if lanelet.adj_left:
                     adj_left = self.find_lanelet_by_id(lanelet.adj_left)
@@ -176,6 +251,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
                         else:
                             adj_left.adj_left = lanelet.adj_right
                             adj_left.adj_left_same_direction = not lanelet.adj_right_same_direction
+                        self._index_references(adj_left, ("adj_left", "adj_right"))
 
                 self.remove_lanelet(lanelet.lanelet_id, remove_references=True)
 
@@ -185,21 +261,18 @@ class ConversionLaneletNetwork(LaneletNetwork):
         :param old_id: Old lanelet_id which has changed.
         :param new_id: New lanelet_id the old_id has changed into.
         """
-
-        for lanelet in self.lanelets:
-            lanelet.predecessor[:] = [
-                new_id if pred == old_id else pred for pred in lanelet.predecessor
-            ]
-
-            lanelet.successor[:] = [
-                new_id if succ == old_id else succ for succ in lanelet.successor
-            ]
-
-            if lanelet.adj_right == old_id:
-                lanelet.adj_right = new_id
-
-            if lanelet.adj_left == old_id:
-                lanelet.adj_left = new_id
+        for lanelet, relation in self._pop_references(old_id):
+            if relation == "predecessor":
+                lanelet.predecessor[:] = [
+                    new_id if pred == old_id else pred for pred in lanelet.predecessor
+                ]
+            elif relation == "successor":
+                lanelet.successor[:] = [
+                    new_id if succ == old_id else succ for succ in lanelet.successor
+                ]
+            else:
+                setattr(lanelet, relation, new_id)
+            self._references.setdefault(new_id, set()).add((lanelet.lanelet_id, relation))
 
     def concatenate_possible_lanelets(self) -> Dict[str, str]:
         """Iterate trough lanelets in network and concatenate possible lanelets together.
@@ -258,6 +331,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
             lanelet_1 = self.find_lanelet_by_id(pair[0])
             lanelet_2 = self.find_lanelet_by_id(pair[1])
             lanelet_1.concatenate(lanelet_2)
+            self._index_references(lanelet_1, ("successor",))
 
             self.remove_lanelet(pair[1])
 
@@ -333,6 +407,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
             lanelet.successor.append(successor_id)
             successor = self.find_lanelet_by_id(successor_id)
             successor.predecessor.append(lanelet.lanelet_id)
+            self._index_references(lanelet, ("successor",))
+            self._index_references(successor, ("predecessor",))
 
     def add_predecessors_to_lanelet(self, lanelet: ConversionLanelet, predecessor_ids: List[str]):
         """Add a predecessor to a lanelet, but add the lanelet also to the successor
@@ -345,6 +421,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
             lanelet.predecessor.append(predecessor_id)
             predecessor = self.find_lanelet_by_id(predecessor_id)
             predecessor.successor.append(lanelet.lanelet_id)
+            self._index_references(lanelet, ("predecessor",))
+            self._index_references(predecessor, ("successor",))
 
     def set_adjacent_left(
         self, lanelet: ConversionLanelet, adj_left_id: str, same_direction: bool = True
@@ -370,6 +448,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
         else:
             new_adj.adj_left = lanelet.lanelet_id
             new_adj.adj_left_same_direction = False
+        self._index_references(lanelet, ("adj_left",))
+        self._index_references(new_adj, ("adj_left", "adj_right"))
         return True
 
     def set_adjacent_right(
@@ -396,6 +476,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
         else:
             new_adj.adj_right = lanelet.lanelet_id
             new_adj.adj_right_same_direction = False
+        self._index_references(lanelet, ("adj_right",))
+        self._index_references(new_adj, ("adj_left", "adj_right"))
         return True
 
     def check_concatenation_potential(
@@ -946,8 +1028,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
                     lane = self.find_lanelet_by_id(lanelet)
                     # Lanelet cannot have more traffic lights than number of successors
                     if len(lane.successor) > len(lane.traffic_lights):
-                        pos_1 = traffic_light.position
-                        pos_2 = lane.center_vertices[-1]
+                        pos_1 = traffic_light.position[:2]
+                        pos_2 = lane.center_vertices[-1][:2]
                         dist = np.linalg.norm(pos_1 - pos_2)
                         if dist < min_distance:
                             min_distance = dist
@@ -976,8 +1058,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
             min_distance = float("inf")
             for lanelet in self.lanelets:
                 # Find closest lanelet to traffic signal
-                pos_1 = traffic_sign.position
-                pos_2 = lanelet.center_vertices[0]
+                pos_1 = traffic_sign.position[:2]
+                pos_2 = lanelet.center_vertices[0][:2]
                 dist = np.linalg.norm(pos_1 - pos_2)
                 if dist < min_distance:
                     min_distance = dist
@@ -1009,8 +1091,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
                 for incoming in intersection.incomings:
                     for lanelet in incoming.incoming_lanelets:
                         lane = self.find_lanelet_by_id(lanelet)
-                        lanelet_position_left = lane.left_vertices[-1]
-                        lanelet_position_right = lane.right_vertices[-1]
+                        lanelet_position_left = lane.left_vertices[-1][:2]
+                        lanelet_position_right = lane.right_vertices[-1][:2]
                         stop_line_position_end = stop_line.start
                         stop_line_position_start = stop_line.end
                         if (
@@ -6,29 +6,12 @@ from pathlib import Path
 from typing import Optional, Union
 
 from commonroad.scenario.scenario import Scenario
-from commonroad_sumo.cr2sumo import CR2SumoMapConverter
-from commonroad_sumo.helpers import SumoApplication, execute_sumo_application
 from lxml import etree
 
 from crdesigner.common.config.general_config import general_config
 from crdesigner.common.config.lanelet2_config import lanelet2_config
 from crdesigner.common.config.opendrive_config import open_drive_config
 from crdesigner.common.file_reader import CRDesignerFileReader
-from crdesigner.map_conversion.lanelet2.cr2lanelet import CR2LaneletConverter
-from crdesigner.map_conversion.lanelet2.lanelet2_parser import Lanelet2Parser
-from crdesigner.map_conversion.lanelet2.lanelet2cr import Lanelet2CRConverter
-from crdesigner.map_conversion.opendrive.cr2odr.converter import Converter
-from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.network import (
-    Network,
-)
-from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.parser import (
-    parse_opendrive,
-)
-from crdesigner.map_conversion.osm2cr.converter_modules.converter import GraphScenario
-from crdesigner.map_conversion.osm2cr.converter_modules.cr_operations.export import (
-    convert_to_scenario,
-)
-from crdesigner.map_conversion.sumo_map.sumo2cr import convert_net_to_cr
 
 Path_T = Union[str, Path]
 
@@ -46,6 +29,9 @@ def lanelet_to_commonroad(
     :param lanelet2_conf: Lanelet2 config parameters.
     :return: CommonRoad scenario
     """
+    from crdesigner.map_conversion.lanelet2.lanelet2_parser import Lanelet2Parser
+    from crdesigner.map_conversion.lanelet2.lanelet2cr import Lanelet2CRConverter
+
     parser = Lanelet2Parser(etree.parse(str(input_file)).getroot(), lanelet2_conf)
     lanelet2_content = parser.parse()
 
@@ -65,6 +51,8 @@ def commonroad_to_lanelet(
     :param output_name: Name and path of lanelet file.
     :param config: Lanelet2 config parameters.
     """
+    from crdesigner.map_conversion.lanelet2.cr2lanelet import CR2LaneletConverter
+
     try:
         crdesigner_reader = CRDesignerFileReader(input_file)
         scenario, _ = crdesigner_reader.open()
@@ -97,6 +85,13 @@ def opendrive_to_commonroad(
     :param odr_conf: OpenDRIVE config parameters.
     :return: CommonRoad scenario
     """
+    from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.network import (
+        Network,
+    )
+    from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.parser import (
+        parse_opendrive,
+    )
+
     if isinstance(input_file, str):
         input_file = Path(input_file)
     opendrive = parse_opendrive(input_file)
@@ -112,6 +107,8 @@ def sumo_to_commonroad(input_file: Path_T) -> Scenario:
     :param input_file: Path to SUMO net file
     :return: CommonRoad scenario
     """
+    from crdesigner.map_conversion.sumo_map.sumo2cr import convert_net_to_cr
+
     return convert_net_to_cr(str(input_file))
 
 
@@ -123,6 +120,7 @@ def commonroad_to_sumo(input_file: Path_T, output_file: Path_T):
     :param output_file: Path where files should be stored
     :return: CommonRoad scenario
     """
+    from commonroad_sumo.cr2sumo import CR2SumoMapConverter
 
     path, _ = os.path.split(output_file)
     converter = CR2SumoMapConverter.from_file(input_file)
@@ -136,6 +134,11 @@ def osm_to_commonroad(input_file: Path_T) -> Scenario:
     :param input_file: Path to OpenStreetMap file
     :return: CommonRoad scenario
     """
+    from crdesigner.map_conversion.osm2cr.converter_modules.converter import GraphScenario
+    from crdesigner.map_conversion.osm2cr.converter_modules.cr_operations.export import (
+        convert_to_scenario,
+    )
+
     osm_graph = GraphScenario(str(input_file)).graph
     return convert_to_scenario(osm_graph)
 
@@ -152,6 +155,8 @@ def osm_to_commonroad_using_sumo(input_file: Path_T) -> Optional[Scenario]:
     :param input_file: Path to OpenStreetMap file
     :return: CommonRoad scenario
     """
+    from commonroad_sumo.helpers import SumoApplication, execute_sumo_application
+
     if isinstance(input_file, str):
         input_file_pth = Path(input_file)
     else:
@@ -194,6 +199,8 @@ def opendrive_to_lanelet(
     :param lanelet2_config: Lanelet2 config parameters
     :return:
     """
+    from crdesigner.map_conversion.lanelet2.cr2lanelet import CR2LaneletConverter
+
     if isinstance(input_file, str):
         input_file = Path(input_file)
     if isinstance(output_file, str):
@@ -216,5 +223,7 @@ def commonroad_to_opendrive(input_file: Path, output_file: Path):
     @param input_file: Path to CommonRoad file
     @param output_file: Path where OpenDRIVE file to be stored
     """
+    from crdesigner.map_conversion.opendrive.cr2odr.converter import Converter
+
     converter = Converter(str(input_file))
     converter.convert(str(output_file))
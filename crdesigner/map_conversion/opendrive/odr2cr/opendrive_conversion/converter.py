@@ -1,5 +1,5 @@
 import copy
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from commonroad.common.common_lanelet import StopLine
 from commonroad.scenario.traffic_light import TrafficLight
@@ -19,12 +19,18 @@ from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.utils impor
     encode_mark_lane_width_id,
     encode_road_section_lane_width_id,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadElevationProfile import (
+    ElevationProfile,
+)
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadLanes import (
     Lane,
     LaneOffset,
     LaneSection,
     LaneWidth,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadLateralProfile import (
+    LateralProfile,
+)
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadPlanView import (
     PlanView,
 )
@@ -34,7 +40,12 @@ class OpenDriveConverter:
     """Class for static methods to convert lane_sections to parametric_lanes."""
 
     @staticmethod
-    def create_reference_border(plan_view: PlanView, lane_offsets: List[LaneOffset]) -> Border:
+    def create_reference_border(
+        plan_view: PlanView,
+        lane_offsets: List[LaneOffset],
+        elevation_profile: Optional[ElevationProfile] = None,
+        lateral_profile: Optional[LateralProfile] = None,
+    ) -> Border:
         """Create the most inner border from a PlanView.
         This border is used as a reference for other
         borders which rely on the PlanView.
@@ -43,6 +54,8 @@ class OpenDriveConverter:
             of the reference path.
         :param lane_offsets: Object which contains information about width offset of reference
             path the plain_view path.
+        :param elevation_profile: Elevation of the reference path. Default is None, i.e., the road is flat.
+        :param lateral_profile: Superelevation of the road. Default is None, i.e., the road is not banked.
          :return: The reference border on which all other borders in this lane section are based upon.
         """
 
@@ -50,6 +63,10 @@ class OpenDriveConverter:
 
         # Set reference to plan view
         reference_border.reference = plan_view
+        if elevation_profile is not None:
+            reference_border.elevations = elevation_profile.elevations
+        if lateral_profile is not None:
+            reference_border.superelevations = lateral_profile.superelevations
 
         # Lane offsets will be coeffs
         # this has to be done if the reference path has the laneoffset attribute
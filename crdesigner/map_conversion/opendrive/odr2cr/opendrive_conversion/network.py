@@ -32,6 +32,7 @@ from pyproj import CRS, Transformer
 from crdesigner.common.common_file_reader_writer import project_lanelet
 from crdesigner.common.config.general_config import GeneralConfig, general_config
 from crdesigner.common.config.opendrive_config import OpenDriveConfig, open_drive_config
+from crdesigner.common.process_pool import imap_forked
 from crdesigner.map_conversion.common.conversion_lanelet import ConversionLanelet
 from crdesigner.map_conversion.common.conversion_lanelet_network import (
     ConversionLaneletNetwork,
@@ -181,6 +182,59 @@ def convert_to_base_lanelet_network(lanelet_network: ConversionLaneletNetwork) -
     return network
 
 
+def _discretize_plane_groups(
+    discretization: Tuple[
+        List[ParametricLaneGroup], float, float, Optional[Transformer], bool, bool
+    ],
+    indices: List[int],
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Calculates the vertices of parametric lane groups.
+
+    :param discretization: Parametric lane groups and arguments of the discretisation.
+    :param indices: Indices of the parametric lane groups.
+    :return: Left and right vertices of each parametric lane group.
+    """
+    planes, error_tolerance, min_delta_s, transformer, adaptive, elevation = discretization
+    return [
+        planes[i].calc_vertices(error_tolerance, min_delta_s, transformer, adaptive, elevation)
+        for i in indices
+    ]
+
+
+def discretize_plane_groups(
+    planes: List[ParametricLaneGroup],
+    error_tolerance: float,
+    min_delta_s: float,
+    transformer: Optional[Transformer],
+    num_processes: int = 1,
+    adaptive: bool = False,
+    elevation: bool = False,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Calculates the vertices of parametric lane groups. The groups are split into consecutive chunks, i.e., mostly
+    the groups of the same road, which are discretised by a pool of forked processes, see imap_forked.
+
+    :param planes: Parametric lane groups.
+    :param error_tolerance: Max. error between reference geometry and polyline of vertices.
+    :param min_delta_s: Min. step length between two sampling positions on the reference geometry
+    :param transformer: Coordinate projection transformer.
+    :param num_processes: Number of processes.
+    :param adaptive: Whether the parametric lanes are sampled adaptively.
+    :param elevation: Whether the vertices contain the height of the road surface as third coordinate.
+    :return: Left and right vertices of each parametric lane group.
+    """
+    chunks = [
+        chunk.tolist()
+        for chunk in np.array_split(
+            np.arange(len(planes)), max(1, min(len(planes), 4 * num_processes))
+        )
+    ]
+    discretization = (planes, error_tolerance, min_delta_s, transformer, adaptive, elevation)
+    results = imap_forked(_discretize_plane_groups, discretization, chunks, num_processes)
+    return [vertices for chunk in results for vertices in chunk]
+
+
 class Network:
     """Represents a network of parametric lanes, with a LinkIndex
     which stores the neighbor relations between the parametric lanes.
@@ -244,7 +298,10 @@ class Network:
 
             # The reference border is the baseline for the whole road
             reference_border = OpenDriveConverter.create_reference_border(
-                road.plan_view, road.lanes.lane_offsets
+                road.plan_view,
+                road.lanes.lane_offsets,
+                road.elevation_profile,
+                road.lateral_profile,
             )
 
             # Extracting signals, signs and stop lines from each road
@@ -256,7 +313,7 @@ class Network:
             self._stop_lines.extend(stop_lines)
 
             # Get crosswalks
-            self._crosswalks.extend(get_crosswalks(road))
+            self._crosswalks.extend(get_crosswalks(road, self._config.elevation))
 
             # stop lines from road objects
             self._stop_lines_from_road(road)
@@ -391,6 +448,23 @@ class Network:
         # Convert groups to lanelets
         lanelet_network = ConversionLaneletNetwork(self._config, transformer)
 
+        # The geometry of each group is independent of the others and is calculated first, possibly in parallel
+        planes = [
+            parametric_lane
+            for parametric_lane in self._planes
+            if filter_types is None or parametric_lane.type in filter_types
+        ]
+        vertices = discretize_plane_groups(
+            planes,
+            self._config.error_tolerance,
+            self._config.min_delta_s,
+            transformer,
+            self._config.num_processes,
+            self._config.adaptive_sampling,
+            self._config.elevation,
+        )
+        vertices = {id(plane): plane_vertices for plane, plane_vertices in zip(planes, vertices)}
+
         for parametric_lane in self._planes:
             if filter_types is not None and parametric_lane.type not in filter_types:
                 # Remove lanelets from intersections dictionary that do not fit the filtered type criterion
@@ -401,6 +475,7 @@ class Network:
                 self._config.min_delta_s,
                 transformer,
                 parametric_lane.driving_direction,
+                vertices[id(parametric_lane)],
             )
             lanelet.predecessor = self._link_index.get_predecessors(parametric_lane.id_)
             lanelet.successor = self._link_index.get_successors(parametric_lane.id_)
@@ -739,11 +814,15 @@ class Network:
 
 
 class LinkIndex:
-    """Overall index of all links in the file, save everything as successors, predecessors can be
-    found via a reverse search"""
+    """Overall index of all links in the file, saved as successors and, updated together with them,
+    as predecessors"""
 
     def __init__(self):
         self._successors = {}
+        self._predecessors = {}
+        # insertion order of the keys of _successors, used to order the predecessors of a lane
+        self._link_order = {}
+        self._link_counter = 0
         self._intersections = []
         self._intersection_dict = {}
 
@@ -897,9 +976,12 @@ class LinkIndex:
 
         if parametric_lane_id not in self._successors:
             self._successors[parametric_lane_id] = []
+            self._link_order[parametric_lane_id] = self._link_counter
+            self._link_counter += 1
 
         if successor not in self._successors[parametric_lane_id]:
             self._successors[parametric_lane_id].append(successor)
+            self._predecessors.setdefault(successor, set()).add(parametric_lane_id)
 
     def _add_junctions(self, opendrive: OpenDrive):
         """Adds junctions.
@@ -977,14 +1059,14 @@ class LinkIndex:
 
         :param parametric_lane_id: ID of lane that should be removed.
         """
-        # Delete key
-        if parametric_lane_id in self._successors:
-            del self._successors[parametric_lane_id]
+        # Delete key and the backward links to its successors
+        for successor in self._successors.pop(parametric_lane_id, []):
+            self._predecessors[successor].discard(parametric_lane_id)
+        self._link_order.pop(parametric_lane_id, None)
 
-        # Delete all occurances in successor lists
-        for successorsId, successors in self._successors.items():
-            if parametric_lane_id in successors:
-                self._successors[successorsId].remove(parametric_lane_id)
+        # Delete all occurrences in successor lists
+        for predecessor in self._predecessors.pop(parametric_lane_id, set()):
+            self._successors[predecessor].remove(parametric_lane_id)
 
     def get_successors(self, parametric_lane_id: str) -> List:
         """Get successors of the specified parametric lane.
@@ -1003,17 +1085,9 @@ class LinkIndex:
         :param parametric_lane_id: ID of ParametricLane for which to search predecessors.
         :return: List of predecessors belonging to the ParametricLane
         """
-        predecessors = []
-        for successor_plane_id, successors in self._successors.items():
-            if parametric_lane_id not in successors:
-                continue
-
-            if successor_plane_id in predecessors:
-                continue
-
-            predecessors.append(successor_plane_id)
-
-        return predecessors
+        return sorted(
+            self._predecessors.get(parametric_lane_id, ()), key=self._link_order.__getitem__
+        )
 
     def clean_intersections(self, parametric_lane_id: str):
         """
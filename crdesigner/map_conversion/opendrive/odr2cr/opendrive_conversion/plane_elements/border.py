@@ -4,6 +4,11 @@ from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.road_record import (
+    RoadRecord,
+    calc_road_records,
+)
+
 
 class Border:
     """A lane border defines a path along a whole lane section. A lane always uses an inner and outer lane border.
@@ -19,6 +24,10 @@ class Border:
 
         self.reference = None
 
+        # elevation and superelevation of the road, only set for the border referencing the plan view
+        self.elevations: List[RoadRecord] = []
+        self.superelevations: List[RoadRecord] = []
+
     def _get_width_index(self, s_pos: float, is_last_pos: bool) -> float:
         """Get the index of the width which applies at position s_pos.
 
@@ -35,6 +44,23 @@ class Border:
             len(self.width_coefficient_offsets) - 1,
         )
 
+    def _get_width_indices(self, s_pos: np.ndarray, is_last_pos: np.ndarray) -> np.ndarray:
+        """Get the indices of the widths which apply at several positions, see _get_width_index.
+
+        :param s_pos: Positions on border in curve_parameter ds
+        :param is_last_pos: Whether each position is the last position
+        :return: Indices of the widths that apply at the positions
+        """
+        offsets = np.asarray(self.width_coefficient_offsets, dtype=float)
+        s_pos, is_last_pos = s_pos[:, np.newaxis], is_last_pos[:, np.newaxis]
+        applies = ((offsets <= s_pos) & (~is_last_pos | (s_pos == 0))) | (
+            (offsets < s_pos) & is_last_pos
+        )
+        # the last applying offset is looked up like list.index, i.e., the first width with this offset is used
+        last_applying = len(offsets) - 1 - np.argmax(applies[:, ::-1], axis=1)
+        indices = np.argmax(offsets[last_applying][:, np.newaxis] == offsets, axis=1)
+        return np.where(applies.any(axis=1), indices, len(offsets) - 1)
+
     def get_next_width_coeffs(self, s_pos: float, is_last_pos: bool = False) -> List[float]:
         """Get width coefficients which apply at position s_pos.
 
@@ -45,6 +71,30 @@ class Border:
         width_idx = self._get_width_index(s_pos, is_last_pos)
         return self.width_coefficients[width_idx]
 
+    def _calc_distance(self, s_pos: float, width_offset: float, is_last_pos: bool) -> float:
+        """Calculate the distance of the border to its reference at position s_pos.
+
+        :param s_pos: Position on border in curve_parameter ds
+        :param width_offset: Offset to add to calculated width at position s_pos
+        :param is_last_pos: Whether s_pos is the last position
+        :return: Distance in orthogonal direction of the reference line
+        """
+        if not self.width_coefficients or not self.width_coefficient_offsets:
+            raise Exception("No entries for width definitions.")
+
+        # Find correct coefficients
+        # find which width segment is at s_pos
+        width_idx = self._get_width_index(s_pos, is_last_pos)
+        # width_idx = min(width_idx, len(self.width_coefficient_offsets)-1)
+        # Calculate width at s_pos
+        return (
+            np.polynomial.polynomial.polyval(
+                s_pos - self.width_coefficient_offsets[width_idx],
+                self.width_coefficients[width_idx],
+            )
+            + width_offset
+        )
+
     # NOTE: might by more efficient to calculate each border once
     # instead of recalculating them over and over.
     @lru_cache(maxsize=200000)
@@ -89,24 +139,76 @@ class Border:
                 compute_curvature=compute_curvature,
             )
 
+        distance = self._calc_distance(s_pos, width_offset, is_last_pos)
+
+        # New point is in orthogonal direction
+        ortho = tang_angle + np.pi / 2
+        coord = ref_coord + np.array([distance * math.cos(ortho), distance * math.sin(ortho)])
+
+        return coord, tang_angle, curv, max_geometry_length
+
+    def calc_lateral_position(
+        self, s_pos: float, width_offset: float = 0.0, is_last_pos: bool = False
+    ) -> Tuple[float, float]:
+        """Calculate the position of the border at s_pos in the coordinates of the road reference line,
+        i.e., the position s along the reference line and the lateral offset t to the reference line.
+
+        :param s_pos: Position s_pos specified in curve parameter ds
+        :param width_offset: Offset to add to calculated width at position s_pos
+        :param is_last_pos: Whether s_pos is the last position
+        :return: Position s on the reference line and lateral offset t
+        """
+        ref_s, ref_t = self.calc_lateral_positions(
+            np.array([s_pos], dtype=float), width_offset, np.array([is_last_pos])
+        )
+        return float(ref_s[0]), float(ref_t[0])
+
+    def calc_lateral_positions(
+        self, s_pos: np.ndarray, width_offset: float, is_last_pos: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the positions of the border at several positions in the coordinates of the road reference line,
+        see calc_lateral_position. The positions are evaluated at once for each width of the border.
+
+        :param s_pos: Positions specified in curve parameter ds
+        :param width_offset: Offset to add to calculated width at the positions
+        :param is_last_pos: Whether each position is the last position
+        :return: Positions s on the reference line and lateral offsets t
+        """
         if not self.width_coefficients or not self.width_coefficient_offsets:
             raise Exception("No entries for width definitions.")
 
-        # Find correct coefficients
-        # find which width segment is at s_pos
-        width_idx = self._get_width_index(s_pos, is_last_pos)
-        # width_idx = min(width_idx, len(self.width_coefficient_offsets)-1)
-        # Calculate width at s_pos
-        distance = (
-            np.polynomial.polynomial.polyval(
-                s_pos - self.width_coefficient_offsets[width_idx],
+        s_pos = np.where(np.isclose(s_pos, 0), 0.0, np.asarray(s_pos, dtype=float))
+        is_last_pos = np.asarray(is_last_pos, dtype=bool)
+        if isinstance(self.reference, Border):
+            ref_s, ref_t = self.reference.calc_lateral_positions(
+                self.ref_offset + s_pos, 0.0, is_last_pos
+            )
+        else:
+            ref_s, ref_t = self.ref_offset + s_pos, np.zeros_like(s_pos)
+
+        width_indices = self._get_width_indices(s_pos, is_last_pos)
+        distances = np.full_like(s_pos, width_offset)
+        for width_idx in np.unique(width_indices):
+            selected = width_indices == width_idx
+            distances[selected] += np.polynomial.polynomial.polyval(
+                s_pos[selected] - self.width_coefficient_offsets[width_idx],
                 self.width_coefficients[width_idx],
             )
-            + width_offset
-        )
+        return ref_s, ref_t + distances
 
-        # New point is in orthogonal direction
-        ortho = tang_angle + np.pi / 2
-        coord = ref_coord + np.array([distance * math.cos(ortho), distance * math.sin(ortho)])
+    def calc_height(self, ref_s: np.ndarray, ref_t: np.ndarray) -> np.ndarray:
+        """Calculate the height of the road surface at several positions in the coordinates of the road reference
+        line. The height is the elevation of the reference line plus the lateral offset tilted by the
+        superelevation. Superelevation is the roll angle around the reference line, positive if the road falls to
+        the right side.
 
-        return coord, tang_angle, curv, max_geometry_length
+        :param ref_s: Positions s on the reference line
+        :param ref_t: Lateral offsets t to the reference line
+        :return: Heights at the positions
+        """
+        if isinstance(self.reference, Border):
+            return self.reference.calc_height(ref_s, ref_t)
+
+        return calc_road_records(self.elevations, ref_s) + np.asarray(ref_t) * np.sin(
+            calc_road_records(self.superelevations, ref_s)
+        )
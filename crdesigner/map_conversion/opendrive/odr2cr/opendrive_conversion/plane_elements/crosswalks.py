@@ -9,13 +9,18 @@ from crdesigner.map_conversion.common.utils import generate_unique_id
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.road import (
     Road,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.road_record import (
+    calc_road_records,
+)
 
 
-def get_crosswalks(road: Road) -> List[ConversionLanelet]:
+def get_crosswalks(road: Road, elevation: bool = False) -> List[ConversionLanelet]:
     """Identify and converts crossing lanelets (represented as OpenDRIVE objects).
     Projection/Transformation will be applied later.
 
     :param road: The road object from which to extract signals.
+    :param elevation: Whether the vertices contain the height of the road surface at the crosswalk as third
+        coordinate.
     :return: list of ConversionLanelets with lanelet_type='crosswalk'
     """
     crosswalks = []
@@ -91,6 +96,14 @@ def get_crosswalks(road: Road) -> List[ConversionLanelet]:
                 else:
                     logging.warning("odr2cr crossing computation: case not supported yet.")
                     continue
+        if elevation:
+            height = calc_road_records(
+                road.elevation_profile.elevations, crosswalk.s
+            ) + crosswalk.t * np.sin(
+                calc_road_records(road.lateral_profile.superelevations, crosswalk.s)
+            )
+            left_vertices = np.column_stack((left_vertices, np.full(len(left_vertices), height)))
+            right_vertices = np.column_stack((right_vertices, np.full(len(right_vertices), height)))
         center_vertices = (left_vertices + right_vertices) / 2
         # create ConversionLanelet
         lanelet = ConversionLanelet(
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
 from numpy.polynomial import polynomial
@@ -7,10 +7,33 @@ from pyproj import Transformer
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.plane_elements.border import (
     Border,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.geometry import (
+    calc_delta_s,
+)
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadLanes import (
     RoadMark,
 )
 
+# max. distance between two vertices of adaptively sampled lanes, also on straight lanes with constant width
+MAX_DELTA_S = 20.0
+
+
+def chord_error(start: np.ndarray, end: np.ndarray, point: np.ndarray) -> float:
+    """Distance of a point to the chord between two vertices.
+
+    :param start: Start of chord.
+    :param end: End of chord.
+    :param point: Point between the vertices.
+    :return: Distance of point to chord.
+    """
+    direction = end - start
+    length = np.hypot(direction[0], direction[1])
+    if length == 0.0:
+        return float(np.hypot(*(point - start)))
+    return float(
+        abs(direction[0] * (point[1] - start[1]) - direction[1] * (point[0] - start[0])) / length
+    )
+
 
 class ParametricLaneBorderGroup:
     """Group Borders and BorderOffsets of ParametricLanes into one class."""
@@ -70,6 +93,32 @@ class ParametricLaneBorderGroup:
             compute_curvature=compute_curvature,
         )
 
+    def calc_border_heights(
+        self,
+        border: str,
+        s_pos: np.ndarray,
+        is_last_pos: np.ndarray,
+        width_offset: float = 0.0,
+    ) -> np.ndarray:
+        """Calc heights of inner or outer Border at several positions.
+
+        :param border: Which border to calculate (inner or outer)
+        :param s_pos: Positions of parameter ds where to calc the heights
+        :param is_last_pos: Whether each position is the last position
+        :param width_offset: Offset to add to calculated width in reference to the reference border
+        :return: Heights of the border at the positions.
+        """
+        if border not in ("inner", "outer"):
+            raise ValueError("Border specified must be 'inner' or 'outer'!")
+
+        select_border = self.inner_border if border == "inner" else self.outer_border
+        select_offset = self.inner_border_offset if border == "inner" else self.outer_border_offset
+
+        ref_s, ref_t = select_border.calc_lateral_positions(
+            select_offset + np.asarray(s_pos, dtype=float), width_offset, is_last_pos
+        )
+        return select_border.calc_height(ref_s, ref_t)
+
     def get_width_coefficients(self) -> List:
         """Get the width coefficients which apply to this ParametricLane.
 
@@ -146,6 +195,20 @@ class ParametricLane:
         )
         return r1, r2, r3, la
 
+    def calc_heights(self, border: str, poses: np.ndarray, width_offset: float = 0.0) -> np.ndarray:
+        """Calc heights of inner or outer Border at several positions.
+
+        :param border: Which border to calculate (inner or outer).
+        :param poses: Positions of parameter ds where to calc the heights
+        :param width_offset: Offset to add to calculated width in reference to the reference border. Default is 0.0.
+        :return: Heights of the border at the positions.
+        """
+        poses = np.asarray(poses, dtype=float)
+        border_poses = self.length - poses if self.reverse else poses
+        return self.border_group.calc_border_heights(
+            border, border_poses, np.isclose(self.length, border_poses), width_offset
+        )
+
     def calc_width(self, s_pos: float) -> float:
         """Calc width of border at position s_pos.
 
@@ -267,14 +330,74 @@ class ParametricLane:
     #         last_width_difference,
     #     )
 
+    def sampling_positions(self, error_tolerance: float, min_delta_s: float) -> np.ndarray:
+        """Positions at which the borders are sampled so that the polylines deviate at most by the error tolerance
+        from both borders. Intervals are bisected while the border at their center deviates too much from the chord
+        or while they are longer than the curvature of the reference geometry permits. The deviation is checked at
+        the quarter points of each interval. Both borders are sampled at the same positions.
+
+        :param error_tolerance: Max. error between reference geometry and polyline of vertices.
+        :param min_delta_s: Min. step length between two sampling positions on the reference geometry
+        :return: Sampling positions in curve parameter ds.
+        """
+        borders = {}
+
+        def calc_borders(s: float) -> Tuple[np.ndarray, np.ndarray, Any]:
+            if s not in borders:
+                inner_pos, _, curvature, _ = self.calc_border("inner", s)
+                outer_pos = self.calc_border("outer", s, compute_curvature=False)[0]
+                borders[s] = (np.asarray(inner_pos), np.asarray(outer_pos), curvature)
+            return borders[s]
+
+        def exceeds_tolerance(start: float, end: float) -> bool:
+            if end - start < 2 * min_delta_s:
+                return False
+            inner_start, outer_start, curvature_start = calc_borders(start)
+            inner_end, outer_end, curvature_end = calc_borders(end)
+            if any(
+                curvature is not None and end - start > calc_delta_s(curvature, error_tolerance)
+                for curvature in (curvature_start, curvature_end)
+            ):
+                return True
+            for fraction in (0.25, 0.5, 0.75):
+                inner, outer, _ = calc_borders(start + fraction * (end - start))
+                if (
+                    chord_error(inner_start, inner_end, inner) > error_tolerance
+                    or chord_error(outer_start, outer_end, outer) > error_tolerance
+                ):
+                    return True
+            return False
+
+        num_steps = int(max(3, np.ceil(self.length / MAX_DELTA_S) + 1))
+        initial_poses = np.linspace(0, self.length, num_steps)
+        poses = [initial_poses[0]]
+        for start, end in zip(initial_poses[:-1], initial_poses[1:]):
+            intervals = [(start, end)]
+            while intervals:
+                start, end = intervals.pop()
+                if exceeds_tolerance(start, end):
+                    center = 0.5 * (start + end)
+                    intervals.append((center, end))
+                    intervals.append((start, center))
+                else:
+                    poses.append(end)
+        return np.array(poses)
+
     def calc_vertices(
-        self, error_tolerance: float, min_delta_s: float, transformer: Optional[Transformer] = None
+        self,
+        error_tolerance: float,
+        min_delta_s: float,
+        transformer: Optional[Transformer] = None,
+        adaptive: bool = False,
+        elevation: bool = False,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Convert a ParametricLane to Lanelet.
 
         :param error_tolerance: Max. error between reference geometry and polyline of vertices.
         :param min_delta_s: Min. step length between two sampling positions on the reference geometry
         :param transformer: Coordinate transformer/projection.
+        :param adaptive: Whether the lane is sampled adaptively instead of every 0.5 in curve parameter ds.
+        :param elevation: Whether the vertices contain the height of the road surface as third coordinate.
         :return: left and right vertices of the created Lanelet
         """
         left_vertices = []
@@ -288,8 +411,11 @@ class ParametricLane:
         #
         if self.length < 0:
             return np.array(left_vertices), np.array(right_vertices)
-        num_steps = int(max(3, np.ceil(self.length / float(0.5))))
-        poses = np.linspace(0, self.length, num_steps)
+        if adaptive:
+            poses = self.sampling_positions(error_tolerance, min_delta_s)
+        else:
+            num_steps = int(max(3, np.ceil(self.length / float(0.5))))
+            poses = np.linspace(0, self.length, num_steps)
         for s in poses:
             #
             # old version end
@@ -324,6 +450,12 @@ class ParametricLane:
             #
             # check_3 = False
         # assert len(left_vertices) >= 3, f"Not enough vertices, len: {len(left_vertices)}"
+        if elevation:
+            # the heights of all positions are evaluated at once
+            return (
+                np.column_stack((left_vertices, self.calc_heights("inner", poses))),
+                np.column_stack((right_vertices, self.calc_heights("outer", poses))),
+            )
         return np.array(left_vertices), np.array(right_vertices)
 
     def zero_width_change_positions(self) -> float:
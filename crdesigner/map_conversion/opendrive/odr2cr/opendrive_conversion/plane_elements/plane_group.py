@@ -173,23 +173,32 @@ class ParametricLaneGroup:
         """
         return all([plane.has_zero_width_everywhere() for plane in self.parametric_lanes])
 
-    def to_lanelet(
-        self, error_tolerance, min_delta_s, transformer: Transformer, driving_direction: bool = True
-    ) -> ConversionLanelet:
-        """Convert a ParametricLaneGroup to a Lanelet.
+    def calc_vertices(
+        self,
+        error_tolerance: float,
+        min_delta_s: float,
+        transformer: Optional[Transformer] = None,
+        adaptive: bool = False,
+        elevation: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculates the left and right vertices of all ParametricLanes of this ParametricLaneGroup.
 
         :param error_tolerance: Max. error between reference geometry and polyline of vertices.
         :param min_delta_s: Min. step length between two sampling positions on the reference geometry
         :param transformer: Coordinate projection transformer.
-        :param driving_direction: Driving direction, right if true.
-        :return: Created Lanelet.
+        :param adaptive: Whether the ParametricLanes are sampled adaptively.
+        :param elevation: Whether the vertices contain the height of the road surface as third coordinate.
+        :return: Left and right vertices.
         """
         left_vertices, right_vertices = np.array([]), np.array([])
-        line_marking_right_vertices = LineMarking.UNKNOWN
 
         for parametric_lane in self.parametric_lanes:
             local_left_vertices, local_right_vertices = parametric_lane.calc_vertices(
-                error_tolerance=error_tolerance, min_delta_s=min_delta_s, transformer=transformer
+                error_tolerance=error_tolerance,
+                min_delta_s=min_delta_s,
+                transformer=transformer,
+                adaptive=adaptive,
+                elevation=elevation,
             )
             # check whether parametric lane cannot be used,
             # e.g., if to small it is possible that no vertices are generated
@@ -207,6 +216,30 @@ class ParametricLaneGroup:
                 left_vertices = local_left_vertices
                 right_vertices = local_right_vertices
 
+        return left_vertices, right_vertices
+
+    def to_lanelet(
+        self,
+        error_tolerance,
+        min_delta_s,
+        transformer: Transformer,
+        driving_direction: bool = True,
+        vertices: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> ConversionLanelet:
+        """Convert a ParametricLaneGroup to a Lanelet.
+
+        :param error_tolerance: Max. error between reference geometry and polyline of vertices.
+        :param min_delta_s: Min. step length between two sampling positions on the reference geometry
+        :param transformer: Coordinate projection transformer.
+        :param driving_direction: Driving direction, right if true.
+        :param vertices: Left and right vertices if they were already calculated.
+        :return: Created Lanelet.
+        """
+        if vertices is None:
+            vertices = self.calc_vertices(error_tolerance, min_delta_s, transformer)
+        left_vertices, right_vertices = vertices
+        line_marking_right_vertices = LineMarking.UNKNOWN
+
         for parametric_lane in self.parametric_lanes:
             line_marking = parametric_lane.line_marking
             if line_marking is not None:
@@ -338,6 +371,28 @@ class ParametricLaneGroup:
             compute_curvature=compute_curvature,
         )
 
+    def calc_heights(self, border: str, poses: np.ndarray) -> np.ndarray:
+        """Calc heights of inner or outer Border at several positions.
+
+        :param border: Which border to calculate (inner or outer)
+        :param poses: Positions of parameter ds where to calc the heights
+        :return: Heights of the border at the positions.
+        """
+        poses = np.asarray(poses, dtype=float)
+        # index of the ParametricLane at each position, positions after the last geometry belong to the last lane
+        plane_idx = np.clip(
+            np.searchsorted(self._geo_lengths, poses, side="right") - 1,
+            0,
+            len(self.parametric_lanes) - 1,
+        )
+        heights = np.zeros_like(poses)
+        for idx in np.unique(plane_idx):
+            mask = plane_idx == idx
+            heights[mask] = self.parametric_lanes[idx].calc_heights(
+                border, poses[mask] - self._geo_lengths[idx]
+            )
+        return heights
+
     def to_lanelet_with_mirroring(
         self,
         mirror_border: str,
@@ -346,6 +401,7 @@ class ParametricLaneGroup:
         adjacent_lanelet: ConversionLanelet,
         precision: float = 0.5,
         transformer: Optional[Transformer] = None,
+        elevation: bool = False,
     ):
         """Convert a ParametricLaneGroup to a Lanelet with mirroring one of the borders.
 
@@ -357,6 +413,8 @@ class ParametricLaneGroup:
         :param precision: Number which indicates at which space interval (in curve parameter ds) the coordinates of the
                         boundaries should be calculated. Default is 0.5.
         :param transformer: Coordinate projection transformer.
+        :param elevation: Whether the vertices contain the height of the road surface as third coordinate. The
+                        heights of a moved border are the heights of the original border.
         :return: Created Lanelet.
         """
         linear_distance_poly = np.polyfit(mirror_interval, distance, 1)
@@ -473,6 +531,9 @@ class ParametricLaneGroup:
             np.array(right_vertices),
         )
         # right_vertices = np.array(right_vertices)
+        if elevation:
+            left_vertices = np.column_stack((left_vertices, self.calc_heights("inner", poses)))
+            right_vertices = np.column_stack((right_vertices, self.calc_heights("outer", poses)))
 
         center_vertices = np.array(
             [(left + right) / 2 for (left, right) in zip(left_vertices, right_vertices)]
@@ -20,6 +20,7 @@ class OpenDrive:
     :ivar _junctions: junction elements in the OpenDRIVE element
     :ivar _junctionGroups: junctionGroup elements in the OpenDRIVE element
     :ivar _stations: station elements in the OpenDRIVE element
+    :ivar _road_index: mapping from road ID to road, built on demand and invalidated when roads are added
     """
 
     def __init__(self):
@@ -29,6 +30,8 @@ class OpenDrive:
         self._junctions = []
         self._junctionGroups = []
         self._stations = []
+        self._road_index: Union[dict, None] = None
+        self._road_index_size = 0
 
     @property
     def header(self) -> Header:
@@ -53,6 +56,15 @@ class OpenDrive:
         """
         return self._roads
 
+    def add_road(self, road: Road):
+        """
+        Adds a road to the OpenDRIVE element.
+
+        :param road: road element
+        """
+        self._roads.append(road)
+        self._road_index = None
+
     def getRoad(self, id_) -> Union[Road, None]:
         """
         Returns the road corresponding to certain road ID.
@@ -60,11 +72,14 @@ class OpenDrive:
         :param: id of the road
         :return: road element
         """
-        for road in self._roads:
-            if road.id == id_:
-                return road
+        # roads appended directly to the road list are detected by the changed number of roads
+        if self._road_index is None or self._road_index_size != len(self._roads):
+            self._road_index = {}
+            for road in self._roads:
+                self._road_index.setdefault(road.id, road)
+            self._road_index_size = len(self._roads)
 
-        return None
+        return self._road_index.get(id_)
 
     @property
     def controllers(self):
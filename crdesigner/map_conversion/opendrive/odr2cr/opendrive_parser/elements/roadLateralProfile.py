@@ -11,8 +11,8 @@ class LateralProfile:
     characteristics of the road surface's banking along the reference line.
     (Section 5.3.6 of OpenDRIVE 1.4)
 
-    Lateral profile and its components are not yet supported in CommonRoad! Thus, they are extracted from the
-    OpenDRIVE file but not used.
+    Superelevations are used if lanes are converted with their elevation. Crossfalls and shapes are not yet
+    supported in CommonRoad! Thus, they are extracted from the OpenDRIVE file but not used.
     """
 
     def __init__(self):
@@ -1,4 +1,7 @@
 from abc import ABC
+from typing import List
+
+import numpy as np
 
 
 class RoadRecord(ABC):
@@ -34,3 +37,34 @@ class RoadRecord(ABC):
         self.polynomial_coefficients = []
         for coeff in polynomial_coefficients:
             self.polynomial_coefficients.append(coeff)
+
+
+def calc_road_records(records: List[RoadRecord], s_pos: np.ndarray) -> np.ndarray:
+    """
+    Evaluates a series of RoadRecords at several positions at once. At each position, the record with the
+    largest start position not exceeding the position applies. Positions before the first record are
+    evaluated with the first record.
+
+    :param records: RoadRecords, e.g., the ElevationRecords of a road.
+    :param s_pos: Positions on the reference line in curve parameter ds.
+    :return: Values of the records at the positions; zero if no record is given.
+    """
+    s_pos = np.asarray(s_pos, dtype=float)
+    if not records:
+        return np.zeros_like(s_pos)
+
+    records = sorted(records, key=lambda record: record.start_pos)
+    starts = np.array([record.start_pos for record in records], dtype=float)
+    coefficients = np.zeros(
+        (len(records), max(len(record.polynomial_coefficients) for record in records))
+    )
+    for i, record in enumerate(records):
+        coefficients[i, : len(record.polynomial_coefficients)] = record.polynomial_coefficients
+
+    idx = np.clip(np.searchsorted(starts, s_pos, side="right") - 1, 0, None)
+    ds = s_pos - starts[idx]
+    # Horner's scheme with the coefficients of the applying record at each position
+    values = np.zeros_like(s_pos)
+    for coefficient in coefficients[idx].T[::-1]:
+        values = values * ds + coefficient
+    return values
@@ -642,7 +642,7 @@ def parse_opendrive_road(opendrive: OpenDrive, road: etree.ElementTree):
 
     calculate_lane_section_lengths(new_road)
 
-    opendrive.roads.append(new_road)
+    opendrive.add_road(new_road)
 
 
 def parse_opendrive_road_object(new_road: Road, obj: etree.ElementTree):
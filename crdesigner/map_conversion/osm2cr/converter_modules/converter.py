@@ -15,70 +15,76 @@ from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_gr
     SublayeredGraph,
 )
 from crdesigner.map_conversion.osm2cr.converter_modules.osm_operations import osm_parser
+from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 
 def step_collection_1(file: str) -> Graph:
     graph = osm_parser.create_graph(file)
-    if config.MAKE_CONTIGUOUS:
-        logging.info("making graph contiguously")
-        graph.make_contiguous()
-    logging.info("merging close intersections")
-    intersection_merger.merge_close_intersections(graph)
-    if isinstance(graph, SublayeredGraph):
-        intersection_merger.merge_close_intersections(graph.sublayer_graph)
-    graph.link_edges()
+    with idgenerator.id_context(graph.id_generator):
+        if config.MAKE_CONTIGUOUS:
+            logging.info("making graph contiguously")
+            graph.make_contiguous()
+        logging.info("merging close intersections")
+        intersection_merger.merge_close_intersections(graph)
+        if isinstance(graph, SublayeredGraph):
+            intersection_merger.merge_close_intersections(graph.sublayer_graph)
+        graph.link_edges()
     return graph
 
 
 def step_collection_2(graph: Graph) -> Graph:
-    logging.info("linking lanes")
-    lane_linker.link_graph(graph)
-    if isinstance(graph, SublayeredGraph):
-        lane_linker.link_graph(graph.sublayer_graph)
-    logging.info("interpolating waypoints")
-    graph.interpolate()
-    logging.info("offsetting roads")
-    offsetter.offset_graph(graph)
-    if isinstance(graph, SublayeredGraph):
-        offsetter.offset_graph(graph.sublayer_graph)
-    logging.info("cropping roads at intersections")
-    edges_to_delete = graph.crop_waypoints_at_intersections(config.INTERSECTION_DISTANCE)
-    if config.DELETE_SHORT_EDGES:
-        logging.info("deleting short edges")
-        graph.delete_edges(edges_to_delete)
-    if isinstance(graph, SublayeredGraph):
-        edges_to_delete = graph.sublayer_graph.crop_waypoints_at_intersections(
-            config.INTERSECTION_DISTANCE_SUBLAYER
-        )
+    with idgenerator.id_context(graph.id_generator):
+        logging.info("linking lanes")
+        lane_linker.link_graph(graph)
+        if isinstance(graph, SublayeredGraph):
+            lane_linker.link_graph(graph.sublayer_graph)
+        logging.info("interpolating waypoints")
+        graph.interpolate()
+        logging.info("offsetting roads")
+        offsetter.offset_graph(graph)
+        if isinstance(graph, SublayeredGraph):
+            offsetter.offset_graph(graph.sublayer_graph)
+        logging.info("cropping roads at intersections")
+        edges_to_delete = graph.crop_waypoints_at_intersections(config.INTERSECTION_DISTANCE)
         if config.DELETE_SHORT_EDGES:
-            graph.sublayer_graph.delete_edges(edges_to_delete)
-    logging.info("applying traffic signs to edges and nodes")
-    mapillary.add_mapillary_signs_to_graph(graph)
-    graph.apply_traffic_signs()
-    logging.info("applying traffic lights to edges")
-    graph.apply_traffic_lights()
-    logging.info("creating waypoints of lanes")
-    graph.create_lane_waypoints()
+            logging.info("deleting short edges")
+            graph.delete_edges(edges_to_delete)
+        if isinstance(graph, SublayeredGraph):
+            edges_to_delete = graph.sublayer_graph.crop_waypoints_at_intersections(
+                config.INTERSECTION_DISTANCE_SUBLAYER
+            )
+            if config.DELETE_SHORT_EDGES:
+                graph.sublayer_graph.delete_edges(edges_to_delete)
+        logging.info("applying traffic signs to edges and nodes")
+        mapillary.add_mapillary_signs_to_graph(graph)
+        graph.apply_traffic_signs()
+        logging.info("applying traffic lights to edges")
+        graph.apply_traffic_lights()
+        logging.info("creating waypoints of lanes")
+        graph.create_lane_waypoints()
     return graph
 
 
 def step_collection_3(graph: Graph) -> Graph:
-    logging.info("creating segments at intersections")
-    graph.create_lane_link_segments()
-    logging.info("clustering segments")
-    segment_clusters.cluster_segments(graph)
-    if isinstance(graph, SublayeredGraph):
-        segment_clusters.cluster_segments(graph.sublayer_graph)
-    logging.info("changing to desired interpolation distance and creating borders of lanes")
-    graph.create_lane_bounds(config.INTERPOLATION_DISTANCE_INTERNAL / config.INTERPOLATION_DISTANCE)
-    if config.DELETE_INVALID_LANES:
-        logging.info("deleting invalid lanes")
-        graph.delete_invalid_lanes()
-    if isinstance(graph, SublayeredGraph):
+    with idgenerator.id_context(graph.id_generator):
+        logging.info("creating segments at intersections")
+        graph.create_lane_link_segments()
+        logging.info("clustering segments")
+        segment_clusters.cluster_segments(graph)
+        if isinstance(graph, SublayeredGraph):
+            segment_clusters.cluster_segments(graph.sublayer_graph)
+        logging.info("changing to desired interpolation distance and creating borders of lanes")
+        graph.create_lane_bounds(
+            config.INTERPOLATION_DISTANCE_INTERNAL / config.INTERPOLATION_DISTANCE
+        )
         if config.DELETE_INVALID_LANES:
-            graph.sublayer_graph.delete_invalid_lanes()
-    logging.info("adjust common bound points")
-    graph.correct_start_end_points()
+            logging.info("deleting invalid lanes")
+            graph.delete_invalid_lanes()
+        if isinstance(graph, SublayeredGraph):
+            if config.DELETE_INVALID_LANES:
+                graph.sublayer_graph.delete_invalid_lanes()
+        logging.info("adjust common bound points")
+        graph.correct_start_end_points()
     logging.info("done converting")
     return graph
 
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Tuple
 
 from commonroad.scenario.scenario import GeoTransformation, Location, Scenario, Tag
@@ -19,6 +20,9 @@ from crdesigner.map_conversion.osm2cr.converter_modules.intermediate_operations.
 from crdesigner.map_conversion.osm2cr.converter_modules.utility.geonamesID import (
     get_geonamesID,
 )
+from crdesigner.map_conversion.osm2cr.converter_modules.utility.labeling_create_tree import (
+    get_city_index,
+)
 
 
 def create_scenario_intermediate(graph) -> Tuple[Scenario, IntermediateFormat]:
@@ -50,11 +54,16 @@ def convert_to_scenario(graph: Graph) -> Scenario:
     scenario.source = source
     scenario.tags = create_tags(general_config.tags)
 
-    # create location tag automatically. Retreive geonamesID from the Internet.
+    # create location tag automatically. Retreive geonamesID from the Internet or the offline index of the cities.
+    cities_index = (
+        get_city_index(Path(osm_config.GEONAMES_CITIES_FILE))
+        if osm_config.GEONAMES_CITIES_FILE
+        else None
+    )
     scenario.location = Location(
         gps_latitude=graph.center_point[0],
         gps_longitude=graph.center_point[1],
-        geo_name_id=get_geonamesID(graph.center_point[0], graph.center_point[1]),
+        geo_name_id=get_geonamesID(graph.center_point[0], graph.center_point[1], cities_index),
         geo_transformation=GeoTransformation(geo_reference=general_config.proj_string_cr),
     )
 
@@ -109,6 +109,7 @@ def merge_nodes(nodes: Set[GraphNode]) -> Tuple[GraphNode, Set[GraphEdge], Set[G
     return new_node, edges_to_delete, nodes_to_delete
 
 
+@id_gen.graph_ids
 def merge_close_intersections(graph: Graph) -> None:
     """
     merges close graph nodes
@@ -14,6 +14,7 @@ from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_gr
 from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph_traffic_sign import (
     GraphTrafficSign,
 )
+from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 
 class Bbox:
@@ -73,6 +74,7 @@ def get_mappilary_traffic_signs(bbox: Bbox):
         return None
 
 
+@idgenerator.graph_ids
 def add_mapillary_signs_to_graph(graph: Graph):
     """
     Add Mapillary sings to the road graph
@@ -88,8 +90,11 @@ def add_mapillary_signs_to_graph(graph: Graph):
     # retrieve traffic signs from given bbox
     signs = get_mappilary_traffic_signs(bbox)
     if signs is not None:
+        edge_index = graph.create_edge_index()
         for sign in signs:
-            edge = graph.find_closest_edge_by_lat_lng(sign[1], direction=sign[2])
+            edge = graph.find_closest_edge_by_lat_lng(
+                sign[1], direction=sign[2], edge_index=edge_index
+            )
             # add to graph traffic signs
             traffic_sign = GraphTrafficSign(
                 {"mapillary": sign[0]}, node=None, edges=[[edge]], direction=sign[2]
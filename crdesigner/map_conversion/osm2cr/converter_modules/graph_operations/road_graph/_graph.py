@@ -9,8 +9,10 @@ from pyproj import Transformer
 
 from crdesigner.common.config.osm_config import osm_config as config
 from crdesigner.map_conversion.common import geometry
+from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 from ._graph_edge import GraphEdge
+from ._graph_edge_index import EdgeIndex
 from ._graph_functions import (
     find_adjacents,
     get_lane_waypoints,
@@ -37,12 +39,14 @@ class Graph:
         transformer: Transformer,
         traffic_signs: List[GraphTrafficSign],
         traffic_lights: List[GraphTrafficLight],
+        id_generator: Optional[idgenerator.IdGenerator] = None,
     ) -> None:
         """
         creates a new graph
 
         :param nodes: nodes of the graph
         :param edges: edges of the graph
+        :param id_generator: generator for the ids of the conversion, the active generator is used if none is given
         :return: None
         """
         self.nodes = nodes
@@ -53,6 +57,9 @@ class Graph:
         self.lanelinks: Set[Lane] = OrderedSet()
         self.traffic_signs = traffic_signs
         self.traffic_lights = traffic_lights
+        self.id_generator = (
+            id_generator if id_generator is not None else idgenerator.current_generator()
+        )
 
     def get_central_node(self) -> GraphNode:
         """
@@ -354,6 +361,7 @@ class Graph:
                 # update_forward(lane, True)
                 pass
 
+    @idgenerator.graph_ids
     def create_lane_link_segments(self) -> None:
         """
         creates link segments for all intersections
@@ -692,40 +700,29 @@ class Graph:
             self.delete_lane(lane)
         # self.set_adjacents()
 
-    def find_closest_edge_by_lat_lng(self, lat_lng, direction=None) -> GraphNode:
+    def create_edge_index(self) -> EdgeIndex:
         """
-        finds the closest GraphEdge in Graph to a given lat_lng tuple/list and a optional direction
+        creates a spatial index of the current edges for snapping several elements to the graph
+
+        :return: index of the edges
+        """
+        return EdgeIndex(self.edges)
+
+    def find_closest_edge_by_lat_lng(
+        self, lat_lng, direction=None, edge_index: Optional[EdgeIndex] = None
+    ) -> GraphEdge:
+        """
+        finds the closest GraphEdge in Graph to a given lat_lng tuple/list and a optional direction.
+        If a direction is given, the closest edge with a compass heading within 60 degrees is returned unless it is more
+        than 20m away, in which case the closest edge regardless of its direction is returned.
 
         :param1 lat_lng: np.array storing latitude and longitude
         :param2 direction: optional filter to only return edge with corresponding direction
+        :param3 edge_index: index of the edges created by create_edge_index; should be provided when snapping
+            several elements, otherwise an index is created for the query
         :return: GraphEdge which is closest to the given lat_lng coordinates
         """
-        given_point = self.transformer.transform(lat_lng[0], lat_lng[1])
-        given_point = np.array(given_point)
-        edges = list(self.edges)
-
-        # edge coordinates need to be converted to lat lng before comparsion
-        points = list()
-        points_to_edge = dict()
-        for edge in edges:
-            edge_orientation = edge.get_compass_degrees()
-            if direction is None or abs(edge_orientation - direction) < 60:  # degrees threshold
-                for waypoint in edge.get_waypoints():
-                    points.append(waypoint)
-                    points_to_edge[tuple(waypoint)] = edge
-        try:
-            points = np.asarray(points)
-            # https://codereview.stackexchange.com/a/28210
-            dist_2 = np.sum((points - given_point) ** 2, axis=1)
-            closest_edge_index = np.argmin(dist_2)
-            found_point = points[closest_edge_index]
-
-            # recalculate if direction input moves signs more than 20m away from its original found position
-            if direction is not None and geometry.distance(found_point, [given_point]) > 0.0002:
-                return self.find_closest_edge_by_lat_lng(lat_lng)
-
-            return points_to_edge[tuple(found_point)]
-        # catch value errors if not enough points were given
-        except ValueError:
-            logging.error("No edge found. Using fallback calculation.")
-            return self.find_closest_edge_by_lat_lng(lat_lng)
+        if edge_index is None:
+            edge_index = self.create_edge_index()
+        given_point = np.array(self.transformer.transform(lat_lng[0], lat_lng[1]))
+        return edge_index.nearest_edge(given_point, direction)
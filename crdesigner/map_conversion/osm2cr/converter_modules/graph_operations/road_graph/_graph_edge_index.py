@@ -0,0 +1,82 @@
+from typing import Iterable, List, Optional
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+from ._graph_edge import GraphEdge
+
+
+def heading_difference(heading1: np.ndarray, heading2: float) -> np.ndarray:
+    """
+    calculates the absolute difference of compass headings, taking into account that 0° and 360° are equal
+
+    :param heading1: compass headings in degrees
+    :param heading2: compass heading in degrees
+    :return: differences in degrees between 0 and 180
+    """
+    difference = np.abs(np.asarray(heading1) - heading2) % 360.0
+    return np.minimum(difference, 360.0 - difference)
+
+
+class EdgeIndex:
+    """
+    Spatial index of the polylines of graph edges for snapping external elements, e.g., traffic signs detected by
+    Mapillary, to the road graph. The polylines are stored in an STRtree together with the compass heading of each
+    edge, so that the nearest edge with a matching heading is found with one query.
+    The index reflects the edges and their waypoints at the time of its creation.
+    """
+
+    def __init__(self, edges: Iterable[GraphEdge]):
+        """
+        creates the index
+
+        :param edges: edges of the graph
+        """
+        self.edges: List[GraphEdge] = list(edges)
+        geometries = []
+        for edge in self.edges:
+            waypoints = edge.get_waypoints()
+            if len(waypoints) > 1:
+                geometries.append(shapely.LineString(waypoints))
+            else:
+                geometries.append(shapely.Point(edge.node1.x, edge.node1.y))
+        self.geometries = np.array(geometries, dtype=object)
+        self.headings = np.array([edge.get_compass_degrees() for edge in self.edges], dtype=float)
+        self._tree = STRtree(self.geometries)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def nearest_edge(
+        self,
+        point: np.ndarray,
+        heading: Optional[float] = None,
+        max_heading_difference: float = 60.0,
+        max_distance: float = 20.0,
+    ) -> Optional[GraphEdge]:
+        """
+        finds the nearest edge to a point. If a heading is given, the nearest edge whose heading differs by less than
+        max_heading_difference is preferred as long as it is not farther than max_distance away; otherwise the
+        nearest edge regardless of its heading is returned.
+
+        :param point: position in the coordinates of the graph
+        :param heading: compass heading in degrees of the element to snap
+        :param max_heading_difference: maximum difference between the heading and the heading of the edge in degrees
+        :param max_distance: maximum distance of an edge with matching heading
+        :return: nearest edge or None if the index is empty
+        """
+        if len(self.edges) == 0:
+            return None
+        query_point = shapely.Point(point[0], point[1])
+        if heading is not None:
+            candidates = np.sort(
+                self._tree.query(query_point, predicate="dwithin", distance=max_distance)
+            )
+            candidates = candidates[
+                heading_difference(self.headings[candidates], heading) < max_heading_difference
+            ]
+            if len(candidates) > 0:
+                distances = shapely.distance(self.geometries[candidates], query_point)
+                return self.edges[int(candidates[np.argmin(distances)])]
+        return self.edges[int(np.min(self._tree.query_nearest(query_point)))]
@@ -6,6 +6,8 @@ from typing import List, Optional, Set, Tuple
 
 from pyproj import Transformer
 
+from crdesigner.map_conversion.osm2cr.converter_modules.utility.idgenerator import IdGenerator
+
 from ._graph import Graph
 from ._graph_edge import GraphEdge
 from ._graph_node import GraphNode
@@ -24,9 +26,17 @@ class SublayeredGraph(Graph):
         traffic_signs: List[GraphTrafficSign],
         traffic_lights: List[GraphTrafficLight],
         sublayer_graph: Graph,
+        id_generator: Optional[IdGenerator] = None,
     ):
         super().__init__(
-            nodes, edges, center_point, bounds, transformer, traffic_signs, traffic_lights
+            nodes,
+            edges,
+            center_point,
+            bounds,
+            transformer,
+            traffic_signs,
+            traffic_lights,
+            id_generator,
         )
         # graph that is connected by crossings only (e.g. pedestrian path)
         self.sublayer_graph = sublayer_graph
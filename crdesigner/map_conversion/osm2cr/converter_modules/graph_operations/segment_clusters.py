@@ -24,6 +24,7 @@ from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_gr
 from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph_node import (
     GraphNode,
 )
+from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 
 def lane_at_start_of_edge(edge: GraphEdge, lane: Lane) -> bool:
@@ -377,6 +378,7 @@ def set_waypoints_of_segments(current_segments: Set[Lane]) -> None:
     return
 
 
+@idgenerator.graph_ids
 def cluster_segments(graph: Graph) -> None:
     """
     groups segments in a graph to clusters
@@ -8,6 +8,7 @@ import warnings
 from typing import List, Set
 
 import numpy as np
+import shapely
 from commonroad.scenario.lanelet import Lanelet, LaneletType, LineMarking
 
 from crdesigner.common.config.osm_config import osm_config as config
@@ -86,6 +87,16 @@ class Edge:
             return False
         return True
 
+    def get_polygon(self) -> shapely.Polygon:
+        """
+        Creates the polygon of the edge in the same way as the polygon of the CommonRoad lanelet
+
+        :return: shapely polygon enclosed by the bounds
+        """
+        return shapely.Polygon(
+            np.concatenate((np.array(self.right_bound), np.flip(np.array(self.left_bound), 0)))
+        )
+
     def to_lanelet(self) -> Lanelet:
         """
         Converts to CommonRoad Lanelet object
@@ -1,5 +1,4 @@
-import copy
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from commonroad.scenario.intersection import Intersection, IntersectionIncomingElement
 from commonroad.scenario.lanelet import LaneletNetwork
@@ -12,6 +11,7 @@ from commonroad.scenario.scenario import (
 )
 from commonroad.scenario.traffic_light import TrafficLight
 from commonroad.scenario.traffic_sign import TrafficSign
+from shapely import STRtree
 
 from crdesigner.common.config.general_config import general_config
 from crdesigner.common.config.osm_config import osm_config as config
@@ -43,6 +43,7 @@ class IntermediateFormat:
         traffic_lights: List[TrafficLight] = None,
         obstacles: List[Obstacle] = None,
         intersections: List[Intersection] = None,
+        id_generator: Optional[idgenerator.IdGenerator] = None,
     ):
         """
         Initialize the Intermediate Format
@@ -53,20 +54,26 @@ class IntermediateFormat:
         :param traffic_lights: List of CommonRoad traffic lights on the map
         :param obstacles: List of CommonRoad obstacles
         :param intersections: List of CommonRoad intersections
+        :param id_generator: generator for new ids of the conversion, the active generator is used if none is given
         """
 
         self.nodes = nodes
+        # edges, traffic signs, and traffic lights are registered by their id
+        self._edges: Dict[int, Edge] = {}
+        self._traffic_signs: Dict[int, TrafficSign] = {}
+        self._traffic_lights: Dict[int, TrafficLight] = {}
         self.edges = edges
         self.intersections = intersections
         self.center_point = center_point
+        self.id_generator = (
+            id_generator if id_generator is not None else idgenerator.current_generator()
+        )
         if self.intersections is None:
             self.intersections = []
-        self.traffic_signs = traffic_signs
-        if self.traffic_signs is None:
-            self.traffic_signs = []
-        self.traffic_lights = traffic_lights
-        if self.traffic_lights is None:
-            self.traffic_lights = []
+        if traffic_signs is not None:
+            self.traffic_signs = traffic_signs
+        if traffic_lights is not None:
+            self.traffic_lights = traffic_lights
         self.obstacles = obstacles
         if self.obstacles is None:
             self.obstacles = []
@@ -74,6 +81,30 @@ class IntermediateFormat:
         if config.INTERSECTION_ENHANCEMENT:
             intersection_enhancement(self)
 
+    @property
+    def edges(self) -> List[Edge]:
+        return list(self._edges.values())
+
+    @edges.setter
+    def edges(self, edges: List[Edge]):
+        self._edges = {edge.id: edge for edge in edges}
+
+    @property
+    def traffic_signs(self) -> List[TrafficSign]:
+        return list(self._traffic_signs.values())
+
+    @traffic_signs.setter
+    def traffic_signs(self, traffic_signs: List[TrafficSign]):
+        self._traffic_signs = {sign.traffic_sign_id: sign for sign in traffic_signs}
+
+    @property
+    def traffic_lights(self) -> List[TrafficLight]:
+        return list(self._traffic_lights.values())
+
+    @traffic_lights.setter
+    def traffic_lights(self, traffic_lights: List[TrafficLight]):
+        self._traffic_lights = {light.traffic_light_id: light for light in traffic_lights}
+
     def find_edge_by_id(self, edge_id):
         """
         Find the edge in the format by id
@@ -81,9 +112,7 @@ class IntermediateFormat:
         :param edge_id: unique id of the edge
         :return: Edge
         """
-        for edge in self.edges:
-            if edge.id == edge_id:
-                return edge
+        return self._edges.get(edge_id)
 
     def find_traffic_sign_by_id(self, sign_id):
         """
@@ -92,9 +121,7 @@ class IntermediateFormat:
         :param sign_id: sign id of the Traffic Sign element
         :return: CommonRoad TrafficSign
         """
-        for sign in self.traffic_signs:
-            if sign.traffic_sign_id == sign_id:
-                return sign
+        return self._traffic_signs.get(sign_id)
 
     def find_traffic_light_by_id(self, light_id):
         """
@@ -103,9 +130,55 @@ class IntermediateFormat:
         :param light_id: light id of the Traffic Light element
         :return: CommonRoad TrafficLight
         """
-        for light in self.traffic_lights:
-            if light.traffic_light_id == light_id:
-                return light
+        return self._traffic_lights.get(light_id)
+
+    def add_edge(self, edge: Edge):
+        """
+        Add an edge to the format
+
+        :param edge: edge to add
+        """
+        self._edges[edge.id] = edge
+
+    def remove_edge(self, edge_id: int):
+        """
+        Remove an edge from the format, references of other edges are not changed
+
+        :param edge_id: id of the edge
+        """
+        self._edges.pop(edge_id, None)
+
+    def add_traffic_sign(self, sign: TrafficSign):
+        """
+        Add a traffic sign to the format
+
+        :param sign: CommonRoad TrafficSign
+        """
+        self._traffic_signs[sign.traffic_sign_id] = sign
+
+    def remove_traffic_sign(self, sign_id: int):
+        """
+        Remove a traffic sign from the format, references of edges are not changed
+
+        :param sign_id: id of the traffic sign
+        """
+        self._traffic_signs.pop(sign_id, None)
+
+    def add_traffic_light(self, light: TrafficLight):
+        """
+        Add a traffic light to the format
+
+        :param light: CommonRoad TrafficLight
+        """
+        self._traffic_lights[light.traffic_light_id] = light
+
+    def remove_traffic_light(self, light_id: int):
+        """
+        Remove a traffic light from the format, references of edges are not changed
+
+        :param light_id: id of the traffic light
+        """
+        self._traffic_lights.pop(light_id, None)
 
     @staticmethod
     def add_is_left_of(incoming_data, incoming_data_id):
@@ -318,7 +391,7 @@ class IntermediateFormat:
         for intersection_node_id in intersections:
             incoming_elements = []
             incoming_data = intersections[intersection_node_id]["incoming"]
-            incoming_ids = [idgenerator.get_id() for incoming in incoming_data]
+            incoming_ids = [graph.id_generator.get() for incoming in incoming_data]
             incoming_data = IntermediateFormat.add_is_left_of(incoming_data, incoming_ids)
             index = 0
             for incoming in incoming_data:
@@ -337,7 +410,7 @@ class IntermediateFormat:
                 )
                 incoming_elements.append(incoming_element)
                 index += 1
-            intersections_cr.append(Intersection(idgenerator.get_id(), incoming_elements))
+            intersections_cr.append(Intersection(graph.id_generator.get(), incoming_elements))
         return intersections_cr
 
     def to_commonroad_scenario(self):
@@ -414,6 +487,7 @@ class IntermediateFormat:
             traffic_signs,
             traffic_lights,
             intersections=intersections,
+            id_generator=graph.id_generator,
         )
 
     @staticmethod
@@ -423,19 +497,22 @@ class IntermediateFormat:
         """
         Calculate all polygon intersections of the lanelets of the two networks.
         For each lanelet of b return the crossing lanelets of a as list.
+        The polygons are created directly from the edges and all lanelets of b are
+        queried at once in a spatial index of the lanelets of a.
 
         :param crossing_interm: crossing network
         :param crossed_interm: network crossed by crossing_interm
         :return: Dict of crossing lanelet ids for each lanelet
         """
-        crossing_lane_network = crossing_interm.to_commonroad_scenario().lanelet_network
-        crossed_lane_network = crossed_interm.to_commonroad_scenario().lanelet_network
-        crossings = dict()
-        for crossed_lanelet in crossed_lane_network.lanelets:
-            crossing_lanelet_ids = crossing_lane_network.find_lanelet_by_shape(
-                crossed_lanelet.polygon
-            )
-            crossings[crossed_lanelet.lanelet_id] = set(crossing_lanelet_ids)
+        crossing_edges = crossing_interm.edges
+        crossed_edges = crossed_interm.edges
+        tree = STRtree([edge.get_polygon() for edge in crossing_edges])
+        crossed_indices, crossing_indices = tree.query(
+            [edge.get_polygon() for edge in crossed_edges], predicate="intersects"
+        )
+        crossings = {edge.id: set() for edge in crossed_edges}
+        for crossed_index, crossing_index in zip(crossed_indices, crossing_indices):
+            crossings[crossed_edges[crossed_index].id].add(crossing_edges[crossing_index].id)
         return crossings
 
     def remove_invalid_references(self):
@@ -443,33 +520,38 @@ class IntermediateFormat:
         remove references of traffic lights and signs that point to
         non existing elements.
         """
-        traffic_light_ids = {tlight.traffic_light_id for tlight in self.traffic_lights}
-        traffic_sign_ids = {tsign.traffic_sign_id for tsign in self.traffic_signs}
-        for edge in self.edges:
+        for edge in self._edges.values():
             for t_light_ref in set(edge.traffic_lights):
-                if t_light_ref not in traffic_light_ids:
+                if t_light_ref not in self._traffic_lights:
                     edge.traffic_lights.remove(t_light_ref)
 
             for t_sign_ref in set(edge.traffic_signs):
-                if t_sign_ref not in traffic_sign_ids:
+                if t_sign_ref not in self._traffic_signs:
                     edge.traffic_signs.remove(t_sign_ref)
 
     def merge(self, other_interm: "IntermediateFormat"):
         """
         Merge other instance of intermediate format into this.
-        The other instance is not changed.
+        The elements of the other instance are moved instead of copied,
+        so the other instance is empty afterwards.
 
         :param other_interm: the indtance of intermediate format to merge
         """
-        self.nodes.extend(copy.deepcopy(other_interm.nodes))
-        edges_to_merge = copy.deepcopy(other_interm.edges)
-        for edge in edges_to_merge:
+        self.nodes.extend(other_interm.nodes)
+        for edge in other_interm._edges.values():
             edge.edge_type = config.SUBLAYER_LANELETTYPE
-        self.edges.extend(edges_to_merge)
-        self.obstacles.extend(copy.deepcopy(other_interm.obstacles))
-        self.traffic_signs.extend(copy.deepcopy(other_interm.traffic_signs))
-        self.traffic_lights.extend(copy.deepcopy(other_interm.traffic_lights))
-        self.intersections.extend(copy.deepcopy(other_interm.intersections))
+        self._edges.update(other_interm._edges)
+        self.obstacles.extend(other_interm.obstacles)
+        self._traffic_signs.update(other_interm._traffic_signs)
+        self._traffic_lights.update(other_interm._traffic_lights)
+        self.intersections.extend(other_interm.intersections)
+
+        other_interm.nodes = []
+        other_interm.edges = []
+        other_interm.obstacles = []
+        other_interm.traffic_signs = []
+        other_interm.traffic_lights = []
+        other_interm.intersections = []
 
     def add_crossing_information(self, crossings: Crossings):
         """
@@ -496,6 +578,7 @@ class IntermediateFormat:
                     i.crossings.add(crossing_id)
 
         # adjust edge type of crossing edges
-        for edge in self.edges:
-            if edge.id in all_crossing_ids:
+        for crossing_id in all_crossing_ids:
+            edge = self.find_edge_by_id(crossing_id)
+            if edge is not None:
                 edge.edge_type = config.CROSSING_LANELETTYPE
@@ -2,7 +2,6 @@ from crdesigner.map_conversion.common import geometry
 from crdesigner.map_conversion.osm2cr.converter_modules.intermediate_operations.traffic_light_generator import (
     TrafficLightGenerator,
 )
-from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 
 def intersection_enhancement(intermediate_format):
@@ -12,10 +11,10 @@ def intersection_enhancement(intermediate_format):
     """
 
     def remove_non_intersection_lights(all_incoming_lanes_in_scenario):
-        traffic_lights_on_intersections = []
+        traffic_lights_on_intersections = set()
         for incoming_lane in all_incoming_lanes_in_scenario:
             if incoming_lane.traffic_lights:
-                traffic_lights_on_intersections.extend(incoming_lane.traffic_lights)
+                traffic_lights_on_intersections.update(incoming_lane.traffic_lights)
         intermediate_format.traffic_lights = list(
             filter(
                 lambda x: x.traffic_light_id in traffic_lights_on_intersections,
@@ -27,9 +26,7 @@ def intersection_enhancement(intermediate_format):
         for lane in incoming_lanes:
             if lane.traffic_lights:
                 for light_id in lane.traffic_lights:
-                    light = intermediate_format.find_traffic_light_by_id(light_id)
-                    if light is not None:
-                        intermediate_format.traffic_lights.remove(light)
+                    intermediate_format.remove_traffic_light(light_id)
             lane.traffic_lights = set()
 
     def remove_innner_lights(intersection, incoming_lanes):
@@ -83,9 +80,9 @@ def intersection_enhancement(intermediate_format):
 
             # create new traffic light
             new_traffic_light = traffic_light_generator.generate_traffic_light(
-                position=position_point, new_id=idgenerator.get_id()
+                position=position_point, new_id=intermediate_format.id_generator.get()
             )
-            intermediate_format.traffic_lights.append(new_traffic_light)
+            intermediate_format.add_traffic_light(new_traffic_light)
 
             # add reference to each incoming lane
             for lane_id in incoming.incoming_lanelets:
@@ -225,7 +222,7 @@ def merge_incoming(incoming, intermediate_format, all_incoming_lanes_in_scenario
             pre_pre_edge.successors.append(edge.id)
 
         # remove pre from edge list
-        intermediate_format.edges.remove(pre)
+        intermediate_format.remove_edge(pre.id)
 
         # update adajcent opposite direction
         if edge.adjacent_left and not edge.adjacent_left_direction_equal:
@@ -291,7 +288,7 @@ def merge_outgoing(outgoing, intermediate_format, all_incoming_lanes_in_scenario
         suc_suc_edge.predecessors.append(outgoing.id)
 
     # remove suc from edge list
-    intermediate_format.edges.remove(suc)
+    intermediate_format.remove_edge(suc.id)
 
     # update adjacent same direction
     if outgoing.adjacent_right and outgoing.adjacent_left_direction_equal:
@@ -2,14 +2,40 @@
 This module provides methods to download OSM maps within the application.
 """
 
+import math
+import os
+import time
 import xml.etree.ElementTree
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError
 from urllib.request import urlopen
 
 import numpy as np
 
 from crdesigner.common.config.osm_config import osm_config as config
 
+OSM_API_URL = "https://api.openstreetmap.org/api/0.6/map?bbox={lon1},{lat1},{lon2},{lat2}"
+
+# retry behaviour of tile downloads: waiting time is DOWNLOAD_BACKOFF_BASE * 2^attempt seconds
+MAX_DOWNLOAD_ATTEMPTS = 5
+DOWNLOAD_BACKOFF_BASE = 1.0
+DOWNLOAD_BACKOFF_MAX = 30.0
+DOWNLOAD_TIMEOUT = 60.0
+# tiles which exceed the node limit of the API are split into four tiles down to this edge length in degree
+MIN_TILE_SIZE = 0.001
+# status codes of temporary errors, e.g., rate limiting or an overloaded server
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504, 509}
+# status codes of areas which are too large, e.g., "You requested too many nodes"
+TOO_LARGE_STATUS_CODES = {400}
+
+# order of the elements in OSM files
+ELEMENT_ORDER = ("node", "way", "relation")
+
+# bounding box of a tile as (lon1, lat1, lon2, lat2) with lon1 < lon2 and lat1 < lat2
+BBox = Tuple[float, float, float, float]
+
 
 def write_bounds_to_file(filename: str, lon1: float, lat1: float, lon2: float, lat2: float):
     """
@@ -35,26 +61,242 @@ def write_bounds_to_file(filename: str, lon1: float, lat1: float, lon2: float, l
     tree.write(filename, encoding="utf-8", xml_declaration=True)
 
 
-def download_map(filename: str, lon1: float, lat1: float, lon2: float, lat2: float):
+def split_into_tiles(
+    lon1: float, lat1: float, lon2: float, lat2: float, tile_size: float
+) -> List[BBox]:
+    """
+    splits an area into tiles of a grid with the given edge length. The grid is aligned to multiples of the edge
+    length, so that overlapping areas share their inner tiles. The tiles are clipped to the area, so that no data
+    outside of the area is requested. Areas which are not larger than one tile are requested as a whole.
+
+    :param lon1: longitude of one border of the area
+    :param lat1: latitude of one border of the area
+    :param lon2: longitude of the opposite border of the area
+    :param lat2: latitude of the opposite border of the area
+    :param tile_size: edge length of the tiles in degree
+    :return: bounding boxes of the tiles which cover the area
+    """
+    lon_min, lon_max = (round(lon, 7) for lon in sorted((lon1, lon2)))
+    lat_min, lat_max = (round(lat, 7) for lat in sorted((lat1, lat2)))
+    if lon_max - lon_min <= tile_size and lat_max - lat_min <= tile_size:
+        return [(lon_min, lat_min, lon_max, lat_max)]
+    tiles = []
+    for i in range(math.floor(lon_min / tile_size), math.ceil(lon_max / tile_size)):
+        for j in range(math.floor(lat_min / tile_size), math.ceil(lat_max / tile_size)):
+            tiles.append(
+                (
+                    max(round(i * tile_size, 7), lon_min),
+                    max(round(j * tile_size, 7), lat_min),
+                    min(round((i + 1) * tile_size, 7), lon_max),
+                    min(round((j + 1) * tile_size, 7), lat_max),
+                )
+            )
+    return [tile for tile in tiles if tile[0] < tile[2] and tile[1] < tile[3]]
+
+
+def _split_tile(bbox: BBox) -> List[BBox]:
+    lon1, lat1, lon2, lat2 = bbox
+    lon_mid, lat_mid = round((lon1 + lon2) / 2, 7), round((lat1 + lat2) / 2, 7)
+    return [
+        (lon1, lat1, lon_mid, lat_mid),
+        (lon_mid, lat1, lon2, lat_mid),
+        (lon1, lat_mid, lon_mid, lat2),
+        (lon_mid, lat_mid, lon2, lat2),
+    ]
+
+
+def _tile_name(bbox: BBox) -> str:
+    return "_".join("{:.7f}".format(coordinate) for coordinate in bbox)
+
+
+def _cached_timestamps(bbox: BBox, cache_path: str) -> List[int]:
+    if not os.path.isdir(cache_path):
+        return []
+    prefix = _tile_name(bbox) + "_"
+    timestamps = [
+        file[len(prefix) : -len(".osm")]
+        for file in os.listdir(cache_path)
+        if file.startswith(prefix) and file.endswith(".osm")
+    ]
+    return sorted(int(timestamp) for timestamp in timestamps if timestamp.isdigit())
+
+
+def _cached_file(bbox: BBox, cache_path: str, timestamp: int) -> Path:
+    return Path(cache_path) / "{}_{}.osm".format(_tile_name(bbox), timestamp)
+
+
+def load_cached_tile(bbox: BBox, cache_path: str, max_age: float) -> Optional[Path]:
+    """
+    looks up the most recently downloaded file of a tile in the cache.
+    The files are named by the bounding box of the tile and the time of the download.
+
+    :param bbox: bounding box of the tile
+    :param cache_path: directory of the cached tiles
+    :param max_age: maximum age of the file in seconds
+    :return: path of the file or None if the tile is not cached or too old
+    """
+    if max_age <= 0:
+        return None
+    timestamps = _cached_timestamps(bbox, cache_path)
+    if not timestamps or time.time() - timestamps[-1] > max_age:
+        return None
+    return _cached_file(bbox, cache_path, timestamps[-1])
+
+
+def download_tile(
+    bbox: BBox,
+    cache_path: str,
+    max_age: float,
+    url_template: str = OSM_API_URL,
+    max_attempts: Optional[int] = None,
+) -> List[Path]:
+    """
+    downloads a tile into the cache unless a recent file of the tile is cached. Temporary errors are retried with
+    exponential backoff and tiles which exceed the node limit of the API are split into four tiles. Split tiles are
+    marked in the cache, so that they are not requested again.
+
+    :param bbox: bounding box of the tile
+    :param cache_path: directory of the cached tiles
+    :param max_age: maximum age of cached files in seconds
+    :param url_template: url of the API containing the placeholders {lon1}, {lat1}, {lon2}, and {lat2}
+    :param max_attempts: maximum number of download attempts; MAX_DOWNLOAD_ATTEMPTS if not provided
+    :return: files containing the tile
+    """
+    max_attempts = max_attempts if max_attempts is not None else MAX_DOWNLOAD_ATTEMPTS
+
+    def download_sub_tiles() -> List[Path]:
+        return [
+            file
+            for sub_tile in _split_tile(bbox)
+            for file in download_tile(sub_tile, cache_path, max_age, url_template, max_attempts)
+        ]
+
+    split_marker = Path(cache_path) / (_tile_name(bbox) + ".split")
+    if split_marker.exists():
+        return download_sub_tiles()
+    cached = load_cached_tile(bbox, cache_path, max_age)
+    if cached is not None:
+        return [cached]
+
+    lon1, lat1, lon2, lat2 = bbox
+    url = url_template.format(lon1=lon1, lat1=lat1, lon2=lon2, lat2=lat2)
+    data = None
+    for attempt in range(max_attempts):
+        try:
+            with urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+                data = response.read()
+            break
+        except HTTPError as error:
+            if error.code in TOO_LARGE_STATUS_CODES and lon2 - lon1 > MIN_TILE_SIZE:
+                os.makedirs(cache_path, exist_ok=True)
+                split_marker.touch()
+                return download_sub_tiles()
+            if error.code not in RETRY_STATUS_CODES or attempt + 1 == max_attempts:
+                raise
+        except OSError:
+            if attempt + 1 == max_attempts:
+                raise
+        time.sleep(min(DOWNLOAD_BACKOFF_BASE * 2**attempt, DOWNLOAD_BACKOFF_MAX))
+
+    # the file is renamed after writing, so that interrupted downloads do not leave incomplete tiles in the cache
+    os.makedirs(cache_path, exist_ok=True)
+    outdated = _cached_timestamps(bbox, cache_path)
+    file = _cached_file(bbox, cache_path, int(time.time()))
+    temporary_file = file.with_suffix(".osm.{}.tmp".format(os.getpid()))
+    with open(temporary_file, "wb") as f:
+        f.write(data)
+    os.replace(temporary_file, file)
+    for timestamp in outdated:
+        if _cached_file(bbox, cache_path, timestamp) != file:
+            os.remove(_cached_file(bbox, cache_path, timestamp))
+    return [file]
+
+
+def merge_osm_files(files: List[Path], filename: str, bounds: Optional[BBox] = None):
+    """
+    merges OSM files into one file. Elements contained in several files, e.g., ways crossing tile borders, are only
+    kept once in their most recent version.
+
+    :param files: OSM files
+    :param filename: name of the merged file
+    :param bounds: bounds of the merged file as (lon1, lat1, lon2, lat2)
+    """
+    elements: Dict[str, Dict[int, xml.etree.ElementTree.Element]] = {
+        tag: {} for tag in ELEMENT_ORDER
+    }
+    for file in files:
+        for element in xml.etree.ElementTree.parse(file).getroot():
+            if element.tag not in elements:
+                continue
+            element_id = int(element.get("id"))
+            previous = elements[element.tag].get(element_id)
+            if previous is None or int(element.get("version", 0)) > int(previous.get("version", 0)):
+                elements[element.tag][element_id] = element
+
+    root = xml.etree.ElementTree.Element(
+        "osm", {"version": "0.6", "generator": "CommonRoad Scenario Designer"}
+    )
+    if bounds is not None:
+        lon1, lat1, lon2, lat2 = bounds
+        xml.etree.ElementTree.SubElement(
+            root,
+            "bounds",
+            {
+                "minlat": str(min(lat1, lat2)),
+                "minlon": str(min(lon1, lon2)),
+                "maxlat": str(max(lat1, lat2)),
+                "maxlon": str(max(lon1, lon2)),
+            },
+        )
+    for tag in ELEMENT_ORDER:
+        for element_id in sorted(elements[tag]):
+            root.append(elements[tag][element_id])
+    xml.etree.ElementTree.ElementTree(root).write(filename, encoding="utf-8", xml_declaration=True)
+
+
+def download_map(
+    filename: str,
+    lon1: float,
+    lat1: float,
+    lon2: float,
+    lat2: float,
+    tile_size: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    max_age: Optional[float] = None,
+    url_template: str = OSM_API_URL,
+):
     """
-    downloads an osm map of a specified area and saves it to disk
+    downloads an osm map of a specified area and saves it to disk. The area is split into tiles, which are
+    downloaded concurrently, cached on disk, and merged into one file. Cached tiles are reused, so that an
+    interrupted download is resumed by calling the function again.
 
     :param filename: name of the file the map is saved to
     :param lon1: longitude of the left border of the downloaded area
     :param lat1: latitude of the upper border of the downloaded area
     :param lon2: longitude of the right border of the downloaded area
     :param lat2: latitude of the lower border of the downloaded area
+    :param tile_size: edge length of the tiles in degree; config.DOWNLOAD_TILE_SIZE if not provided
+    :param max_workers: number of concurrent downloads; config.DOWNLOAD_PARALLEL_REQUESTS if not provided
+    :param cache_path: directory of the cached tiles; config.DOWNLOAD_CACHE_PATH if not provided
+    :param max_age: maximum age of cached tiles in seconds; config.DOWNLOAD_CACHE_MAX_AGE if not provided
+    :param url_template: url of the API containing the placeholders {lon1}, {lat1}, {lon2}, and {lat2}
     """
-    # query = "https://overpass-api.de/api/map?bbox={},{},{},{}".format(
-    #     lon1, lat1, lon2, lat2
-    # )
-    query = "https://api.openstreetmap.org/api/0.6/map?bbox={},{},{},{}".format(
-        lon1, lat1, lon2, lat2
-    )
-    print("downloading map")
-    data = urlopen(query).read()
-    with open(filename, "wb") as file:
-        file.write(data)
+    tile_size = tile_size if tile_size is not None else config.DOWNLOAD_TILE_SIZE
+    max_workers = max_workers if max_workers is not None else config.DOWNLOAD_PARALLEL_REQUESTS
+    cache_path = cache_path if cache_path is not None else config.DOWNLOAD_CACHE_PATH
+    max_age = max_age if max_age is not None else config.DOWNLOAD_CACHE_MAX_AGE
+
+    tiles = split_into_tiles(lon1, lat1, lon2, lat2, tile_size)
+    print("downloading map in {} tiles".format(len(tiles)))
+    # all tiles are attempted before an error is raised, so that a repeated download only requests the failed tiles
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(download_tile, tile, cache_path, max_age, url_template)
+            for tile in tiles
+        ]
+    files = [file for future in futures for file in future.result()]
+    merge_osm_files(files, filename, (lon1, lat1, lon2, lat2))
     print("writing custom bounds")
     write_bounds_to_file(filename, lon1, lat1, lon2, lat2)
 
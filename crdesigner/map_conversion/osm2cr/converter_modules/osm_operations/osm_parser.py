@@ -971,21 +971,22 @@ def create_graph(file_path: str) -> Graph:
             crossing_points,
             transformer,
         ) = parse_file(file, accepted_ways, config.REJECTED_TAGS, custom_bounds)
-        graph = roads_to_graph(
-            roads,
-            points,
-            restrictions,
-            center_point,
-            bounds,
-            traffic_signs,
-            traffic_lights,
-            transformer,
-            additional_nodes,
-        )
+        with idgenerator.id_context(id_generator):
+            graph = roads_to_graph(
+                roads,
+                points,
+                restrictions,
+                center_point,
+                bounds,
+                traffic_signs,
+                traffic_lights,
+                transformer,
+                additional_nodes,
+            )
         return graph, crossing_points
 
-    #  reset id generator for new graph
-    idgenerator.reset()
+    #  new id generator for new graph, all layers share the generator
+    id_generator = idgenerator.IdGenerator()
 
     if config.EXTRACT_SUBLAYER:
         if _value_set(config.ACCEPTED_HIGHWAYS_MAINLAYER) & _value_set(
@@ -1032,6 +1033,7 @@ def create_graph(file_path: str) -> Graph:
             extended_main_graph.traffic_signs,
             extended_main_graph.traffic_lights,
             sub_g,
+            id_generator,
         )
 
     else:
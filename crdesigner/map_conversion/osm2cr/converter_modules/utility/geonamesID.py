@@ -1,28 +1,46 @@
 """
 This module is used to retrieve a geonamesID for a given coordinate.
-An Internet connection is needed and a valid geonames username has to be provided in the osm_config.py file
+An Internet connection is needed and a valid geonames username has to be provided in the osm_config.py file,
+unless an offline index of the geonames cities is used.
 """
 
 import json
 import logging
+from typing import List, Optional, Sequence, Tuple
 from urllib.error import URLError
 from urllib.request import urlopen
 
-import kdtree
-
 from crdesigner.common.config.osm_config import osm_config as config
 from crdesigner.map_conversion.osm2cr.converter_modules.utility.labeling_create_tree import (
+    CityIndex,
     find_nearest_neighbor,
 )
 
 
-def get_geonamesID(lat: float, lng: float, cities_kdtree: kdtree.KDNode = None) -> int:
+def get_geonamesIDs(
+    coords: Sequence[Tuple[float, float]], cities_kdtree: Optional[CityIndex] = None
+) -> List[int]:
+    """
+    Retrieve the geonamesIDs for many scenario coordinate centers at once
+
+    :param1 coords: Latitude and longitude of each scenario center
+    :param2 cities_kdtree: None → use API for each center, CityIndex → use offline implementation
+    :return: GeonamesID for each scenario
+    """
+    if cities_kdtree is None:
+        return [get_geonamesID(lat, lng) for lat, lng in coords]
+    if len(coords) == 0:
+        return []
+    return cities_kdtree.nearest_geoname_ids(coords)
+
+
+def get_geonamesID(lat: float, lng: float, cities_kdtree: Optional[CityIndex] = None) -> int:
     """
     Retrieve a geonamesID for a given scenario coordinate center
 
     :param1 lat: Latitude of scenario center
     :param2 lng: Longitude of scenario center
-    :param3 cities_kdtree: None → use API, kdtree.KDNode → use offline implementation
+    :param3 cities_kdtree: None → use API, CityIndex → use offline implementation
     :return: GeonamesID for scenario
     """
     # try to request information for the given scenario center
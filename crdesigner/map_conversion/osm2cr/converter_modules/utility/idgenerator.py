@@ -1,8 +1,22 @@
 """
 This module provides a simple id generator which can be used to draw unique ids
 without instantiation across several modules.
+
+Each conversion draws its ids from its own generator, which is activated for the duration of the
+conversion steps with id_context. Thereby, repeated conversions of the same file yield the same ids
+and several conversions can run concurrently in different threads of one process.
+The graph operations which create lanes, traffic signs, traffic lights or nodes are decorated with graph_ids, so
+that they draw from the generator of their graph even if they are called outside of a conversion step, e.g., to edit
+a converted graph. The module level generator is only used if no generator is active.
 """
 
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, TypeVar
+
+Function = TypeVar("Function", bound=Callable)
+
 
 class IdGenerator:
     """
@@ -35,13 +49,64 @@ class IdGenerator:
         self.counter = 0
 
 
+# generator of the conversion running in the current thread
+_active_generator: ContextVar[Optional[IdGenerator]] = ContextVar(
+    "active_id_generator", default=None
+)
+
+
+@contextmanager
+def id_context(id_generator: Optional[IdGenerator] = None) -> Iterator[IdGenerator]:
+    """
+    activates an id generator for the current thread, all ids drawn with get_id inside the block are
+    drawn from this generator
+
+    :param id_generator: generator to activate, a new generator is created if none is given
+    :return: the active generator
+    """
+    if id_generator is None:
+        id_generator = IdGenerator()
+    token = _active_generator.set(id_generator)
+    try:
+        yield id_generator
+    finally:
+        _active_generator.reset(token)
+
+
+def graph_ids(function: Function) -> Function:
+    """
+    decorates a graph operation, all ids drawn during the operation are drawn from the generator of the graph which
+    is passed as first argument, e.g., self of the methods of a graph
+
+    :param function: graph operation
+    :return: decorated operation
+    """
+
+    @functools.wraps(function)
+    def wrapper(graph, *args, **kwargs):
+        with id_context(graph.id_generator):
+            return function(graph, *args, **kwargs)
+
+    return wrapper
+
+
+def current_generator() -> IdGenerator:
+    """
+    returns the generator of the running conversion
+
+    :return: active generator or the module level generator if no generator is active
+    """
+    active = _active_generator.get()
+    return generator if active is None else active
+
+
 def get_id():
     """
     draws a unique id
 
     :return: new id
     """
-    return generator.get()
+    return current_generator().get()
 
 
 def reset():
@@ -50,7 +115,7 @@ def reset():
 
     :return: None
     """
-    generator.reset()
+    current_generator().reset()
 
 
 generator = IdGenerator()
@@ -1,8 +1,36 @@
+import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import List, Sequence, Tuple, Union
 
-import kdtree
+import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
+
+CITIES_FILE = Path(__file__).parent.joinpath("cities500.zip")
+
+# columns of the cities files of geonames
+COLUMNS = [
+    "geonameid",
+    "name",
+    "asciiname",
+    "alternatenames",
+    "lat",
+    "lng",
+    "feature class",
+    "feature code",
+    "country code",
+    "cc2",
+    "admin1 code",
+    "admin2 code",
+    "admin3 code",
+    "admin4 code",
+    "population",
+    "elevation",
+    "dem",
+    "timezone",
+    "modification date",
+]
 
 
 class City:
@@ -32,49 +60,216 @@ class City:
         return self.get_label()
 
 
-def create_tree(df: pd.DataFrame) -> kdtree.KDNode:
-    assert "lat" in df.columns and "lng" in df.columns, "DataFrame needs 'lat' and 'lng' columns"
-    city_list = df.apply(get_city_from_row, axis=1).tolist()
-    return kdtree.create(city_list)
+def to_unit_sphere(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """
+    Converts latitudes and longitudes to points on the unit sphere. The euclidean distance between two points is
+    monotonic in their great-circle distance, so that the nearest neighbour on the sphere is the nearest city.
+
+    :param lat: Latitudes in degree.
+    :param lng: Longitudes in degree.
+    :return: Points with x, y, and z coordinate.
+    """
+    lat, lng = np.radians(lat), np.radians(lng)
+    cos_lat = np.cos(lat)
+    return np.stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)), axis=-1)
+
+
+class CityIndex:
+    """
+    Offline index of the cities of geonames for nearest neighbour queries. The cities are stored in NumPy arrays and
+    a cKDTree on their 3D unit sphere coordinates answers the queries.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lng: np.ndarray,
+        geoname_ids: np.ndarray,
+        names: np.ndarray,
+        countries: np.ndarray,
+        timezones: np.ndarray,
+    ):
+        """
+        Constructor.
+
+        :param lat: Latitudes of the cities.
+        :param lng: Longitudes of the cities.
+        :param geoname_ids: Geonames IDs of the cities.
+        :param names: Names of the cities.
+        :param countries: Country codes of the cities.
+        :param timezones: Timezones of the cities.
+        """
+        self.lat = np.asarray(lat, dtype=float)
+        self.lng = np.asarray(lng, dtype=float)
+        self.geoname_ids = np.asarray(geoname_ids, dtype=np.int64)
+        self.names = np.asarray(names, dtype=str)
+        self.countries = np.asarray(countries, dtype=str)
+        self.timezones = np.asarray(timezones, dtype=str)
+        self._tree = cKDTree(to_unit_sphere(self.lat, self.lng))
+
+    def __len__(self) -> int:
+        return len(self.geoname_ids)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "CityIndex":
+        """
+        Creates the index from a table of cities.
+
+        :param df: Cities with the columns of the geonames cities files.
+        :return: Index.
+        """
+        assert (
+            "lat" in df.columns and "lng" in df.columns
+        ), "DataFrame needs 'lat' and 'lng' columns"
+
+        def label(column: str) -> np.ndarray:
+            return (
+                df[column]
+                .astype(str)
+                .str.replace(" ", "-")
+                .str.replace("/", "-")
+                .to_numpy(dtype=str)
+            )
+
+        return cls(
+            df["lat"].to_numpy(),
+            df["lng"].to_numpy(),
+            df["geonameid"].to_numpy(),
+            label("asciiname"),
+            label("country code"),
+            label("timezone"),
+        )
+
+    @classmethod
+    def from_file(cls, file: Path = CITIES_FILE, cache: bool = True) -> "CityIndex":
+        """
+        Creates the index from a cities file. The index is stored as .npz file next to the cities file and is loaded
+        instead of the cities file as long as it is newer.
+
+        :param file: Zip file that can be downloaded from https://download.geonames.org/export/dump/.
+        :param cache: Boolean indicating whether the stored index is used and created.
+        :return: Index.
+        """
+        file = Path(file)
+        index_file = file.with_suffix(".npz")
+        if (
+            cache
+            and index_file.exists()
+            and (not file.exists() or index_file.stat().st_mtime >= file.stat().st_mtime)
+        ):
+            return cls.load(index_file)
+
+        df = pd.read_csv(
+            file,
+            compression="zip",
+            sep="\t",
+            names=COLUMNS,
+            usecols=["geonameid", "asciiname", "lat", "lng", "country code", "timezone"],
+        )
+        index = cls.from_dataframe(df)
+        if cache:
+            try:
+                index.save(index_file)
+            except OSError:
+                logging.warning(f"The index of the cities could not be stored at {index_file}.")
+        return index
+
+    def save(self, file: Path):
+        """
+        Stores the arrays of the index.
+
+        :param file: Path of the .npz file.
+        """
+        np.savez(
+            file,
+            lat=self.lat,
+            lng=self.lng,
+            geoname_ids=self.geoname_ids,
+            names=self.names,
+            countries=self.countries,
+            timezones=self.timezones,
+        )
+
+    @classmethod
+    def load(cls, file: Path) -> "CityIndex":
+        """
+        Loads an index stored by save.
+
+        :param file: Path of the .npz file.
+        :return: Index.
+        """
+        with np.load(file) as data:
+            return cls(
+                data["lat"],
+                data["lng"],
+                data["geoname_ids"],
+                data["names"],
+                data["countries"],
+                data["timezones"],
+            )
+
+    def nearest(self, coords: Union[Sequence[Tuple[float, float]], np.ndarray]) -> np.ndarray:
+        """
+        Finds the nearest city of each coordinate.
+
+        :param coords: Latitude and longitude of each coordinate.
+        :return: Indices of the nearest cities.
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        _, indices = self._tree.query(to_unit_sphere(coords[:, 0], coords[:, 1]))
+        return indices
+
+    def nearest_geoname_ids(
+        self, coords: Union[Sequence[Tuple[float, float]], np.ndarray]
+    ) -> List[int]:
+        """
+        Finds the geonames ID of the nearest city of each coordinate.
+
+        :param coords: Latitude and longitude of each coordinate.
+        :return: Geonames IDs.
+        """
+        return self.geoname_ids[self.nearest(coords)].tolist()
+
+    def city(self, index: int) -> City:
+        """
+        Creates the city object of a city in the index.
+
+        :param index: Index of the city.
+        :return: City.
+        """
+        return City(
+            float(self.lat[index]),
+            float(self.lng[index]),
+            int(self.geoname_ids[index]),
+            str(self.names[index]),
+            str(self.countries[index]),
+            str(self.timezones[index]),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_city_index(file: Path = CITIES_FILE) -> CityIndex:
+    """
+    Returns the index of a cities file, which is created once per process.
+
+    :param file: Zip file of the cities.
+    :return: Index.
+    """
+    return CityIndex.from_file(Path(file))
+
+
+def create_tree(df: pd.DataFrame) -> CityIndex:
+    return CityIndex.from_dataframe(df)
 
 
-def create_tree_from_file(
-    file: Path = Path(__file__).parent.joinpath("cities500.zip"),
-) -> kdtree.KDNode:
+def create_tree_from_file(file: Path = CITIES_FILE) -> CityIndex:
     """
-    Create kdtree.KDNode from cities file.
+    Create city index from cities file.
 
     :param file: zip files that can be downloaded from https://download.geonames.org/export/dump/;
-    :return tree: kdtree.KDNode -- data structured into cities
+    :return tree: CityIndex -- data structured into cities
     """
-    df = pd.read_csv(
-        file,
-        compression="zip",
-        sep="\t",
-        names=[
-            "geonameid",
-            "name",
-            "asciiname",
-            "alternatenames",
-            "lat",
-            "lng",
-            "feature class",
-            "feature code",
-            "country code",
-            "cc2",
-            "admin1 code",
-            "admin2 code",
-            "admin3 code",
-            "admin4 code",
-            "population",
-            "elevation",
-            "dem",
-            "timezone",
-            "modification date",
-        ],
-    )
-    tree = create_tree(df)
-    return tree
+    return CityIndex.from_file(file)
 
 
 def get_city_from_row(row: pd.Series) -> City:
@@ -89,12 +284,11 @@ def get_city_from_row(row: pd.Series) -> City:
     return City(row["lat"], row["lng"], row["geonameid"], name, country, timezone)
 
 
-def find_nearest_neighbor(tree: kdtree.KDNode, coords: Tuple[float, float]) -> City:
+def find_nearest_neighbor(tree: CityIndex, coords: Tuple[float, float]) -> City:
     """
     Finds the nearest neighbor city for a given coordinate tuple (lat, lng) of a city
 
-    :param tree: KDTree consisting of the coordinates of all possible nearest neighbors
+    :param tree: Index consisting of the coordinates of all possible nearest neighbors
     :param coords: Tuple of lat, lng as floats we want to find the nearest neighbor city for
     """
-    neighbor, distance = tree.search_nn(coords)
-    return neighbor.data
+    return tree.city(int(tree.nearest([coords])[0]))
@@ -1,37 +1,24 @@
 import inspect
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from commonroad.planning.planning_problem import PlanningProblemSet
-from commonroad.scenario.scenario import Scenario, Tag
 from typing_extensions import Annotated
 
 from crdesigner.common.config.general_config import general_config
 from crdesigner.common.config.lanelet2_config import lanelet2_config
-from crdesigner.common.file_reader import CRDesignerFileReader
-from crdesigner.common.file_writer import CRDesignerFileWriter, OverwriteExistingFile
-from crdesigner.map_conversion.map_conversion_interface import (
-    commonroad_to_lanelet,
-    commonroad_to_sumo,
-    lanelet_to_commonroad,
-    opendrive_to_commonroad,
-    opendrive_to_lanelet,
-    osm_to_commonroad,
-    sumo_to_commonroad,
-)
-from crdesigner.ui.gui.start_gui import start_gui
-from crdesigner.verification_repairing.config import MapVerParams
-from crdesigner.verification_repairing.map_verification_repairing import (
-    verify_and_repair_dir_maps,
-    verify_and_repair_scenario,
-)
+
+if TYPE_CHECKING:
+    from commonroad.scenario.scenario import Scenario
+
+# The converters, the GUI, and the map verification are imported inside the commands using them,
+# so that a command does not pay for loading the dependencies of all other commands.
 
 cli = typer.Typer(help="Toolbox for Map Conversion and Scenario Creation for Autonomous Vehicles")
 
 
 def store_scenario(
-    sc: Scenario,
+    sc: "Scenario",
     output_file: str,
     force_overwrite: bool,
     author: str,
@@ -48,6 +35,11 @@ def store_scenario(
     @param affiliation: Affiliation of author of CommonRoad scenario.
     @param tags: Tags of CommonRoad scenario.
     """
+    from commonroad.planning.planning_problem import PlanningProblemSet
+    from commonroad.scenario.scenario import Tag
+
+    from crdesigner.common.file_writer import CRDesignerFileWriter, OverwriteExistingFile
+
     tags = set([Tag(t) for t in tags]) if tags is not None else None
     writer = CRDesignerFileWriter(
         scenario=sc,
@@ -83,10 +75,13 @@ def main(
     ] = "",
     tags: Annotated[Optional[List[str]], typer.Option(help="Tags for the created map")] = None,
 ):
-    if ctx.invoked_subcommand is None and input_file is not None:
-        start_gui(input_file.name)
-    elif ctx.invoked_subcommand is None and input_file is None:
-        start_gui()
+    if ctx.invoked_subcommand is None:
+        from crdesigner.ui.gui.start_gui import start_gui
+
+        if input_file is not None:
+            start_gui(input_file.name)
+        else:
+            start_gui()
     else:
         # Set projection if provided
         if projection is not None:
@@ -105,11 +100,19 @@ def main(
 
 @cli.command()
 def gui(ctx: typer.Context):
+    from crdesigner.ui.gui.start_gui import start_gui
+
     start_gui(ctx.obj["input_file"])
 
 
 @cli.command()
 def verify_map(ctx: typer.Context):
+    from crdesigner.common.file_reader import CRDesignerFileReader
+    from crdesigner.common.file_writer import CRDesignerFileWriter
+    from crdesigner.verification_repairing.map_verification_repairing import (
+        verify_and_repair_scenario,
+    )
+
     sc, pp = CRDesignerFileReader(ctx.obj["input_file"]).open()
     sc, valid = verify_and_repair_scenario(sc)
     if not valid:
@@ -132,6 +135,11 @@ def verify_map(ctx: typer.Context):
 
 @cli.command()
 def verify_dir(ctx: typer.Context):
+    from crdesigner.verification_repairing.config import MapVerParams
+    from crdesigner.verification_repairing.map_verification_repairing import (
+        verify_and_repair_dir_maps,
+    )
+
     config = MapVerParams()
     config.evaluation.overwrite_scenario = ctx.obj["force_overwrite"]
     verify_and_repair_dir_maps(ctx.obj["input_file"], config)
@@ -139,6 +147,8 @@ def verify_dir(ctx: typer.Context):
 
 @cli.command()
 def odrcr(ctx: typer.Context):
+    from crdesigner.map_conversion.map_conversion_interface import opendrive_to_commonroad
+
     scenario = opendrive_to_commonroad(ctx.obj["input_file"])
     store_scenario(
         scenario,
@@ -169,6 +179,8 @@ def lanelet2cr(
         ),
     ] = False,
 ):
+    from crdesigner.map_conversion.map_conversion_interface import lanelet_to_commonroad
+
     config_lanelet2 = lanelet2_config
     config_lanelet2.adjacencies = adjacencies
     config_lanelet2.left_driving = left_driving
@@ -191,6 +203,8 @@ def crlanelet2(
         bool, typer.Option(..., help="Overwrite existing CommonRoad file")
     ] = False,
 ):
+    from crdesigner.map_conversion.map_conversion_interface import commonroad_to_lanelet
+
     config = lanelet2_config
     config.autoware = autoware
     config.use_local_coordinates = local_coordinates
@@ -199,6 +213,8 @@ def crlanelet2(
 
 @cli.command()
 def osmcr(ctx: typer.Context):
+    from crdesigner.map_conversion.map_conversion_interface import osm_to_commonroad
+
     scenario = osm_to_commonroad(ctx.obj["input_file"])
     store_scenario(
         scenario,
@@ -212,6 +228,8 @@ def osmcr(ctx: typer.Context):
 
 @cli.command()
 def sumocr(ctx: typer.Context):
+    from crdesigner.map_conversion.map_conversion_interface import sumo_to_commonroad
+
     scenario = sumo_to_commonroad(ctx.obj["input_file"])
     store_scenario(
         scenario,
@@ -225,13 +243,161 @@ def sumocr(ctx: typer.Context):
 
 @cli.command()
 def crsumo(ctx: typer.Context):
+    from crdesigner.map_conversion.map_conversion_interface import commonroad_to_sumo
+
     commonroad_to_sumo(ctx.obj["input_file"], ctx.obj["output_file"])
 
 
 @cli.command()
 def odrlanelet2(ctx: typer.Context):
+    from crdesigner.map_conversion.map_conversion_interface import opendrive_to_lanelet
+
     opendrive_to_lanelet(ctx.obj["input_file"], ctx.obj["output_file"])
 
 
+@cli.command()
+def generate_map(
+    ctx: typer.Context,
+    rows: Annotated[int, typer.Option(help="Rows of the grid of intersections")] = 3,
+    columns: Annotated[int, typer.Option(help="Columns of the grid of intersections")] = 3,
+    lanelets: Annotated[
+        Optional[int],
+        typer.Option(help="Minimum number of lanelets; overrides the number of rows and columns"),
+    ] = None,
+    seed: Annotated[int, typer.Option(help="Seed of the random number generator")] = 0,
+    road_probability: Annotated[
+        float, typer.Option(help="Probability that two neighbouring intersections are connected")
+    ] = 1.0,
+    road_segments: Annotated[
+        int, typer.Option(help="Number of lanelets of a road between two intersections")
+    ] = 1,
+    lanes_per_direction: Annotated[int, typer.Option(help="Number of lanes per direction")] = 1,
+    traffic_signs: Annotated[bool, typer.Option(help="Add traffic signs")] = True,
+    traffic_lights: Annotated[bool, typer.Option(help="Add traffic lights")] = False,
+    gaps: Annotated[
+        int, typer.Option(help="Number of lanelets with a gap to their predecessor")
+    ] = 0,
+    flipped_boundaries: Annotated[
+        int, typer.Option(help="Number of lanelets with swapped left and right boundary")
+    ] = 0,
+    dangling_references: Annotated[
+        int, typer.Option(help="Number of lanelets referencing a non-existent successor")
+    ] = 0,
+):
+    from crdesigner.common.synthetic_map import (
+        SyntheticMapConfig,
+        generate_synthetic_map,
+    )
+
+    parameters = dict(
+        seed=seed,
+        road_probability=road_probability,
+        road_segments=road_segments,
+        lanes_per_direction=lanes_per_direction,
+        traffic_signs=traffic_signs,
+        traffic_lights=traffic_lights,
+        num_gaps=gaps,
+        num_flipped_boundaries=flipped_boundaries,
+        num_dangling_references=dangling_references,
+    )
+    if lanelets is not None:
+        config = SyntheticMapConfig.for_lanelet_count(lanelets, **parameters)
+    else:
+        config = SyntheticMapConfig(rows=rows, columns=columns, **parameters)
+    store_scenario(
+        generate_synthetic_map(config),
+        ctx.obj["output_file"],
+        ctx.obj["force_overwrite"],
+        ctx.obj["author"],
+        ctx.obj["affiliation"],
+        ctx.obj["tags"],
+    )
+
+
+@cli.command()
+def generate_traffic_lights(
+    ctx: typer.Context,
+    intersections: Annotated[
+        Optional[List[int]],
+        typer.Option(
+            help="IDs of the intersections; all intersections are signalized if none are given"
+        ),
+    ] = None,
+    green: Annotated[int, typer.Option(help="Duration of the green phases in time steps")] = 300,
+    yellow: Annotated[int, typer.Option(help="Duration of the yellow phases in time steps")] = 30,
+    red_yellow: Annotated[
+        int, typer.Option(help="Duration of the red-yellow phases in time steps")
+    ] = 10,
+    all_red: Annotated[
+        int, typer.Option(help="Time steps between the phases of two signal groups")
+    ] = 20,
+    left_green: Annotated[
+        int, typer.Option(help="Duration of the protected left turn phases in time steps")
+    ] = 0,
+    time_offset: Annotated[int, typer.Option(help="Time offset of the cycles in time steps")] = 0,
+    min_red: Annotated[
+        int, typer.Option(help="Minimal duration of the red phases in time steps")
+    ] = 0,
+):
+    from crdesigner.common.file_reader import CRDesignerFileReader
+    from crdesigner.common.file_writer import CRDesignerFileWriter, OverwriteExistingFile
+    from crdesigner.common.traffic_light_program import (
+        TrafficLightTimings,
+        create_traffic_light_program,
+    )
+
+    sc, pp = CRDesignerFileReader(ctx.obj["input_file"]).open()
+    timings = TrafficLightTimings(
+        green, yellow, red_yellow, all_red, left_green, time_offset, min_red
+    )
+    for intersection in sc.lanelet_network.intersections:
+        if not intersections or intersection.intersection_id in intersections:
+            create_traffic_light_program(
+                sc.lanelet_network, intersection, timings, sc.generate_object_id
+            )
+
+    file_path = (
+        ctx.obj["output_file"] if ctx.obj["output_file"] is not None else ctx.obj["input_file"]
+    )
+    CRDesignerFileWriter(scenario=sc, planning_problem_set=pp).write_to_file(
+        str(file_path),
+        OverwriteExistingFile.ALWAYS if ctx.obj["force_overwrite"] else OverwriteExistingFile.SKIP,
+    )
+
+
+@cli.command()
+def render_video(
+    ctx: typer.Context,
+    time_begin: Annotated[int, typer.Option(help="First time step of the video")] = 0,
+    time_end: Annotated[
+        Optional[int],
+        typer.Option(help="Last time step; the final time step of the scenario if not given"),
+    ] = None,
+    width: Annotated[int, typer.Option(help="Width of the video in pixels")] = 1280,
+    fps: Annotated[
+        Optional[float],
+        typer.Option(help="Frames per second; the real-time frame rate if not given"),
+    ] = None,
+    processes: Annotated[int, typer.Option(help="Number of processes rendering frames")] = 1,
+):
+    from crdesigner.common.file_reader import CRDesignerFileReader
+    from crdesigner.common.scenario_animation import save_scenario_video
+
+    sc, pp = CRDesignerFileReader(ctx.obj["input_file"]).open()
+    output_file = ctx.obj["output_file"]
+    if output_file is None:
+        output_file = Path(ctx.obj["input_file"]).with_suffix(".mp4")
+    save_scenario_video(
+        sc,
+        output_file,
+        pp,
+        time_begin=time_begin,
+        time_end=time_end,
+        width=width,
+        fps=fps,
+        num_processes=processes,
+    )
+
+
 if __name__ == "__main__":
     cli()
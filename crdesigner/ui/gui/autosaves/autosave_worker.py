@@ -0,0 +1,192 @@
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import threading
+from typing import List, Optional, Tuple
+
+from commonroad.common.writer.file_writer_interface import OverwriteExistingFile
+from commonroad.planning.planning_problem import PlanningProblemSet
+from commonroad.scenario.scenario import Scenario
+
+from crdesigner.common.file_writer import CRDesignerFileWriter
+from crdesigner.ui.gui.autosaves.autosaves_setup import DIR_AUTOSAVE
+
+
+class AutosaveWorker:
+    """
+    Writes autosaves of a scenario in a background thread.
+
+    A call of submit only takes a snapshot of the scenario (a pickled copy), the XML export happens in the worker
+    thread. Snapshots which arrive while the worker is busy replace each other, so only the latest one is written.
+    Snapshots identical to the last written one are skipped. Files are written to a temporary file and then renamed,
+    so an autosave is never left half-written. The previous autosaves are kept as numbered versions next to the
+    latest one.
+    """
+
+    def __init__(
+        self,
+        directory: str = DIR_AUTOSAVE,
+        filename: str = "autosave.xml",
+        versions: int = 3,
+        verify_repair_scenario: bool = False,
+    ):
+        """
+        :param directory: Directory in which the autosaves are stored
+        :param filename: Name of the latest autosave
+        :param versions: Number of kept autosaves including the latest one
+        :param verify_repair_scenario: Whether the scenario is verified and repaired before writing it if
+            not specified for a snapshot
+        """
+        assert versions >= 1
+        self.directory = directory
+        self.filename = filename
+        self.versions = versions
+        self.verify_repair_scenario = verify_repair_scenario
+
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[bytes, bool]] = None
+        self._busy = False
+        self._stopped = False
+        self._last_digest: Optional[bytes] = None
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        """
+        :return: Path of the latest autosave
+        """
+        return os.path.join(self.directory, self.filename)
+
+    def version_paths(self) -> List[str]:
+        """
+        :return: Paths of all autosave versions, newest first
+        """
+        root, ext = os.path.splitext(self.path)
+        return [self.path] + [f"{root}_{i}{ext}" for i in range(1, self.versions)]
+
+    def submit(
+        self,
+        scenario: Optional[Scenario],
+        planning_problem_set: Optional[PlanningProblemSet] = None,
+        verify_repair_scenario: Optional[bool] = None,
+    ) -> None:
+        """
+        Takes a snapshot of the scenario and schedules writing it.
+
+        :param scenario: Scenario which should be saved
+        :param planning_problem_set: Planning problems which should be saved with the scenario
+        :param verify_repair_scenario: Whether the snapshot is verified and repaired before writing it;
+            the setting of the worker is used if None
+        """
+        if scenario is None:
+            return
+        if verify_repair_scenario is None:
+            verify_repair_scenario = self.verify_repair_scenario
+        snapshot = pickle.dumps((scenario, planning_problem_set), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._condition:
+            if self._stopped:
+                return
+            self._pending = (snapshot, verify_repair_scenario)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all submitted snapshots are written.
+
+        :param timeout: Maximum waiting time in seconds
+        :return: True if no writing is pending anymore
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def discard(self) -> None:
+        """
+        Drops the pending snapshot and removes all autosave versions, e.g., after the scenario was saved by the user.
+        """
+        with self._condition:
+            self._pending = None
+            self._condition.wait_for(lambda: not self._busy)
+            self._last_digest = None
+            for path in self.version_paths():
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Writes the pending snapshot and stops the worker thread.
+
+        :param timeout: Maximum waiting time in seconds
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._stopped)
+                if self._pending is None:
+                    return
+                (snapshot, verify_repair_scenario), self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._write(snapshot, verify_repair_scenario)
+            except Exception:
+                logging.warning("Autosave failed", exc_info=True)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, snapshot: bytes, verify_repair_scenario: bool) -> None:
+        digest = hashlib.blake2b(
+            snapshot + bytes([verify_repair_scenario]), digest_size=16
+        ).digest()
+        if digest == self._last_digest:
+            return
+        scenario, planning_problem_set = pickle.loads(snapshot)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        writer = CRDesignerFileWriter(
+            scenario=scenario,
+            planning_problem_set=planning_problem_set,
+            author="Default Author",
+            affiliation="Default Affiliation",
+            source="CommonRoad Scenario Designer",
+            tags=set(),
+        )
+        if planning_problem_set is None:
+            writer.write_scenario_to_file(
+                tmp_path,
+                OverwriteExistingFile.ALWAYS,
+                verify_repair_scenario=verify_repair_scenario,
+            )
+        else:
+            writer.write_to_file(
+                tmp_path,
+                OverwriteExistingFile.ALWAYS,
+                verify_repair_scenario=verify_repair_scenario,
+            )
+        self._rotate()
+        os.replace(tmp_path, self.path)
+        self._last_digest = digest
+
+    def _rotate(self) -> None:
+        paths = self.version_paths()
+        for older, newer in reversed(list(zip(paths[2:], paths[1:-1]))):
+            if os.path.exists(newer):
+                os.replace(newer, older)
+        if len(paths) > 1 and os.path.exists(self.path):
+            # keep the latest autosave in place until it is replaced by the new one
+            if os.path.exists(paths[1]):
+                os.remove(paths[1])
+            try:
+                os.link(self.path, paths[1])
+            except OSError:
+                shutil.copyfile(self.path, paths[1])
@@ -1,12 +1,17 @@
 from typing import List, Optional
 
+from commonroad.planning.planning_problem import PlanningProblemSet
 from commonroad.scenario.intersection import Intersection
 from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
-from commonroad.visualization.mp_renderer import MPRenderer
-from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
 from crdesigner.common.config.gui_config import gui_config
+from crdesigner.common.scenario_animation import (
+    BlittedAnimation,
+    ScenarioAnimation,
+    save_scenario_video,
+)
 from crdesigner.ui.gui.controller.animated_viewer.dynamic_canvas_controller import (
     DynamicCanvasController,
 )
@@ -67,36 +72,37 @@ class AnimatedViewerController:
         self.max_time_step = 0
         # current time step
         self.time_step = Observable(0)
-        # FuncAnimation object
-        self.animation: FuncAnimation = None
+        # animation playing the frames on the canvas and the scenario drawn by it
+        self.animation: Optional[BlittedAnimation] = None
+        self.scenario_animation: Optional[ScenarioAnimation] = None
         # if playing or not
         self.playing = False
 
-    def open_scenario(self, new_file_added: bool = None):
+    def open_scenario(self, new_file_added: bool = None, lanelet_network_changed: bool = True):
         """[summary]
         Open a scenario, setup any configuration.
         :param new_file_added: if a new cr file was created or added
-        :param planning_problem_set: des,
+        :param lanelet_network_changed: if the lanelet network changed; otherwise, the stored copy is kept
         """
         self.dynamic.initial_parameter_config_done = (
             False  # reset so that for any map the parameters are set correctly
         )
         # safe here the original scenario -> this is needed for zooming in / out and for moving around
-
-        self.original_lanelet_network = LaneletNetwork.create_from_lanelet_network(
-            lanelet_network=self.scenario_model.get_lanelet_network()
-        )
-
-        plot_limits = extract_plot_limits(self.scenario_model.get_lanelet_network())
+        if lanelet_network_changed or self.original_lanelet_network is None or new_file_added:
+            self.original_lanelet_network = LaneletNetwork.create_from_lanelet_network(
+                lanelet_network=self.scenario_model.get_lanelet_network()
+            )
 
         self._calc_max_timestep()
         if self.animation:
-            self.animation.event_source.stop()
+            self.animation.stop()
             self.animation = None
+            self.scenario_animation = None
         else:
             self.time_step.value = 0
 
         if new_file_added:
+            plot_limits = extract_plot_limits(self.scenario_model.get_lanelet_network())
             self.update_plot(
                 clear_artists=True, new_file_added=new_file_added, plot_limits=plot_limits
             )
@@ -107,14 +113,11 @@ class AnimatedViewerController:
 
         print("init animation")
         pps = self.pps_model.get_selected_pp()
-        self.dynamic.clear_axes(keep_limits=True)
+        scenario = self.scenario_model.get_current_scenario()
 
         start = self.min_time_step
         end = self.max_timestep
-        dt = self.scenario_model.get_current_scenario().dt
-        # ps = 25
-        # dpi = 120
-        # ln, = self.dynamic.ax.plot([], [], animated=True)
+        dt = scenario.dt
         anim_frames = end - start
 
         if start == end:
@@ -136,37 +139,69 @@ class AnimatedViewerController:
             )
         )
 
-        def draw_frame(draw_params):
+        # the parameters only change with the settings, which open the scenario again
+        draw_params = gui_config.get_draw_params()
+        lanelet_params = gui_config.get_undetailed_params(
+            len(scenario.lanelet_network.lanelets), len(scenario.lanelet_network.traffic_signs)
+        )
+        if lanelet_params is not None:
+            draw_params.lanelet_network.lanelet = lanelet_params
+        if gui_config.show_dynamic_obstacles():
+            draw_obstacles = self.dynamic.draw_obstacles
+        else:
+            draw_params.dynamic_obstacle.trajectory.draw_trajectory = False
+
+            def draw_obstacles(params):
+                pass
+
+        self.dynamic.rnd.ax = self.dynamic.get_axes()
+        self.scenario_animation = ScenarioAnimation(
+            scenario,
+            self.dynamic.rnd,
+            draw_params,
+            PlanningProblemSet([pps]) if pps is not None else None,
+            time_end=end,
+            draw_obstacles=draw_obstacles,
+        )
+
+        def draw_frame(frame: int) -> List[Artist]:
             self.time_step.value += 1
-            time_start = start + self.time_step.value
-            time_end = start + min(anim_frames, self.time_step.value)
-            if time_start > time_end:
+            if self.time_step.value > anim_frames:
                 self.time_step.value = 0
-
-            draw_params = gui_config.get_draw_params()
-
-            # draw_params.dynamic_obstacle = gui_config.get_obstacle_params()
-            draw_params.time_begin = time_start
-            draw_params.time_end = time_end
-            draw_params.dynamic_obstacle.trajectory.time_begin = time_start
-            draw_params.dynamic_obstacle.trajectory.time_end = end
-            draw_params.trajectory.time_begin = time_start
-            draw_params.trajectory.time_end = end
-            self.dynamic.draw_scenario(pps=pps, draw_params=draw_params, draw_dynamic_only=True)
+            return self.scenario_animation.draw_frame(start + self.time_step.value)
 
         # Interval determines the duration of each frame in ms
         interval = 1000 * dt
+        self.animation = BlittedAnimation(
+            self.dynamic.figure, draw_frame, self._draw_animation_background, interval=interval
+        )
+
+    def _draw_animation_background(self) -> List[Artist]:
+        """
+        Draws the static elements of the scenario and the frame of the current time step.
+
+        @return: Animated artists of the frame.
+        """
+        limits = self.dynamic.get_limits()
         self.dynamic.clear_axes(keep_limits=True)
-        self.animation = FuncAnimation(
-            self.dynamic.figure, draw_frame, blit=False, interval=interval, repeat=True
+        self.dynamic.rnd.ax = self.dynamic.get_axes()
+        self.scenario_animation.draw_background(self.min_time_step)
+        self.dynamic.get_axes().set_facecolor(
+            self.scenario_animation.draw_params.color_schema.second_background
         )
+        if self.dynamic.show_aerial:
+            self.dynamic.show_aerial_image()
+        self.dynamic.set_limits(limits)
+        return self.scenario_animation.draw_frame(self.min_time_step + self.time_step.value)
 
     def play(self):
         """plays the animation if existing"""
         if not self.animation:
             self._init_animation()
+        else:
+            # the canvas may show elements drawn without the animation, e.g., obstacles of a single time step
+            self.animation.redraw_background()
 
-        self.dynamic.draw_idle()
         self.animation.event_source.start()
         self.playing = True
 
@@ -197,23 +232,23 @@ class AnimatedViewerController:
         if not path:
             return
 
+        pps = self.pps_model.get_selected_pp()
+        QMessageBox.about(
+            None,
+            "Information",
+            "Exporting the video will take few minutes, please wait until process is finished!",
+        )
         try:
-            rnd = MPRenderer()
-            with open(path, "w"):
-                QMessageBox.about(
-                    None,
-                    "Information",
-                    "Exporting the video will take few minutes, please wait "
-                    "until process is finished!",
-                )
-                rnd.create_video(
-                    [self.scenario_model.get_current_scenario()],
-                    path,
-                    draw_params=self.dynamic.draw_params,
-                )
-        except IOError as e:
+            # the frames are rendered sequentially, since forking the running Qt process is unsafe
+            save_scenario_video(
+                self.scenario_model.get_current_scenario(),
+                path,
+                PlanningProblemSet([pps]) if pps is not None else None,
+                draw_params=self.dynamic.draw_params,
+            )
+        except (IOError, RuntimeError) as e:
             QMessageBox.critical(
-                self,
+                None,
                 "CommonRoad file not created!",
                 "The CommonRoad scenario was not saved as video due to an error.\n\n{}".format(e),
                 QMessageBox.StandardButton.Ok,
@@ -290,7 +325,11 @@ class AnimatedViewerController:
                 y_dim = (plot_limits[3] - plot_limits[2]) / 2
                 gui_config.set_zoom_treshold(x_dim, y_dim)
 
-        self.dynamic.draw_scenario(self.pps_model.get_selected_pp(), time_begin=time_begin)
+        if self.animation is not None:
+            # the obstacles are drawn by the animation, so that they are not part of its background
+            self.animation.redraw_background()
+        else:
+            self.dynamic.draw_scenario(self.pps_model.get_selected_pp(), time_begin=time_begin)
 
         for lanelet in self.scenario_model.get_lanelets():
             color, alpha, zorder, label = self.get_paint_parameters(
@@ -1,6 +1,6 @@
 """Wrapper for the middle visualization."""
 
-from typing import Union
+from typing import Optional, Union
 
 from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.obstacle import Obstacle
@@ -11,6 +11,7 @@ from crdesigner.common.logging import logger
 from crdesigner.ui.gui.controller.animated_viewer.animated_viewer_controller import (
     AnimatedViewerController,
 )
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.utilities.toolbox_ui import PosB
 
@@ -18,9 +19,9 @@ from crdesigner.ui.gui.utilities.toolbox_ui import PosB
 class AnimatedViewerWrapperController:
     def __init__(self, mwindow, scenario_model: ScenarioModel, scenario_saving_dialog):
         self.scenario_model = scenario_model
-        self.scenario_model.subscribe(self.update_scenario)
+        self.scenario_model.subscribe_changes(self.update_scenario)
         self.pps_model = mwindow.pps_model
-        self.pps_model.subscribe(self.update_scenario)
+        self.pps_model.subscribe(lambda: self.update_scenario())
 
         self.cr_viewer = AnimatedViewerController(
             mwindow, self.viewer_callback, self.scenario_model
@@ -31,16 +32,29 @@ class AnimatedViewerWrapperController:
         self.viewer_dock = None
         self.mwindow = mwindow.mwindow_ui  # handle back to the main window
 
-    def update_scenario(self):
+    def update_scenario(self, changes: Optional[ChangeSet] = None):
         """
-        Notifies the GUI that the sceanrio has changed.
+        Notifies the GUI that the sceanrio has changed. The canvas is only redrawn if drawn elements changed.
 
-        @param new_file_added: Indikator if the added file is a complete new scenario
+        @param changes: Changes of the scenario; everything is redrawn if None, e.g., if the planning problems changed
         """
-
-        self.cr_viewer.open_scenario(new_file_added=self.scenario_model.is_new_file_added())
-        self.update_view()
-        self.mwindow.update_max_step()
+        network_changed = changes is None or any(
+            changes.changed(element_type)
+            for element_type in (
+                ElementType.LANELET,
+                ElementType.TRAFFIC_SIGN,
+                ElementType.TRAFFIC_LIGHT,
+                ElementType.INTERSECTION,
+            )
+        )
+        if network_changed or changes.changed(ElementType.OBSTACLE) or changes.new_file_added:
+            self.cr_viewer.open_scenario(
+                new_file_added=self.scenario_model.is_new_file_added(),
+                lanelet_network_changed=network_changed,
+            )
+            self.update_view()
+        if changes is None or changes.changed(ElementType.OBSTACLE):
+            self.mwindow.update_max_step()
         # Autosave
         self.scenario_saving_dialog.autosave(self.scenario_model.get_current_scenario())
 
@@ -52,6 +52,9 @@ class DynamicCanvasController(FigureCanvas):
     This canvas provides zoom with the mouse wheel.
     """
 
+    # emitted with the new limits [x_min, x_max, y_min, y_max] when the canvas is drawn with other limits
+    view_limits_changed = QtCore.pyqtSignal(list)
+
     obstacle_color_array = []
     control_key = False
     show_aerial = False
@@ -125,6 +128,8 @@ class DynamicCanvasController(FigureCanvas):
             "button_release_event", self.dynamic_canvas_release_callback
         )
         self.mpl_connect("scroll_event", self.zoom)
+        self._drawn_limits = None
+        self.mpl_connect("draw_event", self._emit_view_limits)
 
         # any callbacks for interaction per keyboard
         self.mpl_connect("key_press_event", self.dynamic_canvas_ctrl_press_callback)
@@ -197,6 +202,12 @@ class DynamicCanvasController(FigureCanvas):
         y_lim = self.ax.get_ylim()
         return [x_lim[0], x_lim[1], y_lim[0], y_lim[1]]
 
+    def _emit_view_limits(self, _event):
+        limits = self.get_limits()
+        if limits != self._drawn_limits:
+            self._drawn_limits = limits
+            self.view_limits_changed.emit(limits)
+
     def set_limits(self, limits: List[float] = None):
         """
         sets the limits of the plot axis to the given parameter
@@ -162,7 +162,7 @@ class MWindowController:
                 self.road_network_toolbox.initialize_road_network_toolbox()
                 self.obstacle_toolbox.obstacle_toolbox_ui.initialize_obstacle_information()
             elif reply == QMessageBox.StandardButton.No:
-                os.remove(self.path_autosave)
+                self.scenario_saving_dialog.discard_autosave()
 
         if os.path.exists(self.path_logging):
             os.remove(self.path_logging)
@@ -272,6 +272,6 @@ class MWindowController:
         event.ignore()
         close_app = self.mwindow_ui.close_window() if not self._test else True
         if close_app:
-            if os.path.exists(self.path_autosave):
-                os.remove(self.path_autosave)
+            self.scenario_saving_dialog.discard_autosave()
+            self.scenario_saving_dialog.autosave_worker.shutdown()
             QApplication.quit()
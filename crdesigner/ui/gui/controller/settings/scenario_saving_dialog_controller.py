@@ -1,6 +1,3 @@
-import logging
-import os
-import sys
 from typing import Optional
 
 from commonroad.planning.planning_problem import PlanningProblemSet
@@ -15,11 +12,13 @@ from commonroad.scenario.scenario import (
     Underground,
     Weather,
 )
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QFileDialog, QLineEdit, QMessageBox
 
 from crdesigner.common.config.gui_config import gui_config
 from crdesigner.common.file_writer import CRDesignerFileWriter, OverwriteExistingFile
 from crdesigner.common.logging import logger
+from crdesigner.ui.gui.autosaves.autosave_worker import AutosaveWorker
 from crdesigner.ui.gui.autosaves.autosaves_setup import DIR_AUTOSAVE
 from crdesigner.ui.gui.model.planning_problem_set_model import PlanningProblemSetModel
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
@@ -27,6 +26,9 @@ from crdesigner.ui.gui.view.settings.scenario_saving_dialog_ui import (
     ScenarioSavingDialogUI,
 )
 
+# delay in milliseconds after the last change before the scenario is autosaved
+AUTOSAVE_DELAY = 1000
+
 
 def get_float_position(entered_string: QLineEdit) -> float:
     """
@@ -54,6 +56,12 @@ class ScenarioSavingDialogController:
         self.directory = ""
         self.initialized = False
 
+        self.autosave_worker = AutosaveWorker(DIR_AUTOSAVE)
+        self._autosave_scenario: Optional[Scenario] = None
+        self._autosave_timer = QTimer()
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.timeout.connect(self._write_autosave)
+
     def connect_gui_elements(self):
         """Connect the GUI elements with the corresponding methods."""
         self.save_window.country.currentTextChanged.connect(
@@ -218,51 +226,35 @@ class ScenarioSavingDialogController:
 
     def autosave(self, scenario: Scenario):
         """
-        Saves the file in a background file with default parameters
+        Schedules saving the scenario in a background file with default parameters.
 
-        Disables the console output of the writing to file methode that there is no clutter in the console
-        Enables it afterward again
+        Consecutive calls within AUTOSAVE_DELAY milliseconds are merged into one autosave. The scenario is only
+        snapshotted in the GUI thread, writing happens in the background.
 
         :param scenario: Scenario which should be saved
         """
         if scenario is None:
             return
+        self._autosave_scenario = scenario
+        self._autosave_timer.start(AUTOSAVE_DELAY)
 
-        try:
-            self.current_pps = self.current_pps_model.get_pps()
+    def _write_autosave(self):
+        """Hands the scenario scheduled for autosaving to the background writer."""
+        if self._autosave_scenario is None:
+            return
+        self.current_pps = self.current_pps_model.get_pps()
+        self.autosave_worker.submit(
+            self._autosave_scenario,
+            self.current_pps,
+            verify_repair_scenario=gui_config.verify_repair_scenario,
+        )
+        self._autosave_scenario = None
 
-            original_stdout = sys.stdout
-            original_stderr = sys.stderr
-            original_level = logging.getLogger().getEffectiveLevel()
-            logging.getLogger().setLevel(logging.ERROR)
-            sys.stdout = open(os.devnull, "w")
-            sys.stderr = open(os.devnull, "w")
-            writer = CRDesignerFileWriter(
-                scenario=scenario,
-                planning_problem_set=self.current_pps,
-                author="Default Author",
-                affiliation="Default Affiliation",
-                source="CommonRoad Scenario Designer",
-                tags=set(),
-            )
-            filename = DIR_AUTOSAVE + "/autosave" + ".xml"
-            if self.current_pps is None:
-                writer.write_scenario_to_file(
-                    filename,
-                    OverwriteExistingFile.ALWAYS,
-                    verify_repair_scenario=gui_config.verify_repair_scenario,
-                )
-            else:
-                writer.write_to_file(
-                    filename,
-                    OverwriteExistingFile.ALWAYS,
-                    verify_repair_scenario=gui_config.verify_repair_scenario,
-                )
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
-            logging.getLogger().setLevel(original_level)
-        except IOError:
-            pass
+    def discard_autosave(self):
+        """Cancels pending autosaves and removes the existing autosave files."""
+        self._autosave_timer.stop()
+        self._autosave_scenario = None
+        self.autosave_worker.discard()
 
     @logger.log
     def save_scenario(self):
@@ -283,9 +275,7 @@ class ScenarioSavingDialogController:
             else:
                 writer.write_to_file(filename, OverwriteExistingFile.ALWAYS)
             self.save_window.close()
-            filename_autosave = DIR_AUTOSAVE + "/autosave" + ".xml"
-            if os.path.exists(filename_autosave):
-                os.remove(filename_autosave)
+            self.discard_autosave()
         except IOError as e:
             QMessageBox.critical(
                 self.save_window,
@@ -65,6 +65,7 @@ class SettingsController:
             self.scenario_model.notify_all()
         self.parent.mwindow_ui.set_stylesheet(gui_config.get_stylesheet())
         self.parent.mwindow_ui.update_window()
+        self.parent.road_network_toolbox.update_view_limits()
         for config in CONFIGS_TO_RENDER:
             config.notify_all()
 
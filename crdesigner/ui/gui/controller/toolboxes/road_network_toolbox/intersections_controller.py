@@ -29,7 +29,7 @@ class AddIntersectionController:
         self.road_network_toolbox_ui.button_three_way_intersection.clicked.connect(
             lambda: self.add_three_way_intersection()
         )
-        self.road_network_toolbox_ui.selected_intersection.currentTextChanged.connect(
+        self.road_network_toolbox_ui.selected_intersection.currentIndexChanged.connect(
             lambda: self.intersection_ui.update_intersection_information()
         )
         self.road_network_toolbox_ui.button_add_incoming.clicked.connect(
@@ -76,7 +76,6 @@ class AddIntersectionController:
         self.scenario_model.create_four_way_intersection(
             width, diameter, incoming_length, add_traffic_signs, add_traffic_lights
         )
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def add_three_way_intersection(self):
@@ -103,7 +102,6 @@ class AddIntersectionController:
         self.scenario_model.create_three_way_intersection(
             width, diameter, incoming_length, add_traffic_signs, add_traffic_lights
         )
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def fit_intersection(self):
@@ -216,7 +214,6 @@ class AddIntersectionController:
         if len(incomings) > 1:
             intersection = Intersection(intersection_id, incomings, crossings)
             self.scenario_model.add_intersection(intersection)
-            self.road_network_controller.set_default_road_network_list_information()
         else:
             self.road_network_controller.text_browser.append(
                 "_Warning:_ An intersection must consist at least of two incomings."
@@ -244,7 +241,6 @@ class AddIntersectionController:
                 self.road_network_toolbox_ui.selected_intersection.currentText()
             )
             self.scenario_model.remove_intersection(selected_intersection_id)
-            self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def update_intersection(self):
@@ -263,5 +259,6 @@ class AddIntersectionController:
             selected_intersection_id = int(
                 self.road_network_toolbox_ui.selected_intersection.currentText()
             )
-            self.scenario_model.update_intersection(selected_intersection_id)
-            self.add_intersection(selected_intersection_id)
+            with self.scenario_model.transaction():
+                self.scenario_model.update_intersection(selected_intersection_id)
+                self.add_intersection(selected_intersection_id)
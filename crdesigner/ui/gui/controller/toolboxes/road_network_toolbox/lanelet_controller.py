@@ -397,7 +397,6 @@ class AddLaneletController:
 
         self.road_network_controller.updated_lanelet = True
         self.scenario_model.update_lanelet(selected_lanelet, new_lanelet)
-        self.road_network_controller.set_default_road_network_list_information()
         self.road_network_toolbox_ui.mwindow.animated_viewer_wrapper.cr_viewer.dynamic.display_curved_lanelet(
             False
         )
@@ -782,7 +781,6 @@ class AddLaneletController:
         )
 
         self.scenario_model.remove_lanelet(selected_lanelet.lanelet_id)
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def attach_to_other_lanelet(self):
@@ -1022,7 +1020,6 @@ class AddLaneletController:
         if len(added_lanelets) > 0:
             self.last_added_lanelet_id = added_lanelets[len(added_lanelets) - 1].lanelet_id
             self.scenario_model.add_lanelet(added_lanelets)
-            self.road_network_controller.set_default_road_network_list_information()
             self.lanelet_ui.set_default_lanelet_operation_information()
         else:
             self.road_network_controller.text_browser.append("Adjacent lanelet already exists.")
@@ -1057,7 +1054,6 @@ class AddLaneletController:
 
         self.road_network_controller.last_added_lanelet_id = connected_lanelet.lanelet_id
         self.scenario_model.add_lanelet(connected_lanelet)
-        self.road_network_controller.set_default_road_network_list_information()
         self.lanelet_ui.set_default_lanelet_operation_information()
 
     @logger.log
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import List, Optional, Union
 
 from commonroad.scenario.lanelet import Lanelet
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtWidgets import QDockWidget
 
+from crdesigner.common.config.gui_config import gui_config
 from crdesigner.common.config.osm_config import osm_config as config
 from crdesigner.ui.gui.controller.toolboxes.road_network_toolbox.aerial_image_controller import (
     AddAerialImageController,
@@ -20,7 +21,9 @@ from crdesigner.ui.gui.controller.toolboxes.road_network_toolbox.traffic_lights_
 from crdesigner.ui.gui.controller.toolboxes.road_network_toolbox.traffic_signs_controller import (
     AddTrafficSignController,
 )
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
+from crdesigner.ui.gui.utilities.toolbox_ui import ElementComboBox
 from crdesigner.ui.gui.utilities.waitingspinnerwidget import QtWaitingSpinner
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
     RoadNetworkToolboxUI,
@@ -44,6 +47,7 @@ class RoadNetworkController(
         self.update = False
         self.updated_lanelet = False
         self.aerial_map_threshold = config.AERIAL_IMAGE_THRESHOLD
+        self.view_limits = None
 
         self.lanelet_controller = AddLaneletController(
             self, self.scenario_model, self.road_network_toolbox_ui
@@ -65,8 +69,12 @@ class RoadNetworkController(
         self.traffic_lights_controller.traffic_lights_ui.initialize_traffic_light_information()
         self.intersection_controller.intersection_ui.initialize_intersection_information()
         self.set_default_road_network_list_information()
+        self.scenario_model.subscribe_changes(self.update_road_network_list_information)
 
         self.connect_gui_elements()
+        mwindow.animated_viewer_wrapper.cr_viewer.dynamic.view_limits_changed.connect(
+            self.update_view_limits
+        )
 
     def adjust_ui(self):
         """Updates GUI properties like width, etc."""
@@ -83,6 +91,19 @@ class RoadNetworkController(
         self.intersection_controller.connect_gui_intersection()
         self.aerial_image_controller.connect_gui_aerial_image()
 
+    def update_view_limits(self, limits: Optional[List[float]] = None):
+        """
+        Restricts the suggestions of the element pickers to the visible area of the canvas if enabled in the settings.
+
+        @param limits: Visible area [x_min, x_max, y_min, y_max]; if None, the last visible area is used
+        """
+        if limits is not None:
+            self.view_limits = limits
+        for combo_box in self.road_network_toolbox_ui.findChildren(ElementComboBox):
+            combo_box.set_view_limits(
+                self.view_limits if gui_config.SEARCH_ELEMENTS_IN_VIEW else None
+            )
+
     def refresh_toolbox(self, model: ScenarioModel):
         self.scenario_model = model
         self.set_default_road_network_list_information()
@@ -97,6 +118,28 @@ class RoadNetworkController(
 
         self.update = False
 
+    def update_road_network_list_information(self, changes: ChangeSet):
+        """
+        Updates the lists of the toolbox which show changed elements. All lists contain lanelet IDs, so that all
+        lists are updated if lanelets were added or removed.
+
+        @param changes: Changes of the scenario
+        """
+        if changes.ids_changed(ElementType.LANELET):
+            self.set_default_road_network_list_information()
+            return
+
+        self.update = True
+        if changes.changed(ElementType.LANELET):
+            self.lanelet_controller.lanelet_ui.set_default_lanelet_information()
+        if changes.changed(ElementType.TRAFFIC_SIGN):
+            self.traffic_sign_controller.traffic_sign_ui.set_default_traffic_sign_information()
+        if changes.changed(ElementType.TRAFFIC_LIGHT):
+            self.traffic_lights_controller.traffic_lights_ui.set_default_traffic_lights_information()
+        if changes.changed(ElementType.INTERSECTION):
+            self.intersection_controller.intersection_ui.set_default_intersection_information()
+        self.update = False
+
     def initialize_road_network_toolbox(self):
         self.traffic_sign_controller.traffic_sign_ui.initialize_traffic_sign_information()
         self.traffic_lights_controller.traffic_lights_ui.initialize_traffic_light_information()
@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 from commonroad.scenario.traffic_light import (
     TrafficLight,
@@ -8,9 +6,9 @@ from commonroad.scenario.traffic_light import (
     TrafficLightDirection,
     TrafficLightState,
 )
-from commonroad_sumo.cr2sumo import CR2SumoMapConverter
 
 from crdesigner.common.logging import logger
+from crdesigner.common.traffic_light_program import TrafficLightTimings
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
     RoadNetworkToolboxUI,
@@ -47,7 +45,7 @@ class AddTrafficLightsController:
         self.road_network_toolbox_ui.button_create_traffic_lights.clicked.connect(
             lambda: self.create_traffic_light_for_referenced_lanelets()
         )
-        self.road_network_toolbox_ui.selected_traffic_light.currentTextChanged.connect(
+        self.road_network_toolbox_ui.selected_traffic_light.currentIndexChanged.connect(
             lambda: self.traffic_lights_ui.update_traffic_light_information()
         )
 
@@ -157,7 +155,6 @@ class AddTrafficLightsController:
         )
 
         self.scenario_model.add_traffic_light(new_traffic_light, referenced_lanelets)
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def update_traffic_light(self):
@@ -200,8 +197,9 @@ class AddTrafficLightsController:
         else:
             return
 
-        self.scenario_model.update_traffic_light(selected_traffic_light_id)
-        self.add_traffic_light(selected_traffic_light_id)
+        with self.scenario_model.transaction():
+            self.scenario_model.update_traffic_light(selected_traffic_light_id)
+            self.add_traffic_light(selected_traffic_light_id)
 
     @logger.log
     def remove_traffic_light(self):
@@ -223,7 +221,6 @@ class AddTrafficLightsController:
             return
 
         self.scenario_model.remove_traffic_light(selected_traffic_light_id)
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def create_traffic_light_for_referenced_lanelets(self):
@@ -238,40 +235,17 @@ class AddTrafficLightsController:
         if not lanelet_ids:
             return
         self.road_network_toolbox_ui.referenced_lanelets_traffic_light.clear()
-        converter = CR2SumoMapConverter(
-            self.scenario_model.get_current_scenario(),
+        timings = TrafficLightTimings(
+            green=int(self.road_network_toolbox_ui.time_green.text()),
+            yellow=int(self.road_network_toolbox_ui.time_yellow.text()),
+            red_yellow=int(self.road_network_toolbox_ui.time_red_yellow.text()),
+            all_red=0,
+            time_offset=int(self.road_network_toolbox_ui.time_offset.text()),
+            min_red=int(self.road_network_toolbox_ui.time_red.text()),
         )
-        converter.create_sumo_files(self.road_network_controller.tmp_folder)
-        oks = []
-        dt = self.scenario_model.get_current_scenario().dt
-        offset = int(self.road_network_toolbox_ui.time_offset.text())
-        red = int(self.road_network_toolbox_ui.time_red.text())
-        red_yellow = int(self.road_network_toolbox_ui.time_red_yellow.text())
-        green = int(self.road_network_toolbox_ui.time_green.text())
-        yellow = int(self.road_network_toolbox_ui.time_yellow.text())
-        total = red + red_yellow + green + yellow
-
-        for lanelet_id in lanelet_ids:
-            try:
-                ok = converter.auto_generate_traffic_light_system(
-                    lanelet_id,
-                    green_time=int(green * dt),
-                    yellow_time=int(yellow * dt),
-                    all_red_time=0,
-                    left_green_time=math.ceil(0.06 * total * dt),
-                    crossing_min_time=math.ceil(0.1 * total * dt),
-                    crossing_clearance_time=math.ceil(0.15 * total * dt),
-                    time_offset=int(offset * dt),
-                )
-            except Exception:
-                ok = False
-            oks.append(ok)
+        oks = self.scenario_model.create_traffic_light_programs(lanelet_ids, timings)
+        for lanelet_id, ok in zip(lanelet_ids, oks):
             self.road_network_controller.text_browser.append(
                 ("Created" if ok else "ERROR: Could not create")
                 + f" traffic light system for lanelet {lanelet_id}"
             )
-
-        if any(oks):
-            self.scenario_model.create_traffic_lights_for_referenced_lanelets(
-                converter.lanelet_network
-            )
@@ -45,7 +45,7 @@ class AddTrafficSignController:
         self.road_network_toolbox_ui.button_update_traffic_sign.clicked.connect(
             lambda: self.update_traffic_sign()
         )
-        self.road_network_toolbox_ui.selected_traffic_sign.currentTextChanged.connect(
+        self.road_network_toolbox_ui.selected_traffic_sign.currentIndexChanged.connect(
             lambda: self.traffic_sign_ui.update_traffic_sign_information(
                 self.road_network_controller.text_browser
             )
@@ -156,7 +156,6 @@ class AddTrafficSignController:
         )
 
         self.scenario_model.add_traffic_sign(new_sign, referenced_lanelets)
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def remove_traffic_sign(self):
@@ -178,7 +177,6 @@ class AddTrafficSignController:
             return
 
         self.scenario_model.remove_traffic_sign(selected_traffic_sign_id)
-        self.road_network_controller.set_default_road_network_list_information()
 
     @logger.log
     def update_traffic_sign(self):
@@ -222,5 +220,6 @@ class AddTrafficSignController:
         else:
             return
 
-        self.scenario_model.update_traffic_sign(selected_traffic_sign_id)
-        self.add_traffic_sign(selected_traffic_sign_id)
+        with self.scenario_model.transaction():
+            self.scenario_model.update_traffic_sign(selected_traffic_sign_id)
+            self.add_traffic_sign(selected_traffic_sign_id)
@@ -29,6 +29,7 @@ from crdesigner.ui.gui.controller.settings.scenario_saving_dialog_controller imp
     get_float_position,
 )
 from crdesigner.ui.gui.model.planning_problem_set_model import PlanningProblemSetModel
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ElementType
 from crdesigner.ui.gui.view.toolboxes.scenario_toolbox.scenario_toolbox_ui import (
     ScenarioToolboxUI,
 )
@@ -72,7 +73,7 @@ class ScenarioToolboxController(QDockWidget):
         self.update_settings()
         self.connect_settings_elements()
 
-        self.current_scenario.subscribe(self.update_settings)
+        self.current_scenario.subscribe_changes(self.update_settings_on_change)
         self.pps_model.new_pps.connect(self.set_planning_problem_information)
 
     def adjust_ui(self) -> None:
@@ -1183,6 +1184,15 @@ class ScenarioToolboxController(QDockWidget):
         vertices = np.asarray(vertices)
         return vertices
 
+    def update_settings_on_change(self, changes: ChangeSet) -> None:
+        """
+        Updates the scenario settings widget if the meta data of the scenario changed.
+
+        :param changes: Changes of the scenario.
+        """
+        if changes.changed(ElementType.META_DATA):
+            self.update_settings()
+
     @logger.log
     def update_settings(self) -> None:
         """initialize scenario settings widget and updates it"""
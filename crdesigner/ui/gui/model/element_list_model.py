@@ -0,0 +1,248 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from commonroad.scenario.scenario import Scenario
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ElementType
+from crdesigner.ui.gui.model.scenario_model import ScenarioModel
+
+# text of the row which selects no element
+NONE_ITEM = "None"
+
+# bounding box of an element as (x_min, y_min, x_max, y_max)
+Bounds = Tuple[float, float, float, float]
+
+
+class ElementIdListModel(QAbstractListModel):
+    """
+    Sorted list of the IDs of one kind of scenario element, e.g., all lanelets, which is backed by the scenario model.
+    The list is updated with row insertions and removals based on the change sets of the scenario model and is only
+    rebuilt if all elements changed, e.g., after undo or loading a scenario.
+    """
+
+    def __init__(
+        self, scenario_model: ScenarioModel, element_type: ElementType, none_item: bool = True
+    ):
+        """
+        Constructor.
+
+        @param scenario_model: Scenario model providing the elements
+        @param element_type: Kind of the listed elements; meta data has no IDs
+        @param none_item: Indicates whether the first row is "None" for selecting no element
+        """
+        super().__init__()
+        assert element_type != ElementType.META_DATA, "Meta data has no IDs."
+        self.scenario_model = scenario_model
+        self.element_type = element_type
+        self.none_item = none_item
+        self._bounds: Dict[int, Optional[Bounds]] = {}
+        self._ids: List[int] = self._collect_ids()
+        scenario_model.subscribe_changes(self.update_ids)
+
+    def _offset(self) -> int:
+        return 1 if self.none_item else 0
+
+    def _scenario(self) -> Optional[Scenario]:
+        return self.scenario_model.get_current_scenario()
+
+    def _collect_ids(self) -> List[int]:
+        scenario = self._scenario()
+        if scenario is None:
+            return []
+        network = scenario.lanelet_network
+        if self.element_type == ElementType.LANELET:
+            ids = [la.lanelet_id for la in network.lanelets]
+        elif self.element_type == ElementType.TRAFFIC_SIGN:
+            ids = [ts.traffic_sign_id for ts in network.traffic_signs]
+        elif self.element_type == ElementType.TRAFFIC_LIGHT:
+            ids = [tl.traffic_light_id for tl in network.traffic_lights]
+        elif self.element_type == ElementType.INTERSECTION:
+            ids = [inter.intersection_id for inter in network.intersections]
+        else:
+            ids = [obs.obstacle_id for obs in scenario.obstacles]
+        return sorted(ids)
+
+    def _find_element(self, element_id: int) -> Any:
+        scenario = self._scenario()
+        if scenario is None:
+            return None
+        network = scenario.lanelet_network
+        if self.element_type == ElementType.LANELET:
+            return network.find_lanelet_by_id(element_id)
+        if self.element_type == ElementType.TRAFFIC_SIGN:
+            return network.find_traffic_sign_by_id(element_id)
+        if self.element_type == ElementType.TRAFFIC_LIGHT:
+            return network.find_traffic_light_by_id(element_id)
+        if self.element_type == ElementType.INTERSECTION:
+            return network.find_intersection_by_id(element_id)
+        return scenario.obstacle_by_id(element_id)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ids) + self._offset()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        element_id = self.element_id(index.row())
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return NONE_ITEM if element_id is None else str(element_id)
+        if role == Qt.ItemDataRole.UserRole:
+            return element_id
+        return None
+
+    def element_id(self, row: int) -> Optional[int]:
+        """
+        @param row: Row of the model
+        @returns: ID of the element in the row or None for the "None" row
+        """
+        if row < self._offset():
+            return None
+        return self._ids[row - self._offset()]
+
+    def row(self, element_id: Optional[int]) -> int:
+        """
+        @param element_id: ID of an element or None for the "None" row
+        @returns: Row of the element or -1 if the element is not listed
+        """
+        if element_id is None:
+            return 0 if self.none_item else -1
+        position = bisect_left(self._ids, element_id)
+        if position < len(self._ids) and self._ids[position] == element_id:
+            return position + self._offset()
+        return -1
+
+    def ids(self) -> List[int]:
+        """@returns: Sorted IDs of all listed elements"""
+        return list(self._ids)
+
+    def update_ids(self, changes: ChangeSet):
+        """
+        Updates the list according to the changes of the scenario. Elements which were added or removed are inserted
+        or removed row by row, so that views keep their selection.
+
+        @param changes: Changes of the scenario
+        """
+        if changes.everything:
+            self.beginResetModel()
+            self._ids: List[int] = self._collect_ids()
+            self._bounds.clear()
+            self.endResetModel()
+            return
+
+        for element_id in sorted(changes.ids(self.element_type)):
+            self._bounds.pop(element_id, None)
+            exists = self._find_element(element_id) is not None
+            row = self.row(element_id)
+            if exists and row < 0:
+                position = bisect_left(self._ids, element_id)
+                self.beginInsertRows(
+                    QModelIndex(), position + self._offset(), position + self._offset()
+                )
+                self._ids.insert(position, element_id)
+                self.endInsertRows()
+            elif not exists and row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._ids[row - self._offset()]
+                self.endRemoveRows()
+            elif exists:
+                # the position of the element might have changed, which matters for spatial filtering
+                self.dataChanged.emit(self.index(row), self.index(row))
+
+    def bounds(self, element_id: int) -> Optional[Bounds]:
+        """
+        Computes the bounding box of an element. The bounding boxes are cached until the element changes.
+
+        @param element_id: ID of the element
+        @returns: Bounding box (x_min, y_min, x_max, y_max) or None if the element has no position
+        """
+        if element_id not in self._bounds:
+            self._bounds[element_id] = self._compute_bounds(self._find_element(element_id))
+        return self._bounds[element_id]
+
+    def _compute_bounds(self, element: Any) -> Optional[Bounds]:
+        if element is None:
+            return None
+        if self.element_type == ElementType.LANELET:
+            vertices = np.vstack((element.left_vertices, element.right_vertices))
+        elif self.element_type in (ElementType.TRAFFIC_SIGN, ElementType.TRAFFIC_LIGHT):
+            if element.position is None:
+                return None
+            vertices = np.array([element.position])
+        elif self.element_type == ElementType.INTERSECTION:
+            network = self._scenario().lanelet_network
+            lanelets = [
+                network.find_lanelet_by_id(lanelet_id)
+                for incoming in element.incomings
+                for lanelet_id in incoming.incoming_lanelets
+                | incoming.successors_right
+                | incoming.successors_straight
+                | incoming.successors_left
+            ]
+            lanelets = [la for la in lanelets if la is not None]
+            if not lanelets:
+                return None
+            vertices = np.vstack(
+                [np.vstack((la.left_vertices, la.right_vertices)) for la in lanelets]
+            )
+        else:
+            occupancy = element.occupancy_at_time(element.initial_state.time_step)
+            if occupancy is None or not hasattr(occupancy.shape, "shapely_object"):
+                return None
+            return tuple(occupancy.shape.shapely_object.bounds)
+        # vertices of elevated maps have a third column
+        x_min, y_min = vertices[:, :2].min(axis=0)
+        x_max, y_max = vertices[:, :2].max(axis=0)
+        return float(x_min), float(y_min), float(x_max), float(y_max)
+
+
+class ElementFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters an element ID list model by a typed part of the ID and optionally by the visible area of the map. The
+    "None" row is never filtered.
+    """
+
+    def __init__(self, source_model: ElementIdListModel):
+        """
+        Constructor.
+
+        @param source_model: Model of all element IDs
+        """
+        super().__init__()
+        self.setSourceModel(source_model)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._view_limits: Optional[List[float]] = None
+
+    @property
+    def view_limits(self) -> Optional[List[float]]:
+        """@returns: Visible area [x_min, x_max, y_min, y_max] the list is restricted to or None"""
+        return self._view_limits
+
+    def set_view_limits(self, limits: Optional[List[float]]):
+        """
+        Restricts the list to elements overlapping the visible area of the map.
+
+        @param limits: Visible area [x_min, x_max, y_min, y_max] or None to list elements independent of their position
+        """
+        self._view_limits = None if limits is None else list(limits)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model: ElementIdListModel = self.sourceModel()
+        element_id = model.element_id(source_row)
+        if element_id is None:
+            return True
+        if not super().filterAcceptsRow(source_row, source_parent):
+            return False
+        if self._view_limits is None:
+            return True
+        bounds = model.bounds(element_id)
+        if bounds is None:
+            return True
+        x_min, x_max, y_min, y_max = self._view_limits
+        return (
+            bounds[0] <= x_max and bounds[2] >= x_min and bounds[1] <= y_max and bounds[3] >= y_min
+        )
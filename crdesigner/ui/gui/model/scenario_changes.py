@@ -0,0 +1,134 @@
+from enum import Enum
+from typing import Dict, Iterable, Optional, Set
+
+
+class ElementType(Enum):
+    """Kinds of scenario elements whose changes are reported by the scenario model."""
+
+    LANELET = "lanelet"
+    TRAFFIC_SIGN = "traffic_sign"
+    TRAFFIC_LIGHT = "traffic_light"
+    INTERSECTION = "intersection"
+    OBSTACLE = "obstacle"
+    # author, time step size, scenario ID, location, etc.
+    META_DATA = "meta_data"
+
+
+class ChangeType(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    MODIFIED = "modified"
+
+
+# change of an element followed by another change of the same element within one change set
+_MERGED_CHANGE_TYPES = {
+    (ChangeType.ADDED, ChangeType.REMOVED): None,
+    (ChangeType.ADDED, ChangeType.MODIFIED): ChangeType.ADDED,
+    (ChangeType.REMOVED, ChangeType.ADDED): ChangeType.MODIFIED,
+    (ChangeType.REMOVED, ChangeType.MODIFIED): ChangeType.MODIFIED,
+    (ChangeType.MODIFIED, ChangeType.ADDED): ChangeType.MODIFIED,
+}
+
+
+class ChangeSet:
+    """
+    Changes of the scenario which are emitted by the scenario model after a mutation or a transaction.
+    Changes which are not known in detail, e.g., undo, redo, or a new scenario, mark all elements as changed.
+    """
+
+    def __init__(self, everything: bool = False, new_file_added: bool = False):
+        """
+        Constructor.
+
+        :param everything: Boolean indicating whether all elements of the scenario may have changed.
+        :param new_file_added: Boolean indicating whether a new scenario was loaded.
+        """
+        self.everything = everything
+        self.new_file_added = new_file_added
+        self._changes: Dict[ElementType, Dict[int, ChangeType]] = {}
+
+    def __repr__(self) -> str:
+        if self.everything:
+            return f"ChangeSet(everything=True, new_file_added={self.new_file_added})"
+        changes = {
+            element_type.value: {
+                element_id: change_type.value for element_id, change_type in changes.items()
+            }
+            for element_type, changes in self._changes.items()
+        }
+        return f"ChangeSet({changes})"
+
+    def __bool__(self) -> bool:
+        return self.everything or self.new_file_added or len(self._changes) > 0
+
+    def record(
+        self, element_type: ElementType, change_type: ChangeType, element_ids: Iterable[int] = ()
+    ):
+        """
+        Records a change of elements. An element which is added and removed again is no longer reported, and an
+        element which is removed and added again is reported as modified.
+
+        :param element_type: Kind of the elements.
+        :param change_type: Kind of the change.
+        :param element_ids: IDs of the elements; meta data has no IDs.
+        """
+        changes = self._changes.setdefault(element_type, {})
+        for element_id in element_ids:
+            previous = changes.get(element_id)
+            if previous is None:
+                changes[element_id] = change_type
+                continue
+            merged = _MERGED_CHANGE_TYPES.get((previous, change_type), change_type)
+            if merged is None:
+                del changes[element_id]
+            else:
+                changes[element_id] = merged
+
+    def merge(self, other: "ChangeSet"):
+        """
+        Appends the changes of another change set, which happened after the changes of this change set.
+
+        :param other: Change set.
+        """
+        self.everything |= other.everything
+        self.new_file_added |= other.new_file_added
+        for element_type, changes in other._changes.items():
+            self._changes.setdefault(element_type, {})
+            for element_id, change_type in changes.items():
+                self.record(element_type, change_type, (element_id,))
+
+    def changed(self, element_type: ElementType) -> bool:
+        """
+        Checks whether elements of a kind may have changed.
+
+        :param element_type: Kind of the elements.
+        :return: Boolean indicating whether the elements changed.
+        """
+        return self.everything or element_type in self._changes
+
+    def ids(self, element_type: ElementType, change_type: Optional[ChangeType] = None) -> Set[int]:
+        """
+        Returns the IDs of the changed elements of a kind. The IDs are not known if everything changed.
+
+        :param element_type: Kind of the elements.
+        :param change_type: Kind of the change; all changes are considered if none is given.
+        :return: IDs of the elements.
+        """
+        return {
+            element_id
+            for element_id, element_change in self._changes.get(element_type, {}).items()
+            if change_type is None or element_change == change_type
+        }
+
+    def ids_changed(self, element_type: ElementType) -> bool:
+        """
+        Checks whether elements of a kind may have been added or removed, i.e., whether lists of their IDs are
+        outdated.
+
+        :param element_type: Kind of the elements.
+        :return: Boolean indicating whether elements were added or removed.
+        """
+        return self.everything or any(
+            change_type != ChangeType.MODIFIED
+            for change_type in self._changes.get(element_type, {}).values()
+        )
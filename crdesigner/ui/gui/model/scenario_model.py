@@ -1,5 +1,6 @@
 import copy
-from typing import Callable, List, Optional, Set, Union
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Union
 
 import numpy as np
 from commonroad.common.util import Interval
@@ -25,11 +26,41 @@ from commonroad.scenario.traffic_sign import TrafficSign, TrafficSignIDCountries
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from crdesigner.common.logging import logger
+from crdesigner.common.traffic_light_program import (
+    TrafficLightTimings,
+    create_traffic_light_program,
+    find_intersection,
+)
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ChangeType, ElementType
 from crdesigner.ui.gui.utilities.map_creator import MapCreator
 
 
+def _neighbours(lanelet: Lanelet) -> Set[int]:
+    """
+    @param lanelet: Lanelet
+    @returns: IDs of the lanelets referenced by the lanelet as predecessor, successor, or adjacent lanelet
+    """
+    neighbours = set(lanelet.predecessor) | set(lanelet.successor)
+    neighbours |= {la for la in (lanelet.adj_left, lanelet.adj_right) if la is not None}
+    return neighbours
+
+
+def _intersection_lanelets(intersection: Intersection) -> Set[int]:
+    """
+    @param intersection: Intersection
+    @returns: IDs of the incoming lanelets and the lanelets within the intersection
+    """
+    lanelets = set()
+    for incoming in intersection.incomings:
+        lanelets |= incoming.incoming_lanelets | incoming.successors_right
+        lanelets |= incoming.successors_straight | incoming.successors_left
+    return lanelets
+
+
 class ScenarioModel(QObject):
     scenario_changed = pyqtSignal()
+    # emits the ChangeSet of a mutation or transaction after scenario_changed
+    elements_changed = pyqtSignal(object)
 
     def __init__(self):
         super().__init__()
@@ -38,6 +69,10 @@ class ScenarioModel(QObject):
         # Index if the model has already been updated
         self.__updated_scenario = False
         self.__new_file_added = False
+        # changes recorded since the last notification
+        self.__changes = ChangeSet()
+        self.__transaction_depth = 0
+        self.__notification_pending = False
 
     def scenarios(self) -> List[Scenario]:
         """
@@ -54,6 +89,7 @@ class ScenarioModel(QObject):
         if not self.__updated_scenario:
             self.__current_scenario_index += 1
         self.__scenarios.append(copy.deepcopy(scenario))
+        self.__changes.everything = True
         self.notify_all(True)
 
     def _update_scenario(self):
@@ -78,15 +114,77 @@ class ScenarioModel(QObject):
         else:
             return self.__scenarios[self.__current_scenario_index]
 
+    def _record(
+        self, element_type: ElementType, change_type: ChangeType, element_ids: Iterable[int] = ()
+    ):
+        """
+        Records a change which is emitted with the next notification
+
+        @param element_type: Kind of the changed elements
+        @param change_type: Kind of the change
+        @param element_ids: IDs of the changed elements
+        """
+        self.__changes.record(element_type, change_type, element_ids)
+
+    def _record_new_intersection(
+        self,
+        intersection: Intersection,
+        lanelets: List[Lanelet],
+        traffic_signs: List[TrafficSign],
+        traffic_lights: List[TrafficLight],
+    ):
+        """
+        Records the elements of an intersection created by the map creator
+
+        @param intersection: New intersection
+        @param lanelets: New lanelets of the intersection
+        @param traffic_signs: New traffic signs of the intersection
+        @param traffic_lights: New traffic lights of the intersection
+        """
+        self._record(ElementType.INTERSECTION, ChangeType.ADDED, [intersection.intersection_id])
+        self._record(ElementType.LANELET, ChangeType.ADDED, [la.lanelet_id for la in lanelets])
+        self._record(
+            ElementType.TRAFFIC_SIGN, ChangeType.ADDED, [ts.traffic_sign_id for ts in traffic_signs]
+        )
+        self._record(
+            ElementType.TRAFFIC_LIGHT,
+            ChangeType.ADDED,
+            [tl.traffic_light_id for tl in traffic_lights],
+        )
+
     def notify_all(self, new_file_added: bool = False):
         """
-        Notifies all subscribers that the scenario has been changed
+        Notifies all subscribers that the scenario has been changed. Within a transaction, the notification is
+        postponed to the end of the transaction. If no changes were recorded, all elements are reported as changed.
 
         @param new_file_added: Indicates whether a new file was added
         """
-        self.__new_file_added = new_file_added
+        if not self.__changes:
+            self.__changes.everything = True
+        self.__changes.new_file_added |= new_file_added
+        if self.__transaction_depth > 0:
+            self.__notification_pending = True
+            return
+        changes, self.__changes = self.__changes, ChangeSet()
+        self.__notification_pending = False
+        self.__new_file_added = changes.new_file_added
         self.__updated_scenario = False
         self.scenario_changed.emit()
+        self.elements_changed.emit(changes)
+
+    @contextmanager
+    def transaction(self) -> Iterator["ScenarioModel"]:
+        """
+        Groups several mutations into one undo step and one notification with the merged change set. Transactions
+        can be nested; the notification is emitted at the end of the outermost transaction.
+        """
+        self.__transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self.__transaction_depth -= 1
+            if self.__transaction_depth == 0 and self.__notification_pending:
+                self.notify_all()
 
     def is_new_file_added(self) -> bool:
         """
@@ -98,6 +196,10 @@ class ScenarioModel(QObject):
         """Allows subscription without exposing the signal."""
         self.scenario_changed.connect(callback)
 
+    def subscribe_changes(self, callback: Callable[[ChangeSet], None]):
+        """Allows subscription to the change sets without exposing the signal."""
+        self.elements_changed.connect(callback)
+
     def get_current_scenario(self) -> Scenario:
         """Returns the current scenario."""
         return self._current_scenario()
@@ -198,6 +300,8 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().add_objects(lanelet)
+        lanelets = lanelet if isinstance(lanelet, list) else [lanelet]
+        self._record(ElementType.LANELET, ChangeType.ADDED, [la.lanelet_id for la in lanelets])
         self.notify_all()
 
     @logger.log
@@ -209,6 +313,7 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().add_objects(obstacle)
+        self._record(ElementType.OBSTACLE, ChangeType.ADDED, [obstacle.obstacle_id])
         self.notify_all()
 
     @logger.log
@@ -268,6 +373,13 @@ class ScenarioModel(QObject):
                 la_info[0]
             ).adj_right_same_direction = la_info[1]
 
+        self._record(ElementType.LANELET, ChangeType.REMOVED, [old_lanelet_id])
+        self._record(ElementType.LANELET, ChangeType.ADDED, [new_lanelet.lanelet_id])
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            successors + predecessors + [la_info[0] for la_info in adjacent_left + adjacent_right],
+        )
         self.notify_all()
 
     @logger.log
@@ -281,6 +393,8 @@ class ScenarioModel(QObject):
         removed_lanelet = self.find_lanelet_by_id(lanelet_id)
         traffic_lights = removed_lanelet.traffic_lights
         traffic_signs = removed_lanelet.traffic_signs
+        self._record(ElementType.LANELET, ChangeType.REMOVED, [lanelet_id])
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, _neighbours(removed_lanelet))
 
         for traffic_sign_id in traffic_signs:
             if (
@@ -294,6 +408,7 @@ class ScenarioModel(QObject):
                 self._current_scenario().remove_traffic_sign(
                     self.find_traffic_sign_by_id(traffic_sign_id)
                 )
+                self._record(ElementType.TRAFFIC_SIGN, ChangeType.REMOVED, [traffic_sign_id])
 
         for traffic_light_id in traffic_lights:
             if (
@@ -307,6 +422,7 @@ class ScenarioModel(QObject):
                 self._current_scenario().remove_traffic_light(
                     self.find_traffic_light_by_id(traffic_light_id)
                 )
+                self._record(ElementType.TRAFFIC_LIGHT, ChangeType.REMOVED, [traffic_light_id])
 
         MapCreator.remove_lanelet(lanelet_id, self._current_scenario().lanelet_network)
         self.notify_all()
@@ -321,6 +437,11 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         MapCreator.fit_to_predecessor(lanelet_two, lanelet_one)
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            [lanelet_one.lanelet_id, lanelet_two.lanelet_id],
+        )
         self.notify_all()
 
     @logger.log
@@ -338,6 +459,7 @@ class ScenarioModel(QObject):
         lanelet.translate_rotate(initial_vertex - lanelet.center_vertices[0], 0.0)
         self._current_scenario().remove_lanelet(lanelet)
         self._current_scenario().add_objects(lanelet)
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, [lanelet_id])
         self.notify_all()
 
     @logger.log
@@ -350,6 +472,7 @@ class ScenarioModel(QObject):
         self._update_scenario()
         self._current_scenario().remove_lanelet(lanelet)
         self._current_scenario().add_objects(lanelet)
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, [lanelet.lanelet_id])
         self.notify_all()
 
     @logger.log
@@ -367,11 +490,15 @@ class ScenarioModel(QObject):
             new_lanelet = Lanelet.merge_lanelets(lanelet, self.find_lanelet_by_id(suc))
             self._current_scenario().remove_lanelet(self.find_lanelet_by_id(suc))
             self._current_scenario().add_objects(new_lanelet)
+            self._record(ElementType.LANELET, ChangeType.REMOVED, [suc])
+            self._record(ElementType.LANELET, ChangeType.ADDED, [new_lanelet.lanelet_id])
             successors.append(new_lanelet.lanelet_id)
         self._current_scenario().remove_lanelet(lanelet)
+        self._record(ElementType.LANELET, ChangeType.REMOVED, [lanelet.lanelet_id])
         for pred in predecessors:
             for suc in successors:
                 self.find_lanelet_by_id(pred).add_successor(suc)
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, predecessors)
         self.notify_all()
 
     @logger.log
@@ -401,6 +528,19 @@ class ScenarioModel(QObject):
                     neighboured_lanelets.remove(n_lanelet)
                     self._current_scenario().remove_lanelet(n_lanelet)
                     self._current_scenario().remove_lanelet(lanelet)
+                    self._record(
+                        ElementType.LANELET,
+                        ChangeType.REMOVED,
+                        [n_lanelet.lanelet_id, lanelet.lanelet_id],
+                    )
+                    self._record(
+                        ElementType.LANELET, ChangeType.ADDED, [connected_lanelet.lanelet_id]
+                    )
+                    self._record(
+                        ElementType.LANELET,
+                        ChangeType.MODIFIED,
+                        connected_lanelet.successor + connected_lanelet.predecessor,
+                    )
                     last_merged_index = connected_lanelet.lanelet_id
                     break
         return last_merged_index
@@ -415,6 +555,8 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().add_objects(traffic_sign, referenced_lanelets)
+        self._record(ElementType.TRAFFIC_SIGN, ChangeType.ADDED, [traffic_sign.traffic_sign_id])
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, referenced_lanelets)
         self.notify_all()
 
     @logger.log
@@ -426,7 +568,15 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         traffic_sign = self.find_traffic_sign_by_id(traffic_sign_id)
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            self._current_scenario().lanelet_network.get_traffic_sign_referenced_lanelets(
+                traffic_sign_id
+            ),
+        )
         self._current_scenario().remove_traffic_sign(traffic_sign)
+        self._record(ElementType.TRAFFIC_SIGN, ChangeType.REMOVED, [traffic_sign_id])
         self.notify_all()
 
     @logger.log
@@ -438,6 +588,7 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().remove_obstacle(obstacle)
+        self._record(ElementType.OBSTACLE, ChangeType.REMOVED, [obstacle.obstacle_id])
         self.notify_all()
 
     @logger.log
@@ -449,7 +600,15 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         traffic_sign = self.find_traffic_sign_by_id(traffic_sign_id)
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            self._current_scenario().lanelet_network.get_traffic_sign_referenced_lanelets(
+                traffic_sign_id
+            ),
+        )
         self._current_scenario().remove_traffic_sign(traffic_sign)
+        self._record(ElementType.TRAFFIC_SIGN, ChangeType.REMOVED, [traffic_sign_id])
 
     @logger.log
     def add_traffic_light(self, traffic_light: TrafficLight, referenced_lanelets: Set[int]):
@@ -461,6 +620,8 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().add_objects(traffic_light, referenced_lanelets)
+        self._record(ElementType.TRAFFIC_LIGHT, ChangeType.ADDED, [traffic_light.traffic_light_id])
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, referenced_lanelets)
         self.notify_all()
 
     @logger.log
@@ -472,7 +633,15 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         traffic_light = self.find_traffic_light_by_id(traffic_light_id)
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            self._current_scenario().lanelet_network.get_traffic_lights_referenced_lanelets(
+                traffic_light_id
+            ),
+        )
         self._current_scenario().remove_traffic_light(traffic_light)
+        self._record(ElementType.TRAFFIC_LIGHT, ChangeType.REMOVED, [traffic_light_id])
         self.notify_all()
 
     @logger.log
@@ -484,18 +653,53 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         traffic_light = self.find_traffic_light_by_id(traffic_light_id)
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            self._current_scenario().lanelet_network.get_traffic_lights_referenced_lanelets(
+                traffic_light_id
+            ),
+        )
         self._current_scenario().remove_traffic_light(traffic_light)
+        self._record(ElementType.TRAFFIC_LIGHT, ChangeType.REMOVED, [traffic_light_id])
 
     @logger.log
-    def create_traffic_lights_for_referenced_lanelets(self, lanelet_network: LaneletNetwork):
+    def create_traffic_light_programs(
+        self, lanelet_ids: List[int], timings: TrafficLightTimings
+    ) -> List[bool]:
         """
-        Creates traffic lights for referenced lanlets(SUMO)
+        Creates phased traffic lights for the intersections of the given lanelets
 
-        @param lanelet_network: lanelet networks with the new traffic lights
+        @param lanelet_ids: IDs of lanelets of the intersections
+        @param timings: Timings of the phases of the traffic lights
+        @return: Boolean for each lanelet indicating whether the lanelet belongs to an intersection
         """
         self._update_scenario()
-        self._current_scenario().replace_lanelet_network(lanelet_network)
+        network = self._current_scenario().lanelet_network
+        intersections = [find_intersection(network, lanelet_id) for lanelet_id in lanelet_ids]
+        previous_ids = {traffic_light.traffic_light_id for traffic_light in network.traffic_lights}
+        for intersection in {
+            intersection.intersection_id: intersection
+            for intersection in intersections
+            if intersection is not None
+        }.values():
+            create_traffic_light_program(
+                network, intersection, timings, self._current_scenario().generate_object_id
+            )
+            self._record(
+                ElementType.LANELET,
+                ChangeType.MODIFIED,
+                [
+                    lanelet_id
+                    for incoming in intersection.incomings
+                    for lanelet_id in incoming.incoming_lanelets
+                ],
+            )
+        ids = {traffic_light.traffic_light_id for traffic_light in network.traffic_lights}
+        self._record(ElementType.TRAFFIC_LIGHT, ChangeType.REMOVED, previous_ids - ids)
+        self._record(ElementType.TRAFFIC_LIGHT, ChangeType.ADDED, ids - previous_ids)
         self.notify_all()
+        return [intersection is not None for intersection in intersections]
 
     @logger.log
     def create_three_way_intersection(
@@ -532,6 +736,9 @@ class ScenarioModel(QObject):
         self._current_scenario().add_objects(new_lanelets)
         self._current_scenario().add_objects(new_traffic_signs)
         self._current_scenario().add_objects(new_traffic_lights)
+        self._record_new_intersection(
+            intersection, new_lanelets, new_traffic_signs, new_traffic_lights
+        )
         self.notify_all()
 
     @logger.log
@@ -569,6 +776,9 @@ class ScenarioModel(QObject):
         self._current_scenario().add_objects(new_lanelets)
         self._current_scenario().add_objects(new_traffic_signs)
         self._current_scenario().add_objects(new_traffic_lights)
+        self._record_new_intersection(
+            intersection, new_lanelets, new_traffic_signs, new_traffic_lights
+        )
         self.notify_all()
 
     @logger.log
@@ -580,6 +790,7 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self._current_scenario().add_objects(intersection)
+        self._record(ElementType.INTERSECTION, ChangeType.ADDED, [intersection.intersection_id])
         self.notify_all()
 
     @logger.log
@@ -592,6 +803,7 @@ class ScenarioModel(QObject):
         self._update_scenario()
         intersetion = self.find_intersection_by_id(old_intersection_id)
         self._current_scenario().remove_intersection(intersetion)
+        self._record(ElementType.INTERSECTION, ChangeType.REMOVED, [old_intersection_id])
 
     @logger.log
     def remove_intersection(self, intersection_id: int):
@@ -603,6 +815,7 @@ class ScenarioModel(QObject):
         self._update_scenario()
         intersetion = self.find_intersection_by_id(intersection_id)
         self._current_scenario().remove_intersection(intersetion)
+        self._record(ElementType.INTERSECTION, ChangeType.REMOVED, [intersection_id])
         self.notify_all()
 
     @logger.log
@@ -625,6 +838,12 @@ class ScenarioModel(QObject):
             intersection,
             self._current_scenario().lanelet_network,
         )
+        self._record(ElementType.INTERSECTION, ChangeType.MODIFIED, [intersection_id])
+        self._record(
+            ElementType.LANELET,
+            ChangeType.MODIFIED,
+            {predecessor_id, successor_id} | _intersection_lanelets(intersection),
+        )
         self.notify_all()
 
     @logger.log
@@ -637,6 +856,7 @@ class ScenarioModel(QObject):
         """
         lanelet = self.find_lanelet_by_id(lanelet_id)
         lanelet.successor.append(successor_id)
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, [lanelet_id])
 
     @logger.log
     def add_predecessor_to_lanelet(self, lanelet_id: int, predecessor_id: int):
@@ -648,6 +868,7 @@ class ScenarioModel(QObject):
         """
         lanelet = self.find_lanelet_by_id(lanelet_id)
         lanelet.predecessor.append(predecessor_id)
+        self._record(ElementType.LANELET, ChangeType.MODIFIED, [lanelet_id])
 
     @logger.log
     def generate_object_id(self) -> int:
@@ -786,6 +1007,32 @@ class ScenarioModel(QObject):
 
         @param lanelet_network: New lanelet Network which should replace the current one
         """
+        old_network = self._current_scenario().lanelet_network
+        for element_type, old_ids, new_ids in (
+            (
+                ElementType.LANELET,
+                {la.lanelet_id for la in old_network.lanelets},
+                {la.lanelet_id for la in lanelet_network.lanelets},
+            ),
+            (
+                ElementType.TRAFFIC_SIGN,
+                {ts.traffic_sign_id for ts in old_network.traffic_signs},
+                {ts.traffic_sign_id for ts in lanelet_network.traffic_signs},
+            ),
+            (
+                ElementType.TRAFFIC_LIGHT,
+                {tl.traffic_light_id for tl in old_network.traffic_lights},
+                {tl.traffic_light_id for tl in lanelet_network.traffic_lights},
+            ),
+            (
+                ElementType.INTERSECTION,
+                {i.intersection_id for i in old_network.intersections},
+                {i.intersection_id for i in lanelet_network.intersections},
+            ),
+        ):
+            self._record(element_type, ChangeType.REMOVED, old_ids - new_ids)
+            self._record(element_type, ChangeType.ADDED, new_ids - old_ids)
+            self._record(element_type, ChangeType.MODIFIED, old_ids & new_ids)
         self._current_scenario().replace_lanelet_network(lanelet_network)
 
     @logger.log
@@ -795,6 +1042,7 @@ class ScenarioModel(QObject):
         """
         if self.__current_scenario_index > 0:
             self.__current_scenario_index -= 1
+            self.__changes.everything = True
             self.notify_all()
 
     @logger.log
@@ -804,6 +1052,7 @@ class ScenarioModel(QObject):
         """
         if self.__current_scenario_index < len(self.__scenarios) - 1:
             self.__current_scenario_index += 1
+            self.__changes.everything = True
             self.notify_all()
 
     @logger.log
@@ -823,6 +1072,7 @@ class ScenarioModel(QObject):
                 obs.initial_state.position
             ):
                 self._current_scenario().remove_obstacle(obs)
+                self._record(ElementType.OBSTACLE, ChangeType.REMOVED, [obs.obstacle_id])
         self.replace_lanelet_network(new_lanelet_network)
         self.notify_all()
 
@@ -835,6 +1085,7 @@ class ScenarioModel(QObject):
         """
         self._update_scenario()
         self.__scenarios[self.__current_scenario_index] = scenario
+        self.__changes.everything = True
         self.notify_all(True)
 
     def get_copy_of_scenario(self) -> Optional[Scenario]:
@@ -890,6 +1141,7 @@ class ScenarioModel(QObject):
         self._current_scenario().scenario_id.prediction_id = prediction_id
         if location is not None:
             self._current_scenario().location = location
+        self._record(ElementType.META_DATA, ChangeType.MODIFIED)
 
     def update_translate_scenario(self, translation: np.ndarray, geo_reference: str):
         """
@@ -926,4 +1178,6 @@ class ScenarioModel(QObject):
 
         self._current_scenario().translate_rotate(new_translation, 0)
 
+        # all elements are moved
+        self.__changes.everything = True
         self.notify_all()
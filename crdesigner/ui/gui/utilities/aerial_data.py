@@ -2,19 +2,23 @@
 This module provides methods to download and use aerial images from Bing Maps
 """
 
+import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from queue import Queue
-from threading import Thread
-from typing import List, Optional, Tuple
+from threading import Lock
+from typing import Any, Hashable, List, Optional, Tuple
+from urllib.error import URLError
 from urllib.request import HTTPBasicAuthHandler, build_opener, install_opener, urlopen
 
 import mercantile
+import numpy as np
 import requests
 from commonroad.scenario.scenario import Scenario
 from PIL import Image
-from PIL.JpegImagePlugin import JpegImageFile
 from pyproj import Proj
 
 from crdesigner.common.config.gui_config import gui_config
@@ -24,36 +28,138 @@ from crdesigner.common.config.osm_config import osm_config as config
 
 IMAGE_RESOLUTION = 256
 
+# number of concurrent tile downloads
+MAX_PARALLEL_REQUESTS = 16
+# retry behaviour of tile downloads: waiting time is DOWNLOAD_BACKOFF_BASE * 2^attempt seconds
+MAX_DOWNLOAD_ATTEMPTS = 5
+DOWNLOAD_BACKOFF_BASE = 0.5
+DOWNLOAD_BACKOFF_MAX = 8.0
+DOWNLOAD_TIMEOUT = 10.0
+# memory limits of the in-memory caches
+TILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+MOSAIC_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
 bing_maps_api_response = None
+_api_response_lock = Lock()
 
 os.makedirs(config.IMAGE_SAVE_PATH, exist_ok=True)
 
 
-def store_tile(quadkey: str, image: JpegImageFile) -> None:
+class LRUCache:
+    """
+    Thread-safe least recently used cache whose capacity is limited by the size of the stored values in bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: maximum accumulated size of the stored values
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        returns the value of a key and marks it as most recently used
+
+        :param key: key of the entry
+        :return: value or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """
+        stores a value and evicts least recently used entries until the byte limit is respected.
+        Values larger than the byte limit are not stored.
+
+        :param key: key of the entry
+        :param value: value to store
+        :param nbytes: size of the value in bytes
+        """
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+
+    def clear(self) -> None:
+        """
+        removes all entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+# decoded tiles by tile server and quadkey and stitched images by bounds, zoom level and tile server
+tile_cache = LRUCache(TILE_CACHE_MAX_BYTES)
+mosaic_cache = LRUCache(MOSAIC_CACHE_MAX_BYTES)
+
+
+def _tile_file(quadkey: str, url_template: Optional[str] = None) -> str:
     """
+    builds the path of a tile on disk. Tiles of the bing maps server are stored directly in the image directory,
+    tiles of other servers in a subdirectory named by a hash of the url template.
+
+    :param quadkey: quadkey of tile
+    :param url_template: url of the tile server; None for bing maps
+    :return: path of the tile
+    """
+    directory = config.IMAGE_SAVE_PATH
+    if url_template is not None:
+        server = hashlib.blake2b(url_template.encode(), digest_size=8).hexdigest()
+        directory = os.path.join(directory, server, "")
+    return directory + quadkey + ".jpeg"
+
+
+def store_tile(quadkey: str, data: bytes, url_template: Optional[str] = None) -> None:
+    """
+    stores the encoded tile on disk.
     This is useful for low internet connection speeds.
 
     :param quadkey: quadkey of tile
-    :param image: the image
+    :param data: the encoded image
+    :param url_template: url of the tile server; None for bing maps
     :return: None
     """
-    file = config.IMAGE_SAVE_PATH + quadkey + ".jpeg"
-    image.save(file, "JPEG")
+    file = _tile_file(quadkey, url_template)
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+    with open(file, "wb") as f:
+        f.write(data)
     return
 
 
-def load_tile(quadkey: str) -> Optional[JpegImageFile]:
+def load_tile(quadkey: str, url_template: Optional[str] = None) -> Optional[bytes]:
     """
-    tries to load a tile from disk
+    tries to load an encoded tile from disk
 
     :param quadkey: quadkey of tile
-    :return: the image if present, else None
+    :param url_template: url of the tile server; None for bing maps
+    :return: the encoded image if present, else None
     """
     try:
-        image = Image.open(config.IMAGE_SAVE_PATH + quadkey + ".jpeg")
+        with open(_tile_file(quadkey, url_template), "rb") as f:
+            data = f.read()
     except FileNotFoundError:
-        image = None
-    return image
+        data = None
+    return data
 
 
 def get_bin_maps_api_response() -> None:
@@ -128,34 +234,84 @@ def validate_ldbv_credentials() -> bool:
     return True
 
 
-def get_tile(quadkey: str) -> JpegImageFile:
+def _tile_url(quadkey: str) -> Optional[str]:
     """
-    takes a quadkey, downloads the corresponding tile if not present and converts it to an image
+    builds the download url of a tile from the bing maps api response
 
     :param quadkey: quadkey of tile
-    :return: image
+    :return: url of the tile or None if no bing maps key is specified
+    """
+    if bing_maps_api_response is None:
+        with _api_response_lock:
+            if bing_maps_api_response is None:
+                get_bin_maps_api_response()
+    if bing_maps_api_response is None:
+        return None
+    request = bing_maps_api_response["imageUrl"]
+    sub_domain = bing_maps_api_response["imageUrlSubdomains"][0]
+    request = request.replace("{subdomain}", sub_domain)
+    return request.replace("{quadkey}", quadkey)
+
+
+def _decode_tile(data: bytes) -> np.ndarray:
+    """
+    decodes an encoded tile into a read-only RGB array
+
+    :param data: encoded image
+    :return: decoded image
+    """
+    tile = np.asarray(Image.open(BytesIO(data)).convert("RGB"))
+    tile.setflags(write=False)
+    return tile
+
+
+def get_tile(
+    quadkey: str, url_template: Optional[str] = None, max_attempts: int = MAX_DOWNLOAD_ATTEMPTS
+) -> Optional[np.ndarray]:
+    """
+    takes a quadkey and returns the corresponding decoded tile. The tile is looked up in the in-memory cache first,
+    then on disk and is downloaded otherwise. Failed downloads are retried with exponential backoff.
+
+    :param quadkey: quadkey of tile
+    :param url_template: url of the tile server containing the placeholder {quadkey}; the bing maps url is used if
+        not provided
+    :param max_attempts: maximum number of download attempts
+    :return: decoded image or None if the tile could not be obtained
     """
     assert isinstance(quadkey, str)
 
-    global bing_maps_api_response
+    tile = tile_cache.get((url_template, quadkey))
+    if tile is not None:
+        return tile
 
-    image = load_tile(quadkey)
-    if image is None:
+    data = load_tile(quadkey, url_template)
+    if data is None:
         try:
-            if bing_maps_api_response is None:
-                get_bin_maps_api_response()
-            if gui_config.BING_MAPS_KEY == "":
-                return
-            request = bing_maps_api_response["imageUrl"]
-            sub_domain = bing_maps_api_response["imageUrlSubdomains"][0]
-            request = request.replace("{subdomain}", sub_domain)
-            request = request.replace("{quadkey}", quadkey)
-            tile = urlopen(request).read()
-            image = Image.open(BytesIO(tile))
-            store_tile(quadkey, image)
-        except Exception:
-            return get_tile(quadkey)
-    return image
+            url = (
+                url_template.replace("{quadkey}", quadkey)
+                if url_template is not None
+                else _tile_url(quadkey)
+            )
+        except URLError:
+            # the bing maps api could not be reached
+            return None
+        if url is None:
+            return None
+        for attempt in range(max_attempts):
+            try:
+                with urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+                    data = response.read()
+                break
+            except Exception:
+                if attempt + 1 < max_attempts:
+                    time.sleep(min(DOWNLOAD_BACKOFF_BASE * 2**attempt, DOWNLOAD_BACKOFF_MAX))
+        if data is None:
+            return None
+        store_tile(quadkey, data, url_template)
+
+    tile = _decode_tile(data)
+    tile_cache.put((url_template, quadkey), tile, tile.nbytes)
+    return tile
 
 
 def get_required_quadkeys(
@@ -215,83 +371,80 @@ def get_required_quadkeys(
     return quadkeys, x_length, y_length, extent
 
 
-def put_images_together(images: List[Image.Image], x_count: int, y_count: int) -> Image.Image:
+def put_images_together(
+    images: List[Optional[np.ndarray]], x_count: int, y_count: int
+) -> np.ndarray:
     """
-    puts tiles together to one image
+    puts tiles together to one image, missing tiles are left black
 
-    :param images: images in sorted order
-    :param x_count: number of columns
-    :param y_count: number of rows
+    :param images: decoded images in sorted order
+    :param x_count: number of rows
+    :param y_count: number of columns
     :return: resulting image
     """
     height = x_count * IMAGE_RESOLUTION
     width = y_count * IMAGE_RESOLUTION
-    new_im = Image.new("RGB", (width, height))
+    new_im = np.zeros((height, width, 3), dtype=np.uint8)
     for index, image in enumerate(images):
+        if image is None:
+            continue
         x = IMAGE_RESOLUTION * (index // x_count)
         y = IMAGE_RESOLUTION * (index % x_count)
-        new_im.paste(image, (x, y))
+        new_im[y : y + image.shape[0], x : x + image.shape[1]] = image[..., :3]
+    new_im.setflags(write=False)
     return new_im
 
 
-def download_all_images(quadkeys: List[str]) -> List[Image.Image]:
+def download_all_images(
+    quadkeys: List[str], url_template: Optional[str] = None
+) -> List[Optional[np.ndarray]]:
     """
-    downloads all images in list
+    downloads all images in list using a bounded thread pool
 
     :param quadkeys: quadkeys of images
-    :return: resulting images
+    :param url_template: url of the tile server containing the placeholder {quadkey}
+    :return: resulting decoded images, None for tiles which could not be obtained
     """
-
-    def thread_work():
-        while True:
-            quadkey = q.get()
-            if quadkey is None:
-                return
-            image = get_tile(quadkey)
-            images[quadkey] = image
-            q.task_done()
-
-    PARALLEL_REQUESTS = 200
-    q = Queue()
-
-    images = {}
-    threads = []
-    for i in range(PARALLEL_REQUESTS):
-        t = Thread(target=thread_work)
-        t.start()
-        threads.append(t)
-
-    for quadkey in quadkeys:
-        q.put(quadkey)
-
-    q.join()
-    for i in range(PARALLEL_REQUESTS):
-        q.put(None)
-    for t in threads:
-        t.join()
-
-    result = [images[quadkey] for quadkey in quadkeys]
-    return result
+    if len(quadkeys) == 0:
+        return []
+    if url_template is None:
+        # fetch the api response once instead of in every worker
+        try:
+            _tile_url(quadkeys[0])
+        except URLError:
+            return [None] * len(quadkeys)
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(quadkeys))) as executor:
+        return list(executor.map(lambda key: get_tile(key, url_template), quadkeys))
 
 
 def get_aerial_image_bing(
-    bounds: Tuple[float, float, float, float], zoom: int = 19
-) -> Tuple[Image.Image, Tuple[float, float, float, float]]:
+    bounds: Tuple[float, float, float, float], zoom: int = 19, url_template: Optional[str] = None
+) -> Tuple[np.ndarray, Tuple[float, float, float, float]]:
     """
-    gets the image and coordinates to a specified aera from bing
+    gets the image and coordinates to a specified aera from bing.
+    Stitched images are cached by bounds and zoom level.
+
     :param bounds: northern, western, southern and eastern bound
     :param zoom: zoom level
-    :return: Tuple: 1. image, 2. extent of image
+    :param url_template: url of the tile server containing the placeholder {quadkey}; the bing maps url is used if
+        not provided
+    :return: Tuple: 1. image as read-only RGB array, 2. extent of image
     """
     assert 1 <= zoom <= 23
 
+    key = (tuple(bounds), zoom, url_template)
+    cached = mosaic_cache.get(key)
+    if cached is not None:
+        return cached
+
     lat1, lon1, lat2, lon2 = bounds
 
     keys, x_count, y_count, extent = get_required_quadkeys(lon1, lat2, lon2, lat1, zoom)
     print("loading {} tiles".format(len(keys)))
-    # images = [get_tile(key) for key in keys]
-    images = download_all_images(keys)
+    images = download_all_images(keys, url_template)
     image = put_images_together(images, x_count, y_count)
+    if all(img is not None for img in images):
+        mosaic_cache.put(key, (image, extent), image.nbytes)
     return image, extent
 
 
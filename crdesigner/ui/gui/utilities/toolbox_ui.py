@@ -1,10 +1,13 @@
+from typing import List, Optional
+
 from PyQt6 import QtGui
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtCore import QAbstractItemModel, QSize, Qt
 from PyQt6.QtGui import QIcon, QStandardItemModel
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
     QComboBox,
+    QCompleter,
     QFrame,
     QGroupBox,
     QPushButton,
@@ -17,6 +20,10 @@ from PyQt6.QtWidgets import (
 )
 
 from crdesigner.common.config.gui_config import gui_config as config
+from crdesigner.ui.gui.model.element_list_model import (
+    ElementFilterProxyModel,
+    ElementIdListModel,
+)
 
 
 class QHLine(QFrame):
@@ -57,6 +64,74 @@ class SectionExpandButton(QPushButton):
             self.section.setExpanded(True)
 
 
+class ElementComboBox(QComboBox):
+    """
+    Combo box for selecting a scenario element by its ID. The IDs are provided by an item model, e.g., an element ID
+    list model, and the list can be searched by typing a part of an ID. For element ID list models, the suggestions
+    are filtered by an element filter proxy model, which can additionally be restricted to the elements in view.
+    The current text is always the text of the selected item and never a partially typed ID.
+    """
+
+    def __init__(self):
+        super(ElementComboBox, self).__init__()
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.completer().setFilterMode(Qt.MatchFlag.MatchContains)
+        self.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.completion_model: Optional[ElementFilterProxyModel] = None
+        self._view_limits: Optional[List[float]] = None
+        self.lineEdit().textEdited.connect(self.filter_completions)
+        self.lineEdit().editingFinished.connect(self.select_typed_item)
+
+    def setModel(self, model: QAbstractItemModel):
+        super().setModel(model)
+        if isinstance(model, ElementIdListModel):
+            self.completion_model = ElementFilterProxyModel(model)
+            self.completion_model.set_view_limits(self._view_limits)
+            self.completer().setModel(self.completion_model)
+            # the completion model is already filtered, so the completer shows all its rows
+            self.completer().setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        else:
+            self.completion_model = None
+            self.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+
+    def set_view_limits(self, limits: Optional[List[float]]):
+        """
+        Restricts the suggestions to elements overlapping the visible area of the map. The suggestions are only
+        filtered again when the user types, so that moving the map stays cheap.
+
+        @param limits: Visible area [x_min, x_max, y_min, y_max] or None to suggest all elements
+        """
+        self._view_limits = None if limits is None else list(limits)
+
+    def filter_completions(self, text: str):
+        """
+        Filters the suggestions by the typed text and the visible area.
+
+        @param text: Typed part of an ID
+        """
+        if self.completion_model is None:
+            return
+        if self.completion_model.view_limits != self._view_limits:
+            self.completion_model.set_view_limits(self._view_limits)
+        self.completion_model.setFilterFixedString(text)
+
+    def currentText(self) -> str:
+        if self.currentIndex() < 0:
+            return ""
+        return self.itemText(self.currentIndex())
+
+    def setCurrentText(self, text: str):
+        index = self.findText(text)
+        if index >= 0:
+            self.setCurrentIndex(index)
+        self.setEditText(self.currentText())
+
+    def select_typed_item(self):
+        """Selects the item matching the typed text or shows the selected item again if no item matches."""
+        self.setCurrentText(self.lineEdit().text())
+
+
 class CheckableComboBox(QComboBox):
     def __init__(self, mwindow=None, pred_suc=False):
         super(CheckableComboBox, self).__init__()
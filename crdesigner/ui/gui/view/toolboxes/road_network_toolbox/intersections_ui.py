@@ -4,6 +4,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QComboBox, QTableWidgetItem
 
 from crdesigner.common.logging import logger
+from crdesigner.ui.gui.model.element_list_model import ElementIdListModel
+from crdesigner.ui.gui.model.scenario_changes import ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.utilities.toolbox_ui import CheckableComboBox
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
@@ -17,6 +19,8 @@ class AddIntersectionUI:
     ):
         self.road_network_toolbox_ui = road_network_toolbox_ui
         self.scenario_model = scenario_model
+        self.intersection_ids = ElementIdListModel(scenario_model, ElementType.INTERSECTION)
+        self.road_network_toolbox_ui.selected_intersection.setModel(self.intersection_ids)
 
     # TODO: Nowhere used
     def update_incomings(self):
@@ -74,10 +78,6 @@ class AddIntersectionUI:
                 ).setCurrentIndex(index)
 
     def set_default_intersection_information(self):
-        self.road_network_toolbox_ui.selected_intersection.clear()
-        self.road_network_toolbox_ui.selected_intersection.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_intersection_ids()]
-        )
         self.road_network_toolbox_ui.selected_intersection.setCurrentIndex(0)
 
         self.road_network_toolbox_ui.intersection_crossings.clear()
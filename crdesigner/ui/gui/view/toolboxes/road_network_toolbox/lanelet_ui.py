@@ -7,6 +7,8 @@ from numpy import ndarray
 from PyQt6.QtCore import Qt
 
 from crdesigner.common.logging import logger
+from crdesigner.ui.gui.model.element_list_model import ElementIdListModel
+from crdesigner.ui.gui.model.scenario_changes import ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.utilities.helper import angle_between
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
@@ -20,6 +22,10 @@ class AddLaneletUI:
     ):
         self.road_network_toolbox_ui = road_network_toolbox_ui
         self.scenario_model = scenario_model
+        self.lanelet_ids = ElementIdListModel(scenario_model, ElementType.LANELET)
+        self.road_network_toolbox_ui.selected_lanelet_update.setModel(self.lanelet_ids)
+        self.road_network_toolbox_ui.selected_lanelet_one.setModel(self.lanelet_ids)
+        self.road_network_toolbox_ui.selected_lanelet_two.setModel(self.lanelet_ids)
 
     # TODO check for deletion
     # def lanelet_selection_changed(self):
@@ -234,22 +240,10 @@ class AddLaneletUI:
             0
         )
 
-        self.road_network_toolbox_ui.selected_lanelet_update.clear()
-        self.road_network_toolbox_ui.selected_lanelet_update.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_lanelet_ids()]
-        )
         self.road_network_toolbox_ui.selected_lanelet_update.setCurrentIndex(0)
 
-        self.road_network_toolbox_ui.selected_lanelet_one.clear()
-        self.road_network_toolbox_ui.selected_lanelet_one.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_lanelet_ids()]
-        )
         self.road_network_toolbox_ui.selected_lanelet_one.setCurrentIndex(0)
 
-        self.road_network_toolbox_ui.selected_lanelet_two.clear()
-        self.road_network_toolbox_ui.selected_lanelet_two.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_lanelet_ids()]
-        )
         self.road_network_toolbox_ui.selected_lanelet_two.setCurrentIndex(0)
 
         self.road_network_toolbox_ui.selected_lanelet_start_position_x.setEnabled(True)
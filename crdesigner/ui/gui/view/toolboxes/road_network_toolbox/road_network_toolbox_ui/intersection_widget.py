@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from crdesigner.ui.gui.utilities.toolbox_ui import CheckableComboBox
+from crdesigner.ui.gui.utilities.toolbox_ui import CheckableComboBox, ElementComboBox
 
 
 class IntersectionsWidget:
@@ -55,7 +55,7 @@ class IntersectionsWidget:
         label_update_intersection = QLabel("Add/Update/Remove Intersection")
         label_update_intersection.setFont(QFont("Arial", 11, QFont.Weight.Bold))
 
-        self.toolbox.selected_intersection = QComboBox()
+        self.toolbox.selected_intersection = ElementComboBox()
 
         self.toolbox.intersection_incomings_label = QLabel("Incomings:")
         self.toolbox.intersection_incomings_table = QTableWidget()
@@ -21,6 +21,7 @@ from crdesigner.ui.gui.utilities.toolbox_ui import (
     CheckableComboBox,
     CollapsibleArrowBox,
     CollapsibleCheckBox,
+    ElementComboBox,
     PositionButton,
 )
 
@@ -43,7 +44,7 @@ class LaneletAttributesWidget:
             self.toolbox.layout_lanelet_attributes_groupbox
         )
 
-        self.toolbox.selected_lanelet_update = QComboBox()
+        self.toolbox.selected_lanelet_update = ElementComboBox()
         self.toolbox.button_remove_lanelet = QPushButton("Remove")
 
         self.toolbox.layout_lanelet_attributes_groupbox.addRow(
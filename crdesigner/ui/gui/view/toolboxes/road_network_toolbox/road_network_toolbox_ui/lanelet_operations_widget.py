@@ -3,7 +3,6 @@ from PyQt6.QtGui import QDoubleValidator
 from PyQt6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
-    QComboBox,
     QFormLayout,
     QFrame,
     QGridLayout,
@@ -16,6 +15,8 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
+from crdesigner.ui.gui.utilities.toolbox_ui import ElementComboBox
+
 
 class LaneletOperationsWidget:
     """
@@ -29,8 +30,8 @@ class LaneletOperationsWidget:
         widget_lanelet_operations = QFrame(self.toolbox.tree)
         layout_lanelet_operations = QVBoxLayout(widget_lanelet_operations)
 
-        self.toolbox.selected_lanelet_one = QComboBox()
-        self.toolbox.selected_lanelet_two = QComboBox()
+        self.toolbox.selected_lanelet_one = ElementComboBox()
+        self.toolbox.selected_lanelet_two = ElementComboBox()
 
         self.toolbox.adjacent_left_right_button_group = QButtonGroup()
         self.toolbox.create_adjacent_left_selection = QRadioButton("Adjacent left")
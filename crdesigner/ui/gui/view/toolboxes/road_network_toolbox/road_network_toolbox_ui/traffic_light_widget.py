@@ -14,7 +14,11 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from crdesigner.ui.gui.utilities.toolbox_ui import CheckableComboBox, PositionButton
+from crdesigner.ui.gui.utilities.toolbox_ui import (
+    CheckableComboBox,
+    ElementComboBox,
+    PositionButton,
+)
 
 
 class TrafficLightWidget:
@@ -80,7 +84,7 @@ class TrafficLightWidget:
 
         self.toolbox.referenced_lanelets_traffic_light = CheckableComboBox()
 
-        self.toolbox.selected_traffic_light = QComboBox()
+        self.toolbox.selected_traffic_light = ElementComboBox()
 
         self.toolbox.button_add_traffic_light = QPushButton("Add")
         self.toolbox.button_update_traffic_light = QPushButton("Update")
@@ -2,7 +2,6 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QDoubleValidator, QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
-    QComboBox,
     QFormLayout,
     QFrame,
     QGridLayout,
@@ -14,7 +13,11 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from crdesigner.ui.gui.utilities.toolbox_ui import CheckableComboBox, PositionButton
+from crdesigner.ui.gui.utilities.toolbox_ui import (
+    CheckableComboBox,
+    ElementComboBox,
+    PositionButton,
+)
 
 
 class TrafficSignWidget:
@@ -43,7 +46,7 @@ class TrafficSignWidget:
         self.toolbox.y_position_traffic_sign.setAlignment(Qt.AlignmentFlag.AlignRight)
         self.toolbox.traffic_sign_virtual_selection = QCheckBox("virtual")
 
-        self.toolbox.selected_traffic_sign = QComboBox()
+        self.toolbox.selected_traffic_sign = ElementComboBox()
 
         self.toolbox.referenced_lanelets_traffic_sign = CheckableComboBox()
 
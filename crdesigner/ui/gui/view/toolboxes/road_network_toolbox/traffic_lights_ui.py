@@ -1,6 +1,8 @@
 from commonroad.scenario.traffic_light import TrafficLightState
 
 from crdesigner.common.logging import logger
+from crdesigner.ui.gui.model.element_list_model import ElementIdListModel
+from crdesigner.ui.gui.model.scenario_changes import ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
     RoadNetworkToolboxUI,
@@ -13,6 +15,8 @@ class AddTrafficLightsUI:
     ):
         self.road_network_toolbox_ui = road_network_toolbox_ui
         self.scenario_model = scenario_model
+        self.traffic_light_ids = ElementIdListModel(scenario_model, ElementType.TRAFFIC_LIGHT)
+        self.road_network_toolbox_ui.selected_traffic_light.setModel(self.traffic_light_ids)
 
     @logger.log
     def update_traffic_light_information(self):
@@ -76,10 +80,6 @@ class AddTrafficLightsUI:
         )
         self.road_network_toolbox_ui.referenced_lanelets_traffic_light.setCurrentIndex(0)
 
-        self.road_network_toolbox_ui.selected_traffic_light.clear()
-        self.road_network_toolbox_ui.selected_traffic_light.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_traffic_light_ids()]
-        )
         self.road_network_toolbox_ui.selected_traffic_light.setCurrentIndex(0)
 
     def initialize_traffic_light_information(self):
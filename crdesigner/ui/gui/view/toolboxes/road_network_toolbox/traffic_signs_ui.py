@@ -5,6 +5,8 @@ from commonroad.scenario.traffic_sign import (
 from PyQt6.QtWidgets import QComboBox, QTableWidgetItem
 
 from crdesigner.common.logging import logger
+from crdesigner.ui.gui.model.element_list_model import ElementIdListModel
+from crdesigner.ui.gui.model.scenario_changes import ElementType
 from crdesigner.ui.gui.model.scenario_model import ScenarioModel
 from crdesigner.ui.gui.view.toolboxes.road_network_toolbox.road_network_toolbox_ui.road_network_toolbox_ui import (
     RoadNetworkToolboxUI,
@@ -17,6 +19,8 @@ class AddTrafficSignUI:
     ):
         self.road_network_toolbox_ui = road_network_toolbox_ui
         self.scenario_model = scenario_model
+        self.traffic_sign_ids = ElementIdListModel(scenario_model, ElementType.TRAFFIC_SIGN)
+        self.road_network_toolbox_ui.selected_traffic_sign.setModel(self.traffic_sign_ids)
 
     @logger.log
     def update_traffic_sign_information(self, text_browser):
@@ -80,10 +84,6 @@ class AddTrafficSignUI:
         )
         self.road_network_toolbox_ui.referenced_lanelets_traffic_sign.setCurrentIndex(0)
 
-        self.road_network_toolbox_ui.selected_traffic_sign.clear()
-        self.road_network_toolbox_ui.selected_traffic_sign.addItems(
-            ["None"] + [str(item) for item in self.scenario_model.collect_traffic_sign_ids()]
-        )
         self.road_network_toolbox_ui.selected_traffic_sign.setCurrentIndex(0)
 
     def initialize_traffic_sign_information(self):
@@ -121,6 +121,10 @@ class VerificationParams:
     potential_connection_thresh: float = 1e-3
     potential_border_thresh: float = 1e-3
     buffer_size: float = 10.0
+    # Path to the SQLite database caching the results of formulas; no caching if none
+    cache_path: Optional[str] = None
+    # Boolean indicating whether the time and the number of calls of each formula should be profiled
+    profile: bool = False
 
     assert num_threads > 0, "At least one process is required!"
     assert max_iterations >= 0, "Number of iteration must be positive!"
@@ -155,6 +159,10 @@ class EvaluationParams(BaseParam):
     partition_draw_dir: Optional[str] = None
     # Boolean indicates whether the map should be partitioned before evaluation.
     partitioned: bool = False
+    # Path to directory of reports of the invalid states of each map; no reports if none
+    report_dir: Optional[str] = None
+    # Format of the reports, i.e., html or svg
+    report_format: str = "html"
 
     assert invalid_states_draw_dir is None or os.path.exists(
         invalid_states_draw_dir
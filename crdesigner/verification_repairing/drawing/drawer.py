@@ -30,6 +30,11 @@ class Drawer(ABC):
         )
         self._network = network
 
+    @property
+    def complete_map_name(self) -> str:
+        """Name of the map consisting of the country ID, the map name, and the map ID."""
+        return self._complete_map_name
+
     def _get_traffic_sign_position(self, traffic_sign: TrafficSign) -> np.ndarray:
         position = traffic_sign.position
         if position is None and traffic_sign.first_occurrence:
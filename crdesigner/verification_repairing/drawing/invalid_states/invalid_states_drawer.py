@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import matplotlib.lines as mlines
 import matplotlib.patches as mpatches
@@ -14,6 +14,7 @@ from commonroad.visualization.draw_params import (
 )
 from commonroad.visualization.mp_renderer import MPRenderer
 from matplotlib import pyplot as plt
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 
 from crdesigner.verification_repairing.drawing.drawer import Drawer
@@ -295,43 +296,48 @@ class InvalidStatesDrawer(Drawer):
         :param ax: Axes used by renderer.
         """
         self._plot_caption("Invalid States in Map " + str(self._complete_map_name))
+        self._plot_legend(create_legend_artists(), ax)
 
-        invalid_lanelet = mpatches.Patch(color="lightcoral", label="Invalid lanelet")
-        connection_point = mlines.Line2D(
-            [],
-            [],
-            marker="o",
-            color="red",
-            label="Inaccurate connection",
-            linestyle="None",
-            markerfacecolor="r",
-            markersize=7,
-        )
-        border_line = mlines.Line2D([], [], color="red", label="Inaccurate border")
-        reference_arrow = mlines.Line2D(
-            [],
-            [],
-            marker=">",
-            color="red",
-            label="Non-referenced",
-            linestyle="None",
-            markerfacecolor="r",
-            markersize=10,
-        )
-        invalid_sign_light = mlines.Line2D(
-            [],
-            [],
-            marker="o",
-            markerfacecolor="white",
-            label="Invalid traffic sign/light",
-            linestyle="None",
-            color="red",
-            markersize=18,
-            fillstyle="none",
-            markeredgewidth=1.5,
-            markeredgecolor="red",
-        )
-        self._plot_legend(
-            [invalid_lanelet, connection_point, border_line, reference_arrow, invalid_sign_light],
-            ax,
-        )
+
+def create_legend_artists() -> List[Artist]:
+    """
+    Creates the legend entries of the symbols indicating invalid states in a map.
+
+    :return: Legend artists.
+    """
+    invalid_lanelet = mpatches.Patch(color="lightcoral", label="Invalid lanelet")
+    connection_point = mlines.Line2D(
+        [],
+        [],
+        marker="o",
+        color="red",
+        label="Inaccurate connection",
+        linestyle="None",
+        markerfacecolor="r",
+        markersize=7,
+    )
+    border_line = mlines.Line2D([], [], color="red", label="Inaccurate border")
+    reference_arrow = mlines.Line2D(
+        [],
+        [],
+        marker=">",
+        color="red",
+        label="Non-referenced",
+        linestyle="None",
+        markerfacecolor="r",
+        markersize=10,
+    )
+    invalid_sign_light = mlines.Line2D(
+        [],
+        [],
+        marker="o",
+        markerfacecolor="white",
+        label="Invalid traffic sign/light",
+        linestyle="None",
+        color="red",
+        markersize=18,
+        fillstyle="none",
+        markeredgewidth=1.5,
+        markeredgecolor="red",
+    )
+    return [invalid_lanelet, connection_point, border_line, reference_arrow, invalid_sign_light]
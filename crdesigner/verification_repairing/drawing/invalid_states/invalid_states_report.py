@@ -0,0 +1,431 @@
+import html
+import io
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from commonroad.scenario.lanelet import LaneletNetwork
+from commonroad.scenario.scenario import Scenario, ScenarioID
+from commonroad.visualization.draw_params import (
+    LaneletNetworkParams,
+    LaneletParams,
+    TrafficLightParams,
+    TrafficSignParams,
+)
+from commonroad.visualization.mp_renderer import MPRenderer
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+from crdesigner.common.process_pool import imap_forked
+from crdesigner.verification_repairing.drawing.drawer import Drawer
+from crdesigner.verification_repairing.drawing.invalid_states.element_draw_params import (
+    ElementDrawParams,
+    LaneletDrawParams,
+    TrafficLightDrawParams,
+    TrafficSignDrawParams,
+)
+from crdesigner.verification_repairing.drawing.invalid_states.invalid_states_drawer import (
+    create_legend_artists,
+)
+from crdesigner.verification_repairing.verification.satisfaction import InvalidStates
+from crdesigner.verification_repairing.verification.verification_result import (
+    MapVerification,
+    VerificationResult,
+)
+
+# formats of the reports; the background is embedded as PNG image in both formats
+REPORT_FORMATS = ("html", "svg")
+
+# margin around the lanelets in the background of a report in meter
+MARGIN = 10.0
+
+
+class InvalidStatesReport(Drawer):
+    """
+    The class is responsible for creating headless reports of the invalid states in a CommonRoad map. In contrast to
+    the InvalidStatesDrawer, the lanelet network is rendered only once into a cached Agg buffer, which serves as
+    background of all reports of the map. The invalid states of a report are drawn on top of it in one pass with a
+    collection per symbol and a text per element ID. No pyplot state is used, so that reports can be created in
+    worker processes.
+    """
+
+    def __init__(
+        self,
+        network: LaneletNetwork,
+        scenario_id: ScenarioID = ScenarioID(),
+        pixels_per_meter: float = 4.0,
+        max_pixels: int = 4000,
+        dpi: int = 100,
+    ):
+        """
+        Constructor.
+
+        :param network: Lanelet network.
+        :param scenario_id: Scenario ID.
+        :param pixels_per_meter: Resolution of the background.
+        :param max_pixels: Maximum width and height of the background in pixels.
+        :param dpi: Dots per inch of the figures.
+        """
+        super().__init__(network, scenario_id)
+        self._pixels_per_meter = pixels_per_meter
+        self._max_pixels = max_pixels
+        self._dpi = dpi
+        self._background: Optional[np.ndarray] = None
+        self._extent: Optional[Tuple[float, float, float, float]] = None
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """Minimum x, maximum x, minimum y, and maximum y of the background."""
+        if self._extent is None:
+            vertices = [
+                np.concatenate((lanelet.left_vertices[:, :2], lanelet.right_vertices[:, :2]))
+                for lanelet in self._network.lanelets
+            ]
+            if vertices:
+                vertices = np.concatenate(vertices)
+                x_min, y_min = vertices.min(axis=0) - MARGIN
+                x_max, y_max = vertices.max(axis=0) + MARGIN
+            else:
+                x_min, y_min, x_max, y_max = -MARGIN, -MARGIN, MARGIN, MARGIN
+            self._extent = (float(x_min), float(x_max), float(y_min), float(y_max))
+        return self._extent
+
+    @property
+    def background(self) -> np.ndarray:
+        """RGBA image of the lanelet network, which is rendered on first access."""
+        if self._background is None:
+            self._background = self._render_background()
+        return self._background
+
+    def _figure_size(self) -> Tuple[float, float]:
+        """
+        Computes the size of a figure with the resolution of the background.
+
+        :return: Width and height in inches.
+        """
+        x_min, x_max, y_min, y_max = self.extent
+        scale = min(self._pixels_per_meter, self._max_pixels / max(x_max - x_min, y_max - y_min))
+        return (x_max - x_min) * scale / self._dpi, (y_max - y_min) * scale / self._dpi
+
+    def _render_background(self) -> np.ndarray:
+        """
+        Renders the lanelet network, the traffic signs, and the traffic lights into an Agg buffer.
+
+        :return: RGBA image.
+        """
+        figure = Figure(figsize=self._figure_size(), dpi=self._dpi)
+        canvas = FigureCanvasAgg(figure)
+        ax = figure.add_axes((0.0, 0.0, 1.0, 1.0))
+        rnd = MPRenderer(ax=ax, plot_limits=list(self.extent))
+
+        lanelet_network_params = LaneletNetworkParams(
+            lanelet=LaneletParams(draw_linewidth=1.5),
+            traffic_light=TrafficLightParams(draw_traffic_lights=False),
+        )
+        self._network.draw(rnd, lanelet_network_params)
+        for traffic_sign in self._network.traffic_signs:
+            traffic_sign.draw(rnd, TrafficSignParams(show_label=False))
+        for traffic_light in self._network.traffic_lights:
+            traffic_light.draw(rnd, TrafficLightParams(show_label=False))
+        rnd.render()
+
+        ax.set_aspect("auto")
+        ax.set_xlim(self.extent[:2])
+        ax.set_ylim(self.extent[2:])
+        ax.set_axis_off()
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+    def save_report(
+        self,
+        invalid_states: InvalidStates,
+        file_dir: str,
+        file_name: str,
+        file_format: str = "html",
+    ) -> Path:
+        """
+        Saves a self-contained report of the invalid states in the map.
+
+        :param invalid_states: Invalid states.
+        :param file_dir: Directory of the report.
+        :param file_name: Name of the report file without extension.
+        :param file_format: Format of the report, i.e., html or svg.
+        :return: Path of the report.
+        """
+        if file_format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Report format {file_format} is not supported! Supported formats: {REPORT_FORMATS}"
+            )
+
+        figure = self._draw_report(invalid_states)
+        path = Path(file_dir) / f"{file_name}.{file_format}"
+        if file_format == "svg":
+            figure.savefig(path, format="svg")
+            return path
+
+        svg = io.StringIO()
+        figure.savefig(svg, format="svg")
+        rows = "".join(
+            f"<tr><td>{html.escape(formula_id.name)}</td><td>{len(locations)}</td>"
+            f"<td>{html.escape(', '.join(str(location) for location in locations))}</td></tr>"
+            for formula_id, locations in sorted(
+                invalid_states.items(), key=lambda item: item[0].name
+            )
+        )
+        title = html.escape("Invalid States in Map " + self.complete_map_name)
+        path.write_text(
+            "<!DOCTYPE html>\n"
+            f'<html><head><meta charset="utf-8"><title>{title}</title>'
+            "<style>body{font-family:sans-serif}svg{max-width:100%;height:auto}"
+            "table{border-collapse:collapse}td,th{border:1px solid #999;padding:4px;text-align:left}"
+            "</style></head>"
+            f"<body><h1>{title}</h1>{svg.getvalue()[svg.getvalue().find('<svg'):]}"
+            "<table><tr><th>Formula</th><th>Number</th><th>Locations</th></tr>"
+            f"{rows}</table></body></html>\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def _draw_report(self, invalid_states: InvalidStates) -> Figure:
+        """
+        Draws the invalid states on top of the cached background.
+
+        :param invalid_states: Invalid states.
+        :return: Figure of the report.
+        """
+        figure = Figure(figsize=self._figure_size(), dpi=self._dpi)
+        FigureCanvasAgg(figure)
+        ax = figure.add_axes((0.0, 0.0, 1.0, 1.0))
+        ax.imshow(self.background, extent=self.extent, interpolation="nearest")
+        ax.set_axis_off()
+
+        lanelet_params = LaneletDrawParams(self._network)
+        traffic_sign_params = TrafficSignDrawParams(self._network)
+        traffic_light_params = TrafficLightDrawParams(self._network)
+        for parameterizing in (lanelet_params, traffic_sign_params, traffic_light_params):
+            self._insert_params(parameterizing, invalid_states)
+
+        self._draw_lanelets(lanelet_params, ax)
+        self._draw_traffic_signs_lights(traffic_sign_params, traffic_light_params, ax)
+
+        ax.set_xlim(self.extent[:2])
+        ax.set_ylim(self.extent[2:])
+        ax.text(
+            0.5,
+            0.99,
+            "Invalid States in Map " + self.complete_map_name,
+            transform=ax.transAxes,
+            horizontalalignment="center",
+            verticalalignment="top",
+            fontsize=14,
+            zorder=90,
+        )
+        ax.legend(handles=create_legend_artists(), loc="lower left").set_zorder(90)
+        return figure
+
+    @staticmethod
+    def _insert_params(parameterizing: ElementDrawParams, invalid_states: InvalidStates):
+        """
+        Inserts the drawing parameters of the invalid states supported by the element.
+
+        :param parameterizing: Drawing parameters of an element type.
+        :param invalid_states: Invalid states.
+        """
+        for formula_id, locations in invalid_states.items():
+            func = getattr(parameterizing, "param_" + str(formula_id.value), None)
+            if func is None:
+                continue
+            for location in locations:
+                func(location)
+
+    def _draw_lanelets(self, parameterizing: LaneletDrawParams, ax: Axes):
+        """
+        Draws the invalid lanelets, their marked boundaries and vertices, and the vectors to potential neighbours.
+
+        :param parameterizing: Drawing parameters of the lanelets.
+        :param ax: Axes of the report.
+        """
+        default_bound_color = LaneletParams().left_bound_color
+        polygons, face_colors, bounds, bound_colors = [], [], [], []
+        for lanelet_id, params in parameterizing.draw_params.items():
+            lanelet = self._network.find_lanelet_by_id(lanelet_id)
+            if lanelet is None:
+                continue
+            left, right = lanelet.left_vertices[:, :2], lanelet.right_vertices[:, :2]
+            polygons.append(np.concatenate((left, right[::-1])))
+            face_colors.append(params.facecolor)
+            for vertices, color in (
+                (left, params.left_bound_color),
+                (right, params.right_bound_color),
+            ):
+                if color != default_bound_color:
+                    bounds.append(vertices)
+                    bound_colors.append(color)
+            center = polygons[-1].mean(axis=0)
+            ax.text(center[0], center[1], str(lanelet_id), fontsize=6, zorder=60, clip_on=True)
+        ax.add_collection(
+            PolyCollection(
+                polygons, facecolors=face_colors, edgecolors="#555555", alpha=0.8, zorder=20
+            )
+        )
+        ax.add_collection(LineCollection(bounds, colors=bound_colors, linewidths=1.5, zorder=30))
+
+        points, vectors = [], []
+        for lanelet_id, params in parameterizing.custom_draw_params.items():
+            lanelet = self._network.find_lanelet_by_id(lanelet_id)
+            if lanelet is None:
+                continue
+            for param, vertices, index in (
+                ("mark_left_start_vertex", lanelet.left_vertices, 0),
+                ("mark_left_end_vertex", lanelet.left_vertices, -1),
+                ("mark_right_start_vertex", lanelet.right_vertices, 0),
+                ("mark_right_end_vertex", lanelet.right_vertices, -1),
+            ):
+                if params.get(param):
+                    points.append(vertices[index, :2])
+            if "show_vector" in params:
+                vectors.append(np.concatenate(params["show_vector"]))
+        if points:
+            points = np.array(points)
+            ax.scatter(points[:, 0], points[:, 1], s=20, c="red", marker="o", zorder=50)
+        if vectors:
+            vectors = np.array(vectors)
+            ax.quiver(
+                vectors[:, 0],
+                vectors[:, 1],
+                vectors[:, 2] - vectors[:, 0],
+                vectors[:, 3] - vectors[:, 1],
+                angles="xy",
+                scale_units="xy",
+                scale=1,
+                color="red",
+                width=0.002,
+                zorder=50,
+            )
+
+    def _draw_traffic_signs_lights(
+        self,
+        traffic_sign_params: TrafficSignDrawParams,
+        traffic_light_params: TrafficLightDrawParams,
+        ax: Axes,
+    ):
+        """
+        Marks the invalid traffic signs and traffic lights with a circle and their ID.
+
+        :param traffic_sign_params: Drawing parameters of the traffic signs.
+        :param traffic_light_params: Drawing parameters of the traffic lights.
+        :param ax: Axes of the report.
+        """
+        marked = []
+        for element_id in traffic_sign_params.custom_draw_params:
+            traffic_sign = self._network.find_traffic_sign_by_id(element_id)
+            if traffic_sign is not None:
+                marked.append((element_id, self._get_traffic_sign_position(traffic_sign)))
+        for element_id in traffic_light_params.custom_draw_params:
+            traffic_light = self._network.find_traffic_light_by_id(element_id)
+            if traffic_light is not None:
+                marked.append((element_id, self._get_traffic_light_position(traffic_light)))
+
+        circles = []
+        for element_id, position in marked:
+            if position is None:
+                continue
+            circles.append(Circle((position[0], position[1]), 3.5))
+            ax.text(
+                position[0] + 1.5,
+                position[1] + 1.5,
+                str(element_id),
+                bbox=dict(facecolor="lightgrey", edgecolor="black"),
+                zorder=80,
+                clip_on=True,
+            )
+        ax.add_collection(
+            PatchCollection(circles, edgecolors="red", facecolors="none", linewidths=3.5, zorder=50)
+        )
+
+
+def invalid_states_of_map_verification(map_verification: MapVerification) -> InvalidStates:
+    """
+    Extracts the invalid states of a map verification.
+
+    :param map_verification: Map verification.
+    :return: Invalid states.
+    """
+    return {
+        invalid_state.formula: list(invalid_state.locations)
+        for invalid_state in map_verification.map_verification_result.invalid_states
+    }
+
+
+def _save_report(
+    report_args: Tuple[str, str], report_map: Tuple[LaneletNetwork, ScenarioID, InvalidStates]
+) -> Path:
+    """
+    Saves the report of a map.
+
+    :param report_args: Directory and format of the report.
+    :param report_map: Lanelet network, scenario ID, and invalid states of the map.
+    :return: Path of the report.
+    """
+    report_dir, file_format = report_args
+    network, scenario_id, invalid_states = report_map
+    report = InvalidStatesReport(network, scenario_id)
+    return report.save_report(invalid_states, report_dir, report.complete_map_name, file_format)
+
+
+def save_invalid_states_reports(
+    maps: Sequence[Tuple[LaneletNetwork, ScenarioID, InvalidStates]],
+    report_dir: str,
+    file_format: str = "html",
+    num_processes: int = 1,
+) -> List[Path]:
+    """
+    Saves a report of the invalid states of each map. The maps are distributed over a pool of forked processes, see
+    imap_forked.
+
+    :param maps: Lanelet network, scenario ID, and invalid states of each map.
+    :param report_dir: Directory of the reports.
+    :param file_format: Format of the reports, i.e., html or svg.
+    :param num_processes: Number of processes.
+    :return: Paths of the reports.
+    """
+    return list(imap_forked(_save_report, (report_dir, file_format), maps, num_processes))
+
+
+def save_verification_result_reports(
+    scenarios: Sequence[Scenario],
+    verification_result: VerificationResult,
+    report_dir: str,
+    file_format: str = "html",
+    num_processes: int = 1,
+) -> List[Path]:
+    """
+    Saves a report of the invalid states of each map verification. The scenario of a map verification is identified
+    by its benchmark ID, which also names the report, so that the benchmark IDs of the scenarios must be unique.
+
+    :param scenarios: Verified scenarios.
+    :param verification_result: Verification result.
+    :param report_dir: Directory of the reports.
+    :param file_format: Format of the reports, i.e., html or svg.
+    :param num_processes: Number of processes.
+    :return: Paths of the reports.
+    """
+    scenarios_by_name: Dict[str, Scenario] = {}
+    for sc in scenarios:
+        name = f"{sc.scenario_id.country_id}_{sc.scenario_id.map_name}-{sc.scenario_id.map_id}"
+        if name in scenarios_by_name:
+            raise ValueError(f"Several scenarios have the benchmark ID {name}!")
+        scenarios_by_name[name] = sc
+    maps = [
+        (
+            scenarios_by_name[map_verification.benchmark_id].lanelet_network,
+            scenarios_by_name[map_verification.benchmark_id].scenario_id,
+            invalid_states_of_map_verification(map_verification),
+        )
+        for map_verification in verification_result.map_verifications
+        if map_verification.benchmark_id in scenarios_by_name
+    ]
+    return save_invalid_states_reports(maps, report_dir, file_format, num_processes)
@@ -12,9 +12,6 @@ from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.scenario import Scenario, ScenarioID
 
 from crdesigner.verification_repairing.config import MapVerParams
-from crdesigner.verification_repairing.drawing.invalid_states.invalid_states_drawer import (
-    InvalidStatesDrawer,
-)
 from crdesigner.verification_repairing.repairing.map_repairer import MapRepairer
 from crdesigner.verification_repairing.verification.formula_ids import (
     FormulaID,
@@ -23,7 +20,8 @@ from crdesigner.verification_repairing.verification.formula_ids import (
 )
 from crdesigner.verification_repairing.verification.groups_handler import GroupsHandler
 from crdesigner.verification_repairing.verification.map_verifier import MapVerifier
-from crdesigner.verification_repairing.verification.sub_map import SubMap
+from crdesigner.verification_repairing.verification.profiling import merge_profiles
+from crdesigner.verification_repairing.verification.sub_map import SubMap, SubMapIndex
 from crdesigner.verification_repairing.verification.verification_result import (
     VerificationResult,
     initial_map_verification,
@@ -122,11 +120,14 @@ def verify_and_repair_map(
     if config.verification.formulas is None or config.verification.formulas == []:
         config.verification.formulas = extract_formula_ids()
 
-    drawer = (
-        InvalidStatesDrawer(network, scenario_id)
-        if config.evaluation.invalid_states_draw_dir
-        else None
-    )
+    drawer = None
+    if config.evaluation.invalid_states_draw_dir:
+        # matplotlib is only loaded if invalid states are drawn
+        from crdesigner.verification_repairing.drawing.invalid_states.invalid_states_drawer import (
+            InvalidStatesDrawer,
+        )
+
+        drawer = InvalidStatesDrawer(network, scenario_id)
 
     complete_map_name = (
         str(scenario_id.country_id)
@@ -139,6 +140,8 @@ def verify_and_repair_map(
     map_verification = initial_map_verification(verification_result, str(complete_map_name), config)
 
     verification_time, repairing_time = 0.0, 0.0
+    cache_hits, cache_lookups = 0, 0
+    formula_profiles = {}
     logging.info(f"Validating map {complete_map_name}.")
 
     groups_handler = GroupsHandler()
@@ -147,6 +150,7 @@ def verify_and_repair_map(
     final_errors = set()
 
     map_repairer = MapRepairer(network)
+    sub_map_index = None
 
     org_config = copy.deepcopy(config)
 
@@ -165,6 +169,9 @@ def verify_and_repair_map(
         invalid_states = map_verifier.verify()
         end = time.time()
         verification_time += end - start
+        cache_hits += map_verifier.cache_hits
+        cache_lookups += map_verifier.cache_lookups
+        formula_profiles = merge_profiles([formula_profiles, map_verifier.profiles])
 
         for formula_id, locations in invalid_states.items():
             pre_locations = (
@@ -202,7 +209,12 @@ def verify_and_repair_map(
                     end = time.time()
                     repairing_time += end - start
 
-                    sub_map = SubMap(network)
+                    # the index is shared by all sub maps and only updated for the repaired elements
+                    if sub_map_index is None:
+                        sub_map_index = SubMapIndex(network)
+                    else:
+                        sub_map_index.refresh()
+                    sub_map = SubMap(network, index=sub_map_index)
                     sub_map.extract_from_element(element_id)
                     sub_network = sub_map.create_subnetwork()
                     start = time.time()
@@ -212,6 +224,9 @@ def verify_and_repair_map(
                     invalid_states_tmp = map_verifier.verify()
                     end = time.time()
                     verification_time += end - start
+                    cache_hits += map_verifier.cache_hits
+                    cache_lookups += map_verifier.cache_lookups
+                    formula_profiles = merge_profiles([formula_profiles, map_verifier.profiles])
 
                     if drawer is not None:
                         drawer.save_invalid_states_drawing(
@@ -246,7 +261,13 @@ def verify_and_repair_map(
             invalid_states[formula_id] = [location]
 
     update_map_verification(
-        map_verification, verification_time, repairing_time, initial_invalid_states
+        map_verification,
+        verification_time,
+        repairing_time,
+        initial_invalid_states,
+        cache_hits,
+        cache_lookups,
+        formula_profiles,
     )
 
     if drawer is not None:
@@ -284,6 +305,11 @@ def verify_and_repair_maps(
 
     verification_result = VerificationResult()
 
+    # the reports show the invalid states of the original maps, which are repaired in place if they are overwritten
+    report_scenarios = scenarios
+    if config.evaluation.report_dir is not None and config.evaluation.overwrite_scenario:
+        report_scenarios = deepcopy(scenarios)
+
     repaired_networks = []
     for scenario in scenarios:
         repaired_network, scenario_verification_result = verify_and_repair_map(
@@ -292,6 +318,20 @@ def verify_and_repair_maps(
         repaired_networks.append(repaired_network)
         verification_result.map_verifications += scenario_verification_result.map_verifications
 
+    if config.evaluation.report_dir is not None:
+        # matplotlib is only loaded if reports are created
+        from crdesigner.verification_repairing.drawing.invalid_states.invalid_states_report import (
+            save_verification_result_reports,
+        )
+
+        save_verification_result_reports(
+            report_scenarios,
+            verification_result,
+            config.evaluation.report_dir,
+            config.evaluation.report_format,
+            config.verification.num_threads,
+        )
+
     return repaired_networks, verification_result
 
 
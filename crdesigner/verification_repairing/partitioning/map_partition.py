@@ -3,11 +3,11 @@ import itertools
 import logging
 import math
 from abc import ABC
-from functools import reduce
-from typing import List, Tuple
+from typing import Dict, List, Set, Tuple
 
 import numpy as np
 from commonroad.scenario.lanelet import LaneletNetwork
+from shapely import Point, STRtree
 
 try:
     import pymetis
@@ -31,7 +31,8 @@ class MapPartitioning(ABC):
     def __init__(self, network: LaneletNetwork):
         self._network = network
 
-        self._lanelet_ids = [lanelet.lanelet_id for lanelet in self._network.lanelets]
+        self._lanelets = self._network.lanelets
+        self._lanelet_ids = [lanelet.lanelet_id for lanelet in self._lanelets]
         self._traffic_sign_ids = [
             traffic_sign.traffic_sign_id for traffic_sign in self._network.traffic_signs
         ]
@@ -56,6 +57,19 @@ class MapPartitioning(ABC):
             )
         ]
 
+    def _referring_lanelets(self, attribute: str) -> Dict[int, List[int]]:
+        """
+        Maps the IDs of traffic signs or traffic lights to the IDs of the lanelets referencing them.
+
+        :param attribute: Name of the lanelet attribute storing the references, i.e., traffic_signs or traffic_lights.
+        :return: Referring lanelets.
+        """
+        referring_lanelets = {}
+        for lanelet in self._lanelets:
+            for element_id in getattr(lanelet, attribute):
+                referring_lanelets.setdefault(element_id, []).append(lanelet.lanelet_id)
+        return referring_lanelets
+
     @staticmethod
     def _chunks(ids: List[int], size: int):
         """
@@ -91,6 +105,7 @@ class LaneletPartitioning(MapPartitioning):
         super(LaneletPartitioning, self).__init__(network)
 
         self._node_ids = None
+        self._tree = None
         self._graph = self._create_map_graph()
 
     def normal_partition(self, ref_size: int, buffered: bool) -> Partition:
@@ -103,21 +118,14 @@ class LaneletPartitioning(MapPartitioning):
         """
         v_weights = [1 for _ in range(len(self._graph))]
 
-        number_of_edges = len(reduce(lambda a, b: a + b, self._graph))
+        number_of_edges = sum(len(edges) for edges in self._graph)
         e_weights = [1 for _ in range(number_of_edges)]
 
         lanelet_partition = self._partition(
             max_size=ref_size, v_weights=v_weights, e_weights=e_weights, buffered=buffered
         )
 
-        lanelet_partition = self._map_lanelet_partition(lanelet_partition)
-
-        partition = [
-            (block, self._traffic_sign_ids, self._traffic_light_ids, [])
-            for block in lanelet_partition
-        ]
-
-        return partition
+        return self._assign_signs_and_lights(lanelet_partition)
 
     def strips_partition(self, ref_size: int, buffered: bool) -> Partition:
         """
@@ -143,22 +151,17 @@ class LaneletPartitioning(MapPartitioning):
         )
 
         for block in lanelet_partition:
+            members = set(block)
             for node_id in block:
                 for adj_node_id, edge_type in self._graph[node_id]:
                     if edge_type == EdgeType.LEFT_ADJ or edge_type == EdgeType.RIGHT_ADJ:
-                        if adj_node_id not in block:
+                        if adj_node_id not in members:
+                            members.add(adj_node_id)
                             block.append(adj_node_id)
 
-        lanelet_partition = self._map_lanelet_partition(lanelet_partition)
-
-        partition = [
-            (block, self._traffic_sign_ids, self._traffic_light_ids, [])
-            for block in lanelet_partition
-        ]
-
         logging.info([len(block) for block in lanelet_partition])
 
-        return partition
+        return self._assign_signs_and_lights(lanelet_partition)
 
     def _partition(
         self,
@@ -174,9 +177,7 @@ class LaneletPartitioning(MapPartitioning):
         :param buffered: Boolean indicates whether the lanelets from the buffered area should be inserted.
         :return: Partition.
         """
-        lanelets = self._network.lanelets
-
-        n_parts = math.ceil(float(len(lanelets)) / float(max_size))
+        n_parts = math.ceil(float(len(self._lanelets)) / float(max_size))
 
         graph = [[node_id for node_id, _ in node] for node in self._graph]
 
@@ -208,11 +209,9 @@ class LaneletPartitioning(MapPartitioning):
 
         :return: Constructed graph.
         """
-        lanelets = self._network.lanelets
-
-        graph = [[] for _ in range(len(lanelets))]
+        graph = [[] for _ in range(len(self._lanelets))]
 
-        for lan_node_id, lanelet in enumerate(self._network.lanelets):
+        for lan_node_id, lanelet in enumerate(self._lanelets):
             if lanelet.successor is not None:
                 for successor_id in lanelet.successor:
                     if self._network.find_lanelet_by_id(successor_id) is None:
@@ -256,7 +255,7 @@ class LaneletPartitioning(MapPartitioning):
         """
         if self._node_ids is None:
             self._node_ids = {}
-            for node_id, lanelet in enumerate(self._network.lanelets):
+            for node_id, lanelet in enumerate(self._lanelets):
                 self._node_ids.update({lanelet.lanelet_id: node_id})
 
         return self._node_ids[lanelet_id]
@@ -268,12 +267,76 @@ class LaneletPartitioning(MapPartitioning):
         :param node_id: Node ID.
         :return: Mapped ID of node; -1 if node cannot be found.
         """
-        lanelets = self._network.lanelets
-        if 0 <= node_id < len(lanelets):
-            return lanelets[node_id].lanelet_id
+        if 0 <= node_id < len(self._lanelets):
+            return self._lanelets[node_id].lanelet_id
 
         return -1
 
+    def _lanelet_tree(self) -> STRtree:
+        """
+        Creates the spatial index over the lanelet polygons. The index of a polygon equals the node ID.
+
+        :return: Spatial index.
+        """
+        if self._tree is None:
+            self._tree = STRtree([lanelet.polygon.shapely_object for lanelet in self._lanelets])
+        return self._tree
+
+    def _assign_signs_and_lights(self, partition: List[List[int]]) -> Partition:
+        """
+        Creates the partition blocks from the node IDs of lanelet blocks. A block contains the traffic signs and
+        traffic lights referenced by its lanelets or their stop lines. Traffic signs and traffic lights which are not
+        referenced by any lanelet are assigned to the block containing the nearest lanelet.
+
+        :param partition: Blocks of node IDs.
+        :return: Partition.
+        """
+        sign_blocks: List[Set[int]] = [set() for _ in partition]
+        light_blocks: List[Set[int]] = [set() for _ in partition]
+        referenced_signs, referenced_lights = set(), set()
+        existing_signs, existing_lights = set(self._traffic_sign_ids), set(self._traffic_light_ids)
+        for block_id, block in enumerate(partition):
+            for node_id in block:
+                lanelet = self._lanelets[node_id]
+                sign_blocks[block_id].update(lanelet.traffic_signs)
+                light_blocks[block_id].update(lanelet.traffic_lights)
+                if lanelet.stop_line is not None:
+                    sign_blocks[block_id].update(lanelet.stop_line.traffic_sign_ref or set())
+                    light_blocks[block_id].update(lanelet.stop_line.traffic_light_ref or set())
+            # only existing elements can be added to the reduced networks of the blocks
+            sign_blocks[block_id] &= existing_signs
+            light_blocks[block_id] &= existing_lights
+            referenced_signs |= sign_blocks[block_id]
+            referenced_lights |= light_blocks[block_id]
+
+        unreferenced = [
+            (traffic_sign.traffic_sign_id, traffic_sign.position, sign_blocks)
+            for traffic_sign in self._network.traffic_signs
+            if traffic_sign.traffic_sign_id not in referenced_signs
+        ] + [
+            (traffic_light.traffic_light_id, traffic_light.position, light_blocks)
+            for traffic_light in self._network.traffic_lights
+            if traffic_light.traffic_light_id not in referenced_lights
+        ]
+        if unreferenced and partition:
+            node_blocks = {}
+            for block_id, block in enumerate(partition):
+                for node_id in block:
+                    node_blocks.setdefault(node_id, block_id)
+            tree = self._lanelet_tree()
+            for element_id, position, blocks in unreferenced:
+                block_id = 0
+                if position is not None and len(self._lanelets) > 0:
+                    block_id = node_blocks.get(int(tree.nearest(Point(position))), 0)
+                blocks[block_id].add(element_id)
+
+        return [
+            (lanelet_block, sorted(sign_block), sorted(light_block), [])
+            for lanelet_block, sign_block, light_block in zip(
+                self._map_lanelet_partition(partition), sign_blocks, light_blocks
+            )
+        ]
+
     def _map_lanelet_partition(self, partition: List[List[int]]) -> List[List[int]]:
         mapped_partition = []
         for block in partition:
@@ -294,25 +357,15 @@ class LaneletPartitioning(MapPartitioning):
         :param partition: Partition.
         :return: Extended partition.
         """
+        tree = self._lanelet_tree()
         for block in partition:
-            lanelets_p = [
-                self._network.find_lanelet_by_id(self._get_lanelet_id(node_id)) for node_id in block
-            ]
             buffered_areas = [
-                lanelet.polygon.shapely_object.buffer(buffer) for lanelet in lanelets_p
+                self._lanelets[node_id].polygon.shapely_object.buffer(buffer) for node_id in block
             ]
+            _, node_ids = tree.query(buffered_areas, predicate="intersects")
 
-            for lanelet in self._network.lanelets:
-                node_id = self._get_node_id(lanelet.lanelet_id)
-                if node_id in block:
-                    continue
-
-                lanelet_area = lanelet.polygon.shapely_object
-
-                for buffered_area in buffered_areas:
-                    if lanelet_area.intersects(buffered_area):
-                        block.append(node_id)
-                        break
+            members = set(block)
+            block.extend(sorted(set(node_ids.tolist()) - members))
 
         return partition
 
@@ -339,13 +392,13 @@ class TrafficSignPartitioning(MapPartitioning):
         traffic_light_ids = []
         intersection_ids = []
 
+        referring_lanelets = self._referring_lanelets("traffic_signs")
+
         partition = []
         for block in traffic_sign_partition:
             lanelet_ids = []
             for traffic_sign_id in block:
-                for lanelet in self._network.lanelets:
-                    if traffic_sign_id in lanelet.traffic_signs:
-                        lanelet_ids.append(lanelet.lanelet_id)
+                lanelet_ids.extend(referring_lanelets.get(traffic_sign_id, []))
             partition.append((lanelet_ids, block, traffic_light_ids, intersection_ids))
 
         return partition
@@ -372,13 +425,13 @@ class TrafficLightPartitioning(MapPartitioning):
         traffic_sign_ids = []
         intersection_ids = []
 
+        referring_lanelets = self._referring_lanelets("traffic_lights")
+
         partition = []
         for block in traffic_light_partition:
             lanelet_ids = []
             for traffic_light_id in block:
-                for lanelet in self._network.lanelets:
-                    if traffic_light_id in lanelet.traffic_lights:
-                        lanelet_ids.append(lanelet.lanelet_id)
+                lanelet_ids.extend(referring_lanelets.get(traffic_light_id, []))
             partition.append((lanelet_ids, traffic_sign_ids, block, intersection_ids))
 
         return partition
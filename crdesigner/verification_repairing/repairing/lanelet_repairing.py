@@ -15,7 +15,7 @@ from crdesigner.verification_repairing.repairing.repairing import ElementRepairi
 from crdesigner.verification_repairing.repairing.tools.geometry_tools import (
     average_vertices,
     check_intersected_lines,
-    check_line_intersection_efficient,
+    check_line_intersections,
     fill_number_of_vertices,
     insert_vertices,
 )
@@ -329,20 +329,25 @@ class LaneletRepairing(ElementRepairing):
 
         vertices_size = len(left_vertices)
         for vert_right_i in range(0, vertices_size - 1):
-            for vert_left_i in range(0, vertices_size - 1):
-                right_start_point = right_vertices[vert_right_i]
+            vert_left_i = 0
+            while vert_left_i < vertices_size - 1:
+                # all remaining left lines are checked at once; after a swap the vertices changed, so the check is
+                # repeated for the lines after the swapped one
+                intersections = check_line_intersections(
+                    right_vertices[vert_right_i : vert_right_i + 2],
+                    left_vertices[vert_left_i : vertices_size - 1],
+                    left_vertices[vert_left_i + 1 : vertices_size],
+                )
+                if not intersections.any():
+                    break
+                vert_left_i += int(np.argmax(intersections))
+
                 right_end_point = right_vertices[vert_right_i + 1]
-                left_start_point = left_vertices[vert_left_i]
                 left_end_point = left_vertices[vert_left_i + 1]
-
-                if not check_line_intersection_efficient(
-                    [right_start_point, right_end_point], [left_start_point, left_end_point]
-                ):
-                    continue
-
                 right_end_point_copy = right_end_point.copy()
                 right_vertices[vert_right_i + 1] = left_end_point
                 left_vertices[vert_left_i + 1] = right_end_point_copy
+                vert_left_i += 1
 
     def repair_left_self_intersection(self, location: Tuple[int]):
         """
@@ -1,6 +1,6 @@
 import collections
 import math
-from typing import List
+from typing import List, Sequence
 
 import numpy as np
 import shapely
@@ -11,6 +11,101 @@ Line = collections.namedtuple("Line", "x1 y1 x2 y2")
 LPoint = collections.namedtuple("Point", "x y")
 
 
+def polylines_to_linestrings(polylines: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Creates the 2D line strings of several polylines with a single call. The predicates of shapely only consider
+    the x- and y-coordinates, so the z-coordinates are dropped.
+
+    :param polylines: Polylines with at least two vertices each.
+    :return: Array of line strings.
+    """
+    sizes = np.fromiter((len(polyline) for polyline in polylines), dtype=int, count=len(polylines))
+    coords = np.concatenate([np.asarray(polyline, dtype=float)[:, :2] for polyline in polylines])
+    return shapely.linestrings(coords, indices=np.repeat(np.arange(len(polylines)), sizes))
+
+
+def are_polylines_intersecting(
+    polylines_0: Sequence[np.ndarray], polylines_1: Sequence[np.ndarray]
+) -> np.ndarray:
+    """
+    Checks pairwise whether polylines intersect each other.
+
+    :param polylines_0: First polylines.
+    :param polylines_1: Second polylines.
+    :return: Boolean array indicating for each pair whether the polylines intersect each other.
+    """
+    if len(polylines_0) == 0:
+        return np.zeros(0, dtype=bool)
+    return shapely.intersects(
+        polylines_to_linestrings(polylines_0), polylines_to_linestrings(polylines_1)
+    )
+
+
+def are_polylines_self_intersecting(polylines: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Checks for each polyline whether it intersects itself. Since shapely does not detect all cases of
+    self-intersections, a polyline also intersects itself if it contains the same vertex twice or if the
+    largest orientation change between two segments is 180 degrees.
+
+    :param polylines: Polylines with at least two vertices each.
+    :return: Boolean array indicating for each polyline whether it intersects itself.
+    """
+    if len(polylines) == 0:
+        return np.zeros(0, dtype=bool)
+    arrays = [np.asarray(polyline, dtype=float) for polyline in polylines]
+    sizes = np.fromiter((len(polyline) for polyline in arrays), dtype=int, count=len(arrays))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    owner = np.repeat(np.arange(len(arrays)), sizes)
+
+    not_simple = ~shapely.is_simple(polylines_to_linestrings(arrays))
+
+    # the same vertex twice, the dimension is part of the vertex so that 2D and 3D vertices never coincide
+    vertices = np.zeros((len(owner), 5))
+    vertices[:, 0] = owner
+    for polyline, start in zip(arrays, starts):
+        vertices[start : start + len(polyline), 1] = polyline.shape[1]
+        vertices[start : start + len(polyline), 2 : 2 + polyline.shape[1]] = polyline
+    unique_vertices, counts = np.unique(vertices, axis=0, return_counts=True)
+    duplicates = np.zeros(len(arrays), dtype=bool)
+    duplicates[unique_vertices[counts > 1, 0].astype(int)] = True
+
+    # orientation change of 180 degrees between consecutive segments of the same polyline
+    coords = np.concatenate([polyline[:, :2] for polyline in arrays])
+    deltas = np.diff(coords, axis=0)
+    orientations = np.arctan2(deltas[:, 1], deltas[:, 0])
+    changes = np.abs(np.diff(orientations))
+    # change between segment i and i + 1 belongs to a polyline if both segments belong to it
+    same_polyline = (owner[:-2] == owner[1:-1]) & (owner[1:-1] == owner[2:])
+    max_changes = np.zeros(len(arrays))
+    np.maximum.at(max_changes, owner[:-2][same_polyline], changes[same_polyline])
+    reversals = np.isclose(max_changes, np.pi)
+
+    return not_simple | duplicates | reversals
+
+
+def check_line_intersections(
+    line: np.ndarray, start_points: np.ndarray, end_points: np.ndarray
+) -> np.ndarray:
+    """
+    Checks the intersection of a line with several lines defined by start and end points. The check is the
+    same as the one of check_line_intersection_efficient.
+
+    :param line: Line consisting of two points.
+    :param start_points: Start points of the other lines.
+    :param end_points: End points of the other lines.
+    :return: Boolean array indicating for each other line whether it intersects the line.
+    """
+
+    def ccw(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+        return (p3[..., 1] - p1[..., 1]) * (p2[..., 0] - p1[..., 0]) > (p2[..., 1] - p1[..., 1]) * (
+            p3[..., 0] - p1[..., 0]
+        )
+
+    return (ccw(line[0], start_points, end_points) != ccw(line[1], start_points, end_points)) & (
+        ccw(line[0], line[1], start_points) != ccw(line[0], line[1], end_points)
+    )
+
+
 def check_line_intersection_efficient(line1: List[List[float]], line2: List[List[float]]) -> bool:
     """
     Checks intersection of two lines defined by start and end point.
@@ -43,10 +138,10 @@ def check_intersected_lines(
     """
     if excluded_points is None:
         excluded_points = []
-    line_string1 = LineString([(x, y, z[0]) if z else (x, y) for x, y, *z in line1])
+    line_string1 = shapely.linestrings(np.asarray(line1, dtype=float))
     if line2 is None:
         return not line_string1.is_simple
-    line_string2 = LineString([(x, y, z[0]) if z else (x, y) for x, y, *z in line2])
+    line_string2 = shapely.linestrings(np.asarray(line2, dtype=float))
     intersection = line_string1.intersection(line_string2)
 
     if isinstance(intersection, LineString):
@@ -69,19 +164,10 @@ def contains_points(lanelet: Lanelet, polyline: np.ndarray) -> List[bool]:
     :param polyline: Polyline
     :return: Respective points are contained or not
     """
-    left_lanelet_points = list(lanelet.left_vertices)
-    right_lanelet_points: list = list(lanelet.right_vertices)
-    right_lanelet_points.reverse()
-
-    polyline_points = list(polyline)
-
-    poly = Polygon(left_lanelet_points + right_lanelet_points)
-
-    is_points_contained = []
-    for x, y in polyline_points:
-        is_points_contained = is_points_contained + [poly.contains(Point(x, y))]
+    poly = Polygon(np.concatenate((lanelet.left_vertices, lanelet.right_vertices[::-1])))
+    polyline = np.asarray(polyline, dtype=float)
 
-    return is_points_contained
+    return shapely.contains_xy(poly, polyline[:, 0], polyline[:, 1]).tolist()
 
 
 def fill_number_of_vertices(vertices: np.ndarray, number: int) -> np.ndarray:
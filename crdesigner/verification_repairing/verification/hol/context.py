@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Set
+from typing import Any, Callable, Dict, Optional, Set
 
 
 class Context:
@@ -10,18 +10,21 @@ class Context:
         self,
         domain_vals: Dict[str, Set[Any]],
         predicate_funcs: Dict[str, Callable],  # [[Any, ...], bool]],
-        function_funcs: Dict[str, Callable],
-    ):  # [[Any, ...], Any]]):
+        function_funcs: Dict[str, Callable],  # [[Any, ...], Any]]
+        batch_predicate_funcs: Optional[Dict[str, Callable]] = None,
+    ):
         """
         Constructor.
 
         :param domain_vals: Values of domains.
         :param predicate_funcs: Functions of predicates.
         :param function_funcs: Functions of term functions.
+        :param batch_predicate_funcs: Functions evaluating predicates for many groundings at once.
         """
         self._domain_vals = domain_vals
         self._predicate_funcs = predicate_funcs
         self._function_funcs = function_funcs
+        self._batch_predicate_funcs = batch_predicate_funcs if batch_predicate_funcs else {}
 
     @property
     def domain_vals(self) -> Dict[str, Set[Any]]:
@@ -50,6 +53,11 @@ class Context:
     def function_funcs(self, function_funcs: Dict[str, Callable]):  # [[Any, ...], Any]]):
         self._function_funcs = function_funcs
 
+    @property
+    def batch_predicate_funcs(self) -> Dict[str, Callable]:
+        """Functions evaluating predicates for many groundings at once."""
+        return self._batch_predicate_funcs
+
     def add_domain_vals(self, name: str, vals: Set[Any]):
         """
         Adds values of new domain.
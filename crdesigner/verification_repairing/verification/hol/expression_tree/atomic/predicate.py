@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from crdesigner.verification_repairing.verification.hol.context import Context
 from crdesigner.verification_repairing.verification.hol.expression_tree.expression import (
@@ -29,6 +29,12 @@ class Predicate(Expression):
 
         self._terms = terms
         self._func = func
+        self._batch_func: Optional[Callable] = None
+
+        # results of a batch evaluation keyed by the identities of the arguments; the arguments are kept so
+        # that their identities cannot be reused by other objects
+        self._prefetched: Optional[Dict[Tuple[int, ...], bool]] = None
+        self._prefetched_args: List[Tuple[Any, ...]] = []
 
     @property
     def terms(self):
@@ -46,6 +52,11 @@ class Predicate(Expression):
     def func(self, func: Callable):  # [[Any, ...], bool]):
         self._func = func
 
+    @property
+    def batch_func(self) -> Optional[Callable]:
+        """Function evaluating the predicate for many groundings at once."""
+        return self._batch_func
+
     def to_string(self) -> str:
         """
         Converts a predicate to string representation.
@@ -77,8 +88,40 @@ class Predicate(Expression):
         args = []
         for term in self._terms:
             args.append(term.evaluate())
+        if self._prefetched is not None:
+            result = self._prefetched.get(tuple(id(arg) for arg in args))
+            if result is not None:
+                return result
         return self._func(*args)
 
+    def evaluate_terms(self) -> Tuple[Any, ...]:
+        """
+        Evaluates the terms of the predicate for the current values of the variables.
+
+        :return: Arguments of the predicate.
+        """
+        return tuple(term.evaluate() for term in self._terms)
+
+    def prefetch(self, args_list: List[Tuple[Any, ...]]):
+        """
+        Evaluates the predicate for many arguments with a single call of the batch function. Later evaluations
+        with the same arguments return the stored results.
+
+        :param args_list: Arguments of the predicate for each grounding.
+        """
+        results = self._batch_func(*zip(*args_list)) if args_list else []
+        self._prefetched_args = args_list
+        self._prefetched = {
+            tuple(id(arg) for arg in args): bool(result) for args, result in zip(args_list, results)
+        }
+
+    def clear_prefetch(self):
+        """
+        Removes the stored results of a batch evaluation.
+        """
+        self._prefetched = None
+        self._prefetched_args = []
+
     def initialize(self, model: Context):
         """
         Initializes the domain values and the functions of predicates as well as term functions that
@@ -86,6 +129,7 @@ class Predicate(Expression):
 
         :param model: Model.
         """
+        self._batch_func = model.batch_predicate_funcs.get(self._symbol)
         if self._symbol in model.predicate_funcs.keys():
             self._func = model.predicate_funcs[self._symbol]
         else:
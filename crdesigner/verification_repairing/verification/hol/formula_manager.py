@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from crdesigner.verification_repairing.verification.hol.formula import Formula
 from crdesigner.verification_repairing.verification.hol.formula_collection import (
@@ -9,25 +9,34 @@ from crdesigner.verification_repairing.verification.hol.formula_collection impor
     TrafficLightFormulas,
     TrafficSignFormulas,
 )
-from crdesigner.verification_repairing.verification.hol.parser.parser import Parser
+
+_COLLECTIONS = [
+    TrafficLightFormulas,
+    TrafficSignFormulas,
+    IntersectionFormulas,
+    LaneletFormulas,
+    GeneralFormulas,
+]
 
 
 class FormulaManager:
     """
-    Class representing the management of formulas.
+    Class representing the management of formulas. The formulas are only parsed on first access.
     """
 
     def __init__(self):
         """
         Constructor.
         """
-        self._formulas = []
+        self._formulas: Optional[List[Formula]] = None
         self._domains = {}
 
-        self._collect_formulas()
+        self._collect_domains()
 
     @property
     def formulas(self) -> List[Formula]:
+        if self._formulas is None:
+            self._formulas = self._collect_formulas()
         return self._formulas
 
     @formulas.setter
@@ -48,7 +57,7 @@ class FormulaManager:
 
         :param formula: Formula.
         """
-        for f in self._formulas:
+        for f in self.formulas:
             if f.formula_id == formula.formula_id:
                 warnings.warn("Formula with ID {} is already stored!".format(formula.formula_id))
                 return
@@ -66,18 +75,22 @@ class FormulaManager:
             return
         self._domains[domain_id] = values
 
-    def _collect_formulas(self):
-        for collection in [
-            TrafficLightFormulas,
-            TrafficSignFormulas,
-            IntersectionFormulas,
-            LaneletFormulas,
-            GeneralFormulas,
-        ]:
+    @staticmethod
+    def _collect_formulas() -> List[Formula]:
+        # the parser depends on ANTLR, which is only loaded if formulas are needed
+        from crdesigner.verification_repairing.verification.hol.parser.parser import (
+            Parser,
+        )
+
+        formulas = []
+        for collection in _COLLECTIONS:
             for formula_id, formula in collection.formulas.items():
                 for subformula_id, subformula in collection.subformulas.items():
                     formula = formula.replace(subformula_id, subformula)
-                self._formulas.append(Parser.parse(formula, formula_id))
+                formulas.append(Parser.parse(formula, formula_id))
+        return formulas
 
+    def _collect_domains(self):
+        for collection in _COLLECTIONS:
             for domain_id, values in collection.domains.items():
                 self._domains[domain_id] = set(values)
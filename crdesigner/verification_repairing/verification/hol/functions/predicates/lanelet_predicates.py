@@ -1,6 +1,5 @@
 import itertools
 import logging
-from collections import Counter
 
 import numpy as np
 from commonroad.scenario.lanelet import Lanelet, StopLine
@@ -10,13 +9,19 @@ from commonroad_clcs.clcs import CurvilinearCoordinateSystem
 from commonroad_clcs.config import CLCSParams, ResamplingParams
 from commonroad_clcs.util import (
     chaikins_corner_cutting,
-    compute_orientation_from_polyline,
     resample_polyline,
 )
-from shapely import LineString
 from similaritymeasures import similaritymeasures
 
 from crdesigner.common.config.lanelet2_config import Lanelet2Config
+from crdesigner.verification_repairing.repairing.tools import geometry_tools
+
+# Predicates which can be evaluated for many groundings at once; the functions take one sequence per argument
+# and return a Boolean array
+BATCH_PREDICATES = {
+    "is_polylines_intersection": geometry_tools.are_polylines_intersecting,
+    "is_polyline_self_intersection": geometry_tools.are_polylines_self_intersecting,
+}
 
 
 def has_left_adj_ref(lanelet: Lanelet) -> bool:
@@ -236,15 +241,7 @@ def is_polylines_intersection(polyline_0: np.ndarray, polyline_1: np.ndarray) ->
     :param polyline_1: Second lanelet.
     :return: Boolean indicates whether two polylines intersect each other.
     """
-    line_0 = [(x, y, z[0]) if z else (x, y) for x, y, *z in polyline_0]
-    line_1 = [(x, y, z[0]) if z else (x, y) for x, y, *z in polyline_1]
-
-    line_string_0 = LineString(line_0)
-    line_string_1 = LineString(line_1)
-
-    result = line_string_0.intersection(line_string_1)
-
-    return not result.is_empty
+    return bool(geometry_tools.are_polylines_intersecting([polyline_0], [polyline_1])[0])
 
 
 def is_polyline_self_intersection(polyline: np.ndarray):
@@ -254,23 +251,8 @@ def is_polyline_self_intersection(polyline: np.ndarray):
     :param polyline: Polyline.
     :return: Boolean indicates whether the polyline intersects itself.
     """
-    line = [(x, y, z[0]) if z else (x, y) for x, y, *z in polyline]
-    orientation = compute_orientation_from_polyline(
-        polyline[:, :2]
-    )  # function does not support 3d vertices
-    orientation_dif = [
-        abs(orientation[i + 1] - orientation[i]) for i in range(len(orientation) - 1)
-    ]
-    line_string = LineString(line)
-
-    # shapely does not detect all cases of self-intersections:
-    # second check: twice the same element
-    # third check: 180 degree orientation change of line; visually line is perfect
-    return (
-        not line_string.is_simple
-        or Counter(line).most_common(1)[0][1] > 1
-        or np.isclose(np.max(orientation_dif), np.pi)
-    )
+    # shapely does not detect all cases of self-intersections, see are_polylines_self_intersecting
+    return bool(geometry_tools.are_polylines_self_intersecting([polyline])[0])
 
 
 def are_equal_vertices(vertex_0: np.ndarray, vertex_1: np.ndarray) -> bool:
@@ -131,7 +131,7 @@ def stop_line_traffic_signs(stop_line: StopLine) -> Set[int]:
     :param stop_line: Stop line.
     :return: IDs of traffic signs.
     """
-    return stop_line.traffic_sign_ref
+    return stop_line.traffic_sign_ref if stop_line.traffic_sign_ref is not None else set()
 
 
 def stop_line_traffic_lights(stop_line: StopLine) -> Set[int]:
@@ -141,4 +141,4 @@ def stop_line_traffic_lights(stop_line: StopLine) -> Set[int]:
     :param stop_line: Stop line.
     :return: IDs of traffic lights.
     """
-    return stop_line.traffic_light_ref
+    return stop_line.traffic_light_ref if stop_line.traffic_light_ref is not None else set()
@@ -42,6 +42,25 @@ def _prepare_predicate_funcs() -> Dict[str, Callable]:  # [[Any, ...], bool]]:
     return predicate_funcs
 
 
+def _prepare_batch_predicate_funcs() -> Dict[str, Callable]:
+    """
+    Prepares the functions which evaluate predicates for many groundings at once.
+
+    :return: Functions of batch predicates.
+    """
+    batch_predicate_funcs = {}
+    for predicate_functions in [
+        lanelet_predicates,
+        traffic_sign_predicates,
+        traffic_light_predicates,
+        intersection_predicates,
+    ]:
+        for func_name, batch_func in getattr(predicate_functions, "BATCH_PREDICATES", {}).items():
+            batch_predicate_funcs[func_name.capitalize()] = batch_func
+
+    return batch_predicate_funcs
+
+
 def _prepare_function_funcs() -> Dict[str, Callable]:  # [[Any, ...], Any]]:
     """
     Prepares the functions of term functions.
@@ -92,8 +111,9 @@ class HOLMapping(Mapping):
         domain_vals = self._prepare_domains()
         predicate_funcs = _prepare_predicate_funcs()
         function_funcs = _prepare_function_funcs()
+        batch_predicate_funcs = _prepare_batch_predicate_funcs()
 
-        self._model = Context(domain_vals, predicate_funcs, function_funcs)
+        self._model = Context(domain_vals, predicate_funcs, function_funcs, batch_predicate_funcs)
 
     def map_verification_paras(self):
         pass
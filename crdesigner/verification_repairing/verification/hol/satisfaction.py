@@ -1,6 +1,7 @@
 import logging
 import warnings
-from typing import List
+from contextlib import nullcontext
+from typing import Any, List, Optional, Set, Tuple
 
 from commonroad.scenario.intersection import Intersection
 from commonroad.scenario.lanelet import Lanelet
@@ -14,15 +15,62 @@ from crdesigner.verification_repairing.verification.formula_ids import (
     extract_formula_ids,
 )
 from crdesigner.verification_repairing.verification.hol.context import Context
+from crdesigner.verification_repairing.verification.hol.expression_tree.atomic.predicate import (
+    Predicate,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.binary.binary import (
+    Binary,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.expression import (
+    Expression,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.nary.nary import (
+    Nary,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.unary.first_order.first_order import (
+    FirstOrder,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.unary.unary import (
+    Unary,
+)
 from crdesigner.verification_repairing.verification.hol.formula import Formula
 from crdesigner.verification_repairing.verification.hol.mapping import HOLMapping
 from crdesigner.verification_repairing.verification.hol.var_domain_iterator import (
     VarDomainIterator,
 )
+from crdesigner.verification_repairing.verification.profiling import (
+    FormulaProfiles,
+    VerificationProfiler,
+)
 from crdesigner.verification_repairing.verification.satisfaction import (
     InvalidStates,
     VerificationChecker,
 )
+from crdesigner.verification_repairing.verification.verification_cache import (
+    VerificationCache,
+    collect_elements,
+)
+
+
+def batch_predicates(expr: Expression) -> List[Predicate]:
+    """
+    Collects the predicates of an expression which have a batch function and only depend on the free
+    variables of the formula, i.e., which are not in the scope of a quantifier.
+
+    :param expr: Expression.
+    :return: Predicates.
+    """
+    if isinstance(expr, Predicate):
+        return [expr] if expr.batch_func is not None else []
+    if isinstance(expr, FirstOrder):
+        return []
+    if isinstance(expr, Unary):
+        return batch_predicates(expr.expr)
+    if isinstance(expr, Binary):
+        return batch_predicates(expr.left_expr) + batch_predicates(expr.right_expr)
+    if isinstance(expr, Nary):
+        return [predicate for e in expr.exprs for predicate in batch_predicates(e)]
+    return []
 
 
 class HOLVerificationChecker(VerificationChecker):
@@ -37,12 +85,20 @@ class HOLVerificationChecker(VerificationChecker):
 
         self._invalid_states = {}
 
-    def check_validity(self, config: VerificationParams, manager_results: List[InvalidStates]):
+    def check_validity(
+        self,
+        config: VerificationParams,
+        manager_results: List[InvalidStates],
+        manager_cache_stats: Optional[List[Tuple[int, int]]] = None,
+        manager_profiles: Optional[List[FormulaProfiles]] = None,
+    ):
         """
         Checks the network for validity.
 
         :param config: Verification config parameters.
         :param manager_results: Results.
+        :param manager_cache_stats: Number of cache hits and lookups.
+        :param manager_profiles: Profiles of the formulas if profiling is enabled.
         """
         model: Context = self._mapping.model
 
@@ -54,23 +110,57 @@ class HOLVerificationChecker(VerificationChecker):
         else:
             formula_ids = self._formula_ids
 
-        for formula in config.formula_manager.formulas:
-            for formula_id in formula_ids:
-                if formula_id.value == formula.formula_id:
-                    logging.debug(f"HOL::check_validity: {formula_id}")
-                    self._solve_formula(formula, model)
+        cache = None
+        if config.cache_path is not None:
+            cache = VerificationCache(config.cache_path, config)
+            cache.open(collect_elements(model.domain_vals))
+
+        profiler = VerificationProfiler(model) if config.profile else None
+
+        try:
+            with profiler if profiler is not None else nullcontext():
+                for formula in config.formula_manager.formulas:
+                    for formula_id in formula_ids:
+                        if formula_id.value == formula.formula_id:
+                            logging.debug(f"HOL::check_validity: {formula_id}")
+                            with (
+                                profiler.profile(formula.formula_id)
+                                if profiler is not None
+                                else nullcontext()
+                            ):
+                                self._solve_formula(formula, model, cache, profiler)
+        finally:
+            if cache is not None:
+                cache.close()
 
         manager_results.append(self._invalid_states)
+        if manager_cache_stats is not None and cache is not None:
+            manager_cache_stats.append((cache.hits, cache.lookups))
+        if manager_profiles is not None and profiler is not None:
+            manager_profiles.append(profiler.profiles)
 
-    def _solve_formula(self, formula: Formula, model: Context):
+    def _solve_formula(
+        self,
+        formula: Formula,
+        model: Context,
+        cache: Optional[VerificationCache] = None,
+        profiler: Optional[VerificationProfiler] = None,
+    ):
         """
-        Solves a formula.
+        Solves a formula. Groundings whose elements are unchanged since a previous verification are answered from
+        the cache.
 
         :param formula: Formula.
         :param model:
+        :param cache: Cache of verification results.
+        :param profiler: Profiler counting the enumerated groundings.
         """
         formula.initialize(model)
 
+        cached = cache.load(formula) if cache is not None else None
+        failures: Set[bytes] = set()
+        cacheable = cache is not None
+
         iters = []
         for var, domain in zip(formula.free_vars, formula.free_var_domains):
             iters.append(VarDomainIterator(var, domain))
@@ -80,17 +170,35 @@ class HOLVerificationChecker(VerificationChecker):
             prev_iter.next_iter = init_iter
             init_iter = prev_iter
 
-        while init_iter is not None:
-            combination = init_iter.next_combination()
-            if combination is None:
-                break
-            free_var_vals = {}
-            for i, var in enumerate(formula.free_vars):
-                free_var_vals[var.name] = combination[i]
+        combinations = self._combinations(init_iter)
+        predicates = batch_predicates(formula.expr)
+        if predicates:
+            combinations = list(combinations)
+            self._prefetch(formula, predicates, combinations)
 
-            formula.update_free_variables(free_var_vals)
+        for combination in combinations:
+            if profiler is not None:
+                profiler.count_grounding()
+            key = cache.grounding_key(combination) if cacheable else None
+            if key is None:
+                cacheable = False
+            else:
+                cache.lookups += 1
 
-            if not formula.evaluate():
+            if key is not None and cached is not None and cache.is_unchanged(combination, cached):
+                cache.hits += 1
+                valid = key not in cached.failures
+            else:
+                free_var_vals = {}
+                for i, var in enumerate(formula.free_vars):
+                    free_var_vals[var.name] = combination[i]
+
+                formula.update_free_variables(free_var_vals)
+                valid = formula.evaluate()
+
+            if not valid:
+                if key is not None:
+                    failures.add(key)
                 location = []
                 for element in combination:
                     if isinstance(element, Lanelet):
@@ -110,3 +218,46 @@ class HOLVerificationChecker(VerificationChecker):
                     self._invalid_states[formula_id].append(location)
                 else:
                     self._invalid_states[formula_id] = [location]
+
+        for predicate in predicates:
+            predicate.clear_prefetch()
+
+        if cacheable:
+            cache.store(formula, failures)
+
+    @staticmethod
+    def _combinations(init_iter: Optional[VarDomainIterator]):
+        """
+        Enumerates the groundings of the free variables of a formula.
+
+        :param init_iter: Iterator over the domain of the first free variable.
+        :return: Generator of groundings.
+        """
+        while init_iter is not None:
+            combination = init_iter.next_combination()
+            if combination is None:
+                break
+            yield combination
+
+    @staticmethod
+    def _prefetch(
+        formula: Formula, predicates: List[Predicate], combinations: List[Tuple[Any, ...]]
+    ):
+        """
+        Evaluates the predicates with a batch function for all groundings at once, e.g., the geometric
+        predicates of the single-lanelet formulas with one array operation over all lanelets.
+
+        :param formula: Formula.
+        :param predicates: Predicates with a batch function.
+        :param combinations: Groundings of the free variables.
+        """
+        args_lists = [[] for _ in predicates]
+        for combination in combinations:
+            formula.update_free_variables(
+                {var.name: combination[i] for i, var in enumerate(formula.free_vars)}
+            )
+            for args_list, predicate in zip(args_lists, predicates):
+                args_list.append(predicate.evaluate_terms())
+
+        for args_list, predicate in zip(args_lists, predicates):
+            predicate.prefetch(args_list)
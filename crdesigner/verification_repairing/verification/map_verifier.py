@@ -32,6 +32,10 @@ from crdesigner.verification_repairing.verification.hol.mapping import HOLMappin
 from crdesigner.verification_repairing.verification.hol.satisfaction import (
     HOLVerificationChecker,
 )
+from crdesigner.verification_repairing.verification.profiling import (
+    FormulaProfiles,
+    merge_profiles,
+)
 from crdesigner.verification_repairing.verification.satisfaction import InvalidStates
 
 
@@ -47,6 +51,25 @@ class MapVerifier:
         self._network = network
         self._config = config
 
+        self._cache_hits = 0
+        self._cache_lookups = 0
+        self._profiles: FormulaProfiles = {}
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of groundings answered from the verification cache by the last verification."""
+        return self._cache_hits
+
+    @property
+    def cache_lookups(self) -> int:
+        """Number of groundings looked up in the verification cache by the last verification."""
+        return self._cache_lookups
+
+    @property
+    def profiles(self) -> FormulaProfiles:
+        """Profiles of the formulas of the last verification; empty if profiling is disabled."""
+        return self._profiles
+
     def verify(self) -> InvalidStates:
         """
         Verifies and detects the invalid states in the map.
@@ -82,8 +105,10 @@ class MapVerifier:
         ]
         valid_checker = self._create_verifier(mapping, formula_ids)
 
-        results = []
-        valid_checker.check_validity(self._config.verification, results)
+        results, cache_stats, profiles = [], [], []
+        valid_checker.check_validity(self._config.verification, results, cache_stats, profiles)
+        self._update_cache_stats(cache_stats)
+        self._profiles = merge_profiles(profiles)
 
         return results[0]
 
@@ -97,6 +122,8 @@ class MapVerifier:
 
         manager = multiprocessing.Manager()
         results = manager.list()
+        cache_stats = manager.list()
+        profiles = manager.list()
 
         for formula_type in FormulaTypes:
             if self._config.verification.formulas is None:
@@ -142,13 +169,16 @@ class MapVerifier:
                     processes.clear()
 
                 p = Process(
-                    target=valid_checker.check_validity, args=(self._config.verification, results)
+                    target=valid_checker.check_validity,
+                    args=(self._config.verification, results, cache_stats, profiles),
                 )
                 processes.append(p)
                 p.start()
 
         for p in processes:
             p.join()
+        self._update_cache_stats(cache_stats)
+        self._profiles = merge_profiles(profiles)
 
         invalid_states = {}
         for result in results:
@@ -162,6 +192,15 @@ class MapVerifier:
 
         return invalid_states
 
+    def _update_cache_stats(self, cache_stats: List[Tuple[int, int]]):
+        """
+        Sums up the cache statistics of all validity checkers.
+
+        :param cache_stats: Number of cache hits and lookups of each validity checker.
+        """
+        self._cache_hits = sum(hits for hits, _ in cache_stats)
+        self._cache_lookups = sum(lookups for _, lookups in cache_stats)
+
     def _reduce_network(
         self, block: Tuple[LaneletBlock, TrafficSignBlock, TrafficLightBlock, IntersectionBlock]
     ) -> LaneletNetwork:
@@ -172,6 +211,7 @@ class MapVerifier:
         :return: Reduced lanelet network
         """
         lanelet_block, traffic_sign_block, traffic_light_block, intersection_block = block
+        lanelet_members = set(lanelet_block)
 
         network = LaneletNetwork()
 
@@ -195,23 +235,23 @@ class MapVerifier:
         # Remove references from lanelets in other blocks
         for lanelet in network.lanelets:
             left_adj = lanelet.adj_left
-            if left_adj is not None and left_adj not in lanelet_block:
+            if left_adj is not None and left_adj not in lanelet_members:
                 if self._network.find_lanelet_by_id(left_adj) is not None:
                     lanelet.adj_left = None
 
             right_adj = lanelet.adj_right
-            if right_adj is not None and right_adj not in lanelet_block:
+            if right_adj is not None and right_adj not in lanelet_members:
                 if self._network.find_lanelet_by_id(right_adj) is not None:
                     lanelet.adj_right = None
 
             predecessor = copy.copy(lanelet.predecessor)
             for pre in predecessor:
-                if self._network.find_lanelet_by_id(pre) is not None and pre not in lanelet_block:
+                if self._network.find_lanelet_by_id(pre) is not None and pre not in lanelet_members:
                     lanelet.predecessor.remove(pre)
 
             successor = copy.copy(lanelet.successor)
             for suc in successor:
-                if self._network.find_lanelet_by_id(suc) is not None and suc not in lanelet_block:
+                if self._network.find_lanelet_by_id(suc) is not None and suc not in lanelet_members:
                     lanelet.successor.remove(suc)
 
         network.cleanup_traffic_sign_references()
@@ -0,0 +1,275 @@
+import functools
+import json
+import time
+import types
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+import shapely
+from similaritymeasures import similaritymeasures
+
+from crdesigner.verification_repairing.verification.hol.context import Context
+
+SHAPELY = "shapely"
+FRECHET = "frechet"
+
+FormulaProfiles = Dict[str, "FormulaProfile"]
+
+
+@dataclass
+class FormulaProfile:
+    """
+    Profile of the verification of a formula.
+
+    The times of predicates and term functions include the time of the predicates and functions they call.
+    Library times are attributed to the innermost predicate or function calling the library.
+    """
+
+    formula_id: str
+    wall_time: float = 0.0
+    groundings: int = 0
+    predicate_calls: Dict[str, int] = field(default_factory=dict)
+    function_calls: Dict[str, int] = field(default_factory=dict)
+    call_times: Dict[str, float] = field(default_factory=dict)
+    library_times: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def shapely_time(self) -> float:
+        """Time spent in shapely calls."""
+        return sum(self.library_times.get(SHAPELY, {}).values())
+
+    @property
+    def frechet_time(self) -> float:
+        """Time spent in Fréchet distance calls."""
+        return sum(self.library_times.get(FRECHET, {}).values())
+
+    def merge(self, other: "FormulaProfile"):
+        """
+        Adds the measurements of another profile of the same formula, e.g., of another block of a partition.
+
+        :param other: Profile.
+        """
+        self.wall_time += other.wall_time
+        self.groundings += other.groundings
+        for own, others in (
+            (self.predicate_calls, other.predicate_calls),
+            (self.function_calls, other.function_calls),
+            (self.call_times, other.call_times),
+        ):
+            for name, value in others.items():
+                own[name] = own.get(name, 0) + value
+        for library, times in other.library_times.items():
+            own = self.library_times.setdefault(library, {})
+            for name, value in times.items():
+                own[name] = own.get(name, 0.0) + value
+
+    def to_dict(self) -> Dict:
+        """
+        Converts the profile to a dictionary which can be serialized as JSON.
+
+        :return: Dictionary.
+        """
+        profile = asdict(self)
+        profile["shapely_time"] = self.shapely_time
+        profile["frechet_time"] = self.frechet_time
+        return profile
+
+
+class VerificationProfiler:
+    """
+    Records a profile for each verified formula. While the profiler is active, the predicates and term
+    functions of the model as well as the shapely functions and the Fréchet distance are replaced by timed
+    wrappers; the original functions are restored on exit.
+    """
+
+    def __init__(self, model: Context):
+        """
+        Constructor.
+
+        :param model: Model whose predicates and term functions are profiled.
+        """
+        self._model = model
+        self._profiles: FormulaProfiles = {}
+        self._current: Optional[FormulaProfile] = None
+        self._caller: str = ""
+        self._library_depth = 0
+        self._restore: List[Callable[[], None]] = []
+
+    @property
+    def profiles(self) -> FormulaProfiles:
+        """Profiles of the verified formulas."""
+        return self._profiles
+
+    def __enter__(self) -> "VerificationProfiler":
+        self._patch_dict(self._model.predicate_funcs, "predicate_calls")
+        self._patch_dict(self._model.batch_predicate_funcs, "predicate_calls", "[batch]")
+        self._patch_dict(self._model.function_funcs, "function_calls")
+
+        for name, func in vars(shapely).items():
+            if isinstance(func, types.FunctionType):
+                self._patch_module(shapely, name, self._wrap_library(SHAPELY, func))
+        self._patch_module(
+            similaritymeasures,
+            "frechet_dist",
+            self._wrap_library(FRECHET, similaritymeasures.frechet_dist),
+        )
+        return self
+
+    def __exit__(self, *exc):
+        for restore in reversed(self._restore):
+            restore()
+        self._restore.clear()
+        self._current = None
+        return False
+
+    def profile(self, formula_id: str) -> "_FormulaTimer":
+        """
+        Creates a context in which the measurements are attributed to a formula.
+
+        :param formula_id: ID of formula.
+        :return: Context.
+        """
+        if formula_id not in self._profiles:
+            self._profiles[formula_id] = FormulaProfile(formula_id)
+        return _FormulaTimer(self, self._profiles[formula_id])
+
+    def count_grounding(self):
+        """Counts an enumerated grounding of the free variables of the current formula."""
+        if self._current is not None:
+            self._current.groundings += 1
+
+    def _patch_dict(self, funcs: Dict[str, Callable], calls: str, suffix: str = ""):
+        originals = dict(funcs)
+        for name, func in originals.items():
+            funcs[name] = self._wrap_call(name + suffix, func, calls)
+        self._restore.append(lambda: funcs.update(originals))
+
+    def _patch_module(self, module: types.ModuleType, name: str, wrapper: Callable):
+        original = getattr(module, name)
+        setattr(module, name, wrapper)
+        self._restore.append(lambda: setattr(module, name, original))
+
+    def _wrap_call(self, name: str, func: Callable, calls: str) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = self._current
+            if profile is None:
+                return func(*args, **kwargs)
+            counts = getattr(profile, calls)
+            counts[name] = counts.get(name, 0) + 1
+            caller, self._caller = self._caller, name
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.call_times[name] = (
+                    profile.call_times.get(name, 0.0) + time.perf_counter() - start
+                )
+                self._caller = caller
+
+        return wrapper
+
+    def _wrap_library(self, library: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = self._current
+            # calls within library calls, e.g., of shapely functions calling each other, are not timed again
+            if profile is None or self._library_depth > 0:
+                return func(*args, **kwargs)
+            self._library_depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._library_depth -= 1
+                times = profile.library_times.setdefault(library, {})
+                times[self._caller] = times.get(self._caller, 0.0) + time.perf_counter() - start
+
+        return wrapper
+
+
+class _FormulaTimer:
+    """Context measuring the wall time of the verification of a formula."""
+
+    def __init__(self, profiler: VerificationProfiler, profile: FormulaProfile):
+        self._profiler = profiler
+        self._profile = profile
+        self._start = 0.0
+
+    def __enter__(self) -> FormulaProfile:
+        self._profiler._current = self._profile
+        self._start = time.perf_counter()
+        return self._profile
+
+    def __exit__(self, *exc):
+        self._profile.wall_time += time.perf_counter() - self._start
+        self._profiler._current = None
+        return False
+
+
+def merge_profiles(profiles: Iterable[FormulaProfiles]) -> FormulaProfiles:
+    """
+    Merges the profiles of several verifications, e.g., of the blocks of a partition.
+
+    :param profiles: Profiles of the verifications.
+    :return: Merged profiles.
+    """
+    merged = {}
+    for formula_profiles in profiles:
+        for formula_id, profile in formula_profiles.items():
+            merged.setdefault(formula_id, FormulaProfile(formula_id)).merge(profile)
+    return merged
+
+
+def profiles_to_json(profiles: FormulaProfiles, path: str):
+    """
+    Stores the profiles as JSON.
+
+    :param profiles: Profiles.
+    :param path: Path of JSON file.
+    """
+    with open(path, "w") as file:
+        json.dump(
+            {formula_id: profile.to_dict() for formula_id, profile in sorted(profiles.items())},
+            file,
+            indent=2,
+        )
+
+
+def profiles_to_folded_stacks(profiles: FormulaProfiles) -> List[str]:
+    """
+    Converts the profiles to the folded stack format, e.g., of flamegraph.pl or speedscope. Each line consists of
+    a stack of the formula, the predicate or function, and the library followed by the time in microseconds.
+    Calls of predicates and functions by other predicates and functions are not nested.
+
+    :param profiles: Profiles.
+    :return: Lines.
+    """
+    lines = []
+    for formula_id, profile in sorted(profiles.items()):
+        library_times = defaultdict(float)
+        for library, times in sorted(profile.library_times.items()):
+            for caller, duration in sorted(times.items()):
+                library_times[caller] += duration
+                stack = f"{formula_id};{caller};{library}" if caller else f"{formula_id};{library}"
+                lines.append(f"{stack} {round(duration * 1e6)}")
+
+        for name, duration in sorted(profile.call_times.items()):
+            self_time = max(duration - library_times[name], 0.0)
+            lines.append(f"{formula_id};{name} {round(self_time * 1e6)}")
+
+        overhead = profile.wall_time - sum(profile.call_times.values()) - library_times[""]
+        lines.append(f"{formula_id} {round(max(overhead, 0.0) * 1e6)}")
+    return lines
+
+
+def profiles_to_folded_file(profiles: FormulaProfiles, path: str):
+    """
+    Stores the profiles in the folded stack format.
+
+    :param profiles: Profiles.
+    :param path: Path of file.
+    """
+    with open(path, "w") as file:
+        file.write("\n".join(profiles_to_folded_stacks(profiles)) + "\n")
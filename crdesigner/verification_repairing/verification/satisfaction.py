@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from crdesigner.verification_repairing.config import VerificationParams
 from crdesigner.verification_repairing.verification.formula_ids import FormulaID
 from crdesigner.verification_repairing.verification.mapping import Mapping
+from crdesigner.verification_repairing.verification.profiling import FormulaProfiles
 
 Locations = List[Tuple[Any, ...]]
 InvalidStates = Dict[FormulaID, Locations]
@@ -19,11 +20,19 @@ class VerificationChecker(ABC):
         self._formula_ids = formula_ids
 
     @abstractmethod
-    def check_validity(self, config: VerificationParams, manager_results: List[InvalidStates]):
+    def check_validity(
+        self,
+        config: VerificationParams,
+        manager_results: List[InvalidStates],
+        manager_cache_stats: Optional[List[Tuple[int, int]]] = None,
+        manager_profiles: Optional[List[FormulaProfiles]] = None,
+    ):
         """
         Checks the network for validity.
 
         :param config: Verification config parameters.
         :param manager_results: List where invalid states are stored.
+        :param manager_cache_stats: List where the number of cache hits and lookups are stored.
+        :param manager_profiles: List where the profiles of the formulas are stored if profiling is enabled.
         """
         pass
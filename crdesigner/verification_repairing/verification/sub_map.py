@@ -1,25 +1,233 @@
-from copy import deepcopy
+import copy
+from typing import Dict, Optional, Set, Tuple
 
-from commonroad.scenario.lanelet import LaneletNetwork
-from shapely import Point
+import numpy as np
+import shapely
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
+from shapely import Point, STRtree
 from shapely.geometry.base import BaseGeometry
 from shapely.validation import make_valid
 
 
+class SubMapIndex:
+    """
+    Spatial and reverse-reference index over a lanelet network which is shared by all sub maps of the network.
+
+    The lanelet polygons are stored in an STRtree and the positions of traffic signs and traffic lights in arrays.
+    The reverse-reference index maps each traffic sign and traffic light to the lanelets referencing it. If the
+    network is modified, e.g., by repairing, the index must be refreshed; only the modified parts are updated.
+    """
+
+    def __init__(self, network: LaneletNetwork):
+        """
+        Constructor.
+
+        :param network: Lanelet network.
+        """
+        self._network = network
+
+        # lanelet ID -> (lanelet, polygon, referenced traffic signs, referenced traffic lights)
+        self._lanelets: Dict[int, Tuple[Lanelet, BaseGeometry, Set[int], Set[int]]] = {}
+        self._sign_refs: Dict[int, Set[int]] = {}
+        self._light_refs: Dict[int, Set[int]] = {}
+
+        # traffic sign/light ID -> position
+        self._sign_positions: Dict[int, Tuple[float, float]] = {}
+        self._light_positions: Dict[int, Tuple[float, float]] = {}
+
+        self._tree: Optional[STRtree] = None
+        self._tree_ids: Optional[np.ndarray] = None
+        self._sign_points: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._light_points: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        self.refresh()
+
+    @property
+    def network(self) -> LaneletNetwork:
+        return self._network
+
+    def refresh(self):
+        """
+        Synchronises the index with the current state of the network. Lanelets whose object or polygon was replaced
+        invalidate the STRtree, and moved traffic signs or traffic lights invalidate the position arrays. The
+        invalidated structures are rebuilt on the next query.
+        """
+        lanelets = {la.lanelet_id: la for la in self._network.lanelets}
+        for lanelet_id in set(self._lanelets) - set(lanelets):
+            _, _, signs, lights = self._lanelets.pop(lanelet_id)
+            self._update_refs(lanelet_id, signs, lights, set(), set())
+            self._tree = None
+
+        for lanelet_id, lanelet in lanelets.items():
+            polygon = lanelet.polygon.shapely_object
+            old_signs, old_lights = set(), set()
+            if (entry := self._lanelets.get(lanelet_id)) is not None:
+                indexed_lanelet, indexed_polygon, old_signs, old_lights = entry
+                if (
+                    indexed_lanelet is lanelet
+                    and indexed_polygon is polygon
+                    and old_signs == lanelet.traffic_signs
+                    and old_lights == lanelet.traffic_lights
+                ):
+                    continue
+            if entry is None or entry[1] is not polygon:
+                self._tree = None
+            signs, lights = set(lanelet.traffic_signs), set(lanelet.traffic_lights)
+            self._update_refs(lanelet_id, old_signs, old_lights, signs, lights)
+            self._lanelets[lanelet_id] = (lanelet, polygon, signs, lights)
+
+        signs = {
+            ts.traffic_sign_id: self._position(ts.position) for ts in self._network.traffic_signs
+        }
+        if signs != self._sign_positions:
+            self._sign_positions = signs
+            self._sign_points = None
+        lights = {
+            tl.traffic_light_id: self._position(tl.position) for tl in self._network.traffic_lights
+        }
+        if lights != self._light_positions:
+            self._light_positions = lights
+            self._light_points = None
+
+    def lanelets_referencing_sign(self, traffic_sign_id: int) -> Set[int]:
+        """
+        Returns the IDs of the lanelets which reference a traffic sign.
+
+        :param traffic_sign_id: Traffic sign ID.
+        :return: Lanelet IDs.
+        """
+        return self._sign_refs.get(traffic_sign_id, set())
+
+    def lanelets_referencing_light(self, traffic_light_id: int) -> Set[int]:
+        """
+        Returns the IDs of the lanelets which reference a traffic light.
+
+        :param traffic_light_id: Traffic light ID.
+        :return: Lanelet IDs.
+        """
+        return self._light_refs.get(traffic_light_id, set())
+
+    def query(self, shape: BaseGeometry) -> Tuple[Set[int], Set[int], Set[int]]:
+        """
+        Queries the elements contained in a shape.
+
+        :param shape: Shape.
+        :return: IDs of the lanelets intersecting the shape and of the traffic signs and traffic lights contained
+            in the shape.
+        """
+        if self._tree is None:
+            self._tree_ids = np.fromiter(
+                self._lanelets.keys(), dtype=int, count=len(self._lanelets)
+            )
+            self._tree = STRtree([entry[1] for entry in self._lanelets.values()])
+        lanelet_ids = set(self._tree_ids[self._tree.query(shape, predicate="intersects")].tolist())
+
+        if self._sign_points is None:
+            self._sign_points = self._points(self._sign_positions)
+        if self._light_points is None:
+            self._light_points = self._points(self._light_positions)
+
+        return (
+            lanelet_ids,
+            self._contained(shape, *self._sign_points),
+            self._contained(shape, *self._light_points),
+        )
+
+    def _update_refs(
+        self,
+        lanelet_id: int,
+        old_signs: Set[int],
+        old_lights: Set[int],
+        signs: Set[int],
+        lights: Set[int],
+    ):
+        """
+        Updates the reverse-reference index for the changed references of a lanelet.
+
+        :param lanelet_id: Lanelet ID.
+        :param old_signs: Previously referenced traffic signs.
+        :param old_lights: Previously referenced traffic lights.
+        :param signs: Referenced traffic signs.
+        :param lights: Referenced traffic lights.
+        """
+        for refs, old, new in [
+            (self._sign_refs, old_signs, signs),
+            (self._light_refs, old_lights, lights),
+        ]:
+            for element_id in old - new:
+                refs[element_id].discard(lanelet_id)
+            for element_id in new - old:
+                refs.setdefault(element_id, set()).add(lanelet_id)
+
+    @staticmethod
+    def _position(position: np.ndarray) -> Tuple[float, float]:
+        """
+        Converts the position of a traffic sign or traffic light into a tuple which does not change if the
+        position array of the element is modified in place.
+
+        :param position: Position.
+        :return: Coordinates.
+        """
+        return float(position[0]), float(position[1])
+
+    @staticmethod
+    def _points(positions: Dict[int, Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stacks the positions of elements into arrays.
+
+        :param positions: Positions of elements.
+        :return: Element IDs and coordinates.
+        """
+        ids = np.fromiter(positions.keys(), dtype=int, count=len(positions))
+        coords = np.array(list(positions.values()), dtype=float).reshape(-1, 2)
+        return ids, coords
+
+    @staticmethod
+    def _contained(shape: BaseGeometry, ids: np.ndarray, coords: np.ndarray) -> Set[int]:
+        """
+        Returns the IDs of the points contained in a shape.
+
+        :param shape: Shape.
+        :param ids: Element IDs of the points.
+        :param coords: Coordinates of the points.
+        :return: IDs of the contained points.
+        """
+        if len(ids) == 0:
+            return set()
+        min_x, min_y, max_x, max_y = shape.bounds
+        candidates = (
+            (coords[:, 0] >= min_x)
+            & (coords[:, 0] <= max_x)
+            & (coords[:, 1] >= min_y)
+            & (coords[:, 1] <= max_y)
+        )
+        candidates[candidates] = shapely.contains_xy(
+            shape, coords[candidates, 0], coords[candidates, 1]
+        )
+        return set(ids[candidates].tolist())
+
+
 class SubMap:
     """
     Class representing a sub map.
     """
 
-    def __init__(self, network: LaneletNetwork, buffer_size: float = 100.0):
+    def __init__(
+        self,
+        network: LaneletNetwork,
+        buffer_size: float = 100.0,
+        index: Optional[SubMapIndex] = None,
+    ):
         """
         Constructor.
 
         :param network: Lanelet network.
         :param buffer_size: Buffer size.
+        :param index: Index of the network shared with other sub maps; it is created if not provided.
         """
         self._network = network
         self._buffer_size = buffer_size
+        self._index = index if index is not None else SubMapIndex(network)
 
         self._lanelet_ids = set()
         self._traffic_sign_ids = set()
@@ -46,6 +254,10 @@ class SubMap:
         """
         Creates a subnetwork from the extracted IDs of lanelets, traffic signs, traffic lights, and intersections.
 
+        The subnetwork is a read-only view of the network: the elements share their geometry and all other
+        attributes with the elements of the network. Only lanelets, stop lines, and intersections are copied
+        shallowly so that their references to elements outside of the sub map can be removed.
+
         :return: Subnetwork.
         """
         network = LaneletNetwork()
@@ -53,27 +265,29 @@ class SubMap:
         for lanelet_id in self._lanelet_ids:
             if (lanelet := self._network.find_lanelet_by_id(lanelet_id)) is None:
                 continue  # it might be the case that some CR element has a non-existent reference
-            lanelet = deepcopy(lanelet)
-            network.add_lanelet(lanelet)
+            lanelet = copy.copy(lanelet)
+            if lanelet.stop_line is not None:
+                lanelet.stop_line = copy.copy(lanelet.stop_line)
+            network.add_lanelet(lanelet, rtree=False)
 
         for traffic_sign_id in self._traffic_sign_ids:
             if (traffic_sign := self._network.find_traffic_sign_by_id(traffic_sign_id)) is None:
                 continue  # it might be the case that some CR element has a non-existent reference
-            traffic_sign = deepcopy(traffic_sign)
             network.add_traffic_sign(traffic_sign, set())
 
         for traffic_light_id in self._traffic_light_ids:
             if (traffic_light := self._network.find_traffic_light_by_id(traffic_light_id)) is None:
                 continue  # it might be the case that some CR element has a non-existent reference
-            traffic_light = deepcopy(traffic_light)
             network.add_traffic_light(traffic_light, set())
 
         for intersection_id in self._intersection_ids:
             if (intersection := self._network.find_intersection_by_id(intersection_id)) is None:
                 continue  # it might be the case that some CR element has a non-existent reference
-            intersection = deepcopy(intersection)
+            intersection = copy.copy(intersection)
+            intersection._incomings = [copy.copy(incoming) for incoming in intersection.incomings]
             network.add_intersection(intersection)
 
+        # the cleanup assigns new containers to the copies, the network is not modified
         network.cleanup_lanelet_references()
         network.cleanup_traffic_sign_references()
         network.cleanup_traffic_light_references()
@@ -124,7 +338,7 @@ class SubMap:
         :param traffic_light_id: Traffic light ID.
         """
         self._extract_refs_from_traffic_light(traffic_light_id)
-        self._extract_area_from_traffic_sign(traffic_light_id)
+        self._extract_area_from_traffic_light(traffic_light_id)
 
     def extract_from_intersection(self, intersection_id: int):
         """
@@ -178,11 +392,7 @@ class SubMap:
 
         self._lanelet_ids = self._lanelet_ids.union(traffic_sign.first_occurrence)
         self._lanelet_ids = self._lanelet_ids.union(
-            set(
-                la.lanelet_id
-                for la in self._network.lanelets
-                if traffic_sign_id in la.traffic_signs
-            )
+            self._index.lanelets_referencing_sign(traffic_sign_id)
         )
 
     def _extract_refs_from_traffic_light(self, traffic_light_id: int):
@@ -194,11 +404,7 @@ class SubMap:
         """
         self._traffic_light_ids.add(traffic_light_id)
         self._lanelet_ids = self._lanelet_ids.union(
-            set(
-                la.lanelet_id
-                for la in self._network.lanelets
-                if traffic_light_id in la.traffic_lights
-            )
+            self._index.lanelets_referencing_light(traffic_light_id)
         )
 
     def _extract_refs_from_intersection(self, intersection_id: int):
@@ -276,23 +482,14 @@ class SubMap:
 
         :param shape: Shape.
         """
-        shape.buffer(self._buffer_size, join_style=2)
+        shape = shape.buffer(self._buffer_size, join_style=2)
 
         if not shape.is_valid:
-            make_valid(shape)
+            shape = make_valid(shape)
             if not shape.is_valid:
                 shape = shape.convex_hull
 
-        for lanelet in self._network.lanelets:
-            if lanelet.polygon.shapely_object.intersects(shape):
-                self._lanelet_ids.add(lanelet.lanelet_id)
-
-        for traffic_sign in self._network.traffic_signs:
-            pos = traffic_sign.position
-            if shape.contains(Point(pos[0], pos[1])):
-                self._traffic_sign_ids.add(traffic_sign.traffic_sign_id)
-
-        for traffic_light in self._network.traffic_lights:
-            pos = traffic_light.position
-            if shape.contains(Point(pos[0], pos[1])):
-                self._traffic_light_ids.add(traffic_light.traffic_light_id)
+        lanelet_ids, traffic_sign_ids, traffic_light_ids = self._index.query(shape)
+        self._lanelet_ids |= lanelet_ids
+        self._traffic_sign_ids |= traffic_sign_ids
+        self._traffic_light_ids |= traffic_light_ids
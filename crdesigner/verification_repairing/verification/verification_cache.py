@@ -0,0 +1,363 @@
+import dataclasses
+import enum
+import hashlib
+import os
+import sqlite3
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from shapely.geometry.base import BaseGeometry
+
+from crdesigner.verification_repairing.config import VerificationParams
+from crdesigner.verification_repairing.verification.hol.expression_tree.binary.binary import (
+    Binary,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.expression import (
+    Expression,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.nary.nary import (
+    Nary,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.unary.first_order.first_order import (
+    FirstOrder,
+)
+from crdesigner.verification_repairing.verification.hol.expression_tree.unary.unary import (
+    Unary,
+)
+from crdesigner.verification_repairing.verification.hol.formula import Formula
+
+# Increase if the canonical serialisation or the semantics of the stored results change
+CACHE_VERSION = 1
+
+DIGEST_SIZE = 16
+
+# Attributes which are derived from other attributes or do not belong to the map
+_IGNORED_ATTRIBUTES = {
+    "_polygon",
+    "_distance",
+    "_inner_distance",
+    "_dynamic_obstacles_on_lanelet",
+    "_static_obstacles_on_lanelet",
+}
+
+# Verification parameters which do not influence the result of a formula
+_IGNORED_PARAMS = {
+    "formulas",
+    "excluded_formulas",
+    "formula_manager",
+    "max_iterations",
+    "num_threads",
+    "cache_path",
+    "profile",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    digest BLOB UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_elements (
+    snapshot INTEGER NOT NULL,
+    element BLOB NOT NULL,
+    PRIMARY KEY (snapshot, element)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS snapshot_elements_element ON snapshot_elements (element);
+CREATE TABLE IF NOT EXISTS results (
+    snapshot INTEGER NOT NULL,
+    formula BLOB NOT NULL,
+    failures BLOB NOT NULL,
+    PRIMARY KEY (snapshot, formula)
+) WITHOUT ROWID;
+"""
+
+
+def _canonical(obj: Any) -> bytes:
+    """
+    Serialises an object independently of the memory layout, the order of sets, and the order of attributes.
+
+    :param obj: Object, e.g., a lanelet or one of its attributes.
+    :return: Canonical serialisation.
+    """
+    if obj is None:
+        return b"N"
+    if isinstance(obj, bool):
+        return b"B1" if obj else b"B0"
+    if isinstance(obj, enum.Enum):
+        return b"E" + type(obj).__qualname__.encode() + _canonical(obj.value)
+    if isinstance(obj, (int, np.integer)):
+        return b"I%d;" % int(obj)
+    if isinstance(obj, (float, np.floating)):
+        return b"F" + float(obj).hex().encode() + b";"
+    if isinstance(obj, str):
+        data = obj.encode()
+        return b"S%d:" % len(data) + data
+    if isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        return b"A" + array.dtype.str.encode() + repr(array.shape).encode() + array.tobytes()
+    if isinstance(obj, (list, tuple)):
+        return b"L%d:" % len(obj) + b"".join(_canonical(item) for item in obj)
+    if isinstance(obj, (set, frozenset)):
+        return b"T%d:" % len(obj) + b"".join(sorted(_canonical(item) for item in obj))
+    if isinstance(obj, dict):
+        items = sorted(_canonical(key) + _canonical(val) for key, val in obj.items())
+        return b"D%d:" % len(items) + b"".join(items)
+    if isinstance(obj, BaseGeometry):
+        return b"G"
+    if hasattr(obj, "__dict__"):
+        attributes = sorted(
+            (name, val) for name, val in vars(obj).items() if name not in _IGNORED_ATTRIBUTES
+        )
+        return (
+            b"O"
+            + type(obj).__qualname__.encode()
+            + b"".join(_canonical(name) + _canonical(val) for name, val in attributes)
+        )
+    return b"R" + repr(obj).encode()
+
+
+def element_digest(element: Any) -> bytes:
+    """
+    Computes the content hash of a map element, e.g., a lanelet, traffic sign, traffic light, or intersection.
+    Two elements have the same digest if and only if they have the same content including their references.
+
+    :param element: Map element.
+    :return: Digest.
+    """
+    return hashlib.blake2b(_canonical(element), digest_size=DIGEST_SIZE).digest()
+
+
+def params_digest(config: VerificationParams) -> bytes:
+    """
+    Computes the hash of the verification parameters which influence the results of formulas.
+
+    :param config: Verification parameters.
+    :return: Digest.
+    """
+    values = {
+        f.name: getattr(config, f.name)
+        for f in dataclasses.fields(config)
+        if f.name not in _IGNORED_PARAMS
+    }
+    return hashlib.blake2b(_canonical(values), digest_size=DIGEST_SIZE).digest()
+
+
+def is_quantified(expr: Expression) -> bool:
+    """
+    Checks whether an expression contains a quantifier. The value of such an expression can depend on elements
+    which are not part of the grounding of the free variables.
+
+    :param expr: Expression.
+    :return: Boolean indicating whether the expression contains a quantifier.
+    """
+    if isinstance(expr, FirstOrder):
+        return True
+    if isinstance(expr, Unary):
+        return is_quantified(expr.expr)
+    if isinstance(expr, Binary):
+        return is_quantified(expr.left_expr) or is_quantified(expr.right_expr)
+    if isinstance(expr, Nary):
+        return any(is_quantified(e) for e in expr.exprs)
+    return False
+
+
+@dataclasses.dataclass
+class CachedResult:
+    """Dataclass storing the result of a formula for a previously verified snapshot of a map."""
+
+    # Digests of the elements which are contained in the previous and in the current snapshot
+    unchanged: FrozenSet[bytes]
+    # Grounding keys of all violations of the formula in the previous snapshot
+    failures: FrozenSet[bytes]
+
+
+class VerificationCache:
+    """
+    Content-addressed cache for the results of formulas. The results are stored in a local SQLite database.
+
+    Each verified map is stored as a snapshot, i.e., the set of the content hashes of its elements. For each snapshot
+    and formula, the groundings violating the formula are stored. If a formula is checked again, the stored
+    snapshot sharing the most elements with the current map is selected. A grounding consisting only of elements
+    which are contained in both snapshots is answered from the cache. Formulas with quantifiers can depend on all
+    elements of the map and are therefore only answered from the cache if the map is unchanged.
+    """
+
+    def __init__(self, path: str, config: VerificationParams):
+        """
+        Constructor.
+
+        :param path: Path to the SQLite database. The file is created if it does not exist.
+        :param config: Verification parameters.
+        """
+        self._path = path
+        self._params_digest = params_digest(config)
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._snapshot_id: Optional[int] = None
+        self._digests: Dict[int, bytes] = {}
+
+        self.hits = 0
+        self.lookups = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of groundings which were answered from the cache."""
+        return self.hits / self.lookups if self.lookups > 0 else 0.0
+
+    def open(self, elements: Iterable[Any]):
+        """
+        Opens the database and registers the current snapshot of the map.
+
+        :param elements: All elements of the map.
+        """
+        self._digests = {id(element): element_digest(element) for element in elements}
+        digests = sorted(set(self._digests.values()))
+
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self._path, timeout=60.0)
+        self._connection.executescript(_SCHEMA)
+        self._connection.execute("CREATE TEMP TABLE current (element BLOB PRIMARY KEY)")
+        self._connection.executemany("INSERT INTO current VALUES (?)", ((d,) for d in digests))
+
+        snapshot_digest = hashlib.blake2b(b"".join(digests), digest_size=DIGEST_SIZE).digest()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO snapshots (digest) VALUES (?)", (snapshot_digest,)
+            )
+            (self._snapshot_id,) = self._connection.execute(
+                "SELECT id FROM snapshots WHERE digest = ?", (snapshot_digest,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR IGNORE INTO snapshot_elements SELECT ?, element FROM current",
+                (self._snapshot_id,),
+            )
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+        self._snapshot_id = None
+        self._digests = {}
+
+    def formula_key(self, formula: Formula) -> bytes:
+        """
+        Computes the key of a formula which considers its definition and the verification parameters.
+
+        :param formula: Formula.
+        :return: Key.
+        """
+        definition = f"{CACHE_VERSION}|{formula.formula_id}|{formula.to_string()}".encode()
+        return hashlib.blake2b(definition + self._params_digest, digest_size=DIGEST_SIZE).digest()
+
+    def grounding_key(self, combination: Tuple[Any, ...]) -> Optional[bytes]:
+        """
+        Computes the key of a grounding of the free variables of a formula.
+
+        :param combination: Values of the free variables.
+        :return: Key; none if a value is neither a map element nor a primitive value.
+        """
+        parts = []
+        for value in combination:
+            digest = self._digests.get(id(value))
+            if digest is not None:
+                parts.append(digest)
+            elif isinstance(value, (int, float, str, enum.Enum)) or value is None:
+                parts.append(_canonical(value))
+            else:
+                return None
+        return hashlib.blake2b(b"".join(parts), digest_size=DIGEST_SIZE).digest()
+
+    def is_unchanged(self, combination: Tuple[Any, ...], cached: CachedResult) -> bool:
+        """
+        Checks whether all map elements of a grounding are contained in the snapshot of the cached result.
+        The grounding must have a grounding key.
+
+        :param combination: Values of the free variables.
+        :param cached: Cached result.
+        :return: Boolean indicating whether the result of the grounding can be taken from the cache.
+        """
+        for value in combination:
+            digest = self._digests.get(id(value))
+            if digest is not None and digest not in cached.unchanged:
+                return False
+        return True
+
+    def load(self, formula: Formula) -> Optional[CachedResult]:
+        """
+        Loads the result of the formula for the most similar previously verified snapshot.
+
+        :param formula: Formula.
+        :return: Cached result; none if no suitable snapshot exists.
+        """
+        row = self._connection.execute(
+            "SELECT r.snapshot, r.failures, COUNT(*) AS overlap FROM results r "
+            "JOIN snapshot_elements e ON e.snapshot = r.snapshot "
+            "JOIN current c ON c.element = e.element "
+            "WHERE r.formula = ? GROUP BY r.snapshot ORDER BY overlap DESC, r.snapshot = ? DESC "
+            "LIMIT 1",
+            (self.formula_key(formula), self._snapshot_id),
+        ).fetchone()
+        if row is None:
+            return None
+        snapshot_id, failures, _ = row
+        if is_quantified(formula.expr) and snapshot_id != self._snapshot_id:
+            return None
+        unchanged = frozenset(
+            element
+            for (element,) in self._connection.execute(
+                "SELECT e.element FROM snapshot_elements e JOIN current c ON c.element = e.element "
+                "WHERE e.snapshot = ?",
+                (snapshot_id,),
+            )
+        )
+        return CachedResult(
+            unchanged=unchanged,
+            failures=frozenset(
+                failures[i : i + DIGEST_SIZE] for i in range(0, len(failures), DIGEST_SIZE)
+            ),
+        )
+
+    def store(self, formula: Formula, failures: Set[bytes]):
+        """
+        Stores the violations of a formula for the current snapshot.
+
+        :param formula: Formula.
+        :param failures: Grounding keys of all violations.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (self._snapshot_id, self.formula_key(formula), b"".join(sorted(failures))),
+            )
+
+    def clear(self):
+        """
+        Removes all stored results.
+        """
+        connection = sqlite3.connect(self._path)
+        with connection:
+            connection.executescript(_SCHEMA)
+            for table in ["results", "snapshot_elements", "snapshots"]:
+                connection.execute(f"DELETE FROM {table}")
+        connection.close()
+
+
+def collect_elements(domain_vals: Dict[str, Set[Any]]) -> List[Any]:
+    """
+    Collects all map elements contained in the domains of a model.
+
+    :param domain_vals: Values of domains.
+    :return: Map elements.
+    """
+    elements = {}
+    for values in domain_vals.values():
+        for value in values:
+            elements[id(value)] = value
+    return list(elements.values())
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from commonroad.scenario.lanelet import LaneletNetwork
 
@@ -12,6 +12,7 @@ from crdesigner.verification_repairing.verification.formula_ids import (
     TrafficLightFormulaID,
     TrafficSignFormulaID,
 )
+from crdesigner.verification_repairing.verification.profiling import FormulaProfiles
 from crdesigner.verification_repairing.verification.satisfaction import InvalidStates
 
 
@@ -21,6 +22,8 @@ class InvalidState:
 
     formula: FormulaID = LaneletFormulaID.UNIQUE_ID
     element_ids: List[int] = field(default_factory=list)
+    # complete locations of the invalid state, e.g., a lanelet and its predecessor; the first entries are element_ids
+    locations: List[Tuple[int, ...]] = field(default_factory=list)
 
 
 @dataclass
@@ -30,6 +33,15 @@ class MapVerificationResult:
     verification_time: float = 0.0
     repairing_time: float = 0.0
     invalid_states: List[InvalidState] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_lookups: int = 0
+    # profiles of the formulas; only recorded if profiling is enabled
+    formula_profiles: FormulaProfiles = field(default_factory=dict)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of groundings which were answered from the verification cache."""
+        return self.cache_hits / self.cache_lookups if self.cache_lookups > 0 else 0.0
 
 
 @dataclass
@@ -84,6 +96,22 @@ def extract_repairing_computation_times(
     return rep_times
 
 
+def extract_formula_profiles(verification_result: VerificationResult) -> Dict[str, FormulaProfiles]:
+    """
+    Extracts the profiles of the formulas for each map.
+
+    :param verification_result: Verification result.
+    :return: Profiles of formulas.
+    """
+    profiles = {}
+    for map_verification in verification_result.map_verifications:
+        profiles[map_verification.benchmark_id] = (
+            map_verification.map_verification_result.formula_profiles
+        )
+
+    return profiles
+
+
 def extract_benchmark_ids(verification_result: VerificationResult) -> List[str]:
     """
     Extracts benchmark IDs from all map verification s.
@@ -170,6 +198,9 @@ def update_map_verification(
     verification_time: float,
     repairing_time: float,
     invalid_states: InvalidStates,
+    cache_hits: int = 0,
+    cache_lookups: int = 0,
+    formula_profiles: Optional[FormulaProfiles] = None,
 ):
     """
     Updates a map verification .
@@ -178,9 +209,16 @@ def update_map_verification(
     :param verification_time: Computation time of verification .
     :param repairing_time: Computation time of repairing.
     :param invalid_states: Invalid states.
+    :param cache_hits: Number of groundings answered from the verification cache.
+    :param cache_lookups: Number of groundings looked up in the verification cache.
+    :param formula_profiles: Profiles of the formulas.
     """
     map_verification_result = MapVerificationResult(
-        verification_time=verification_time, repairing_time=repairing_time
+        verification_time=verification_time,
+        repairing_time=repairing_time,
+        cache_hits=cache_hits,
+        cache_lookups=cache_lookups,
+        formula_profiles=formula_profiles if formula_profiles is not None else {},
     )
 
     for formula, locations in invalid_states.items():
@@ -188,7 +226,7 @@ def update_map_verification(
         for location in locations:
             element_ids.append(location[0])
         map_verification_result.invalid_states.append(
-            InvalidState(formula=formula, element_ids=element_ids)
+            InvalidState(formula=formula, element_ids=element_ids, locations=list(locations))
         )
 
     map_verification.map_verification_result = map_verification_result
@@ -0,0 +1,106 @@
+"""
+Benchmark of the verification, the conversion to Lanelet2 and the rendering of synthetic maps of increasing size.
+
+The sizes are given as exponents of ten lanelets by the environment variable CRDESIGNER_BENCHMARK_SCALES, e.g., "2,3,4,5"
+for maps with 10², 10³, 10⁴ and 10⁵ lanelets. By default, only the smallest map is used. Setting
+CRDESIGNER_BENCHMARK_OUTPUT stores the measured times as JSON file at the given path. The benchmark is deselected by
+default and run with "pytest -m benchmark".
+"""
+
+import json
+import os
+import time
+import unittest
+import warnings
+from typing import Dict
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+
+from commonroad.visualization.mp_renderer import MPRenderer  # noqa: E402
+
+from crdesigner.common.config.gui_config import gui_config  # noqa: E402
+from crdesigner.common.synthetic_map import (  # noqa: E402
+    SyntheticMapConfig,
+    SyntheticMapGenerator,
+)
+from crdesigner.map_conversion.lanelet2.cr2lanelet import CR2LaneletConverter  # noqa: E402
+from crdesigner.verification_repairing.config import MapVerParams  # noqa: E402
+from crdesigner.verification_repairing.verification.formula_ids import (  # noqa: E402
+    extract_formula_ids,
+)
+from crdesigner.verification_repairing.verification.map_verifier import (  # noqa: E402
+    MapVerifier,
+)
+
+warnings.filterwarnings("ignore")
+
+pytestmark = pytest.mark.benchmark
+
+SCALES = [int(scale) for scale in os.environ.get("CRDESIGNER_BENCHMARK_SCALES", "2").split(",")]
+OUTPUT = os.environ.get("CRDESIGNER_BENCHMARK_OUTPUT")
+
+# injected gaps and flipped boundaries per 100 lanelets; dangling references are not injected, since the conversion to
+# Lanelet2 requires all referenced lanelets to exist
+DEFECT_RATE = 1
+
+
+def measure(num_lanelets: int) -> Dict[str, float]:
+    """
+    Generates a synthetic map and measures the time of each step.
+
+    :param num_lanelets: Minimum number of lanelets of the map.
+    :return: Number of lanelets and time of each step.
+    """
+    num_defects = max(1, num_lanelets * DEFECT_RATE // 100)
+    config = SyntheticMapConfig.for_lanelet_count(
+        num_lanelets,
+        road_probability=0.9,
+        traffic_lights=True,
+        num_gaps=num_defects,
+        num_flipped_boundaries=num_defects,
+    )
+    measurements = {}
+
+    start = time.perf_counter()
+    scenario = SyntheticMapGenerator(config).generate()
+    measurements["generation"] = time.perf_counter() - start
+    measurements["lanelets"] = len(scenario.lanelet_network.lanelets)
+
+    verification_config = MapVerParams()
+    verification_config.verification.formulas = extract_formula_ids()
+    verification_config.partitioning.partitioned = True
+    start = time.perf_counter()
+    invalid_states = MapVerifier(scenario.lanelet_network, verification_config).verify()
+    measurements["verification"] = time.perf_counter() - start
+    measurements["invalid_states"] = sum(len(states) for states in invalid_states.values())
+
+    start = time.perf_counter()
+    CR2LaneletConverter()(scenario)
+    measurements["conversion"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    renderer = MPRenderer()
+    scenario.draw(renderer, draw_params=gui_config.get_draw_params())
+    renderer.render()
+    measurements["rendering"] = time.perf_counter() - start
+    matplotlib.pyplot.close("all")
+    return measurements
+
+
+class TestScaleBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.measurements = {10**scale: measure(10**scale) for scale in SCALES}
+        if OUTPUT is not None:
+            with open(OUTPUT, "w") as file:
+                json.dump(cls.measurements, file, indent=1)
+
+    def test_maps(self):
+        for num_lanelets, measurement in self.measurements.items():
+            with self.subTest(lanelets=num_lanelets):
+                self.assertGreaterEqual(measurement["lanelets"], 0.9 * num_lanelets)
+                # each map contains injected defects, which must be found by the verification
+                self.assertGreater(measurement["invalid_states"], 0)
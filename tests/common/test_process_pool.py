@@ -0,0 +1,25 @@
+import os
+import threading
+import unittest
+
+from crdesigner.common import process_pool
+from crdesigner.common.process_pool import imap_forked
+
+
+class TestProcessPool(unittest.TestCase):
+    def test_sequential(self):
+        results = imap_forked(lambda data, task: (data, task, os.getpid()), "data", [1, 2, 3])
+        self.assertEqual([("data", i, os.getpid()) for i in (1, 2, 3)], list(results))
+
+    def test_forked(self):
+        # neither the function nor the data are picklable, since they are inherited by the workers
+        lock = threading.Lock()
+        results = list(
+            imap_forked(
+                lambda data, task: (data is lock, task, os.getpid()), lock, list(range(8)), 2
+            )
+        )
+        self.assertEqual([(True, i) for i in range(8)], [result[:2] for result in results])
+        if "fork" in process_pool.multiprocessing.get_all_start_methods():
+            self.assertNotIn(os.getpid(), {result[2] for result in results})
+        self.assertIsNone(process_pool._job)
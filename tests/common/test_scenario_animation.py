@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from commonroad.visualization.mp_renderer import MPRenderer
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from crdesigner.common import scenario_animation
+from crdesigner.common.file_reader import CRDesignerFileReader
+from crdesigner.common.scenario_animation import (
+    BlittedAnimation,
+    FrameRenderer,
+    ScenarioAnimation,
+    final_time_step,
+    render_frames,
+    save_scenario_video,
+    scenario_extent,
+)
+
+SCENARIO_PATH = (
+    Path(__file__).parent.parent / "map_verification/test_maps/DEU_TrafficLightTest-1.xml"
+)
+
+
+class TestScenarioAnimation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scenario, self.planning_problem_set = CRDesignerFileReader(SCENARIO_PATH).open()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_final_time_step(self):
+        self.assertEqual(200, final_time_step(self.scenario))
+
+    def test_frames(self):
+        renderer = FrameRenderer(self.scenario, self.planning_problem_set, width=320)
+        first = renderer.render(0)
+        self.assertEqual(320, first.shape[1])
+        self.assertEqual(0, first.shape[0] % 2)
+        num_artists = len(renderer.ax.get_children())
+        num_callbacks = len(renderer.ax.callbacks.callbacks["xlim_changed"])
+
+        # the obstacles move and the artists of the previous frames are removed
+        frames = [renderer.render(time_step) for time_step in range(1, 30)]
+        self.assertFalse(np.array_equal(first, frames[-1]))
+        np.testing.assert_array_equal(first, renderer.render(0))
+        self.assertEqual(num_artists, len(renderer.ax.get_children()))
+        self.assertEqual(num_callbacks, len(renderer.ax.callbacks.callbacks["xlim_changed"]))
+
+    def test_occupancy_collection(self):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot()
+        animation = ScenarioAnimation(self.scenario, MPRenderer(ax=ax), max_detailed_obstacles=0)
+        self.assertFalse(animation.detailed_obstacles)
+        animation.draw_background()
+
+        collection = animation.draw_frame(10)[-1]
+        occupancies = [
+            obstacle.occupancy_at_time(10)
+            for obstacle in self.scenario.dynamic_obstacles
+            if obstacle.occupancy_at_time(10) is not None
+        ]
+        self.assertEqual(len(occupancies), len(collection.get_paths()))
+        vertices = occupancies[0].shape.vertices
+        np.testing.assert_allclose(vertices, collection.get_paths()[0].vertices[: len(vertices)])
+        # the collection is updated in place
+        self.assertIs(collection, animation.draw_frame(20)[-1])
+        self.assertIs(ax, collection.axes)
+
+    def test_parallel_rendering(self):
+        time_steps = list(range(0, 45, 2))
+        sequential = list(render_frames(self.scenario, time_steps, width=160))
+        parallel = list(render_frames(self.scenario, time_steps, num_processes=2, width=160))
+        self.assertEqual(len(time_steps), len(parallel))
+        for frame_sequential, frame_parallel in zip(sequential, parallel):
+            np.testing.assert_array_equal(frame_sequential, frame_parallel)
+
+    def test_save_gif(self):
+        path = save_scenario_video(
+            self.scenario,
+            Path(self.directory.name) / "scenario.gif",
+            self.planning_problem_set,
+            time_end=30,
+            width=160,
+            num_processes=2,
+        )
+        with Image.open(path) as image:
+            self.assertEqual(31, image.n_frames)
+            self.assertEqual(160, image.width)
+
+    def test_missing_ffmpeg(self):
+        with mock.patch.object(scenario_animation.shutil, "which", return_value=None):
+            with self.assertRaises(RuntimeError):
+                save_scenario_video(
+                    self.scenario, Path(self.directory.name) / "scenario", time_end=5, width=160
+                )
+
+    def test_blitted_animation(self):
+        figure = Figure(figsize=(3, 3))
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot()
+        animation = ScenarioAnimation(self.scenario, MPRenderer(ax=ax))
+
+        def draw_background():
+            animation.draw_background()
+            x_min, x_max, y_min, y_max = scenario_extent(self.scenario)
+            ax.set_xlim(x_min, x_max)
+            ax.set_ylim(y_min, y_max)
+            return animation.draw_frame(0)
+
+        blitted = BlittedAnimation(figure, animation.draw_frame, draw_background, interval=100)
+        # the animated obstacles are not part of a full redraw, but drawn onto the cached image afterwards
+        figure.canvas.draw()
+        frame = np.asarray(figure.canvas.buffer_rgba()).copy()
+        for artist in animation.draw_frame(0):
+            self.assertTrue(artist.get_animated())
+        for _ in range(3):
+            blitted.draw_next_frame()
+        self.assertEqual(2, animation.draw_params.time_begin)
+        self.assertFalse(np.array_equal(frame, np.asarray(figure.canvas.buffer_rgba())))
+        blitted.stop()
@@ -0,0 +1,114 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+from shapely.geometry import box
+
+from crdesigner.common.file_reader import CRDesignerFileReader
+from crdesigner.common.scenario_filter import ScenarioFilter
+
+SCENARIO_PATH = (
+    Path(__file__).parent.parent / "map_verification/test_maps/DEU_TrafficLightTest-1.xml"
+)
+PLANNING_PROBLEM_PATH = (
+    Path(__file__).parent.parent / "map_verification/test_maps/USA_US101-9_1_T-1.xml"
+)
+
+
+class TestScenarioFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reader = CRDesignerFileReader(SCENARIO_PATH)
+        self.scenario, self.planning_problem_set = self.reader.open()
+
+    def test_bounding_box(self):
+        bounding_box = (40.0, 40.0, 60.0, 70.0)
+        scenario, _ = self.reader.open(bounding_box=bounding_box)
+        window = box(*bounding_box)
+        expected = {
+            lanelet.lanelet_id
+            for lanelet in self.scenario.lanelet_network.lanelets
+            if lanelet.polygon.shapely_object.intersects(window)
+        }
+        lanelet_ids = {lanelet.lanelet_id for lanelet in scenario.lanelet_network.lanelets}
+        self.assertEqual(expected, lanelet_ids)
+        self.assertLess(len(lanelet_ids), len(self.scenario.lanelet_network.lanelets))
+
+        # references to lanelets outside of the window are removed
+        for lanelet in scenario.lanelet_network.lanelets:
+            self.assertTrue(set(lanelet.predecessor) <= lanelet_ids)
+            self.assertTrue(set(lanelet.successor) <= lanelet_ids)
+            self.assertTrue(lanelet.adj_left in lanelet_ids | {None})
+            self.assertTrue(lanelet.adj_right in lanelet_ids | {None})
+        self.assertEqual(1, len(scenario.lanelet_network.intersections))
+        for incoming in scenario.lanelet_network.intersections[0].incomings:
+            self.assertTrue(incoming.incoming_lanelets <= lanelet_ids)
+            self.assertTrue(incoming.successors_straight <= lanelet_ids)
+        self.assertLess(
+            len(scenario.lanelet_network.intersections[0].incomings),
+            len(self.scenario.lanelet_network.intersections[0].incomings),
+        )
+
+        # the referenced traffic lights are kept
+        referenced = set().union(
+            *(lanelet.traffic_lights for lanelet in scenario.lanelet_network.lanelets)
+        )
+        self.assertEqual(
+            referenced,
+            {light.traffic_light_id for light in scenario.lanelet_network.traffic_lights},
+        )
+
+        # only the obstacles passing the window are kept
+        self.assertLess(0, len(scenario.obstacles))
+        self.assertLess(len(scenario.obstacles), len(self.scenario.obstacles))
+        for obstacle in self.scenario.obstacles:
+            positions = np.array(
+                [obstacle.initial_state.position]
+                + [state.position for state in obstacle.prediction.trajectory.state_list]
+            )
+            passes = np.any(
+                np.all((positions >= (40.0, 40.0)) & (positions <= (60.0, 70.0)), axis=1)
+            )
+            if passes:
+                self.assertIsNotNone(scenario.obstacle_by_id(obstacle.obstacle_id))
+
+    def test_window_inside_lanelet(self):
+        lanelet = self.scenario.lanelet_network.lanelets[0]
+        x, y = lanelet.polygon.shapely_object.representative_point().coords[0]
+        lanelet_network = self.reader.open_lanelet_network(
+            bounding_box=(x - 0.01, y - 0.01, x + 0.01, y + 0.01)
+        )
+        self.assertIn(lanelet.lanelet_id, [la.lanelet_id for la in lanelet_network.lanelets])
+
+    def test_element_ids(self):
+        obstacle = self.scenario.dynamic_obstacles[0]
+        scenario, _ = self.reader.open(element_ids={100, obstacle.obstacle_id})
+        self.assertEqual(
+            [100], [lanelet.lanelet_id for lanelet in scenario.lanelet_network.lanelets]
+        )
+        self.assertEqual([], scenario.lanelet_network.lanelets[0].successor)
+        self.assertEqual(obstacle, scenario.obstacle_by_id(obstacle.obstacle_id))
+        self.assertEqual(1, len(scenario.obstacles))
+
+    def test_complete_window(self):
+        scenario, _ = self.reader.open(bounding_box=(-1e4, -1e4, 1e4, 1e4))
+        self.assertEqual(self.scenario.lanelet_network, scenario.lanelet_network)
+        self.assertEqual(len(self.scenario.obstacles), len(scenario.obstacles))
+
+    def test_planning_problems(self):
+        reader = CRDesignerFileReader(PLANNING_PROBLEM_PATH)
+        _, planning_problem_set = reader.open()
+        initial_position = next(
+            iter(planning_problem_set.planning_problem_dict.values())
+        ).initial_state.position
+        x, y = initial_position
+        _, filtered = reader.open(bounding_box=(x - 1.0, y - 1.0, x + 1.0, y + 1.0))
+        self.assertEqual(
+            planning_problem_set.planning_problem_dict.keys(),
+            filtered.planning_problem_dict.keys(),
+        )
+        _, filtered = reader.open(bounding_box=(x + 1e4, y + 1e4, x + 1e4 + 1.0, y + 1e4 + 1.0))
+        self.assertEqual({}, filtered.planning_problem_dict)
+
+    def test_missing_selection(self):
+        with self.assertRaises(ValueError):
+            ScenarioFilter()
@@ -0,0 +1,149 @@
+import unittest
+
+from commonroad.scenario.traffic_light import TrafficLightDirection, TrafficLightState
+
+from crdesigner.common.synthetic_map import SyntheticMapConfig, SyntheticMapGenerator
+from crdesigner.common.traffic_light_program import (
+    TrafficLightTimings,
+    _ConflictChecker,
+    create_traffic_light_program,
+    find_intersection,
+)
+
+
+class TestTrafficLightProgram(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scenario = SyntheticMapGenerator(
+            SyntheticMapConfig(rows=3, columns=3, traffic_lights=True)
+        ).generate()
+        self.network = self.scenario.lanelet_network
+        self.checker = _ConflictChecker(self.network)
+
+    def green_incomings(self, intersection, time_step: int, direction: TrafficLightDirection):
+        green = []
+        for incoming in intersection.incomings:
+            lanelet = self.network.find_lanelet_by_id(next(iter(incoming.incoming_lanelets)))
+            for traffic_light_id in lanelet.traffic_lights:
+                traffic_light = self.network.find_traffic_light_by_id(traffic_light_id)
+                if (
+                    traffic_light.direction in (direction, TrafficLightDirection.ALL)
+                    and traffic_light.get_state_at_time_step(time_step) == TrafficLightState.GREEN
+                ):
+                    green.append(incoming)
+        return green
+
+    def assert_no_conflicting_green(self, intersection, cycle_length: int):
+        for time_step in range(cycle_length):
+            green = self.green_incomings(
+                intersection, time_step, TrafficLightDirection.STRAIGHT_RIGHT
+            )
+            for incoming in green:
+                for other in green:
+                    if incoming is not other:
+                        self.assertFalse(
+                            self.checker.conflict(
+                                self.checker.main_movements(incoming),
+                                self.checker.main_movements(other),
+                            )
+                        )
+
+    def test_four_way_intersection(self):
+        intersection = next(
+            intersection
+            for intersection in self.network.intersections
+            if len(intersection.incomings) == 4
+        )
+        timings = TrafficLightTimings(green=100, yellow=10, red_yellow=5, all_red=5)
+        traffic_lights = create_traffic_light_program(self.network, intersection, timings)
+
+        # one traffic light per incoming, which replaces the existing traffic light
+        self.assertEqual(4, len(traffic_lights))
+        for incoming in intersection.incomings:
+            for lanelet_id in incoming.incoming_lanelets:
+                self.assertEqual(1, len(self.network.find_lanelet_by_id(lanelet_id).traffic_lights))
+
+        # the opposite incomings share a green phase, so that the cycle has two signal groups
+        cycle_length = 2 * (5 + 100 + 10 + 5)
+        for traffic_light in traffic_lights:
+            cycle = traffic_light.traffic_light_cycle
+            self.assertEqual(
+                cycle_length, sum(element.duration for element in cycle.cycle_elements)
+            )
+        self.assert_no_conflicting_green(intersection, cycle_length)
+        self.assertEqual(
+            2, len(self.green_incomings(intersection, 10, TrafficLightDirection.STRAIGHT_RIGHT))
+        )
+        # all incomings are red during the all-red time
+        self.assertEqual(
+            [], self.green_incomings(intersection, 118, TrafficLightDirection.STRAIGHT_RIGHT)
+        )
+
+    def test_min_red(self):
+        intersection = next(
+            intersection
+            for intersection in self.network.intersections
+            if len(intersection.incomings) == 4
+        )
+        timings = TrafficLightTimings(green=100, yellow=10, red_yellow=5, all_red=5, min_red=200)
+        traffic_lights = create_traffic_light_program(self.network, intersection, timings)
+
+        # the all-red time of both signal groups is extended from 5 to 43 time steps
+        cycle_length = 2 * (5 + 100 + 10 + 43)
+        for traffic_light in traffic_lights:
+            states = [
+                traffic_light.get_state_at_time_step(time_step)
+                for time_step in range(2 * cycle_length)
+            ]
+            self.assertEqual(states[:cycle_length], states[cycle_length:])
+            longest_red, red = 0, 0
+            for state in states:
+                red = red + 1 if state == TrafficLightState.RED else 0
+                longest_red = max(longest_red, red)
+            self.assertGreaterEqual(longest_red, 200)
+        self.assert_no_conflicting_green(intersection, cycle_length)
+
+    def test_protected_left_turns(self):
+        intersection = next(
+            intersection
+            for intersection in self.network.intersections
+            if len(intersection.incomings) == 4
+        )
+        timings = TrafficLightTimings(green=100, yellow=10, red_yellow=5, all_red=5, left_green=20)
+        traffic_lights = create_traffic_light_program(self.network, intersection, timings)
+
+        self.assertEqual(8, len(traffic_lights))
+        cycle_length = 2 * (5 + 20 + 10 + 5) + 2 * (5 + 100 + 10 + 5)
+        self.assert_no_conflicting_green(intersection, cycle_length)
+        for time_step in range(cycle_length):
+            # left turns never have green together with the straight movements
+            left = self.green_incomings(intersection, time_step, TrafficLightDirection.LEFT)
+            straight = self.green_incomings(
+                intersection, time_step, TrafficLightDirection.STRAIGHT_RIGHT
+            )
+            self.assertFalse(left and straight)
+
+    def test_find_intersection(self):
+        intersection, incoming, incoming_id = next(
+            (intersection, incoming, lanelet_id)
+            for intersection in self.network.intersections
+            for incoming in intersection.incomings
+            for lanelet_id in incoming.incoming_lanelets
+            if self.network.find_lanelet_by_id(lanelet_id).predecessor
+        )
+        predecessor_id = next(iter(self.network.find_lanelet_by_id(incoming_id).predecessor))
+        movement_id = next(iter(incoming.successors_left | incoming.successors_straight))
+
+        self.assertIs(intersection, find_intersection(self.network, incoming_id))
+        self.assertIs(intersection, find_intersection(self.network, predecessor_id))
+        self.assertIs(intersection, find_intersection(self.network, movement_id))
+
+    def test_unique_ids(self):
+        existing_ids = {lanelet.lanelet_id for lanelet in self.network.lanelets}
+        ids = []
+        for intersection in self.network.intersections:
+            traffic_lights = create_traffic_light_program(
+                self.network, intersection, id_generator=self.scenario.generate_object_id
+            )
+            ids += [traffic_light.traffic_light_id for traffic_light in traffic_lights]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertFalse(existing_ids & set(ids))
@@ -0,0 +1,155 @@
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from unittest import mock
+from urllib.error import URLError
+
+import numpy as np
+from PIL import Image
+
+import crdesigner.ui.gui.utilities.aerial_data as aerial_data
+from crdesigner.common.config.osm_config import osm_config
+
+
+def _encoded_tile(color) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (aerial_data.IMAGE_RESOLUTION, aerial_data.IMAGE_RESOLUTION), color).save(
+        buffer, "PNG"
+    )
+    return buffer.getvalue()
+
+
+class _TileHandler(BaseHTTPRequestHandler):
+    """
+    Serves a uniformly colored tile for every quadkey, failing the first request of each quadkey.
+    Tiles below /other/ have a different color, so that they act as a second tile server.
+    """
+
+    tile = _encoded_tile((10, 200, 30))
+    other_tile = _encoded_tile((200, 10, 30))
+    requests = []
+    failed = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        quadkey = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.requests.append(quadkey)
+            fail = quadkey.startswith("fail") or self.path not in self.failed
+            self.failed.add(self.path)
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+        tile = self.other_tile if self.path.startswith("/other/") else self.tile
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(tile)))
+        self.end_headers()
+        self.wfile.write(tile)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAerialData(unittest.TestCase):
+    def setUp(self) -> None:
+        _TileHandler.requests = []
+        _TileHandler.failed = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _TileHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url_template = f"http://127.0.0.1:{self.server.server_port}/tiles/{{quadkey}}"
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image_save_path = osm_config.IMAGE_SAVE_PATH
+        osm_config.IMAGE_SAVE_PATH = self.tmp_dir.name + "/"
+        self.backoff_base = aerial_data.DOWNLOAD_BACKOFF_BASE
+        aerial_data.DOWNLOAD_BACKOFF_BASE = 0.001
+        aerial_data.tile_cache.clear()
+        aerial_data.mosaic_cache.clear()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        osm_config.IMAGE_SAVE_PATH = self.image_save_path
+        aerial_data.DOWNLOAD_BACKOFF_BASE = self.backoff_base
+        aerial_data.tile_cache.clear()
+        aerial_data.mosaic_cache.clear()
+        self.tmp_dir.cleanup()
+
+    def test_get_tile_retries_and_caches(self):
+        tile = aerial_data.get_tile("0123", self.url_template)
+        self.assertEqual(
+            (aerial_data.IMAGE_RESOLUTION, aerial_data.IMAGE_RESOLUTION, 3), tile.shape
+        )
+        np.testing.assert_array_equal([10, 200, 30], tile[0, 0])
+        self.assertEqual(["0123", "0123"], _TileHandler.requests)
+
+        # served from memory, which distinguishes the tile servers
+        self.assertIs(tile, aerial_data.get_tile("0123", self.url_template))
+        self.assertIn((self.url_template, "0123"), aerial_data.tile_cache)
+        self.assertNotIn((None, "0123"), aerial_data.tile_cache)
+        self.assertEqual(2, len(_TileHandler.requests))
+
+        # served from disk
+        aerial_data.tile_cache.clear()
+        np.testing.assert_array_equal(tile, aerial_data.get_tile("0123", self.url_template))
+        self.assertEqual(2, len(_TileHandler.requests))
+
+        # the same quadkey of another server is neither served from memory nor from disk
+        other_template = self.url_template.replace("/tiles/", "/other/")
+        other = aerial_data.get_tile("0123", other_template)
+        np.testing.assert_array_equal([200, 10, 30], other[0, 0])
+        self.assertEqual(4, len(_TileHandler.requests))
+        aerial_data.tile_cache.clear()
+        np.testing.assert_array_equal(other, aerial_data.get_tile("0123", other_template))
+        np.testing.assert_array_equal(tile, aerial_data.get_tile("0123", self.url_template))
+        self.assertEqual(4, len(_TileHandler.requests))
+
+    def test_get_tile_gives_up(self):
+        self.assertIsNone(aerial_data.get_tile("fail", self.url_template, max_attempts=3))
+        self.assertEqual(3, len(_TileHandler.requests))
+
+    def test_bing_maps_api_unreachable(self):
+        with (
+            mock.patch.object(aerial_data, "bing_maps_api_response", None),
+            mock.patch.object(
+                aerial_data, "get_bin_maps_api_response", side_effect=URLError("offline")
+            ),
+        ):
+            self.assertIsNone(aerial_data.get_tile("0123"))
+            self.assertEqual([None, None], aerial_data.download_all_images(["0123", "0132"]))
+
+    def test_lru_cache_byte_limit(self):
+        cache = aerial_data.LRUCache(10)
+        cache.put("a", 1, 4)
+        cache.put("b", 2, 4)
+        cache.get("a")
+        cache.put("c", 3, 4)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(8, cache.current_bytes)
+        cache.put("d", 4, 11)
+        self.assertNotIn("d", cache)
+        self.assertEqual(2, len(cache))
+
+    def test_get_aerial_image_bing(self):
+        bounds = (48.2625, 11.6575, 48.2620, 11.6585)
+        image, extent = aerial_data.get_aerial_image_bing(bounds, 18, self.url_template)
+        keys, x_count, y_count, expected_extent = aerial_data.get_required_quadkeys(
+            bounds[1], bounds[2], bounds[3], bounds[0], 18
+        )
+        self.assertEqual(expected_extent, extent)
+        self.assertEqual(
+            (x_count * aerial_data.IMAGE_RESOLUTION, y_count * aerial_data.IMAGE_RESOLUTION, 3),
+            image.shape,
+        )
+        self.assertTrue(np.all(image == [10, 200, 30]))
+        self.assertEqual(2 * len(keys), len(_TileHandler.requests))
+
+        # stitched image is cached
+        cached_image, _ = aerial_data.get_aerial_image_bing(bounds, 18, self.url_template)
+        self.assertIs(image, cached_image)
+        self.assertEqual(2 * len(keys), len(_TileHandler.requests))
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from crdesigner.common.file_writer import CRDesignerFileWriter
+from crdesigner.ui.gui.autosaves.autosave_worker import AutosaveWorker
+
+
+class TestAutosaveWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.worker = AutosaveWorker(self.tmp_dir.name, versions=2)
+        self.scenario, self.pps = CommonRoadFileReader(
+            os.path.dirname(os.path.realpath(__file__))
+            + "/../map_conversion/test_maps/cr2odr/ZAM_Lanelet-1_1_T-1.xml"
+        ).open()
+
+    def tearDown(self) -> None:
+        self.worker.shutdown()
+        self.tmp_dir.cleanup()
+
+    def test_write_and_rotate(self):
+        self.worker.submit(self.scenario, self.pps)
+        self.assertTrue(self.worker.flush(30))
+        self.assertTrue(os.path.exists(self.worker.path))
+        self.assertFalse(os.path.exists(self.worker.path + ".tmp"))
+        scenario, _ = CommonRoadFileReader(self.worker.path).open()
+        self.assertEqual(
+            len(self.scenario.lanelet_network.lanelets), len(scenario.lanelet_network.lanelets)
+        )
+
+        # unchanged scenario is not written again
+        modified = os.path.getmtime(self.worker.path)
+        self.worker.submit(self.scenario, self.pps)
+        self.assertTrue(self.worker.flush(30))
+        self.assertEqual(modified, os.path.getmtime(self.worker.path))
+        self.assertFalse(os.path.exists(self.worker.version_paths()[1]))
+
+        self.scenario.remove_lanelet(self.scenario.lanelet_network.lanelets[0])
+        self.worker.submit(self.scenario, self.pps)
+        self.assertTrue(self.worker.flush(30))
+        latest, previous = self.worker.version_paths()
+        self.assertEqual(
+            len(self.scenario.lanelet_network.lanelets),
+            len(CommonRoadFileReader(latest).open()[0].lanelet_network.lanelets),
+        )
+        self.assertEqual(
+            len(self.scenario.lanelet_network.lanelets) + 1,
+            len(CommonRoadFileReader(previous).open()[0].lanelet_network.lanelets),
+        )
+
+        self.worker.discard()
+        self.assertFalse(any(os.path.exists(p) for p in self.worker.version_paths()))
+
+    def test_submit_does_not_keep_reference(self):
+        self.worker.submit(self.scenario)
+        # the snapshot is taken at submission, later changes are not saved
+        for lanelet in list(self.scenario.lanelet_network.lanelets):
+            self.scenario.remove_lanelet(lanelet)
+        self.assertTrue(self.worker.flush(30))
+        scenario, _ = CommonRoadFileReader(self.worker.path).open()
+        self.assertGreater(len(scenario.lanelet_network.lanelets), 0)
+
+    def test_verify_repair_setting(self):
+        write_to_file = CRDesignerFileWriter.write_to_file
+        with mock.patch.object(
+            CRDesignerFileWriter, "write_to_file", autospec=True, side_effect=write_to_file
+        ) as write:
+            self.worker.submit(self.scenario, self.pps)
+            self.assertTrue(self.worker.flush(30))
+            self.assertFalse(write.call_args.kwargs["verify_repair_scenario"])
+            # the same scenario is written again if the setting changed
+            self.worker.submit(self.scenario, self.pps, verify_repair_scenario=True)
+            self.assertTrue(self.worker.flush(60))
+            self.assertEqual(2, write.call_count)
+            self.assertTrue(write.call_args.kwargs["verify_repair_scenario"])
+
+    def test_failure_is_logged(self):
+        with (
+            mock.patch.object(
+                CRDesignerFileWriter, "write_to_file", side_effect=OSError("disk full")
+            ),
+            self.assertLogs(level="WARNING") as logs,
+        ):
+            self.worker.submit(self.scenario, self.pps)
+            self.assertTrue(self.worker.flush(30))
+        self.assertIn("Autosave failed", logs.output[0])
+        self.assertFalse(os.path.exists(self.worker.path))
@@ -0,0 +1,144 @@
+import numpy as np
+from commonroad.scenario.lanelet import Lanelet
+
+from crdesigner.common.config.gui_config import gui_config
+from crdesigner.common.synthetic_map import SyntheticMapConfig, generate_synthetic_map
+from crdesigner.ui.gui.controller.mwindow_controller import MWindowController
+from crdesigner.ui.gui.model.element_list_model import (
+    ElementFilterProxyModel,
+    ElementIdListModel,
+)
+from crdesigner.ui.gui.model.scenario_changes import ElementType
+from crdesigner.ui.gui.model.scenario_model import ScenarioModel
+from crdesigner.ui.gui.utilities.map_creator import MapCreator
+from crdesigner.ui.gui.utilities.toolbox_ui import ElementComboBox
+
+
+def create_model():
+    scenario_model = ScenarioModel()
+    scenario_model.set_scenario(generate_synthetic_map(SyntheticMapConfig(rows=1, columns=2)))
+    return scenario_model, ElementIdListModel(scenario_model, ElementType.LANELET)
+
+
+def test_incremental_updates():
+    scenario_model, model = create_model()
+    lanelet_ids = sorted(la.lanelet_id for la in scenario_model.get_lanelet_network().lanelets)
+    assert model.ids() == lanelet_ids
+    assert model.rowCount() == len(lanelet_ids) + 1
+    assert model.element_id(0) is None
+
+    inserted, removed, resets = [], [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    lanelet = MapCreator.create_straight(3, 10, 5, scenario_model.generate_object_id(), set())
+    scenario_model.add_lanelet(lanelet)
+    assert inserted == [model.rowCount() - 1]
+    assert model.row(lanelet.lanelet_id) == model.rowCount() - 1
+
+    scenario_model.remove_lanelet(lanelet_ids[0])
+    assert removed == [1]
+    assert model.row(lanelet_ids[0]) == -1
+    assert not resets
+
+    scenario_model.undo()
+    assert resets
+    assert model.ids() == sorted(lanelet_ids + [lanelet.lanelet_id])
+
+
+def test_filter():
+    scenario_model, model = create_model()
+    proxy = ElementFilterProxyModel(model)
+    lanelet_id = model.ids()[-1]
+
+    proxy.setFilterFixedString(str(lanelet_id))
+    texts = [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+    assert texts[0] == "None"
+    assert str(lanelet_id) in texts
+    assert all(str(lanelet_id) in text for text in texts[1:])
+
+    proxy.setFilterFixedString("")
+    x_min, y_min, x_max, y_max = model.bounds(lanelet_id)
+    proxy.set_view_limits([x_min, x_max, y_min, y_max])
+    visible = [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+    assert str(lanelet_id) in visible
+    assert len(visible) < model.rowCount()
+
+    proxy.set_view_limits([x_max + 1000, x_max + 1001, y_max + 1000, y_max + 1001])
+    assert proxy.rowCount() == 1
+    proxy.set_view_limits(None)
+    assert proxy.rowCount() == model.rowCount()
+
+
+def test_bounds_of_elevated_lanelet():
+    scenario_model, model = create_model()
+    straight = MapCreator.create_straight(3, 10, 5, scenario_model.generate_object_id(), set())
+    elevation = np.full((len(straight.center_vertices), 1), 7.0)
+    lanelet = Lanelet(
+        np.hstack((straight.left_vertices, elevation)),
+        np.hstack((straight.center_vertices, elevation)),
+        np.hstack((straight.right_vertices, elevation)),
+        straight.lanelet_id,
+    )
+    scenario_model.add_lanelet(lanelet)
+    x_min, y_min, x_max, y_max = model.bounds(lanelet.lanelet_id)
+    vertices = np.vstack((straight.left_vertices, straight.right_vertices))
+    assert (x_min, y_min) == tuple(vertices.min(axis=0))
+    assert (x_max, y_max) == tuple(vertices.max(axis=0))
+
+    proxy = ElementFilterProxyModel(model)
+    proxy.set_view_limits([x_min, x_max, y_min, y_max])
+    visible = [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+    assert str(lanelet.lanelet_id) in visible
+
+
+def test_element_combo_box(qtbot):
+    scenario_model, model = create_model()
+    combo = ElementComboBox()
+    qtbot.addWidget(combo)
+    combo.setModel(model)
+    lanelet_id = model.ids()[1]
+
+    combo.setCurrentText(str(lanelet_id))
+    assert combo.currentText() == str(lanelet_id)
+
+    # partially typed IDs are not reported as current text
+    combo.setEditText("12345")
+    assert combo.currentText() == str(lanelet_id)
+    combo.select_typed_item()
+    assert combo.lineEdit().text() == str(lanelet_id)
+
+    # the suggestions are filtered by the proxy model and optionally restricted to the elements in view
+    combo.lineEdit().textEdited.emit(str(lanelet_id))
+    assert combo.completer().model() is combo.completion_model
+    suggestions = combo.completion_model.rowCount()
+    assert 1 < suggestions < model.rowCount()
+    x_min, y_min, x_max, y_max = model.bounds(lanelet_id)
+    combo.set_view_limits([x_max + 1000, x_max + 1001, y_max + 1000, y_max + 1001])
+    assert combo.completion_model.rowCount() == suggestions
+    combo.lineEdit().textEdited.emit(str(lanelet_id))
+    assert combo.completion_model.rowCount() == 1
+    combo.set_view_limits(None)
+    combo.lineEdit().textEdited.emit("")
+    assert combo.completion_model.rowCount() == model.rowCount()
+
+
+def test_view_limits_of_canvas(qtbot):
+    window = MWindowController(test=True)
+    qtbot.addWidget(window.mwindow_ui)
+    canvas = window.animated_viewer_wrapper.cr_viewer.dynamic
+    combo = window.road_network_toolbox.road_network_toolbox_ui.selected_lanelet_update
+    search_in_view = gui_config.SEARCH_ELEMENTS_IN_VIEW
+    try:
+        gui_config.SEARCH_ELEMENTS_IN_VIEW = True
+        canvas.set_limits([10.0, 20.0, 30.0, 40.0])
+        canvas.draw()
+        assert window.road_network_toolbox.view_limits == canvas.get_limits()
+        assert combo._view_limits == canvas.get_limits()
+
+        gui_config.SEARCH_ELEMENTS_IN_VIEW = False
+        window.road_network_toolbox.update_view_limits()
+        assert combo._view_limits is None
+    finally:
+        gui_config.SEARCH_ELEMENTS_IN_VIEW = search_in_view
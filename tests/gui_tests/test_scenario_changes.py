@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+from commonroad.scenario.traffic_sign import (
+    TrafficSign,
+    TrafficSignElement,
+    TrafficSignIDZamunda,
+)
+
+from crdesigner.common.synthetic_map import SyntheticMapConfig, generate_synthetic_map
+from crdesigner.ui.gui.model.scenario_changes import ChangeSet, ChangeType, ElementType
+from crdesigner.ui.gui.model.scenario_model import ScenarioModel
+from crdesigner.ui.gui.utilities.map_creator import MapCreator
+
+
+class TestChangeSet(unittest.TestCase):
+    def test_merge(self):
+        changes = ChangeSet()
+        changes.record(ElementType.LANELET, ChangeType.ADDED, [1, 2])
+        changes.record(ElementType.LANELET, ChangeType.REMOVED, [2, 3])
+        changes.record(ElementType.LANELET, ChangeType.MODIFIED, [1])
+        later = ChangeSet()
+        later.record(ElementType.LANELET, ChangeType.ADDED, [3])
+        changes.merge(later)
+
+        # an added and removed lanelet is not reported, a removed and added lanelet is modified
+        self.assertEqual({1}, changes.ids(ElementType.LANELET, ChangeType.ADDED))
+        self.assertEqual({3}, changes.ids(ElementType.LANELET, ChangeType.MODIFIED))
+        self.assertEqual(set(), changes.ids(ElementType.LANELET, ChangeType.REMOVED))
+        self.assertTrue(changes.ids_changed(ElementType.LANELET))
+        self.assertFalse(changes.changed(ElementType.TRAFFIC_SIGN))
+
+    def test_meta_data(self):
+        changes = ChangeSet()
+        self.assertFalse(changes)
+        changes.record(ElementType.META_DATA, ChangeType.MODIFIED)
+        self.assertTrue(changes)
+        self.assertTrue(changes.changed(ElementType.META_DATA))
+        self.assertFalse(changes.ids_changed(ElementType.META_DATA))
+
+
+class TestScenarioModelChanges(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = ScenarioModel()
+        self.changes = []
+        self.notifications = []
+        self.model.subscribe_changes(self.changes.append)
+        self.model.subscribe(lambda: self.notifications.append(True))
+        self.model.set_scenario(generate_synthetic_map(SyntheticMapConfig(rows=1, columns=2)))
+
+    def test_new_scenario(self):
+        self.assertEqual(1, len(self.changes))
+        self.assertTrue(self.changes[0].everything)
+        self.assertTrue(self.changes[0].new_file_added)
+        self.assertTrue(self.model.is_new_file_added())
+
+    def test_add_and_remove_lanelet(self):
+        lanelet = MapCreator.create_straight(3, 10, 5, self.model.generate_object_id(), set())
+        self.model.add_lanelet(lanelet)
+        self.model.remove_lanelet(lanelet.lanelet_id)
+
+        added, removed = self.changes[1:]
+        self.assertFalse(added.everything)
+        self.assertEqual({lanelet.lanelet_id}, added.ids(ElementType.LANELET, ChangeType.ADDED))
+        self.assertFalse(added.changed(ElementType.OBSTACLE))
+        self.assertEqual({lanelet.lanelet_id}, removed.ids(ElementType.LANELET, ChangeType.REMOVED))
+        self.assertEqual(3, len(self.notifications))
+
+    def test_transaction(self):
+        lanelet_id = self.model.get_lanelet_network().lanelets[0].lanelet_id
+        sign = TrafficSign(
+            self.model.generate_object_id(),
+            [TrafficSignElement(TrafficSignIDZamunda.MAX_SPEED, ["10"])],
+            {lanelet_id},
+            np.array([0.0, 0.0]),
+        )
+        self.model.add_traffic_sign(sign, {lanelet_id})
+        num_scenarios = len(self.model.scenarios())
+
+        with self.model.transaction():
+            self.model.update_traffic_sign(sign.traffic_sign_id)
+            with self.model.transaction():
+                self.model.add_traffic_sign(sign, {lanelet_id})
+            # nested transactions do not notify
+            self.assertEqual(2, len(self.changes))
+
+        # one notification and one undo step for the transaction
+        self.assertEqual(3, len(self.changes))
+        self.assertEqual(num_scenarios + 1, len(self.model.scenarios()))
+        self.assertEqual(
+            {sign.traffic_sign_id},
+            self.changes[-1].ids(ElementType.TRAFFIC_SIGN, ChangeType.MODIFIED),
+        )
+        self.assertFalse(self.changes[-1].ids_changed(ElementType.TRAFFIC_SIGN))
+        self.assertFalse(self.changes[-1].new_file_added)
+
+    def test_undo(self):
+        self.model.update_meta_data(
+            "author", "affiliation", "source", set(), 1, False, "ZAM", 1, "Test", "", 1, 0.1
+        )
+        self.model.notify_all()
+        self.assertFalse(self.changes[-1].everything)
+        self.assertTrue(self.changes[-1].changed(ElementType.META_DATA))
+        self.assertFalse(self.changes[-1].changed(ElementType.LANELET))
+
+        self.model.remove_lanelet(self.model.get_lanelet_network().lanelets[0].lanelet_id)
+        self.model.undo()
+        self.assertTrue(self.changes[-1].everything)
@@ -1,10 +1,83 @@
 import os
 import subprocess
+import sys
 import time
 import unittest
 from pathlib import Path
 
 
+def import_time(module: str, *modules: str) -> float:
+    """
+    Measures the cumulative import time of a module in a fresh interpreter.
+
+    :param module: Module whose import time is measured.
+    :param modules: Modules which are imported before, e.g., the modules a command imports additionally.
+    :return: Import time in seconds.
+    """
+    statement = "; ".join(f"import {m}" for m in (module,) + modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) * 1e-6
+    raise AssertionError(f"{module} was not imported")
+
+
+def loaded_modules(statement: str, modules: list) -> list:
+    """
+    Executes a statement in a fresh interpreter and returns which of the given modules got loaded.
+
+    :param statement: Python statement which is executed.
+    :param modules: Modules to check.
+    :return: Loaded modules.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(' '.join(m for m in {modules!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+class TestCommandLineImports(unittest.TestCase):
+    heavy_modules = [
+        "matplotlib.pyplot",
+        "commonroad_sumo",
+        "sumolib",
+        "antlr4",
+        "pymetis",
+        "crdesigner.ui.gui.start_gui",
+    ]
+
+    def test_headless_import_time(self):
+        # importing all commands eagerly took about 3.5s, the lazy imports take less than 0.5s
+        self.assertLess(import_time("crdesigner.ui.command_line"), 1.5)
+
+    def test_no_heavy_modules_loaded(self):
+        self.assertEqual(
+            loaded_modules("import crdesigner.ui.command_line", self.heavy_modules), []
+        )
+
+    def test_opendrive_command_imports(self):
+        loaded = loaded_modules(
+            "from crdesigner.map_conversion.map_conversion_interface import opendrive_to_commonroad; "
+            "from crdesigner.common.file_writer import CRDesignerFileWriter; "
+            "from crdesigner.verification_repairing.config import MapVerParams; MapVerParams()",
+            self.heavy_modules,
+        )
+        self.assertEqual(loaded, [])
+
+
 class TestCommandLineInterface(unittest.TestCase):
     def setUp(self) -> None:
         self.output_path = os.path.dirname(os.path.realpath(__file__)) + "/.pytest_cache"
@@ -130,3 +203,93 @@ class TestCommandLineInterface(unittest.TestCase):
         path_1.unlink()
         path_2.unlink()
         path_3.unlink()
+
+    def test_generate_map(self):
+        subprocess.Popen(
+            [
+                "crdesigner",
+                "--output-file",
+                self.output_path + "/synthetic_command_line.xml",
+                "generate-map",
+                "--rows",
+                "2",
+                "--columns",
+                "2",
+                "--gaps",
+                "1",
+            ]
+        )
+        time.sleep(20)
+        exists = Path(self.output_path + "/synthetic_command_line.xml")
+        self.assertTrue(exists.is_file())
+        exists.unlink()
+
+    def test_generate_traffic_lights(self):
+        from commonroad.planning.planning_problem import PlanningProblemSet
+
+        from crdesigner.common.file_reader import CRDesignerFileReader
+        from crdesigner.common.file_writer import (
+            CRDesignerFileWriter,
+            OverwriteExistingFile,
+        )
+        from crdesigner.common.synthetic_map import (
+            SyntheticMapConfig,
+            generate_synthetic_map,
+        )
+
+        input_file = Path(self.output_path + "/traffic_lights_input.xml")
+        output_file = Path(self.output_path + "/traffic_lights_command_line.xml")
+        scenario = generate_synthetic_map(SyntheticMapConfig(rows=2, columns=2))
+        CRDesignerFileWriter(
+            scenario, PlanningProblemSet(), author="", affiliation="", source="", tags=set()
+        ).write_to_file(str(input_file), OverwriteExistingFile.ALWAYS)
+        subprocess.run(
+            [
+                "crdesigner",
+                "--input-file",
+                str(input_file),
+                "--output-file",
+                str(output_file),
+                "generate-traffic-lights",
+                "--green",
+                "100",
+            ],
+            check=True,
+        )
+        scenario, _ = CRDesignerFileReader(output_file).open()
+        self.assertGreater(len(scenario.lanelet_network.traffic_lights), 0)
+        for incoming in scenario.lanelet_network.intersections[0].incomings:
+            for lanelet_id in incoming.incoming_lanelets:
+                self.assertTrue(
+                    scenario.lanelet_network.find_lanelet_by_id(lanelet_id).traffic_lights
+                )
+        input_file.unlink()
+        output_file.unlink()
+
+    def test_render_video(self):
+        from PIL import Image
+
+        output_file = Path(self.output_path + "/video_command_line.gif")
+        subprocess.run(
+            [
+                "crdesigner",
+                "--input-file",
+                str(
+                    Path(__file__).parent.parent
+                    / "map_verification/test_maps/DEU_TrafficLightTest-1.xml"
+                ),
+                "--output-file",
+                str(output_file),
+                "render-video",
+                "--time-end",
+                "10",
+                "--width",
+                "160",
+                "--processes",
+                "2",
+            ],
+            check=True,
+        )
+        with Image.open(output_file) as image:
+            self.assertEqual(11, image.n_frames)
+        output_file.unlink()
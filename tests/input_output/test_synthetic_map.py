@@ -0,0 +1,105 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from crdesigner.common.synthetic_map import SyntheticMapConfig, SyntheticMapGenerator
+from crdesigner.verification_repairing.config import MapVerParams
+from crdesigner.verification_repairing.verification.formula_ids import (
+    LaneletFormulaID,
+    extract_formula_ids,
+)
+from crdesigner.verification_repairing.verification.map_verifier import MapVerifier
+
+warnings.filterwarnings("ignore")
+
+
+def verify(network) -> dict:
+    config = MapVerParams()
+    config.verification.formulas = extract_formula_ids()
+    return MapVerifier(network, config).verify()
+
+
+def invalid_lanelets(invalid_states: dict, formula_id: LaneletFormulaID) -> set:
+    return {state[0] for state in invalid_states.get(formula_id, [])}
+
+
+class TestSyntheticMap(unittest.TestCase):
+    def test_grid(self):
+        config = SyntheticMapConfig(rows=3, columns=4, road_segments=2, lanes_per_direction=2)
+        scenario = SyntheticMapGenerator(config).generate()
+        network = scenario.lanelet_network
+
+        self.assertEqual(config.num_lanelets(), len(network.lanelets))
+        self.assertEqual(config.rows * config.columns, len(network.intersections))
+        self.assertGreater(len(network.traffic_signs), 0)
+        self.assertEqual([], network.traffic_lights)
+
+        invalid_states = verify(network)
+        for formula_id in (
+            LaneletFormulaID.EXISTENCE_SUCCESSOR,
+            LaneletFormulaID.EXISTENCE_PREDECESSOR,
+            LaneletFormulaID.CONNECTIONS_SUCCESSOR,
+            LaneletFormulaID.CONNECTIONS_PREDECESSOR,
+            LaneletFormulaID.LEFT_RIGHT_BOUNDARY_ASSIGNMENT,
+            LaneletFormulaID.POLYLINES_INTERSECTION,
+        ):
+            self.assertNotIn(formula_id, invalid_states)
+
+    def test_reproducible(self):
+        config = SyntheticMapConfig(
+            rows=4,
+            columns=4,
+            road_probability=0.6,
+            traffic_lights=True,
+            seed=3,
+            num_gaps=1,
+            num_dangling_references=1,
+        )
+        first = SyntheticMapGenerator(config).generate().lanelet_network
+        second = SyntheticMapGenerator(config).generate().lanelet_network
+        self.assertLess(len(first.lanelets), config.num_lanelets())
+        self.assertGreater(len(first.traffic_lights), 0)
+
+        self.assertEqual(
+            [la.lanelet_id for la in first.lanelets], [la.lanelet_id for la in second.lanelets]
+        )
+        for lanelet, other in zip(first.lanelets, second.lanelets):
+            np.testing.assert_array_equal(lanelet.left_vertices, other.left_vertices)
+            self.assertEqual(lanelet.successor, other.successor)
+
+        config.seed = 4
+        third = SyntheticMapGenerator(config).generate().lanelet_network
+        self.assertNotEqual(
+            [la.lanelet_id for la in first.lanelets], [la.lanelet_id for la in third.lanelets]
+        )
+
+    def test_defects(self):
+        config = SyntheticMapConfig(
+            rows=3, columns=3, num_gaps=2, num_flipped_boundaries=2, num_dangling_references=2
+        )
+        generator = SyntheticMapGenerator(config)
+        invalid_states = verify(generator.generate().lanelet_network)
+
+        self.assertEqual(2, len(generator.defects["gaps"]))
+        self.assertEqual(
+            set(generator.defects["gaps"]),
+            invalid_lanelets(invalid_states, LaneletFormulaID.CONNECTIONS_PREDECESSOR)
+            & set(generator.defects["gaps"]),
+        )
+        self.assertEqual(
+            set(generator.defects["flipped_boundaries"]),
+            invalid_lanelets(invalid_states, LaneletFormulaID.LEFT_RIGHT_BOUNDARY_ASSIGNMENT),
+        )
+        self.assertEqual(
+            set(generator.defects["dangling_references"]),
+            invalid_lanelets(invalid_states, LaneletFormulaID.EXISTENCE_SUCCESSOR),
+        )
+
+    def test_for_lanelet_count(self):
+        for num_lanelets in [100, 1000]:
+            config = SyntheticMapConfig.for_lanelet_count(num_lanelets)
+            self.assertGreaterEqual(config.num_lanelets(), num_lanelets)
+            config.rows -= 1
+            config.columns -= 1
+            self.assertLess(config.num_lanelets(), num_lanelets)
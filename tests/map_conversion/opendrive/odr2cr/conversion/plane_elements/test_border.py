@@ -6,6 +6,12 @@ import numpy as np
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.plane_elements.border import (
     Border,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadElevationProfile import (
+    ElevationRecord,
+)
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadLateralProfile import (
+    Superelevation,
+)
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.roadPlanView import (
     PlanView,
 )
@@ -88,3 +94,47 @@ class TestBorder(unittest.TestCase):
 
         self.assertAlmostEqual(coord_border[0], coord[0])
         self.assertAlmostEqual(coord_border[1], coord[1])
+
+    def test_calc_height(self):
+        view = PlanView(0.2, 0.3)
+        view.add_line(0.0, 0.0, 50)
+        reference_border = Border(0.0)
+        reference_border.width_coefficients = [[0.5]]
+        reference_border.width_coefficient_offsets = [0.0]
+        reference_border.reference = view
+        reference_border.elevations = [ElevationRecord(2.0, 0.1, 0.0, 0.0, start_pos=0.0)]
+        reference_border.superelevations = [Superelevation(0.1, 0.0, 0.0, 0.0, start_pos=0.0)]
+
+        border = Border(5.0)
+        border.width_coefficients = [[3.0]]
+        border.width_coefficient_offsets = [0.0]
+        border.reference = reference_border
+
+        ref_s, ref_t = border.calc_lateral_position(10.0)
+        self.assertAlmostEqual(15.0, ref_s)
+        self.assertAlmostEqual(3.5, ref_t)
+        self.assertAlmostEqual(ref_t, border.calc(10.0)[0][1])
+
+        heights = border.calc_height(np.array([ref_s, 0.0]), np.array([ref_t, -2.0]))
+        np.testing.assert_allclose([3.5 + 3.5 * np.sin(0.1), 2.0 - 2.0 * np.sin(0.1)], heights)
+
+    def test_calc_lateral_positions(self):
+        view = PlanView(0.0, 0.0)
+        view.add_line(0.0, 0.0, 50)
+        border = Border(0.0)
+        border.width_coefficients = [[1.0, 0.1], [2.0], [3.0, 0.0, 0.01]]
+        border.width_coefficient_offsets = [0.0, 10.0, 20.0]
+        border.reference = view
+
+        s_pos = np.array([0.0, 5.0, 10.0, 10.0, 15.0, 20.0, 20.0, 30.0])
+        is_last_pos = np.array([False, False, False, True, False, False, True, True])
+        ref_s, ref_t = border.calc_lateral_positions(s_pos, 0.5, is_last_pos)
+
+        # the width of the previous segment applies at the last position of a lane
+        np.testing.assert_allclose([1.5, 2.0, 2.5, 2.5, 2.5, 3.5, 2.5, 4.5], ref_t)
+        np.testing.assert_allclose(s_pos, ref_s)
+        for i in range(len(s_pos)):
+            self.assertEqual(
+                (ref_s[i], ref_t[i]),
+                border.calc_lateral_position(s_pos[i], 0.5, is_last_pos[i]),
+            )
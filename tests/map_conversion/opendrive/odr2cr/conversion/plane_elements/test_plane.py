@@ -2,6 +2,7 @@ import unittest
 
 import numpy as np
 from pyproj.transformer import CRS, Transformer
+from shapely import LineString, Point
 
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.plane_elements.border import (
     Border,
@@ -247,6 +248,46 @@ class TestParametricLane(unittest.TestCase):
         self.assertListEqual([], left.tolist())
         self.assertListEqual([], right.tolist())
 
+    def test_calc_vertices_adaptive(self):
+        parametric_lane = self.init_lane()
+        parametric_lane.border_group.outer_border_offset = 0.0
+        parametric_lane.length = 46.911
+        left, right = parametric_lane.calc_vertices(
+            error_tolerance=0.2, min_delta_s=0.3, adaptive=True
+        )
+        dense_left, dense_right = parametric_lane.calc_vertices(
+            error_tolerance=0.2, min_delta_s=0.3
+        )
+
+        # straight lanes are only sampled every MAX_DELTA_S
+        self.assertEqual(4, len(left))
+        self.assertEqual(4, len(right))
+        np.testing.assert_almost_equal(dense_left[[0, -1]], left[[0, -1]])
+        np.testing.assert_almost_equal(dense_right[[0, -1]], right[[0, -1]])
+
+        view = PlanView(error_tolerance_s=0.2, min_delta_s=0.3)
+        view.add_arc([0.0, 0.0], 0.0, 60.0, 0.05)
+        for border in [
+            parametric_lane.border_group.inner_border,
+            parametric_lane.border_group.outer_border,
+        ]:
+            border.reference = view
+        parametric_lane.border_group.outer_border.width_coefficients[0] = [-1.0, -0.05, 0.0, 0.0]
+        parametric_lane.length = 60.0
+        left, right = parametric_lane.calc_vertices(
+            error_tolerance=0.1, min_delta_s=0.3, adaptive=True
+        )
+        dense_left, dense_right = parametric_lane.calc_vertices(
+            error_tolerance=0.1, min_delta_s=0.3
+        )
+
+        self.assertEqual(len(left), len(right))
+        self.assertLess(len(left), len(dense_left) / 2)
+        for vertices, dense_vertices in [(left, dense_left), (right, dense_right)]:
+            polyline = LineString(vertices)
+            for vertex in dense_vertices:
+                self.assertLessEqual(polyline.distance(Point(vertex)), 0.1)
+
     def test_calc_vertices_transformed(self):
         crs_from = CRS(
             "+proj=tmerc +a=6378137 +b=6378137 +lon_0=11.663999726157273 +x_0=-0 "
@@ -300,6 +300,32 @@ class TestConversionLanelet(unittest.TestCase):
             "102.0.0.-1", conversion_lanelet_network.find_lanelet_by_id("71.0.-1.-1").adj_right
         )
 
+    def test_reference_index(self):
+        conversion_lanelet_network = ConversionLaneletNetwork()
+        lanelet_1 = init_lanelet_from_id("1.0.1.-1")
+        lanelet_2 = init_lanelet_from_id("2.0.1.-1")
+        lanelet_3 = init_lanelet_from_id("3.0.1.-1")
+        lanelet_1.successor.append("2.0.1.-1")
+        lanelet_3.adj_left = "2.0.1.-1"
+        add_lanelets_to_network(conversion_lanelet_network, [lanelet_1, lanelet_2, lanelet_3])
+
+        # references added after building the index are tracked by the network methods
+        conversion_lanelet_network.update_lanelet_id_references("2.0.1.-1", "4.0.1.-1")
+        conversion_lanelet_network.add_predecessors_to_lanelet(lanelet_2, ["3.0.1.-1"])
+        self.assertListEqual(["4.0.1.-1"], lanelet_1.successor)
+        self.assertEqual("4.0.1.-1", lanelet_3.adj_left)
+
+        self.assertListEqual(["3.0.1.-1"], lanelet_2.predecessor)
+        self.assertListEqual(["2.0.1.-1"], lanelet_3.successor)
+
+        conversion_lanelet_network.remove_lanelet("2.0.1.-1", True)
+        self.assertListEqual([], lanelet_3.successor)
+        self.assertListEqual(["4.0.1.-1"], lanelet_1.successor)
+
+        conversion_lanelet_network.update_lanelet_id_references("4.0.1.-1", "1.0.1.-1")
+        conversion_lanelet_network.remove_lanelet("1.0.1.-1", True)
+        self.assertIsNone(lanelet_3.adj_left)
+
     def test_concatenate_possible_lanelets(self):
         conversion_lanelet_network = ConversionLaneletNetwork()
         plane_group = ParametricLaneGroup()
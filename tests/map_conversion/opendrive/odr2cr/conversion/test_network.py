@@ -1,9 +1,16 @@
 import unittest
+from pathlib import Path
 
+import numpy as np
+
+from crdesigner.common.config.opendrive_config import open_drive_config
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_conversion.network import (
     LinkIndex,
     Network,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.parser import (
+    parse_opendrive,
+)
 
 
 class TestNetwork(unittest.TestCase):
@@ -41,11 +48,63 @@ class TestNetwork(unittest.TestCase):
         n.assign_country_id(id)
         self.assertEqual("ZAM", n._country_ID)
 
+    def test_parallel_discretization(self):
+        path = Path(__file__).parent.parent.parent.parent / "test_maps/odr2cr/FourWaySignal.xodr"
+        lanelet_networks = []
+        try:
+            for num_processes in [1, 2]:
+                open_drive_config.num_processes = num_processes
+                network = Network(open_drive_config)
+                network.load_opendrive(parse_opendrive(path))
+                lanelet_networks.append(
+                    network.export_lanelet_network(None, open_drive_config.filter_types)
+                )
+        finally:
+            open_drive_config.num_processes = 1
+
+        sequential, parallel = lanelet_networks
+        self.assertEqual(len(sequential.lanelets), len(parallel.lanelets))
+        for lanelet, parallel_lanelet in zip(sequential.lanelets, parallel.lanelets):
+            np.testing.assert_array_equal(lanelet.left_vertices, parallel_lanelet.left_vertices)
+            np.testing.assert_array_equal(lanelet.right_vertices, parallel_lanelet.right_vertices)
+
+    def test_elevation(self):
+        path = (
+            Path(__file__).parent.parent.parent.parent
+            / "test_maps/odr2cr/poly3_and_border_record.xodr"
+        )
+        lanelet_networks = []
+        try:
+            for elevation in [False, True]:
+                open_drive_config.elevation = elevation
+                network = Network(open_drive_config)
+                network.load_opendrive(parse_opendrive(path))
+                lanelet_networks.append(
+                    network.export_lanelet_network(None, open_drive_config.filter_types)
+                )
+        finally:
+            open_drive_config.elevation = False
+
+        flat, elevated = lanelet_networks
+        self.assertEqual(len(flat.lanelets), len(elevated.lanelets))
+        for lanelet, elevated_lanelet in zip(flat.lanelets, elevated.lanelets):
+            self.assertEqual(2, lanelet.left_vertices.shape[1])
+            self.assertEqual(3, elevated_lanelet.left_vertices.shape[1])
+            self.assertEqual(3, elevated_lanelet.center_vertices.shape[1])
+            # the planview is not changed by the elevation
+            np.testing.assert_array_equal(
+                lanelet.right_vertices, elevated_lanelet.right_vertices[:, :2]
+            )
+            # the road descends from 789.12 m by about 3 m
+            self.assertTrue(np.all(elevated_lanelet.left_vertices[:, 2] > 785.0))
+            self.assertTrue(np.all(elevated_lanelet.left_vertices[:, 2] <= 789.13))
+
 
 class TestLinkIndex(unittest.TestCase):
     def test_init(self):
         link_index = LinkIndex()
         self.assertDictEqual({}, link_index._successors)
+        self.assertDictEqual({}, link_index._predecessors)
         self.assertListEqual([], link_index._intersections)
         self.assertDictEqual({}, link_index._intersection_dict)
 
@@ -69,19 +128,25 @@ class TestLinkIndex(unittest.TestCase):
         link_index.add_link("69.0.0.-1", "71.0.0.-1", True)
         self.assertDictEqual({"71.0.0.-1": ["69.0.0.-1"]}, link_index._successors)
 
+        self.assertEqual({"69.0.0.-1": {"71.0.0.-1"}}, link_index._predecessors)
+
     def test_remove(self):
         link_index = LinkIndex()
-        link_index._successors = {
-            "88.0.4.-1": ["79.0.-1.-1", "79.0.-2.-1"],
-            "100.0.0.0": ["101.0.0.0"],
-        }
+        link_index.add_link("88.0.4.-1", "79.0.-1.-1")
+        link_index.add_link("88.0.4.-1", "79.0.-2.-1")
+        link_index.add_link("100.0.0.0", "101.0.0.0")
+        link_index.add_link("101.0.0.0", "88.0.4.-1")
         link_index.remove("88.0.4.-1")
-        self.assertDictEqual({"100.0.0.0": ["101.0.0.0"]}, link_index._successors)
+        self.assertDictEqual({"100.0.0.0": ["101.0.0.0"], "101.0.0.0": []}, link_index._successors)
+        self.assertListEqual([], link_index.get_predecessors("79.0.-1.-1"))
+        self.assertListEqual([], link_index.get_predecessors("88.0.4.-1"))
+        self.assertListEqual(["100.0.0.0"], link_index.get_predecessors("101.0.0.0"))
 
     def test_get_predecessors(self):
         link_index = LinkIndex()
-        link_index._successors = {
-            "88.0.4.-1": ["79.0.-1.-1", "79.0.-2.-1"],
-            "100.0.0.0": ["79.0.-1.-1"],
-        }
+        link_index.add_link("88.0.4.-1", "79.0.-2.-1")
+        link_index.add_link("100.0.0.0", "79.0.-1.-1")
+        link_index.add_link("88.0.4.-1", "79.0.-1.-1")
+        # predecessors are ordered by their first appearance as link source
         self.assertListEqual(["88.0.4.-1", "100.0.0.0"], link_index.get_predecessors("79.0.-1.-1"))
+        self.assertListEqual([], link_index.get_predecessors("100.0.0.0"))
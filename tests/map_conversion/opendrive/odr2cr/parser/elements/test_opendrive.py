@@ -4,6 +4,7 @@ from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.opendr
     Header,
     OpenDrive,
 )
+from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.road import Road
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.parser import Junction
 
 
@@ -100,6 +101,24 @@ class TestOpenDrive(unittest.TestCase):
         self.assertEqual([junction1, junction3, junction2], opendrive.junctions)
         self.assertEqual(junction2, opendrive.getJunction(3245000))
 
+    def test_get_road(self):
+        opendrive = OpenDrive()
+        road1 = Road()
+        road1.id = 1
+        road2 = Road()
+        road2.id = 2
+        opendrive.add_road(road1)
+        self.assertEqual(road1, opendrive.getRoad(1))
+        self.assertIsNone(opendrive.getRoad(2))
+        opendrive.add_road(road2)
+        self.assertEqual(road2, opendrive.getRoad(2))
+        # roads added directly to the road list are found as well
+        road3 = Road()
+        road3.id = 3
+        opendrive.roads.append(road3)
+        self.assertEqual(road3, opendrive.getRoad(3))
+        self.assertEqual([road1, road2, road3], opendrive.roads)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
 import unittest
 
+import numpy as np
+
 from crdesigner.map_conversion.opendrive.odr2cr.opendrive_parser.elements.road_record import (
     RoadRecord,
+    calc_road_records,
 )
 
 
@@ -15,6 +18,23 @@ class TestRoadRecord(unittest.TestCase):
         self.assertEqual(road_record.start_pos, start_pos)
         self.assertEqual([a, b, c, d], road_record.polynomial_coefficients)
 
+    def test_calc_road_records(self):
+        records = [
+            RoadRecord(10.0, 0.5, 0.0, 0.0, start_pos=10.0),
+            RoadRecord(1.0, 0.0, 2.0, 0.1, start_pos=0.0),
+        ]
+        s_pos = np.array([-1.0, 0.0, 2.5, 10.0, 12.0])
+
+        expected = [
+            np.polynomial.polynomial.polyval(-1.0, [1.0, 0.0, 2.0, 0.1]),
+            1.0,
+            np.polynomial.polynomial.polyval(2.5, [1.0, 0.0, 2.0, 0.1]),
+            10.0,
+            11.0,
+        ]
+        np.testing.assert_allclose(expected, calc_road_records(records, s_pos))
+        np.testing.assert_array_equal(np.zeros(5), calc_road_records([], s_pos))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from crdesigner.map_conversion.osm2cr.converter_modules.utility.geonamesID import (
+    get_geonamesIDs,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.utility.labeling_create_tree import (
+    CityIndex,
+    find_nearest_neighbor,
+)
+
+# geonameid, asciiname, lat, lng, country code, and timezone of the test cities
+CITIES = [
+    (1, "Garching bei Muenchen", 48.24896, 11.65101, "DE", "Europe/Berlin"),
+    (2, "Karlsfeld", 48.22697, 11.47573, "DE", "Europe/Berlin"),
+    (3, "Suva", -18.14161, 178.44149, "FJ", "Pacific/Fiji"),
+    (4, "Apia", -13.83333, -171.76666, "WS", "Pacific/Apia"),
+    (5, "Longyearbyen", 78.22334, 15.64689, "SJ", "Arctic/Longyearbyen"),
+]
+
+
+def write_cities_file(path: Path):
+    rows = []
+    for geoname_id, name, lat, lng, country, timezone in CITIES:
+        row = [str(geoname_id), name, name, "", str(lat), str(lng), "P", "PPL", country]
+        row += [""] * 8 + [timezone, "2024-01-01"]
+        rows.append("\t".join(row))
+    with zipfile.ZipFile(path, "w") as file:
+        file.writestr(path.with_suffix(".txt").name, "\n".join(rows) + "\n")
+
+
+class TestCityIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.file = Path(self.directory.name) / "cities.zip"
+        write_cities_file(self.file)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_nearest_city(self):
+        index = CityIndex.from_file(self.file)
+        city = find_nearest_neighbor(index, (48.1787904, 11.5113984))
+        self.assertEqual(2, city.geonameID)
+        self.assertEqual("Karlsfeld_DE_Europe-Berlin", city.get_label())
+
+    def test_great_circle_distance(self):
+        index = CityIndex.from_file(self.file)
+        # across the antimeridian, Suva is closer than Apia although the difference of the longitudes is larger
+        self.assertEqual([3], index.nearest_geoname_ids([(-17.0, -179.5)]))
+        # close to the pole, the longitude hardly matters
+        self.assertEqual([5], index.nearest_geoname_ids([(89.0, -170.0)]))
+
+    def test_batch(self):
+        index = CityIndex.from_file(self.file)
+        coords = [(48.26, 11.66), (48.2, 11.4), (-18.0, 178.0)]
+        self.assertEqual([1, 2, 3], get_geonamesIDs(coords, index))
+        self.assertEqual([1, 2, 3], index.nearest_geoname_ids(np.array(coords)))
+        self.assertEqual([], get_geonamesIDs([], index))
+
+    def test_persistent_index(self):
+        index = CityIndex.from_file(self.file)
+        index_file = self.file.with_suffix(".npz")
+        self.assertTrue(index_file.exists())
+
+        # the stored index is used as long as it is newer than the cities file
+        self.file.write_bytes(b"invalid")
+        os.utime(self.file, (0, 0))
+        loaded = CityIndex.from_file(self.file)
+        self.assertEqual(len(index), len(loaded))
+        np.testing.assert_array_equal(index.geoname_ids, loaded.geoname_ids)
+        np.testing.assert_array_equal(index.timezones, loaded.timezones)
+        self.assertEqual(index.city(0).get_label(), loaded.city(0).get_label())
@@ -0,0 +1,73 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from crdesigner.map_conversion.common import geometry
+from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph import (
+    Graph,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph_edge import (
+    GraphEdge,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph_edge_index import (
+    EdgeIndex,
+    heading_difference,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations.road_graph._graph_node import (
+    GraphNode,
+)
+
+
+def create_edge(edge_id: int, start, end) -> GraphEdge:
+    node1 = GraphNode(2 * edge_id, start[0], start[1], set())
+    node2 = GraphNode(2 * edge_id + 1, end[0], end[1], set())
+    waypoints = [geometry.Point(None, x, y) for x, y in np.linspace(start, end, 5)]
+    lane_info = (1, 1, 0, True, None, None, None)
+    return GraphEdge(
+        edge_id, node1, node2, waypoints, lane_info, (False, False, False), 50, "primary"
+    )
+
+
+class TestEdgeIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.east = create_edge(1, (0.0, 0.0), (100.0, 0.0))
+        self.west = create_edge(2, (100.0, 5.0), (0.0, 5.0))
+        self.north = create_edge(3, (200.0, 0.0), (200.0, 100.0))
+        self.index = EdgeIndex([self.east, self.west, self.north])
+
+    def test_heading_difference(self):
+        np.testing.assert_allclose(
+            [10.0, 85.0, 175.0], heading_difference([355.0, 90.0, 180.0], 5.0)
+        )
+        self.assertAlmostEqual(0.0, heading_difference([360.0], 0.0)[0])
+
+    def test_nearest_edge(self):
+        self.assertEqual(90.0, self.east.get_compass_degrees())
+        # without heading the nearest edge is returned
+        self.assertIs(self.west, self.index.nearest_edge(np.array([50.0, 4.0])))
+        # the nearest edge with matching heading is preferred
+        self.assertIs(self.east, self.index.nearest_edge(np.array([50.0, 4.0]), heading=80.0))
+        self.assertIs(self.west, self.index.nearest_edge(np.array([50.0, 1.0]), heading=275.0))
+        # edges with matching heading which are too far away are not considered
+        self.assertIs(self.east, self.index.nearest_edge(np.array([150.0, 0.0]), heading=0.0))
+        self.assertIs(self.north, self.index.nearest_edge(np.array([185.0, 0.0]), heading=0.0))
+        self.assertIsNone(EdgeIndex([]).nearest_edge(np.array([0.0, 0.0])))
+
+    def test_graph(self):
+        transformer = SimpleNamespace(transform=lambda lat, lng: (lat, lng))
+        graph = Graph(
+            {self.east.node1, self.east.node2, self.west.node1, self.west.node2},
+            {self.east, self.west},
+            (0.0, 0.0),
+            None,
+            transformer,
+            [],
+            [],
+        )
+        self.assertIs(self.east, graph.find_closest_edge_by_lat_lng([50.0, 4.0], direction=90.0))
+        edge_index = graph.create_edge_index()
+        self.assertEqual(2, len(edge_index))
+        self.assertIs(
+            self.west, graph.find_closest_edge_by_lat_lng([50.0, 4.0], edge_index=edge_index)
+        )
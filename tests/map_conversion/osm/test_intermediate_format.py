@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+from commonroad.scenario.traffic_light import TrafficLight
+
+from crdesigner.common.config.osm_config import osm_config
+from crdesigner.map_conversion.common import geometry
+from crdesigner.map_conversion.osm2cr.converter_modules.intermediate_operations.intermediate_format._intermediate_edge import (
+    Edge,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.intermediate_operations.intermediate_format._intermediate_format import (
+    IntermediateFormat,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.intermediate_operations.intermediate_format._intermediate_node import (
+    Node,
+)
+
+
+def create_edge(edge_id: int, start, end, width: float = 3.0) -> Edge:
+    start, end = np.array(start, dtype=float), np.array(end, dtype=float)
+    direction = (end - start) / np.linalg.norm(end - start)
+    offset = np.array([-direction[1], direction[0]]) * width / 2
+    center = list(np.linspace(start, end, 3))
+    return Edge(
+        edge_id,
+        Node(2 * edge_id, geometry.Point(None, *start)),
+        Node(2 * edge_id + 1, geometry.Point(None, *end)),
+        [point + offset for point in center],
+        [point - offset for point in center],
+        center,
+        None,
+        True,
+        None,
+        True,
+        [],
+        [],
+        set(),
+        set(),
+    )
+
+
+class TestIntermediateFormat(unittest.TestCase):
+    def test_registries(self):
+        edges = [create_edge(1, (0, 0), (10, 0)), create_edge(2, (10, 0), (20, 0))]
+        light = TrafficLight(5, np.array([10.0, 0.0]))
+        interm = IntermediateFormat([], edges, (0.0, 0.0))
+        self.assertIs(edges[1], interm.find_edge_by_id(2))
+        interm.add_traffic_light(light)
+        self.assertIs(light, interm.find_traffic_light_by_id(5))
+        self.assertIsNone(interm.find_traffic_sign_by_id(5))
+
+        edge = create_edge(3, (20, 0), (30, 0))
+        interm.add_edge(edge)
+        interm.remove_edge(1)
+        self.assertEqual([2, 3], [e.id for e in interm.edges])
+        self.assertIsNone(interm.find_edge_by_id(1))
+
+        # references to removed elements are removed as well
+        edge.traffic_lights.add(5)
+        interm.remove_traffic_light(5)
+        interm.remove_invalid_references()
+        self.assertEqual(set(), edge.traffic_lights)
+
+        interm.traffic_lights = [light]
+        self.assertIs(light, interm.find_traffic_light_by_id(5))
+
+    def test_lanelet_intersections(self):
+        crossed = IntermediateFormat(
+            [],
+            [create_edge(1, (0, 0), (20, 0)), create_edge(2, (0, 10), (20, 10))],
+            (0.0, 0.0),
+        )
+        crossing = IntermediateFormat(
+            [],
+            [create_edge(11, (5, -5), (5, 15)), create_edge(12, (30, -5), (30, 15))],
+            (0.0, 0.0),
+        )
+        crossings = IntermediateFormat.get_lanelet_intersections(crossing, crossed)
+        self.assertEqual({1: {11}, 2: {11}}, crossings)
+
+        expected = {
+            lanelet.lanelet_id: set(
+                crossing.to_commonroad_scenario().lanelet_network.find_lanelet_by_shape(
+                    lanelet.polygon
+                )
+            )
+            for lanelet in crossed.to_commonroad_scenario().lanelet_network.lanelets
+        }
+        self.assertEqual(expected, crossings)
+
+    def test_merge(self):
+        interm = IntermediateFormat([], [create_edge(1, (0, 0), (10, 0))], (0.0, 0.0))
+        sublayer_edge = create_edge(11, (5, -5), (5, 5))
+        sublayer = IntermediateFormat([sublayer_edge.node1], [sublayer_edge], (0.0, 0.0))
+        interm.merge(sublayer)
+
+        # the elements are moved, not copied
+        self.assertIs(sublayer_edge, interm.find_edge_by_id(11))
+        self.assertEqual(osm_config.SUBLAYER_LANELETTYPE, sublayer_edge.edge_type)
+        self.assertIs(sublayer_edge.node1, interm.nodes[0])
+        self.assertEqual([], sublayer.edges)
+        self.assertEqual([], sublayer.nodes)
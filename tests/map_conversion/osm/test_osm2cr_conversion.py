@@ -1,6 +1,7 @@
 import math
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 from commonroad.planning.planning_problem import PlanningProblemSet
@@ -12,6 +13,10 @@ from crdesigner.common.file_writer import CRDesignerFileWriter, OverwriteExistin
 from crdesigner.map_conversion.osm2cr.converter_modules.cr_operations.export import (
     convert_to_scenario,
 )
+from crdesigner.map_conversion.osm2cr.converter_modules.graph_operations import (
+    segment_clusters,
+)
+from crdesigner.map_conversion.osm2cr.converter_modules.utility import idgenerator
 
 
 class TestOSMToCommonRoadConversion(unittest.TestCase):
@@ -22,24 +27,31 @@ class TestOSMToCommonRoadConversion(unittest.TestCase):
         if not os.path.isdir(self.out_path):
             os.makedirs(self.out_path)
 
-    def load_and_convert(self, osm_file_name: str) -> Tuple[Scenario, str]:
+    def load_and_convert(self, osm_file_name: str, suffix: str = "") -> Tuple[Scenario, str]:
         path = (
             os.path.dirname(os.path.realpath(__file__)) + f"/../test_maps/osm/{osm_file_name}.osm"
         )
 
-        converted_path = os.path.join(self.out_path, osm_file_name + "_converted_scenario.xml")
+        converted_path = os.path.join(
+            self.out_path, osm_file_name + suffix + "_converted_scenario.xml"
+        )
 
         osm_graph = converter.GraphScenario(path).graph
         cr_scenario = convert_to_scenario(osm_graph)
 
         fw = CRDesignerFileWriter(scenario=cr_scenario, planning_problem_set=PlanningProblemSet())
         fw.write_to_file(
-            filename=self.out_path + "/" + osm_file_name + "_converted_scenario.xml",
+            filename=converted_path,
             overwrite_existing_file=OverwriteExistingFile.ALWAYS,
         )
 
         return cr_scenario, converted_path
 
+    def convert_to_bytes(self, osm_file_name: str, index: int) -> bytes:
+        _, converted_path = self.load_and_convert(osm_file_name, f"_{index}")
+        with open(converted_path, "rb") as converted_file:
+            return converted_file.read()
+
     def osm2cr_conversion_ids(self, converted_path: str):
         """Test if Scenario IDs are correctly ordered ascending"""
 
@@ -124,3 +136,38 @@ class TestOSMToCommonRoadConversion(unittest.TestCase):
         Test whether map without crossing nodes can be converted (there was once a bug)
         """
         self.execute_tests("map_without_crossing_nodes")
+
+    def test_deterministic_ids(self):
+        """
+        Test whether repeated and concurrent conversions of the same file result in identical files
+        """
+        expected = self.convert_to_bytes("garching_intersection", 0)
+        self.assertEqual(expected, self.convert_to_bytes("garching_intersection", 1))
+        with ThreadPoolExecutor(3) as executor:
+            results = list(
+                executor.map(
+                    lambda index: self.convert_to_bytes("garching_intersection", index), range(2, 5)
+                )
+            )
+        for result in results:
+            self.assertEqual(expected, result)
+
+    def test_graph_operations_outside_of_conversion(self):
+        """
+        Test whether graph operations called outside of the conversion steps draw from the generator of the graph
+        """
+        path = (
+            os.path.dirname(os.path.realpath(__file__))
+            + "/../test_maps/osm/garching_intersection.osm"
+        )
+        graph = converter.step_collection_2(converter.step_collection_1(path))
+        fallback_counter = idgenerator.generator.counter
+        graph_counter = graph.id_generator.counter
+
+        graph.create_lane_link_segments()
+        segment_clusters.cluster_segments(graph)
+
+        self.assertEqual(fallback_counter, idgenerator.generator.counter)
+        self.assertLess(graph_counter, graph.id_generator.counter)
+        lane_ids = [lane.id for lane in graph.get_all_lanes()]
+        self.assertEqual(len(lane_ids), len(set(lane_ids)))
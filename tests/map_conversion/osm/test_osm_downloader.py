@@ -0,0 +1,171 @@
+import os
+import tempfile
+import threading
+import unittest
+import xml.etree.ElementTree as ElTree
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlparse
+
+from crdesigner.map_conversion.osm2cr.converter_modules.osm_operations import downloader
+
+# node ID, longitude, and latitude of the canned map
+NODES = [(i, 11.6 + 0.005 * i, 48.25 + 0.004 * i) for i in range(1, 10)]
+# way ID and node IDs of the canned map; the way crosses several tiles
+WAYS = [(100, [1, 2, 3, 4, 5, 6, 7, 8, 9]), (101, [2, 3])]
+# tiles with more nodes exceed the node limit of the stand-in
+MAX_NODES = 3
+
+
+class OsmApiStandIn(BaseHTTPRequestHandler):
+    """Serves the canned map like the map call of the OSM API."""
+
+    requests = []
+    failures = set()
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        lon1, lat1, lon2, lat2 = (float(value) for value in query["bbox"][0].split(","))
+        OsmApiStandIn.requests.append((lon1, lat1, lon2, lat2))
+        if (lon1, lat1) in OsmApiStandIn.failures:
+            OsmApiStandIn.failures.remove((lon1, lat1))
+            self.send_error(429)
+            return
+
+        node_ids = {
+            node_id for node_id, lon, lat in NODES if lon1 <= lon <= lon2 and lat1 <= lat <= lat2
+        }
+        if len(node_ids) > MAX_NODES:
+            self.send_error(400, "You requested too many nodes")
+            return
+        ways = [(way_id, refs) for way_id, refs in WAYS if node_ids & set(refs)]
+        node_ids |= {ref for _, refs in ways for ref in refs}
+
+        root = ElTree.Element("osm", {"version": "0.6"})
+        for node_id, lon, lat in NODES:
+            if node_id in node_ids:
+                ElTree.SubElement(
+                    root, "node", {"id": str(node_id), "lon": str(lon), "lat": str(lat)}
+                )
+        for way_id, refs in ways:
+            way = ElTree.SubElement(root, "way", {"id": str(way_id)})
+            for ref in refs:
+                ElTree.SubElement(way, "nd", {"ref": str(ref)})
+            ElTree.SubElement(way, "tag", {"k": "highway", "v": "residential"})
+        body = ElTree.tostring(root, encoding="utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestOsmDownloader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), OsmApiStandIn)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = (
+            "http://127.0.0.1:{}/api/0.6/map?bbox={{lon1}},{{lat1}},{{lon2}},{{lat2}}".format(
+                self.server.server_port
+            )
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "tiles")
+        OsmApiStandIn.requests = []
+        OsmApiStandIn.failures = set()
+        backoff = mock.patch.object(downloader, "DOWNLOAD_BACKOFF_BASE", 0.0)
+        backoff.start()
+        self.addCleanup(backoff.stop)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def download(self, filename: str, max_age: float = 3600) -> ElTree.Element:
+        downloader.download_map(
+            filename,
+            11.6,
+            48.25,
+            11.65,
+            48.29,
+            tile_size=0.02,
+            max_workers=4,
+            cache_path=self.cache_path,
+            max_age=max_age,
+            url_template=self.url,
+        )
+        return ElTree.parse(filename).getroot()
+
+    def test_split_into_tiles(self):
+        tiles = downloader.split_into_tiles(11.61, 48.29, 11.65, 48.25, 0.02)
+        self.assertEqual(9, len(tiles))
+        # the tiles are clipped to the area
+        self.assertIn((11.61, 48.25, 11.62, 48.26), tiles)
+        self.assertIn((11.62, 48.26, 11.64, 48.28), tiles)
+        self.assertEqual(tiles, downloader.split_into_tiles(11.61, 48.25, 11.65, 48.29, 0.02))
+
+        # areas smaller than a tile are requested as a whole, even if they cross the grid
+        self.assertEqual(
+            [(11.619, 48.259, 11.621, 48.261)],
+            downloader.split_into_tiles(11.619, 48.259, 11.621, 48.261, 0.02),
+        )
+
+    def test_download_map(self):
+        # the first request of one tile is rate limited
+        OsmApiStandIn.failures.add((11.6, 48.25))
+        root = self.download(os.path.join(self.directory.name, "map.osm"))
+
+        node_ids = [int(node.get("id")) for node in root.iter("node")]
+        way_ids = [int(way.get("id")) for way in root.iter("way")]
+        self.assertEqual(sorted(node_id for node_id, _, _ in NODES), node_ids)
+        self.assertEqual([100, 101], way_ids)
+        self.assertEqual(["bounds", "node"], [child.tag for child in root[:2]])
+        self.assertEqual(1, len(root.findall("custom_bounds")))
+        # a request of a too large tile is split into four requests
+        self.assertTrue(any(lon2 - lon1 < 0.02 for lon1, _, lon2, _ in OsmApiStandIn.requests))
+
+    def test_cache(self):
+        self.download(os.path.join(self.directory.name, "map.osm"))
+        num_requests = len(OsmApiStandIn.requests)
+        num_files = len(list(Path(self.cache_path).iterdir()))
+
+        second = self.download(os.path.join(self.directory.name, "cached.osm"))
+        self.assertEqual(num_requests, len(OsmApiStandIn.requests))
+        self.assertEqual(len(NODES), len(second.findall("node")))
+
+        # outdated tiles are downloaded again and replace the cached files, split tiles are not requested again
+        self.download(os.path.join(self.directory.name, "outdated.osm"), max_age=0)
+        num_split = len(list(Path(self.cache_path).glob("*.split")))
+        self.assertLess(0, num_split)
+        self.assertEqual(2 * num_requests - num_split, len(OsmApiStandIn.requests))
+        self.assertEqual(num_files, len(list(Path(self.cache_path).iterdir())))
+
+    def test_resume(self):
+        OsmApiStandIn.failures = {(11.62, 48.26)}
+        with mock.patch.object(downloader, "MAX_DOWNLOAD_ATTEMPTS", 1):
+            with self.assertRaises(HTTPError):
+                downloader.download_map(
+                    os.path.join(self.directory.name, "map.osm"),
+                    11.6,
+                    48.25,
+                    11.65,
+                    48.29,
+                    tile_size=0.02,
+                    max_workers=1,
+                    cache_path=self.cache_path,
+                    max_age=3600,
+                    url_template=self.url,
+                )
+        first_requests = list(OsmApiStandIn.requests)
+
+        # only the failed tile is downloaded again when the download is repeated
+        self.download(os.path.join(self.directory.name, "map.osm"))
+        failed_tile = (11.62, 48.26, 11.64, 48.28)
+        repeated_requests = OsmApiStandIn.requests[len(first_requests) :]
+        self.assertEqual(failed_tile, repeated_requests[0])
+        self.assertEqual({failed_tile}, set(first_requests) & set(repeated_requests))
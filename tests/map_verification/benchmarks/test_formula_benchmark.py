@@ -0,0 +1,121 @@
+"""
+Benchmark of the verification of each formula on the test maps.
+
+The number of enumerated groundings is compared with the baseline in every test run. The number of predicate and
+function calls is not compared, since it depends on the order in which quantifiers enumerate their values. Wall
+times depend on the machine and are only compared if the environment variable CRDESIGNER_BENCHMARK_TIMES is set: the
+ratio of the time of each formula to its baseline is divided by the median ratio of all formulas, so that only
+formulas slowing down relative to the others fail. The allowed factor is set by CRDESIGNER_BENCHMARK_THRESHOLD.
+Setting CRDESIGNER_BENCHMARK_UPDATE stores the measurements as new baseline. The benchmark is deselected by default and
+run with "pytest -m benchmark".
+"""
+
+import json
+import os
+import statistics
+import unittest
+import warnings
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from crdesigner.verification_repairing.config import MapVerParams
+from crdesigner.verification_repairing.verification.groups_handler import GroupsHandler
+from crdesigner.verification_repairing.verification.map_verifier import MapVerifier
+
+warnings.filterwarnings("ignore")
+
+pytestmark = pytest.mark.benchmark
+
+BASELINE_PATH = Path(__file__).parent / "formula_baseline.json"
+MAPS_PATH = Path(__file__).parent.parent / "test_maps"
+
+TIMES = bool(os.environ.get("CRDESIGNER_BENCHMARK_TIMES"))
+UPDATE = bool(os.environ.get("CRDESIGNER_BENCHMARK_UPDATE"))
+THRESHOLD = float(os.environ.get("CRDESIGNER_BENCHMARK_THRESHOLD", 2.0))
+
+# times are measured repeatedly and the minimum is taken; formulas faster than the minimal time are too noisy
+REPETITIONS = 3
+MIN_TIME = 0.005
+
+
+def measure(path: Path, repetitions: int) -> Dict[str, Dict[str, float]]:
+    """
+    Verifies a map group by group and measures each formula.
+
+    :param path: Path to map.
+    :param repetitions: Number of verifications.
+    :return: Measurements of each formula.
+    """
+    scenario, _ = CommonRoadFileReader(path).open()
+    measurements = {}
+    for _ in range(repetitions):
+        for group in GroupsHandler().groups:
+            config = MapVerParams()
+            config.verification.formulas = list(group.formulas)
+            config.verification.profile = True
+            verifier = MapVerifier(scenario.lanelet_network, config)
+            verifier.verify()
+
+            for formula_id, profile in verifier.profiles.items():
+                previous = measurements.get(formula_id)
+                measurements[formula_id] = {
+                    "wall_time": (
+                        profile.wall_time
+                        if previous is None
+                        else min(previous["wall_time"], profile.wall_time)
+                    ),
+                    "groundings": profile.groundings,
+                }
+    return measurements
+
+
+class TestFormulaBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repetitions = REPETITIONS if TIMES or UPDATE else 1
+        cls.measurements = {
+            str(path.relative_to(MAPS_PATH)): measure(path, repetitions)
+            for path in sorted(MAPS_PATH.rglob("*.xml"))
+        }
+
+        if UPDATE:
+            with open(BASELINE_PATH, "w") as file:
+                json.dump(cls.measurements, file, indent=1, sort_keys=True)
+        with open(BASELINE_PATH) as file:
+            cls.baseline = json.load(file)
+
+    def pairs(self):
+        for map_name, formulas in sorted(self.baseline.items()):
+            for formula_id, baseline in sorted(formulas.items()):
+                yield map_name, formula_id, baseline, self.measurements[map_name][formula_id]
+
+    def test_baseline_complete(self):
+        self.assertEqual(
+            {name: set(formulas) for name, formulas in self.measurements.items()},
+            {name: set(formulas) for name, formulas in self.baseline.items()},
+        )
+
+    def test_groundings(self):
+        for map_name, formula_id, baseline, measurement in self.pairs():
+            with self.subTest(map=map_name, formula=formula_id):
+                self.assertEqual(baseline["groundings"], measurement["groundings"])
+
+    @unittest.skipIf(not TIMES, "timing benchmark is disabled")
+    def test_wall_times(self):
+        ratios = {
+            (map_name, formula_id): measurement["wall_time"] / baseline["wall_time"]
+            for map_name, formula_id, baseline, measurement in self.pairs()
+            if baseline["wall_time"] >= MIN_TIME
+        }
+        median = statistics.median(ratios.values())
+        for (map_name, formula_id), ratio in sorted(ratios.items()):
+            with self.subTest(map=map_name, formula=formula_id):
+                self.assertLessEqual(
+                    ratio / median,
+                    THRESHOLD,
+                    f"{formula_id} on {map_name} takes {ratio:.2f} times its baseline "
+                    f"(median of all formulas: {median:.2f})",
+                )
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+from commonroad.scenario.lanelet import Lanelet
+
+from crdesigner.verification_repairing.repairing.tools.geometry_tools import (
+    are_polylines_intersecting,
+    are_polylines_self_intersecting,
+    check_line_intersection_efficient,
+    check_line_intersections,
+    contains_points,
+)
+
+
+class TestGeometryTools(unittest.TestCase):
+    def test_polylines_self_intersecting(self):
+        polylines = [
+            np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]]),
+            np.array([[0.0, 0.0], [2.0, 0.0], [1.0, 1.0], [1.0, -1.0]]),  # crossing
+            np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]),  # same vertex twice
+            np.array([[0.0, 0.0], [2.0, 0.0], [1.0, 0.0]]),  # reversal
+            np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 1.0], [2.0, 0.0, 2.0]]),
+            np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]]),
+        ]
+        np.testing.assert_array_equal(
+            [False, True, True, True, False, True], are_polylines_self_intersecting(polylines)
+        )
+        self.assertEqual(0, len(are_polylines_self_intersecting([])))
+
+    def test_polylines_intersecting(self):
+        polyline = np.array([[0.0, 0.0], [2.0, 0.0]])
+        others = [
+            np.array([[0.0, 1.0], [2.0, 1.0]]),
+            np.array([[1.0, -1.0], [1.0, 1.0]]),
+            np.array([[2.0, 0.0], [3.0, 0.0]]),
+        ]
+        np.testing.assert_array_equal(
+            [False, True, True], are_polylines_intersecting([polyline] * 3, others)
+        )
+
+    def test_line_intersections(self):
+        rng = np.random.default_rng(0)
+        line = np.array([[0.0, 0.0], [4.0, 4.0]])
+        start_points = rng.integers(0, 5, size=(50, 2)).astype(float)
+        end_points = rng.integers(0, 5, size=(50, 2)).astype(float)
+        expected = [
+            check_line_intersection_efficient(line, [start, end])
+            for start, end in zip(start_points, end_points)
+        ]
+        np.testing.assert_array_equal(
+            expected, check_line_intersections(line, start_points, end_points)
+        )
+
+    def test_contains_points(self):
+        left_vertices = np.array([[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]])
+        right_vertices = np.array([[0.0, -1.0], [1.0, -1.0], [2.0, -1.0]])
+        lanelet = Lanelet(left_vertices, (left_vertices + right_vertices) / 2, right_vertices, 1)
+        points = np.array([[1.0, 0.0], [3.0, 0.0], [0.0, 1.0]])
+        self.assertEqual([True, False, False], contains_points(lanelet, points))
@@ -0,0 +1,120 @@
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+from commonroad.scenario.scenario import ScenarioID
+
+from crdesigner.common.synthetic_map import SyntheticMapConfig, SyntheticMapGenerator
+from crdesigner.verification_repairing.config import MapVerParams
+from crdesigner.verification_repairing.drawing.invalid_states.invalid_states_report import (
+    InvalidStatesReport,
+    save_invalid_states_reports,
+    save_verification_result_reports,
+)
+from crdesigner.verification_repairing.map_verification_repairing import (
+    verify_and_repair_maps,
+)
+from crdesigner.verification_repairing.verification.formula_ids import LaneletFormulaID
+from crdesigner.verification_repairing.verification.verification_result import (
+    VerificationResult,
+)
+
+warnings.filterwarnings("ignore")
+
+
+def generate_scenario(map_id: int):
+    config = SyntheticMapConfig(
+        rows=2, columns=2, seed=map_id, num_gaps=1, num_flipped_boundaries=1
+    )
+    scenario = SyntheticMapGenerator(config).generate()
+    scenario.scenario_id = ScenarioID(country_id="ZAM", map_name="Report", map_id=map_id)
+    return scenario
+
+
+class TestInvalidStatesReport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.report_dir = tempfile.TemporaryDirectory()
+        self.scenario = generate_scenario(1)
+        self.lanelet_id = self.scenario.lanelet_network.lanelets[0].lanelet_id
+        self.successor_id = next(iter(self.scenario.lanelet_network.lanelets[0].successor))
+        self.invalid_states = {
+            LaneletFormulaID.CONNECTIONS_SUCCESSOR: [(self.lanelet_id, self.successor_id)],
+            LaneletFormulaID.POLYLINES_INTERSECTION: [(self.lanelet_id,)],
+            LaneletFormulaID.POTENTIAL_SUCCESSOR: [(self.lanelet_id, self.successor_id)],
+        }
+
+    def tearDown(self) -> None:
+        self.report_dir.cleanup()
+
+    def test_background_rendered_once(self):
+        report = InvalidStatesReport(self.scenario.lanelet_network, self.scenario.scenario_id)
+        background = report.background
+        self.assertEqual(4, background.shape[2])
+        # the background is not white everywhere, i.e., the lanelets are drawn
+        self.assertLess(background[:, :, :3].min(), 255)
+
+        report.save_report(self.invalid_states, self.report_dir.name, "first", "svg")
+        report.save_report({}, self.report_dir.name, "second", "svg")
+        self.assertIs(background, report.background)
+
+        svg = (Path(self.report_dir.name) / "first.svg").read_text()
+        self.assertIn("<image", svg)
+        self.assertIn(str(self.lanelet_id), svg)
+
+    def test_html_report(self):
+        report = InvalidStatesReport(self.scenario.lanelet_network, self.scenario.scenario_id)
+        path = report.save_report(self.invalid_states, self.report_dir.name, "report")
+
+        content = path.read_text()
+        self.assertTrue(content.startswith("<!DOCTYPE html>"))
+        self.assertIn("<svg", content)
+        self.assertIn("CONNECTIONS_SUCCESSOR", content)
+        self.assertIn(f"({self.lanelet_id}, {self.successor_id})", content)
+
+    def test_unsupported_format(self):
+        report = InvalidStatesReport(self.scenario.lanelet_network, self.scenario.scenario_id)
+        with self.assertRaises(ValueError):
+            report.save_report(self.invalid_states, self.report_dir.name, "report", "png")
+
+    def test_duplicate_benchmark_ids(self):
+        with self.assertRaises(ValueError):
+            save_verification_result_reports(
+                [self.scenario, generate_scenario(1)], VerificationResult(), self.report_dir.name
+            )
+
+    def test_process_pool(self):
+        maps = [
+            (scenario.lanelet_network, scenario.scenario_id, self.invalid_states if i == 0 else {})
+            for i, scenario in enumerate(
+                [self.scenario, generate_scenario(2), generate_scenario(3)]
+            )
+        ]
+        paths = save_invalid_states_reports(maps, self.report_dir.name, num_processes=2)
+
+        self.assertEqual(
+            ["ZAM_Report-1.html", "ZAM_Report-2.html", "ZAM_Report-3.html"],
+            [path.name for path in paths],
+        )
+        for path in paths:
+            self.assertTrue(path.is_file())
+
+    def test_verification_reports(self):
+        config = MapVerParams()
+        config.verification.formulas = [
+            LaneletFormulaID.CONNECTIONS_PREDECESSOR,
+            LaneletFormulaID.LEFT_RIGHT_BOUNDARY_ASSIGNMENT,
+        ]
+        config.evaluation.report_dir = self.report_dir.name
+        _, result = verify_and_repair_maps([self.scenario, generate_scenario(2)], config)
+
+        for map_verification in result.map_verifications:
+            content = (
+                Path(self.report_dir.name) / f"{map_verification.benchmark_id}.html"
+            ).read_text()
+            for invalid_state in map_verification.map_verification_result.invalid_states:
+                self.assertEqual(
+                    invalid_state.element_ids,
+                    [location[0] for location in invalid_state.locations],
+                )
+                self.assertIn(invalid_state.formula.name, content)
@@ -0,0 +1,70 @@
+import unittest
+import warnings
+from pathlib import Path
+
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from crdesigner.verification_repairing.partitioning.map_partition import (
+    LaneletPartitioning,
+    TrafficSignPartitioning,
+    pymetis_imported,
+)
+
+warnings.filterwarnings("ignore")
+
+
+@unittest.skipIf(not pymetis_imported, "pymetis is not installed")
+class TestLaneletPartitioning(unittest.TestCase):
+    def setUp(self) -> None:
+        path = Path(__file__).parent / "test_maps/paper_test_maps/DEU_BadEssen-3_1_T-1.xml"
+        scenario, _ = CommonRoadFileReader(path).open()
+        self.network = scenario.lanelet_network
+
+    def check_partition(self, partition):
+        lanelet_ids = set()
+        traffic_sign_ids = set()
+        for lanelet_block, traffic_sign_block, traffic_light_block, _ in partition:
+            lanelet_ids.update(lanelet_block)
+            traffic_sign_ids.update(traffic_sign_block)
+            self.assertEqual(len(lanelet_block), len(set(lanelet_block)))
+
+            referenced = set()
+            for lanelet_id in lanelet_block:
+                referenced |= self.network.find_lanelet_by_id(lanelet_id).traffic_signs
+            for traffic_sign_id in traffic_sign_block:
+                referring = [
+                    la
+                    for la in self.network.lanelets
+                    if traffic_sign_id in la.traffic_signs
+                    or la.stop_line is not None
+                    and traffic_sign_id in (la.stop_line.traffic_sign_ref or set())
+                ]
+                if referring:
+                    self.assertTrue(any(la.lanelet_id in lanelet_block for la in referring))
+            self.assertTrue(
+                referenced & {ts.traffic_sign_id for ts in self.network.traffic_signs}
+                <= set(traffic_sign_block)
+            )
+
+        self.assertEqual({la.lanelet_id for la in self.network.lanelets}, lanelet_ids)
+        self.assertEqual(
+            {ts.traffic_sign_id for ts in self.network.traffic_signs}, traffic_sign_ids
+        )
+        self.assertLess(max(len(block[1]) for block in partition), len(self.network.traffic_signs))
+
+    def test_normal_partition(self):
+        partition = LaneletPartitioning(self.network).normal_partition(ref_size=20, buffered=True)
+        self.assertGreater(len(partition), 1)
+        self.check_partition(partition)
+
+    def test_strips_partition(self):
+        partition = LaneletPartitioning(self.network).strips_partition(ref_size=20, buffered=False)
+        self.assertGreater(len(partition), 1)
+        self.check_partition(partition)
+
+    def test_signs_chunks_partition(self):
+        partition = TrafficSignPartitioning(self.network).signs_chunks_partition(size=2)
+        for lanelet_block, traffic_sign_block, _, _ in partition:
+            for lanelet_id in lanelet_block:
+                lanelet = self.network.find_lanelet_by_id(lanelet_id)
+                self.assertTrue(lanelet.traffic_signs & set(traffic_sign_block))
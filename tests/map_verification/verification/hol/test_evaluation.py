@@ -4,6 +4,10 @@ from typing import List
 from crdesigner.verification_repairing.verification.hol.context import Context
 from crdesigner.verification_repairing.verification.hol.formula import Formula
 from crdesigner.verification_repairing.verification.hol.parser.parser import Parser
+from crdesigner.verification_repairing.verification.hol.satisfaction import (
+    HOLVerificationChecker,
+    batch_predicates,
+)
 
 
 class TestEvaluation(unittest.TestCase):
@@ -156,6 +160,29 @@ class TestEvaluation(unittest.TestCase):
         f = self._prepare_formula(formula)
         self.assertTrue(f.evaluate())
 
+    def test_batch_predicate(self):
+        calls = []
+
+        def even_batch(vals):
+            calls.append(len(vals))
+            return [val % 2 == 0 for val in vals]
+
+        self._model.batch_predicate_funcs["Even"] = even_batch
+        f = self._prepare_formula("(!(Even(x)) | E y in D1. (Even(y))) || x in D1")
+        predicates = batch_predicates(f.expr)
+        self.assertEqual(1, len(predicates))
+
+        combinations = [(val,) for val in sorted(self._model.domain_vals["D1"])]
+        HOLVerificationChecker._prefetch(f, predicates, combinations)
+        self.assertEqual([10], calls)
+
+        # the predicate outside of the quantifier is answered by the batch evaluation
+        predicates[0].func = None
+        for (val,) in combinations:
+            f.update_free_variables({"x": val})
+            self.assertEqual(val % 2 == 0, predicates[0].evaluate())
+        predicates[0].clear_prefetch()
+
     def _prepare_formula(self, formula: str) -> Formula:
         """
         Prepares a formula.
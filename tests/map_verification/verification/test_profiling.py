@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import shapely
+from commonroad.common.file_reader import CommonRoadFileReader
+from similaritymeasures import similaritymeasures
+
+from crdesigner.verification_repairing.config import MapVerParams
+from crdesigner.verification_repairing.verification.formula_ids import (
+    LaneletFormulaID,
+    extract_formula_ids,
+)
+from crdesigner.verification_repairing.verification.map_verifier import MapVerifier
+from crdesigner.verification_repairing.verification.profiling import (
+    merge_profiles,
+    profiles_to_folded_stacks,
+    profiles_to_json,
+)
+
+warnings.filterwarnings("ignore")
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self) -> None:
+        path = (
+            Path(__file__).parent.parent / "test_maps/paper_test_maps/DEU_Guetersloh-20_1_T-1.xml"
+        )
+        scenario, _ = CommonRoadFileReader(path).open()
+        self.network = scenario.lanelet_network
+
+    def verify(self, profile: bool):
+        config = MapVerParams()
+        config.verification.formulas = extract_formula_ids()
+        config.verification.profile = profile
+        verifier = MapVerifier(self.network, config)
+        return verifier.verify(), verifier.profiles
+
+    def test_profiles(self):
+        shapely_area, frechet_dist = shapely.area, similaritymeasures.frechet_dist
+        expected, profiles = self.verify(profile=False)
+        self.assertEqual({}, profiles)
+
+        invalid_states, profiles = self.verify(profile=True)
+        self.assertEqual(expected, invalid_states)
+        self.assertIs(shapely_area, shapely.area)
+        self.assertIs(frechet_dist, similaritymeasures.frechet_dist)
+
+        profile = profiles[LaneletFormulaID.POLYLINES_INTERSECTION.value]
+        self.assertEqual(len(self.network.lanelets), profile.groundings)
+        self.assertGreater(profile.wall_time, 0.0)
+        self.assertGreater(profile.shapely_time, 0.0)
+        self.assertIn("Is_polylines_intersection[batch]", profile.predicate_calls)
+
+        profile = profiles[LaneletFormulaID.EXISTENCE_SUCCESSOR.value]
+        self.assertGreater(sum(profile.function_calls.values()), 0)
+
+    def test_export(self):
+        _, profiles = self.verify(profile=True)
+        merged = merge_profiles([profiles, profiles])
+        formula_id = LaneletFormulaID.POLYLINES_INTERSECTION.value
+        self.assertEqual(2 * profiles[formula_id].groundings, merged[formula_id].groundings)
+
+        for line in profiles_to_folded_stacks(profiles):
+            stack, value = line.rsplit(" ", 1)
+            self.assertIn(stack.split(";")[0], profiles)
+            self.assertGreaterEqual(int(value), 0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "profiles.json")
+            profiles_to_json(profiles, path)
+            with open(path) as file:
+                exported = json.load(file)
+        self.assertEqual(set(profiles), set(exported))
+        self.assertEqual(profiles[formula_id].shapely_time, exported[formula_id]["shapely_time"])
@@ -0,0 +1,108 @@
+import copy
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+from commonroad.common.file_reader import CommonRoadFileReader
+from shapely import Point
+
+from crdesigner.verification_repairing.verification.sub_map import SubMap, SubMapIndex
+from crdesigner.verification_repairing.verification.verification_cache import (
+    element_digest,
+)
+
+warnings.filterwarnings("ignore")
+
+
+class TestSubMap(unittest.TestCase):
+    def setUp(self) -> None:
+        path = Path(__file__).parent.parent / "test_maps/paper_test_maps/DEU_BadEssen-3_1_T-1.xml"
+        scenario, _ = CommonRoadFileReader(path).open()
+        self.network = scenario.lanelet_network
+
+    def elements(self, network):
+        return (
+            network.lanelets
+            + network.traffic_signs
+            + network.traffic_lights
+            + network.intersections
+        )
+
+    def test_buffer_applied(self):
+        lanelet = self.network.lanelets[0]
+        sub_map = SubMap(self.network, buffer_size=50.0)
+        sub_map.extract_from_element(lanelet.lanelet_id)
+
+        shape = lanelet.polygon.shapely_object.buffer(50.0, join_style=2)
+        expected_lanelets = {
+            la.lanelet_id
+            for la in self.network.lanelets
+            if la.polygon.shapely_object.intersects(shape)
+        }
+        expected_signs = {
+            ts.traffic_sign_id
+            for ts in self.network.traffic_signs
+            if shape.contains(Point(ts.position[0], ts.position[1]))
+        }
+        self.assertGreater(len(expected_lanelets), 1)
+        self.assertTrue(expected_lanelets <= sub_map.lanelet_ids)
+        self.assertTrue(expected_signs <= sub_map.traffic_sign_ids)
+
+    def test_refs_from_traffic_sign(self):
+        traffic_sign = next(
+            ts
+            for ts in self.network.traffic_signs
+            if any(ts.traffic_sign_id in la.traffic_signs for la in self.network.lanelets)
+        )
+        sub_map = SubMap(self.network, buffer_size=0.0)
+        sub_map.extract_from_element(traffic_sign.traffic_sign_id)
+
+        for lanelet in self.network.lanelets:
+            if traffic_sign.traffic_sign_id in lanelet.traffic_signs:
+                self.assertIn(lanelet.lanelet_id, sub_map.lanelet_ids)
+
+    def test_subnetwork_is_view(self):
+        digests = [element_digest(element) for element in self.elements(self.network)]
+
+        lanelet = self.network.lanelets[0]
+        sub_map = SubMap(self.network, buffer_size=10.0)
+        sub_map.extract_from_element(lanelet.lanelet_id)
+        sub_network = sub_map.create_subnetwork()
+
+        self.assertEqual(sub_map.lanelet_ids, {la.lanelet_id for la in sub_network.lanelets})
+        for la in sub_network.lanelets:
+            self.assertTrue(set(la.successor) <= sub_map.lanelet_ids)
+            self.assertIs(
+                la.left_vertices, self.network.find_lanelet_by_id(la.lanelet_id).left_vertices
+            )
+        for ts in sub_network.traffic_signs:
+            self.assertIs(ts, self.network.find_traffic_sign_by_id(ts.traffic_sign_id))
+
+        # removing the references to elements outside of the sub map must not modify the network
+        self.assertEqual(
+            digests, [element_digest(element) for element in self.elements(self.network)]
+        )
+
+    def test_index_refresh(self):
+        index = SubMapIndex(self.network)
+        lanelet = copy.deepcopy(self.network.lanelets[0])
+        traffic_sign = self.network.traffic_signs[0]
+
+        # move a traffic sign next to a lanelet and reference it from another lanelet
+        traffic_sign.position = np.array(lanelet.center_vertices[0])
+        other = next(la for la in self.network.lanelets if la.lanelet_id != lanelet.lanelet_id)
+        other.traffic_signs.add(traffic_sign.traffic_sign_id)
+        self.network.remove_lanelet(lanelet.lanelet_id)
+        index.refresh()
+
+        sub_map = SubMap(self.network, buffer_size=1.0, index=index)
+        sub_map.extract_from_element(traffic_sign.traffic_sign_id)
+        self.assertNotIn(lanelet.lanelet_id, sub_map.lanelet_ids)
+        self.assertIn(other.lanelet_id, sub_map.lanelet_ids)
+
+        self.network.add_lanelet(lanelet)
+        index.refresh()
+        sub_map = SubMap(self.network, buffer_size=1.0, index=index)
+        sub_map.extract_from_element(traffic_sign.traffic_sign_id)
+        self.assertIn(lanelet.lanelet_id, sub_map.lanelet_ids)
@@ -0,0 +1,102 @@
+import copy
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from crdesigner.verification_repairing.config import MapVerParams, VerificationParams
+from crdesigner.verification_repairing.map_verification_repairing import (
+    verify_and_repair_map,
+)
+from crdesigner.verification_repairing.verification.formula_ids import (
+    extract_formula_ids,
+)
+from crdesigner.verification_repairing.verification.map_verifier import MapVerifier
+from crdesigner.verification_repairing.verification.verification_cache import (
+    element_digest,
+    params_digest,
+)
+
+warnings.filterwarnings("ignore")
+
+
+class TestVerificationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        path = (
+            Path(__file__).parent.parent / "test_maps/paper_test_maps/DEU_Guetersloh-20_1_T-1.xml"
+        )
+        scenario, _ = CommonRoadFileReader(path).open()
+        self.network = scenario.lanelet_network
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache.sqlite")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def verify(self, network, cache: bool):
+        config = MapVerParams()
+        config.verification.formulas = extract_formula_ids()
+        config.verification.cache_path = self.cache_path if cache else None
+        verifier = MapVerifier(copy.deepcopy(network), config)
+        invalid_states = {
+            formula: sorted(locations) for formula, locations in verifier.verify().items()
+        }
+        return invalid_states, verifier.cache_hits, verifier.cache_lookups
+
+    def test_element_digest(self):
+        lanelet = self.network.lanelets[0]
+        self.assertEqual(element_digest(lanelet), element_digest(copy.deepcopy(lanelet)))
+
+        changed = copy.deepcopy(lanelet)
+        changed.successor.append(123456)
+        self.assertNotEqual(element_digest(lanelet), element_digest(changed))
+
+        moved = copy.deepcopy(lanelet)
+        moved.left_vertices = moved.left_vertices + np.array([0.0, 1e-9])
+        self.assertNotEqual(element_digest(lanelet), element_digest(moved))
+
+    def test_params_digest(self):
+        config = VerificationParams()
+        self.assertEqual(params_digest(config), params_digest(VerificationParams(num_threads=4)))
+        self.assertNotEqual(
+            params_digest(config), params_digest(VerificationParams(connection_thresh=1.0))
+        )
+
+    def test_unchanged_map(self):
+        expected, _, _ = self.verify(self.network, cache=False)
+
+        cold, hits, lookups = self.verify(self.network, cache=True)
+        self.assertEqual(expected, cold)
+        self.assertEqual(0, hits)
+        self.assertGreater(lookups, 0)
+
+        warm, hits, lookups = self.verify(self.network, cache=True)
+        self.assertEqual(expected, warm)
+        self.assertEqual(lookups, hits)
+
+    def test_changed_map(self):
+        self.verify(self.network, cache=True)
+
+        network = copy.deepcopy(self.network)
+        lanelet = network.lanelets[0]
+        lanelet.left_vertices = lanelet.left_vertices + 0.5
+        expected, _, _ = self.verify(network, cache=False)
+
+        result, hits, lookups = self.verify(network, cache=True)
+        self.assertEqual(expected, result)
+        self.assertGreater(hits, 0)
+        self.assertLess(hits, lookups)
+
+    def test_hit_rate_recorded(self):
+        config = MapVerParams()
+        config.verification.cache_path = self.cache_path
+        verify_and_repair_map(self.network, config)
+        _, result = verify_and_repair_map(self.network, config)
+
+        map_verification_result = result.map_verifications[0].map_verification_result
+        self.assertGreater(map_verification_result.cache_lookups, 0)
+        self.assertGreater(map_verification_result.cache_hit_rate, 0.0)